@@ -0,0 +1,12 @@
+-- CreateTable
+CREATE TABLE "dashboard_snapshots" (
+    "id" TEXT NOT NULL,
+    "metrics" JSONB NOT NULL,
+    "stats" JSONB NOT NULL,
+    "version" INTEGER NOT NULL DEFAULT 1,
+    "computeMs" INTEGER NOT NULL DEFAULT 0,
+    "computedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "dashboard_snapshots_pkey" PRIMARY KEY ("id")
+);
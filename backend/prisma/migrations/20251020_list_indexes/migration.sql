@@ -0,0 +1,50 @@
+-- CreateIndex
+CREATE INDEX "partners_type_isActive_idx" ON "partners"("type", "isActive");
+
+-- CreateIndex
+CREATE INDEX "partners_createdAt_id_idx" ON "partners"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "cattle_purchases_status_purchaseDate_idx" ON "cattle_purchases"("status", "purchaseDate");
+
+-- CreateIndex
+CREATE INDEX "cattle_purchases_vendorId_idx" ON "cattle_purchases"("vendorId");
+
+-- CreateIndex
+CREATE INDEX "cattle_purchases_createdAt_id_idx" ON "cattle_purchases"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "lot_pen_links_penId_status_idx" ON "lot_pen_links"("penId", "status");
+
+-- CreateIndex
+CREATE INDEX "lot_pen_links_purchaseId_status_idx" ON "lot_pen_links"("purchaseId", "status");
+
+-- CreateIndex
+CREATE INDEX "expenses_isPaid_dueDate_idx" ON "expenses"("isPaid", "dueDate");
+
+-- CreateIndex
+CREATE INDEX "expenses_createdAt_id_idx" ON "expenses"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "expenses_purchaseId_idx" ON "expenses"("purchaseId");
+
+-- CreateIndex
+CREATE INDEX "expenses_payerAccountId_idx" ON "expenses"("payerAccountId");
+
+-- CreateIndex
+CREATE INDEX "revenues_isReceived_dueDate_idx" ON "revenues"("isReceived", "dueDate");
+
+-- CreateIndex
+CREATE INDEX "revenues_createdAt_id_idx" ON "revenues"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "revenues_saleRecordId_idx" ON "revenues"("saleRecordId");
+
+-- CreateIndex
+CREATE INDEX "revenues_payerAccountId_idx" ON "revenues"("payerAccountId");
+
+-- CreateIndex
+CREATE INDEX "cash_flows_status_date_idx" ON "cash_flows"("status", "date");
+
+-- CreateIndex
+CREATE INDEX "cash_flows_type_date_idx" ON "cash_flows"("type", "date");
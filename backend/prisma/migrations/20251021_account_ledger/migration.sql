@@ -0,0 +1,70 @@
+-- CreateTable
+CREATE TABLE "account_ledger_entries" (
+    "id" TEXT NOT NULL,
+    "accountId" TEXT NOT NULL,
+    "sequence" SERIAL NOT NULL,
+    "entryDate" TIMESTAMP(3) NOT NULL,
+    "amount" DOUBLE PRECISION NOT NULL,
+    "balanceAfter" DOUBLE PRECISION NOT NULL,
+    "sourceType" TEXT NOT NULL,
+    "sourceId" TEXT,
+    "description" TEXT NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "account_ledger_entries_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "account_ledger_entries_accountId_entryDate_sequence_idx" ON "account_ledger_entries"("accountId", "entryDate", "sequence");
+
+-- CreateIndex
+CREATE INDEX "account_ledger_entries_sourceType_sourceId_idx" ON "account_ledger_entries"("sourceType", "sourceId");
+
+-- AddForeignKey
+ALTER TABLE "account_ledger_entries" ADD CONSTRAINT "account_ledger_entries_accountId_fkey" FOREIGN KEY ("accountId") REFERENCES "payer_accounts"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Backfill: movimentações já efetivadas (despesas pagas, receitas recebidas e fluxo de
+-- caixa pago/recebido) com saldo acumulado por conta. O lançamento de abertura absorve a
+-- diferença para o saldo atual, então o último saldo acumulado de cada conta é igual a
+-- "payer_accounts"."balance".
+WITH "movements" AS (
+    SELECT "payerAccountId" AS "accountId", COALESCE("paymentDate", "dueDate") AS "entryDate",
+           -"totalAmount" AS "amount", 'EXPENSE' AS "sourceType", "id" AS "sourceId", "description"
+    FROM "expenses"
+    WHERE "isPaid" AND "impactsCashFlow" AND "payerAccountId" IS NOT NULL
+    UNION ALL
+    SELECT "payerAccountId", COALESCE("receiptDate", "dueDate"),
+           "totalAmount", 'REVENUE', "id", "description"
+    FROM "revenues"
+    WHERE "isReceived" AND "payerAccountId" IS NOT NULL
+    UNION ALL
+    SELECT "accountId", COALESCE("paymentDate", "date"),
+           CASE WHEN "type" = 'INCOME' THEN "amount" ELSE -"amount" END, 'CASH_FLOW', "id", "description"
+    FROM "cash_flows"
+    WHERE "status" IN ('PAID', 'RECEIVED')
+),
+"totals" AS (
+    SELECT "accountId", SUM("amount") AS "total", MIN("entryDate") AS "firstDate"
+    FROM "movements"
+    GROUP BY "accountId"
+),
+"entries" AS (
+    SELECT a."id" AS "accountId", LEAST(a."createdAt", t."firstDate") AS "entryDate",
+           a."balance" - COALESCE(t."total", 0) AS "amount", 'OPENING' AS "sourceType",
+           NULL::TEXT AS "sourceId", 'Saldo de abertura' AS "description", 0 AS "rank"
+    FROM "payer_accounts" a
+    LEFT JOIN "totals" t ON t."accountId" = a."id"
+    UNION ALL
+    SELECT m."accountId", m."entryDate", m."amount", m."sourceType", m."sourceId", m."description", 1
+    FROM "movements" m
+)
+INSERT INTO "account_ledger_entries" ("id", "accountId", "entryDate", "amount", "balanceAfter", "sourceType", "sourceId", "description")
+SELECT gen_random_uuid()::TEXT, e."accountId", e."entryDate", e."amount",
+       SUM(e."amount") OVER (
+           PARTITION BY e."accountId"
+           ORDER BY e."entryDate", e."rank", e."sourceId"
+           ROWS UNBOUNDED PRECEDING
+       ),
+       e."sourceType", e."sourceId", e."description"
+FROM "entries" e
+ORDER BY e."accountId", e."entryDate", e."rank", e."sourceId";
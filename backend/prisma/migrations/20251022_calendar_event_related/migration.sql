@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "calendar_events_relatedId_autoGenerated_idx" ON "calendar_events"("relatedId", "autoGenerated");
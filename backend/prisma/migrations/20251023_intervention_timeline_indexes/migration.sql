@@ -0,0 +1,29 @@
+-- CreateIndex
+CREATE INDEX "weight_readings_purchaseId_readingDate_idx" ON "weight_readings"("purchaseId", "readingDate");
+
+-- CreateIndex
+CREATE INDEX "weight_readings_readingDate_idx" ON "weight_readings"("readingDate");
+
+-- CreateIndex
+CREATE INDEX "health_interventions_cattlePurchaseId_applicationDate_idx" ON "health_interventions"("cattlePurchaseId", "applicationDate");
+
+-- CreateIndex
+CREATE INDEX "health_interventions_penId_applicationDate_idx" ON "health_interventions"("penId", "applicationDate");
+
+-- CreateIndex
+CREATE INDEX "health_interventions_applicationDate_idx" ON "health_interventions"("applicationDate");
+
+-- CreateIndex
+CREATE INDEX "mortality_records_cattlePurchaseId_deathDate_idx" ON "mortality_records"("cattlePurchaseId", "deathDate");
+
+-- CreateIndex
+CREATE INDEX "mortality_records_penId_deathDate_idx" ON "mortality_records"("penId", "deathDate");
+
+-- CreateIndex
+CREATE INDEX "mortality_records_deathDate_idx" ON "mortality_records"("deathDate");
+
+-- CreateIndex
+CREATE INDEX "pen_movements_cattlePurchaseId_movementDate_idx" ON "pen_movements"("cattlePurchaseId", "movementDate");
+
+-- CreateIndex
+CREATE INDEX "pen_movements_movementDate_idx" ON "pen_movements"("movementDate");
@@ -0,0 +1,23 @@
+-- AlterTable
+ALTER TABLE "weight_readings" ADD COLUMN "averageDailyGain" DOUBLE PRECISION;
+
+-- CreateTable
+CREATE TABLE "animal_weights" (
+    "id" TEXT NOT NULL,
+    "readingId" TEXT NOT NULL,
+    "purchaseId" TEXT NOT NULL,
+    "animalTag" TEXT,
+    "weight" DOUBLE PRECISION NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "animal_weights_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "animal_weights_readingId_idx" ON "animal_weights"("readingId");
+
+-- CreateIndex
+CREATE INDEX "animal_weights_purchaseId_animalTag_idx" ON "animal_weights"("purchaseId", "animalTag");
+
+-- AddForeignKey
+ALTER TABLE "animal_weights" ADD CONSTRAINT "animal_weights_readingId_fkey" FOREIGN KEY ("readingId") REFERENCES "weight_readings"("id") ON DELETE CASCADE ON UPDATE CASCADE;
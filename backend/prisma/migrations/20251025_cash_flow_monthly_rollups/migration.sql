@@ -0,0 +1,55 @@
+-- CreateTable
+CREATE TABLE "cash_flow_monthly_rollups" (
+    "id" TEXT NOT NULL,
+    "month" TIMESTAMP(3) NOT NULL,
+    "type" "FinancialType" NOT NULL,
+    "status" "PaymentStatus" NOT NULL,
+    "accountId" TEXT NOT NULL,
+    "categoryId" TEXT NOT NULL,
+    "totalAmount" DOUBLE PRECISION NOT NULL,
+    "entryCount" INTEGER NOT NULL,
+    "refreshedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "cash_flow_monthly_rollups_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "cash_flow_monthly_rollups_month_key" ON "cash_flow_monthly_rollups"("month", "type", "status", "accountId", "categoryId");
+
+-- Invalida a rollup do mês fechado afetado por qualquer gravação em cash_flows (inclusive
+-- createMany/deleteMany e serviços com PrismaClient próprio). O lock compartilhado por mês
+-- (chave 4207, ano * 12 + mês - 1) impede que o resumo materialize um mês com gravação em
+-- andamento; o resumo só tenta o lock exclusivo, sem esperar.
+CREATE FUNCTION "cash_flow_rollup_invalidate"() RETURNS TRIGGER AS $$
+DECLARE
+    months TIMESTAMP(3)[] := ARRAY[]::TIMESTAMP(3)[];
+    target TIMESTAMP(3);
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND (OLD."date", OLD."amount", OLD."type", OLD."status", OLD."accountId", OLD."categoryId")
+            IS NOT DISTINCT FROM (NEW."date", NEW."amount", NEW."type", NEW."status", NEW."accountId", NEW."categoryId") THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        months := array_append(months, date_trunc('month', OLD."date"));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        months := array_append(months, date_trunc('month', NEW."date"));
+    END IF;
+
+    FOR target IN SELECT DISTINCT m FROM unnest(months) AS m ORDER BY m LOOP
+        -- O mês aberto nunca é materializado
+        CONTINUE WHEN target >= date_trunc('month', now() AT TIME ZONE 'UTC');
+        PERFORM pg_advisory_xact_lock_shared(4207, (EXTRACT(YEAR FROM target) * 12 + EXTRACT(MONTH FROM target) - 1)::int);
+        DELETE FROM "cash_flow_monthly_rollups" WHERE "month" = target;
+    END LOOP;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- CreateTrigger
+CREATE TRIGGER "cash_flows_rollup_invalidate"
+AFTER INSERT OR UPDATE OR DELETE ON "cash_flows"
+FOR EACH ROW EXECUTE FUNCTION "cash_flow_rollup_invalidate"();
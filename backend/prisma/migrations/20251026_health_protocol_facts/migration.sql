@@ -0,0 +1,34 @@
+-- CreateTable
+CREATE TABLE "health_protocol_facts" (
+    "id" TEXT NOT NULL,
+    "purchaseId" TEXT NOT NULL,
+    "penId" TEXT NOT NULL,
+    "interventionType" TEXT NOT NULL,
+    "productName" TEXT NOT NULL,
+    "firstApplication" TIMESTAMP(3) NOT NULL,
+    "lastApplication" TIMESTAMP(3) NOT NULL,
+    "applications" INTEGER NOT NULL,
+    "cost" DOUBLE PRECISION NOT NULL,
+    "treatedHead" INTEGER NOT NULL,
+    "deathsAfter" INTEGER NOT NULL,
+    "weightBefore" DOUBLE PRECISION,
+    "weightBeforeDate" TIMESTAMP(3),
+    "weightAfter" DOUBLE PRECISION,
+    "weightAfterDate" TIMESTAMP(3),
+    "averageDailyGain" DOUBLE PRECISION,
+    "refreshedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "health_protocol_facts_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "health_protocol_facts_protocol_key" ON "health_protocol_facts"("purchaseId", "penId", "interventionType", "productName");
+
+-- CreateIndex
+CREATE INDEX "health_protocol_facts_firstApplication_idx" ON "health_protocol_facts"("firstApplication");
+
+-- CreateIndex
+CREATE INDEX "health_protocol_facts_productName_firstApplication_idx" ON "health_protocol_facts"("productName", "firstApplication");
+
+-- CreateIndex
+CREATE INDEX "health_protocol_facts_penId_firstApplication_idx" ON "health_protocol_facts"("penId", "firstApplication");
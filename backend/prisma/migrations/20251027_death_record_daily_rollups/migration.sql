@@ -0,0 +1,80 @@
+-- CreateTable
+CREATE TABLE "death_record_daily_rollups" (
+    "id" TEXT NOT NULL,
+    "day" DATE NOT NULL,
+    "purchaseId" TEXT NOT NULL,
+    "penId" TEXT NOT NULL,
+    "deathType" "DeathType" NOT NULL,
+    "deaths" INTEGER NOT NULL,
+    "records" INTEGER NOT NULL,
+    "estimatedLoss" DOUBLE PRECISION NOT NULL,
+    "updatedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "death_record_daily_rollups_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "death_record_daily_rollups_day_key" ON "death_record_daily_rollups"("day", "purchaseId", "penId", "deathType");
+
+-- CreateIndex
+CREATE INDEX "death_record_daily_rollups_purchaseId_day_idx" ON "death_record_daily_rollups"("purchaseId", "day");
+
+-- CreateIndex
+CREATE INDEX "death_record_daily_rollups_penId_day_idx" ON "death_record_daily_rollups"("penId", "day");
+
+-- Carga inicial a partir dos registros existentes
+INSERT INTO "death_record_daily_rollups" ("id", "day", "purchaseId", "penId", "deathType", "deaths", "records", "estimatedLoss")
+SELECT gen_random_uuid()::text, "deathDate"::date, "purchaseId", "penId", "deathType",
+       SUM("quantity"), COUNT(*), COALESCE(SUM("estimatedLoss"), 0)
+FROM "death_records"
+GROUP BY "deathDate"::date, "purchaseId", "penId", "deathType";
+
+-- Soma (ou subtrai) um registro na linha do dia/lote/curral/tipo; a linha some ao zerar
+CREATE FUNCTION "death_record_rollup_apply"(
+    target_day DATE, target_purchase TEXT, target_pen TEXT, target_type "DeathType",
+    delta_deaths INTEGER, delta_records INTEGER, delta_loss DOUBLE PRECISION
+) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO "death_record_daily_rollups" ("id", "day", "purchaseId", "penId", "deathType", "deaths", "records", "estimatedLoss")
+    VALUES (gen_random_uuid()::text, target_day, target_purchase, target_pen, target_type, delta_deaths, delta_records, delta_loss)
+    ON CONFLICT ("day", "purchaseId", "penId", "deathType") DO UPDATE SET
+        "deaths" = "death_record_daily_rollups"."deaths" + EXCLUDED."deaths",
+        "records" = "death_record_daily_rollups"."records" + EXCLUDED."records",
+        "estimatedLoss" = "death_record_daily_rollups"."estimatedLoss" + EXCLUDED."estimatedLoss",
+        "updatedAt" = CURRENT_TIMESTAMP;
+
+    IF delta_records < 0 THEN
+        DELETE FROM "death_record_daily_rollups"
+        WHERE "day" = target_day AND "purchaseId" = target_purchase
+          AND "penId" = target_pen AND "deathType" = target_type AND "records" <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Mantém a rollup em qualquer gravação em death_records (inclusive createMany/deleteMany,
+-- scripts de correção e serviços com PrismaClient próprio)
+CREATE FUNCTION "death_record_rollup_maintain"() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND (OLD."deathDate"::date, OLD."purchaseId", OLD."penId", OLD."deathType", OLD."quantity", OLD."estimatedLoss")
+            IS NOT DISTINCT FROM (NEW."deathDate"::date, NEW."purchaseId", NEW."penId", NEW."deathType", NEW."quantity", NEW."estimatedLoss") THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM "death_record_rollup_apply"(OLD."deathDate"::date, OLD."purchaseId", OLD."penId", OLD."deathType",
+            -OLD."quantity", -1, -COALESCE(OLD."estimatedLoss", 0));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM "death_record_rollup_apply"(NEW."deathDate"::date, NEW."purchaseId", NEW."penId", NEW."deathType",
+            NEW."quantity", 1, COALESCE(NEW."estimatedLoss", 0));
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- CreateTrigger
+CREATE TRIGGER "death_records_rollup_maintain"
+AFTER INSERT OR UPDATE OR DELETE ON "death_records"
+FOR EACH ROW EXECUTE FUNCTION "death_record_rollup_maintain"();
@@ -0,0 +1,16 @@
+-- CreateTable
+CREATE TABLE "risk_model_coefficients" (
+    "id" TEXT NOT NULL,
+    "model" TEXT NOT NULL,
+    "dimension" TEXT NOT NULL,
+    "key" TEXT NOT NULL,
+    "value" DOUBLE PRECISION NOT NULL,
+    "stdDev" DOUBLE PRECISION,
+    "sampleSize" INTEGER NOT NULL,
+    "fittedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "risk_model_coefficients_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "risk_model_coefficients_model_dimension_key_key" ON "risk_model_coefficients"("model", "dimension", "key");
@@ -41,7 +41,12 @@ import integratedFinancialAnalysisRoutes from '@/routes/integratedFinancialAnaly
 import penAllocationsRoutes from '@/routes/penAllocations.routes';
 import testDataRoutes from '@/routes/testData.routes';
 // import dataImportRoutes from '@/routes/dataImport.routes';
-// import dashboardRoutes from '@/routes/dashboard.routes';
+import dashboardRoutes from '@/routes/dashboard.routes';
+import offlineSyncRoutes from '@/routes/offlineSync.routes';
+import { dashboardSnapshotService } from '@/services/dashboardSnapshot.service';
+import { catchAsync } from '@/utils/catchAsync';
+import { auditLog } from '@/middlewares/audit';
+import { authenticate } from '@/middlewares/auth';
 
 // Rotas removidas - usando apenas Prisma agora
 
@@ -125,49 +130,6 @@ export function createApp(): Application {
   // Health check routes
   app.use('/health', healthRoutes);
 
-  // Rotas públicas otimizadas para desenvolvimento (performance < 500ms)
-  app.get('/api/v1/stats', (req, res) => {
-    const startTime = Date.now();
-    
-    // Dados pré-calculados para máxima performance
-    const stats = {
-      totalCattle: 850,
-      activeLots: 12,
-      occupiedPens: 8,
-      totalRevenue: 2500000,
-      totalExpenses: 1800000,
-      netProfit: 700000,
-      averageWeight: 450,
-      mortalityRate: 0.5,
-      dateRange: "2025-01-01 to 2025-12-31",
-      cashFlow: {
-        inflow: 2500000,
-        outflow: 1800000,
-        balance: 700000,
-        trend: 1.25 // Valor numérico representando crescimento positivo (25%)
-      },
-      performanceIndex: {
-        overall: 8.5,
-        efficiency: 9.2,
-        profitability: 8.8,
-        growth: 7.9,
-        sustainability: 8.1
-      },
-      lastUpdated: new Date().toISOString()
-    };
-
-    const responseTime = Date.now() - startTime;
-    
-    // Headers de performance
-    res.set({
-      'Cache-Control': 'public, max-age=60',
-      'X-Response-Time': `${responseTime}ms`,
-      'Content-Type': 'application/json'
-    });
-
-    res.json(stats);
-  });
-
   app.get('/api/v1/frontend-data', async (_, res) => {
     res.json({
       cycles: [],
@@ -189,6 +151,9 @@ export function createApp(): Application {
   // Rotas da API
   const apiRouter = express.Router();
   
+  // Auditoria das operações de escrita (gravada em lote)
+  apiRouter.use(auditLog);
+
   // Registra as rotas
   apiRouter.use('/auth', authRoutes);
   apiRouter.use('/users', userRoutes);
@@ -203,6 +168,36 @@ export function createApp(): Application {
   apiRouter.use('/sale-records', saleRecordRoutes);
   apiRouter.use('/sales', saleRecordRoutes); // Alias para compatibilidade
   apiRouter.use('/analytics', analyticsRoutes);
+  apiRouter.use('/dashboard', dashboardRoutes);
+  // Indicadores do dashboard (financeiros inclusive): exige autenticação e não pode ir para caches compartilhados
+  apiRouter.get('/stats', authenticate, catchAsync(async (_req: express.Request, res: express.Response) => {
+    const startTime = Date.now();
+    
+    // Indicadores pré-calculados no snapshot do dashboard (uma única consulta)
+    const { snapshot, source } = await dashboardSnapshotService.get();
+    const stats = {
+      ...(snapshot.stats as Record<string, unknown>),
+      lastUpdated: snapshot.computedAt.toISOString(),
+      snapshot: {
+        version: snapshot.version,
+        computedAt: snapshot.computedAt.toISOString(),
+        computeMs: snapshot.computeMs,
+        source,
+      },
+    };
+
+    const responseTime = Date.now() - startTime;
+    
+    // Headers de performance
+    res.set({
+      'Cache-Control': 'private, no-store',
+      'X-Response-Time': `${responseTime}ms`,
+      'X-Dashboard-Snapshot': source,
+      'Content-Type': 'application/json'
+    });
+
+    res.json(stats);
+  }));
   apiRouter.use('/cost-centers', costCenterRoutes);
   
   // Rota unificada para compras de gado (substitui purchase-orders e cattle-lots)
@@ -237,6 +232,9 @@ export function createApp(): Application {
   // Rotas de relatórios
   apiRouter.use('/reports', reportRoutes);
   
+  // Sincronização da fila offline
+  apiRouter.use('/sync', offlineSyncRoutes);
+  
   // Rotas de importação de dados
   // apiRouter.use('/data-import', dataImportRoutes);
 
@@ -45,6 +45,8 @@ export const initializeSocket = (server: HTTPServer) => {
       socket.join('admins');
     }
     socket.join(`user:${socket.data.userId}`);
+    // Sala comum aos usuários autenticados (notificações para todos)
+    socket.join('users');
     
     // Eventos de currais (pen occupancy)
     socket.on('subscribe:pen-occupancy', () => {
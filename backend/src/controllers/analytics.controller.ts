@@ -1,6 +1,7 @@
 import { Request, Response } from 'express';
 import { WeightBreakAnalysisService } from '../services/weightBreakAnalysis.service';
 import { MortalityAnalysisService } from '../services/mortalityAnalysis.service';
+import { riskModelService } from '../services/riskModel.service';
 
 const weightBreakService = new WeightBreakAnalysisService();
 const mortalityService = new MortalityAnalysisService();
@@ -224,6 +225,55 @@ export class AnalyticsController {
     }
   }
 
+  // ===== RISK MODEL =====
+
+  // Pontuar todos os lotes em aberto (mortalidade e quebra esperada)
+  async scoreOpenLots(req: Request, res: Response) {
+    try {
+      const result = await riskModelService.scoreOpenLots();
+      res.json({
+        success: true,
+        data: result
+      });
+    } catch (error: any) {
+      res.status(500).json({
+        success: false,
+        error: error.message
+      });
+    }
+  }
+
+  // Situação dos coeficientes ajustados
+  async getRiskModel(req: Request, res: Response) {
+    try {
+      res.json({
+        success: true,
+        data: riskModelService.getModelInfo()
+      });
+    } catch (error: any) {
+      res.status(500).json({
+        success: false,
+        error: error.message
+      });
+    }
+  }
+
+  // Reajustar os coeficientes agora
+  async fitRiskModel(req: Request, res: Response) {
+    try {
+      const result = await riskModelService.fit();
+      res.json({
+        success: true,
+        data: result
+      });
+    } catch (error: any) {
+      res.status(500).json({
+        success: false,
+        error: error.message
+      });
+    }
+  }
+
   // ===== COMBINED ANALYTICS =====
 
   // Dashboard de análise completa
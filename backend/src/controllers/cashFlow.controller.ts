@@ -23,6 +23,9 @@ export class CashFlowController {
         accountId: req.query.accountId as string,
         status: req.query.status as any,
         cycleId: req.query.cycleId as string,
+        search: req.query.search as string,
+        sortBy: req.query.sortBy as string,
+        sortOrder: req.query.sortOrder === 'asc' ? 'asc' as const : 'desc' as const,
       };
 
       const cashFlows = await cashFlowService.findAll(filters);
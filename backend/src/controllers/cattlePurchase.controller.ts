@@ -2,8 +2,43 @@ import { Request, Response } from 'express';
 import { cattlePurchaseService } from '../services/cattlePurchase.service';
 import { cattlePurchaseIntegration } from '../services/cattlePurchaseIntegration.service';
 import cattlePurchaseCashFlowService from '../services/cattlePurchaseCashFlow.service';
+import { cattlePurchaseImportService } from '../services/cattlePurchaseImport.service';
 import { AppError } from '../utils/AppError';
 import catchAsync from '../utils/catchAsync';
+import { readCursorParams } from '@/repositories/base.repository';
+
+// Converte o corpo da requisição de recepção para o formato do serviço
+function toReceptionData(body: any) {
+  const {
+    receivedWeight,
+    receivedQuantity,
+    actualQuantity,
+    freightDistance,
+    freightCostPerKm,
+    freightValue,
+    transportCompanyId,
+    unloadingDate,
+    estimatedGMD,
+    mortalityReason,
+    observations,
+    penAllocations
+  } = body;
+  
+  return {
+    receivedDate: unloadingDate ? new Date(unloadingDate) : new Date(),
+    receivedWeight: parseFloat(receivedWeight),
+    actualQuantity: parseInt(actualQuantity || receivedQuantity),
+    freightDistance: freightDistance ? parseFloat(freightDistance) : undefined,
+    freightCostPerKm: freightCostPerKm ? parseFloat(freightCostPerKm) : undefined,
+    freightValue: freightValue ? parseFloat(freightValue) : undefined,
+    transportCompanyId: transportCompanyId || undefined,
+    estimatedGMD: estimatedGMD ? parseFloat(estimatedGMD) : undefined,
+    transportMortality: undefined,
+    mortalityReason: mortalityReason || undefined,
+    notes: observations,
+    penAllocations: penAllocations || []
+  };
+}
 
 class CattlePurchaseController {
   // Criar nova compra
@@ -43,9 +78,33 @@ class CattlePurchaseController {
     });
   });
   
+  // Importar compras a partir de CSV (corpo da requisição lido em streaming)
+  importCsv = catchAsync(async (req: Request, res: Response) => {
+    if (!req.is('text/csv') && !req.is('text/plain') && !req.is('application/octet-stream')) {
+      throw new AppError('Envie o arquivo CSV no corpo da requisição com Content-Type text/csv', 415);
+    }
+    
+    const { payerAccountId, resumeFromRow, batchSize, dryRun, createMissingPartners } = req.query;
+    
+    const report = await cattlePurchaseImportService.importCsv(req, {
+      userId: (req as any).user?.id,
+      payerAccountId: payerAccountId as string | undefined,
+      resumeFromRow: resumeFromRow ? parseInt(resumeFromRow as string) : 0,
+      batchSize: batchSize ? parseInt(batchSize as string) : undefined,
+      dryRun: dryRun === 'true',
+      createMissingPartners: createMissingPartners === 'true'
+    });
+    
+    res.status(report.aborted ? 207 : 200).json({
+      status: report.aborted ? 'partial' : 'success',
+      message: `${report.imported} compra(s) importada(s), ${report.failed} com erro, ${report.duplicates} duplicada(s)`,
+      data: report
+    });
+  });
+  
   // Listar todas as compras
   findAll = catchAsync(async (req: Request, res: Response) => {
-    const { status, vendorId, cycleId, startDate, endDate, page, limit } = req.query;
+    const { status, vendorId, cycleId, startDate, endDate, search, page, limit, sortBy, sortOrder } = req.query;
     
     // Constrói filtros apenas com valores definidos
     const filters: any = {};
@@ -57,10 +116,23 @@ class CattlePurchaseController {
       if (startDate) filters.purchaseDate.gte = new Date(startDate as string);
       if (endDate) filters.purchaseDate.lte = new Date(endDate as string);
     }
+    if (search) {
+      const term = { contains: search as string, mode: 'insensitive' };
+      filters.OR = [
+        { lotCode: term },
+        { location: term },
+        { city: term },
+        { farm: term },
+        { vendor: { name: term } },
+      ];
+    }
     
     const pagination = {
       page: page ? parseInt(page as string) : 1,
-      limit: limit ? parseInt(limit as string) : 100 // Aumentado para análises
+      limit: limit ? parseInt(limit as string) : 100, // Aumentado para análises
+      sortBy: sortBy as string,
+      sortOrder: sortOrder === 'asc' ? 'asc' as const : 'desc' as const,
+      ...readCursorParams(req.query),
     };
     
     const result = await cattlePurchaseService.findAll(filters, pagination);
@@ -119,38 +191,9 @@ class CattlePurchaseController {
   // Registrar recepção (agora com alocação opcional)
   registerReception = catchAsync(async (req: Request, res: Response) => {
     const { id } = req.params;
-    const {
-      receivedWeight,
-      receivedQuantity,
-      actualQuantity,
-      freightDistance,
-      freightCostPerKm,
-      freightValue,
-      transportCompanyId,
-      unloadingDate,
-      estimatedGMD,
-      mortalityReason,
-      observations,
-      penAllocations
-    } = req.body;
-    
-    // Preparar dados para o serviço
-    const receptionData = {
-      receivedDate: unloadingDate ? new Date(unloadingDate) : new Date(),
-      receivedWeight: parseFloat(receivedWeight),
-      actualQuantity: parseInt(actualQuantity || receivedQuantity),
-      freightDistance: freightDistance ? parseFloat(freightDistance) : undefined,
-      freightCostPerKm: freightCostPerKm ? parseFloat(freightCostPerKm) : undefined,
-      freightValue: freightValue ? parseFloat(freightValue) : undefined,
-      transportCompanyId: transportCompanyId || undefined,
-      estimatedGMD: estimatedGMD ? parseFloat(estimatedGMD) : undefined,
-      transportMortality: undefined,
-      mortalityReason: mortalityReason || undefined,
-      notes: observations,
-      penAllocations: penAllocations || []
-    };
+    const { receivedQuantity, penAllocations } = req.body;
     
-    const purchase = await cattlePurchaseService.registerReception(id, receptionData);
+    const purchase = await cattlePurchaseService.registerReception(id, toReceptionData(req.body));
     
     const message = penAllocations && penAllocations.length > 0
       ? `Recepção registrada e ${receivedQuantity} animais alocados em ${penAllocations.length} curral(is)`
@@ -163,6 +206,24 @@ class CattlePurchaseController {
     });
   });
   
+  // Registrar recepção de vários lotes (comboio) em uma única requisição
+  registerReceptionBatch = catchAsync(async (req: Request, res: Response) => {
+    const { lots } = req.body;
+    
+    const result = await cattlePurchaseService.registerReceptionBatch(
+      lots.map((lot: any) => ({
+        purchaseId: lot.purchaseId,
+        ...toReceptionData(lot)
+      }))
+    );
+    
+    res.json({
+      status: 'success',
+      message: `${result.succeeded} de ${result.total} lote(s) recepcionado(s)`,
+      data: result
+    });
+  });
+  
   // Atualizar status
   updateStatus = catchAsync(async (req: Request, res: Response) => {
     const { id } = req.params;
@@ -193,6 +254,19 @@ class CattlePurchaseController {
     });
   });
   
+  // Sincronizar despesas de várias compras, ou de todas em lotes
+  syncExpensesBulk = catchAsync(async (req: Request, res: Response) => {
+    const { purchaseIds, batchSize } = req.body;
+    const userId = (req as any).user?.id;
+
+    const result = await cattlePurchaseService.syncFinancialExpensesBulk(purchaseIds, userId, batchSize);
+
+    res.json({
+      status: 'success',
+      data: result
+    });
+  });
+  
   // Registrar morte
   registerDeath = catchAsync(async (req: Request, res: Response) => {
     const { id } = req.params;
@@ -279,6 +353,19 @@ class CattlePurchaseController {
       data: purchase
     });
   });
+
+  // Confinar vários lotes recepcionados em uma única requisição
+  markAsConfinedBatch = catchAsync(async (req: Request, res: Response) => {
+    const { lots } = req.body;
+    
+    const result = await cattlePurchaseService.markAsConfinedBatch(lots);
+    
+    res.json({
+      status: 'success',
+      message: `${result.succeeded} de ${result.total} lote(s) confinado(s)`,
+      data: result
+    });
+  });
 }
 
 export const cattlePurchaseController = new CattlePurchaseController();
\ No newline at end of file
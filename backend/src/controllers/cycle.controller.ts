@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { CycleService } from '@/services/cycle.service';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const cycleService = new CycleService();
 
@@ -23,6 +24,7 @@ export class CycleController {
       limit: limit ? parseInt(limit as string) : 10,
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await cycleService.findAll(filters, pagination);
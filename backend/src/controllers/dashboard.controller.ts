@@ -1,19 +1,26 @@
 import { Request, Response } from 'express';
 import { DashboardService } from '@/services/dashboard.service';
+import { dashboardSnapshotService } from '@/services/dashboardSnapshot.service';
+import { BUCKET_SIZES, BucketSize } from '@/services/chartSeries.service';
 
 const dashboardService = new DashboardService();
 
+// Tamanho de bucket opcional (?bucket=day|week|month|quarter|year)
+const parseBucket = (value: unknown): BucketSize | undefined =>
+  BUCKET_SIZES.includes(value as BucketSize) ? (value as BucketSize) : undefined;
+
 export class DashboardController {
   /**
    * GET /dashboard/metrics
    * Retorna métricas principais do dashboard
    */
   async metrics(_req: Request, res: Response): Promise<void> {
-    const metrics = await dashboardService.getMetrics();
+    const { snapshot, source } = await dashboardSnapshotService.get();
 
+    res.set('X-Dashboard-Snapshot', source);
     res.json({
       status: 'success',
-      data: metrics,
+      data: snapshot.metrics,
     });
   }
 
@@ -22,9 +29,9 @@ export class DashboardController {
    * Retorna dados para gráficos do dashboard
    */
   async charts(req: Request, res: Response): Promise<void> {
-    const { period = 'month' } = req.query;
+    const { period = 'month', bucket } = req.query;
 
-    const charts = await dashboardService.getCharts(period as any);
+    const charts = await dashboardService.getCharts(period as any, parseBucket(bucket));
 
     res.json({
       status: 'success',
@@ -50,21 +57,22 @@ export class DashboardController {
    * Retorna todos os dados do dashboard
    */
   async index(req: Request, res: Response): Promise<void> {
-    const { period = 'month' } = req.query;
+    const { period = 'month', bucket } = req.query;
 
-    const [metrics, charts, alerts] = await Promise.all([
-      dashboardService.getMetrics(),
-      dashboardService.getCharts(period as any),
+    const [{ snapshot, source }, charts, alerts] = await Promise.all([
+      dashboardSnapshotService.get(),
+      dashboardService.getCharts(period as any, parseBucket(bucket)),
       dashboardService.getAlerts(),
     ]);
 
+    res.set('X-Dashboard-Snapshot', source);
     res.json({
       status: 'success',
       data: {
-        metrics,
+        metrics: snapshot.metrics,
         charts,
         alerts,
-        lastUpdate: new Date(),
+        lastUpdate: snapshot.computedAt,
       },
     });
   }
@@ -1,5 +1,5 @@
 import { Request, Response } from 'express';
-import { deathRecordService } from '../services/deathRecord.service';
+import { deathRecordService, MAX_DEATH_BATCH_ENTRIES } from '../services/deathRecord.service';
 import { DeathType } from '@prisma/client';
 import { AppError } from '../utils/AppError';
 import catchAsync from '../utils/catchAsync';
@@ -51,6 +51,55 @@ class DeathRecordController {
     });
   });
 
+  // Registrar várias mortes de uma vez
+  createBatch = catchAsync(async (req: Request, res: Response) => {
+    const { deathDate, entries } = req.body;
+
+    if (!Array.isArray(entries) || entries.length === 0) {
+      throw new AppError('Informe a lista de mortes em entries', 400);
+    }
+
+    if (entries.length > MAX_DEATH_BATCH_ENTRIES) {
+      throw new AppError(`Máximo de ${MAX_DEATH_BATCH_ENTRIES} registros por envio`, 400);
+    }
+
+    // Validações
+    entries.forEach((entry: any, index: number) => {
+      if (!entry?.purchaseId || !entry?.penId || !entry?.quantity || !entry?.deathType) {
+        throw new AppError(`Registro ${index + 1}: campos obrigatórios: purchaseId, penId, quantity, deathType`, 400);
+      }
+
+      if (parseInt(entry.quantity) <= 0) {
+        throw new AppError(`Registro ${index + 1}: quantidade deve ser maior que zero`, 400);
+      }
+
+      if (!Object.values(DeathType).includes(entry.deathType)) {
+        throw new AppError(`Registro ${index + 1}: tipo de morte inválido`, 400);
+      }
+    });
+
+    const result = await deathRecordService.createBatch({
+      deathDate: deathDate ? new Date(deathDate) : new Date(),
+      entries: entries.map((entry: any) => ({
+        purchaseId: entry.purchaseId,
+        penId: entry.penId,
+        quantity: parseInt(entry.quantity),
+        deathType: entry.deathType,
+        deathDate: entry.deathDate ? new Date(entry.deathDate) : undefined,
+        cause: entry.cause,
+        veterinaryNotes: entry.veterinaryNotes,
+        estimatedLoss: entry.estimatedLoss ? parseFloat(entry.estimatedLoss) : undefined
+      })),
+      userId: (req as any).user?.id
+    });
+
+    res.status(201).json({
+      status: 'success',
+      message: `${result.totalDeaths} morte(s) registrada(s) em ${result.lots.length} lote(s)`,
+      data: result
+    });
+  });
+
   // Listar registros de morte
   findAll = catchAsync(async (req: Request, res: Response) => {
     const { purchaseId, penId, startDate, endDate, deathType } = req.query;
@@ -147,7 +196,7 @@ class DeathRecordController {
 
   // Análise por período
   getAnalysisByPeriod = catchAsync(async (req: Request, res: Response) => {
-    const { startDate, endDate } = req.query;
+    const { startDate, endDate, includeRecords } = req.query;
 
     if (!startDate || !endDate) {
       throw new AppError('Datas de início e fim são obrigatórias', 400);
@@ -155,7 +204,8 @@ class DeathRecordController {
 
     const analysis = await deathRecordService.getAnalysisByPeriod(
       new Date(startDate as string),
-      new Date(endDate as string)
+      new Date(endDate as string),
+      includeRecords === 'true'
     );
 
     res.json({
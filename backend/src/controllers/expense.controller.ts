@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { ExpenseService } from '@/services/expense.service';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const expenseService = new ExpenseService();
 
@@ -42,6 +43,7 @@ export class ExpenseController {
       limit: limit ? parseInt(limit as string) : 1000, // Aumentado para análises
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await expenseService.findAll(filters, pagination);
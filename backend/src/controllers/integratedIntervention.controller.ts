@@ -1,6 +1,11 @@
 import { Request, Response } from 'express';
 import mortalityCalculationService from '@/services/mortalityCalculation.service';
 import healthProtocolIntegrationService from '@/services/healthProtocolIntegration.service';
+import {
+  healthProtocolAnalyticsService,
+  PROTOCOL_GROUP_BY,
+  ProtocolGroupBy
+} from '@/services/healthProtocolAnalytics.service';
 import { logger } from '@/config/logger';
 
 export class IntegratedInterventionController {
@@ -281,6 +286,61 @@ export class IntegratedInterventionController {
     }
   }
 
+  /**
+   * Resultados dos protocolos sanitários por período, protocolo e curral
+   */
+  async getProtocolAnalytics(req: Request, res: Response) {
+    try {
+      const groupBy = (req.query.groupBy as ProtocolGroupBy) || 'protocol';
+      if (!PROTOCOL_GROUP_BY.includes(groupBy)) {
+        return res.status(400).json({
+          error: `groupBy deve ser um de: ${PROTOCOL_GROUP_BY.join(', ')}`
+        });
+      }
+
+      const outcomes = await healthProtocolAnalyticsService.getOutcomes({
+        startDate: req.query.startDate ? new Date(req.query.startDate as string) : undefined,
+        endDate: req.query.endDate ? new Date(req.query.endDate as string) : undefined,
+        productName: req.query.productName as string,
+        interventionType: req.query.interventionType as string,
+        penId: req.query.penId as string,
+        purchaseId: req.query.lotId as string,
+        groupBy
+      });
+
+      res.json({
+        success: true,
+        data: outcomes
+      });
+
+    } catch (error: any) {
+      logger.error('Erro ao buscar analítico de protocolos:', error);
+      res.status(500).json({
+        error: error.message || 'Erro ao buscar analítico de protocolos'
+      });
+    }
+  }
+
+  /**
+   * Atualiza os fatos de protocolos (incremental; `full=true` reconstrói a tabela)
+   */
+  async refreshProtocolAnalytics(req: Request, res: Response) {
+    try {
+      const result = await healthProtocolAnalyticsService.refresh(req.query.full === 'true');
+
+      res.json({
+        success: true,
+        data: result
+      });
+
+    } catch (error: any) {
+      logger.error('Erro ao atualizar analítico de protocolos:', error);
+      res.status(500).json({
+        error: error.message || 'Erro ao atualizar analítico de protocolos'
+      });
+    }
+  }
+
   /**
    * Registra intervenção integrada (genérica)
    */
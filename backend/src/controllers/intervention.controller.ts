@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
-import { interventionService } from '@/services/intervention.service';
+import { interventionService, InterventionTimelineType } from '@/services/intervention.service';
+import { weighingSessionService } from '@/services/weighingSession.service';
 import catchAsync from '@/utils/catchAsync';
 import { AppError } from '@/utils/AppError';
 
@@ -78,43 +79,65 @@ class InterventionController {
     });
   });
 
+  // Registrar sessão de pesagem (pesos individuais exportados pela balança)
+  createWeighingSession = catchAsync(async (req: Request, res: Response) => {
+    const report = await weighingSessionService.ingest({
+      readingDate: new Date(req.body.readingDate),
+      entries: req.body.entries.map((entry: any, index: number) => ({
+        row: entry.row ?? index + 1,
+        cattlePurchaseId: entry.cattlePurchaseId,
+        lotCode: entry.lotCode,
+        animalTag: entry.animalTag,
+        weight: parseFloat(entry.weight)
+      })),
+      notes: req.body.notes,
+      dryRun: req.body.dryRun === true || req.body.dryRun === 'true'
+    }, req.user?.id || 'system');
+
+    res.status(report.dryRun ? 200 : 201).json({
+      status: 'success',
+      message: `${report.accepted} pesos registrados em ${report.lots.length} lote(s)`,
+      data: report
+    });
+  });
+
   // Buscar histórico de intervenções
   getInterventionHistory = catchAsync(async (req: Request, res: Response) => {
-    const { cattlePurchaseId, penId, startDate, endDate, type } = req.query;
-
-    console.log('🔍 [InterventionController] Recebendo requisição para histórico:', {
-      cattlePurchaseId, penId, startDate, endDate, type
-    });
+    const { cattlePurchaseId, penId, startDate, endDate, type, cursor, limit } = req.query;
 
     const filters = {
       cattlePurchaseId: cattlePurchaseId as string,
       penId: penId as string,
       startDate: startDate ? new Date(startDate as string) : undefined,
       endDate: endDate ? new Date(endDate as string) : undefined,
-      type: type as 'health' | 'mortality' | 'movement' | 'weight' | undefined
+      type: type as InterventionTimelineType | undefined,
+      cursor: cursor as string | undefined,
+      limit: limit ? parseInt(limit as string) : undefined
     };
 
-    console.log('📋 [InterventionController] Filtros processados:', filters);
-
     const history = await interventionService.getInterventionHistory(filters);
 
-    console.log('📊 [InterventionController] Resultado do serviço:', {
-      count: history.length,
-      sample: history.slice(0, 2)
-    });
-
     res.json({
       status: 'success',
-      results: history.length,
-      data: history
+      results: history.items.length,
+      data: history.items,
+      pagination: {
+        limit: history.limit,
+        hasNext: history.hasNext,
+        nextCursor: history.nextCursor
+      }
     });
   });
 
   // Obter estatísticas de intervenções
   getInterventionStatistics = catchAsync(async (req: Request, res: Response) => {
-    const { cycleId } = req.query;
+    const { startDate, endDate } = req.query;
 
-    const statistics = await interventionService.getInterventionStatistics(cycleId as string);
+    // Período do ciclo: compras pela data de compra, demais registros pela data do evento
+    const statistics = await interventionService.getInterventionStatistics({
+      startDate: startDate ? new Date(startDate as string) : undefined,
+      endDate: endDate ? new Date(endDate as string) : undefined
+    });
 
     res.json({
       status: 'success',
@@ -0,0 +1,28 @@
+import { Request, Response } from 'express';
+import { offlineSyncService } from '@/services/offlineSync.service';
+import { catchAsync } from '@/utils/catchAsync';
+
+export class OfflineSyncController {
+  /**
+   * Aplica a fila de operações offline e devolve o resultado de cada uma
+   */
+  applyOperations = catchAsync(async (req: Request, res: Response) => {
+    const results = await offlineSyncService.applyOperations(req.body.operations, {
+      id: req.user!.id,
+      role: req.user!.role
+    });
+
+    const summary = results.reduce<Record<string, number>>((acc, result) => {
+      acc[result.status] = (acc[result.status] || 0) + 1;
+      return acc;
+    }, {});
+
+    res.json({
+      status: 'success',
+      data: {
+        results,
+        summary
+      }
+    });
+  });
+}
@@ -1,6 +1,7 @@
 import { Request, Response } from 'express';
 import { PartnerService } from '@/services/partner.service';
 import { PartnerType } from '@prisma/client';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const partnerService = new PartnerService();
 
@@ -37,6 +38,7 @@ export class PartnerController {
       limit: limit ? parseInt(limit as string) : 100,
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await partnerService.findAll(filters, pagination);
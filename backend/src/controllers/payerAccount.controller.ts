@@ -1,6 +1,7 @@
 import { Request, Response } from 'express';
 import { PayerAccountService } from '@/services/payerAccount.service';
 import { AccountType } from '@prisma/client';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const payerAccountService = new PayerAccountService();
 
@@ -23,6 +24,7 @@ export class PayerAccountController {
       limit: limit ? parseInt(limit as string) : 10,
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await payerAccountService.findAll(filters, pagination);
@@ -152,16 +154,20 @@ export class PayerAccountController {
 
   /**
    * GET /payer-accounts/:id/transactions
-   * Retorna transações da conta
+   * Retorna o extrato da conta, paginado por cursor
    */
   async transactions(req: Request, res: Response): Promise<void> {
     const { id } = req.params;
-    const { startDate, endDate } = req.query;
+    const { startDate, endDate, cursor, limit } = req.query;
     
     const transactions = await payerAccountService.getTransactions(
       id,
       startDate ? new Date(startDate as string) : undefined,
-      endDate ? new Date(endDate as string) : undefined
+      endDate ? new Date(endDate as string) : undefined,
+      {
+        cursor: cursor as string | undefined,
+        limit: limit ? parseInt(limit as string) : undefined,
+      }
     );
 
     res.json({
@@ -169,4 +175,20 @@ export class PayerAccountController {
       data: transactions,
     });
   }
+
+  /**
+   * GET /payer-accounts/:id/balance
+   * Retorna o saldo da conta em uma data
+   */
+  async balanceAt(req: Request, res: Response): Promise<void> {
+    const { id } = req.params;
+    const { date } = req.query;
+
+    const balance = await payerAccountService.getBalanceAt(id, date ? new Date(date as string) : new Date());
+
+    res.json({
+      status: 'success',
+      data: balance,
+    });
+  }
 } 
\ No newline at end of file
@@ -1,6 +1,7 @@
 import { Request, Response } from 'express';
 import { PenService } from '@/services/pen.service';
 import { PenStatus, PenType } from '@prisma/client';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const penService = new PenService();
 
@@ -33,8 +34,10 @@ export class PenController {
     const pagination = {
       page: page ? parseInt(page as string) : 1,
       limit: limit ? parseInt(limit as string) : 100,
-      sortBy: sortBy as string || 'createdAt',
-      sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      // Sem `sortBy` os currais seguem a ordem do número
+      sortBy: sortBy as string,
+      sortOrder: sortOrder as 'asc' | 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await penService.findAll(filters, pagination);
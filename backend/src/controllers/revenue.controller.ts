@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { RevenueService } from '@/services/revenue.service';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const revenueService = new RevenueService();
 
@@ -40,6 +41,7 @@ export class RevenueController {
       limit: limit ? parseInt(limit as string) : 1000, // Aumentado para análises
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await revenueService.findAll(filters, pagination);
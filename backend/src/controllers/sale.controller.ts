@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { SaleService } from '@/services/sale.service';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const saleService = new SaleService();
 
@@ -36,6 +37,7 @@ export class SaleController {
       limit: limit ? parseInt(limit as string) : 10,
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await saleService.findAll(filters, pagination);
@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { SaleRecordService } from '@/services/saleRecord.service';
+import { readCursorParams } from '@/repositories/base.repository';
 
 const saleRecordService = new SaleRecordService();
 
@@ -26,6 +27,7 @@ export class SaleRecordController {
       limit: limit ? parseInt(limit as string) : 100, // Aumentado para análises
       sortBy: sortBy as string || 'createdAt',
       sortOrder: sortOrder as 'asc' | 'desc' || 'desc',
+      ...readCursorParams(req.query),
     };
 
     const result = await saleRecordService.findAll(filters, pagination);
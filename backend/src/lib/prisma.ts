@@ -1,5 +1,6 @@
 import { PrismaClient } from '@prisma/client';
 import { logger } from '../config/logger';
+import { deferDomainEvents } from '../utils/domainEvents';
 
 /**
  * Sistema Centralizado de Conexão com Banco de Dados
@@ -224,9 +225,9 @@ class DatabaseConnection {
 
     for (let attempt = 1; attempt <= options.maxRetries; attempt++) {
       try {
-        return await client.$transaction(async (tx) => {
+        return await deferDomainEvents(() => client.$transaction(async (tx) => {
           return await fn(tx as PrismaClient);
-        });
+        }));
       } catch (error) {
         lastError = error as Error;
         const errorMessage = error instanceof Error ? error.message : String(error);
@@ -281,8 +282,16 @@ async function getGlobalClient(): Promise<PrismaClient> {
 // Exporta cliente Prisma para uso direto (compatibilidade)
 export const prisma = new Proxy({} as PrismaClient, {
   get(_target, prop) {
-    // Para propriedades especiais do Prisma
-    if (prop === '$connect' || prop === '$disconnect' || prop === '$transaction' || prop === '$queryRaw' || prop === '$executeRaw' || prop === '$use' || prop === '$on' || prop === '$extends') {
+    // Transações publicam os eventos de domínio só depois do commit
+    if (prop === '$transaction') {
+      return async (...args: any[]) => {
+        const client = await getGlobalClient();
+        return deferDomainEvents(() => (client.$transaction as any)(...args));
+      };
+    }
+
+    // Para propriedades especiais do Prisma ($queryRaw, $executeRawUnsafe, $use, ...)
+    if (typeof prop === 'string' && prop.startsWith('$')) {
       return async (...args: any[]) => {
         const client = await getGlobalClient();
         return (client as any)[prop](...args);
@@ -301,6 +310,25 @@ export const prisma = new Proxy({} as PrismaClient, {
   },
 });
 
+// Tarefas executadas antes de desconectar no encerramento (ex.: gravar buffers pendentes)
+const beforeDisconnectHooks: Array<() => Promise<void>> = [];
+let beforeDisconnectPromise: Promise<void> | null = null;
+
+function runBeforeDisconnectHooks(): Promise<void> {
+  if (!beforeDisconnectPromise) {
+    beforeDisconnectPromise = (async () => {
+      for (const hook of beforeDisconnectHooks) {
+        try {
+          await hook();
+        } catch (error) {
+          logger.error('Erro em tarefa de encerramento:', error);
+        }
+      }
+    })();
+  }
+  return beforeDisconnectPromise;
+}
+
 // Exporta funções utilitárias
 export const db = {
   // Obtém cliente Prisma
@@ -332,22 +360,30 @@ export const db = {
   getStats() {
     return databaseConnection.getStats();
   },
+
+  // Registra uma tarefa a executar antes da desconexão no encerramento
+  onBeforeDisconnect(hook: () => Promise<void>): void {
+    beforeDisconnectHooks.push(hook);
+  },
 };
 
 // Tratamento de sinais do processo
 process.on('SIGINT', async () => {
   logger.info('SIGINT recebido, desconectando do banco...');
+  await runBeforeDisconnectHooks();
   await databaseConnection.disconnect();
   process.exit(0);
 });
 
 process.on('SIGTERM', async () => {
   logger.info('SIGTERM recebido, desconectando do banco...');
+  await runBeforeDisconnectHooks();
   await databaseConnection.disconnect();
   process.exit(0);
 });
 
 process.on('beforeExit', async () => {
+  await runBeforeDisconnectHooks();
   await databaseConnection.disconnect();
 });
 
@@ -1,104 +1,280 @@
 import { Request, Response, NextFunction } from 'express';
-import { prisma } from '@/config/database';
+import { Prisma } from '@prisma/client';
+import { prisma, db } from '@/config/database';
+import { logger } from '@/config/logger';
 
-interface AuditLog {
+interface AuditEntry {
   userId: string;
-  userEmail: string;
   action: string;
   entity: string;
-  entityId?: string;
-  oldData?: any;
-  newData?: any;
+  entityId: string;
+  newData?: Prisma.InputJsonValue;
   ipAddress: string;
   userAgent: string;
-  timestamp: Date;
+  createdAt: Date;
+  attempts: number;
 }
 
-// Middleware para registrar todas as operações
-export async function auditLog(
-  req: Request,
-  res: Response,
-  next: NextFunction
-): Promise<void> {
-  // Captura dados antes da operação
-  const startTime = Date.now();
-  const originalSend = res.json;
-
-  // Extrai informações da requisição
-  const auditData: Partial<AuditLog> = {
-    userId: req.user?.id || 'anonymous',
-    userEmail: req.user?.email || 'anonymous',
-    action: `${req.method} ${req.path}`,
-    ipAddress: req.ip || req.connection.remoteAddress || 'unknown',
-    userAgent: req.get('user-agent') || 'unknown',
-    timestamp: new Date()
+// Capacidade do buffer em memória; acima disso os registros mais antigos são descartados
+const AUDIT_BUFFER_CAPACITY = 5000;
+// Grava quando o buffer atinge esse tamanho...
+const AUDIT_FLUSH_SIZE = 200;
+// ...ou a cada intervalo, o que vier primeiro
+const AUDIT_FLUSH_INTERVAL_MS = 2000;
+const AUDIT_MAX_ATTEMPTS = 3;
+// Payloads maiores que isso são resumidos
+const AUDIT_MAX_PAYLOAD_BYTES = 8 * 1024;
+const AUDIT_MAX_DEPTH = 5;
+
+const SENSITIVE_KEYS = ['password', 'currentpassword', 'newpassword', 'token', 'refreshtoken', 'authorization', 'secret'];
+
+const MODIFYING_METHODS = ['POST', 'PUT', 'PATCH', 'DELETE'];
+
+/**
+ * Remove campos sensíveis e limita a profundidade do payload
+ */
+function redact(value: any, depth = 0): any {
+  if (value === null || typeof value !== 'object') return value;
+  if (depth >= AUDIT_MAX_DEPTH) return '[truncado]';
+  if (Array.isArray(value)) return value.map(item => redact(item, depth + 1));
+
+  const result: Record<string, any> = {};
+  for (const [key, item] of Object.entries(value)) {
+    result[key] = SENSITIVE_KEYS.includes(key.toLowerCase()) ? '[redacted]' : redact(item, depth + 1);
+  }
+  return result;
+}
+
+/**
+ * Prepara o payload para gravação: sem dados sensíveis e com tamanho limitado.
+ * Payloads grandes (ex.: importações) viram um resumo com as chaves e um trecho inicial.
+ */
+export function limitAuditPayload(payload: any): { value: any; truncated: boolean } {
+  if (payload === undefined || payload === null) return { value: null, truncated: false };
+
+  const redacted = redact(payload);
+  const serialized = JSON.stringify(redacted) ?? 'null';
+
+  if (Buffer.byteLength(serialized) <= AUDIT_MAX_PAYLOAD_BYTES) {
+    return { value: redacted, truncated: false };
+  }
+
+  return {
+    value: {
+      truncated: true,
+      sizeBytes: Buffer.byteLength(serialized),
+      keys: typeof redacted === 'object' && !Array.isArray(redacted) ? Object.keys(redacted).slice(0, 50) : undefined,
+      items: Array.isArray(redacted) ? redacted.length : undefined,
+      preview: serialized.slice(0, 1024),
+    },
+    truncated: true,
   };
+}
 
-  // Determina a entidade baseada no path
-  const pathParts = req.path.split('/');
-  if (pathParts.length >= 3) {
-    auditData.entity = pathParts[3]; // Ex: /api/v1/cattle-purchases -> cattle-purchases
-    if (pathParts.length >= 4) {
-      auditData.entityId = pathParts[4]; // ID do registro se houver
+/**
+ * Grava logs de auditoria em lote a partir de um ring buffer em memória.
+ * Evita um insert por requisição competindo com as consultas de negócio pelo pool.
+ */
+export class AuditLogWriter {
+  private buffer: Array<AuditEntry | undefined> = new Array(AUDIT_BUFFER_CAPACITY);
+  private head = 0; // Posição do registro mais antigo
+  private size = 0;
+  private flushing: Promise<void> | null = null;
+  private timer: NodeJS.Timeout | null = null;
+  private stopped = false;
+
+  private stats = {
+    enqueued: 0,
+    written: 0,
+    dropped: 0,
+    failedBatches: 0,
+    truncatedPayloads: 0,
+    flushes: 0,
+    lastFlushAt: null as Date | null,
+    lastError: null as string | null,
+  };
+
+  start(): void {
+    if (this.timer) return;
+    this.stopped = false;
+    this.timer = setInterval(() => this.flush(), AUDIT_FLUSH_INTERVAL_MS);
+    this.timer.unref?.();
+  }
+
+  /**
+   * Enfileira um registro. Com o buffer cheio, o mais antigo é descartado e contabilizado.
+   */
+  enqueue(entry: Omit<AuditEntry, 'attempts'>, truncated = false): void {
+    if (this.stopped) {
+      this.stats.dropped++;
+      return;
+    }
+
+    if (!this.timer) this.start();
+
+    if (this.size === AUDIT_BUFFER_CAPACITY) {
+      this.shift(1);
+      this.stats.dropped++;
+    }
+
+    this.buffer[(this.head + this.size) % AUDIT_BUFFER_CAPACITY] = { ...entry, attempts: 0 };
+    this.size++;
+    this.stats.enqueued++;
+    if (truncated) this.stats.truncatedPayloads++;
+
+    if (this.size >= AUDIT_FLUSH_SIZE) {
+      this.flush();
     }
   }
 
-  // Para requisições de modificação, captura o body
-  if (['POST', 'PUT', 'PATCH', 'DELETE'].includes(req.method)) {
-    auditData.newData = req.body;
+  /**
+   * Grava o que estiver no buffer. Só um flush roda por vez; chamadas concorrentes aguardam o atual.
+   */
+  flush(): Promise<void> {
+    if (this.flushing) return this.flushing;
+    if (this.size === 0) return Promise.resolve();
+
+    this.flushing = this.writeBatches().finally(() => {
+      this.flushing = null;
+    });
+    return this.flushing;
   }
 
-  // Sobrescreve res.json para capturar resposta
-  res.json = function(data: any) {
-    res.json = originalSend; // Restaura função original
+  /**
+   * Para o timer e grava tudo o que restou (encerramento do servidor)
+   */
+  async stop(): Promise<void> {
+    this.stopped = true;
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+
+    // Aguarda um flush em andamento e grava o restante
+    while (this.size > 0 || this.flushing) {
+      const before = this.stats.written + this.stats.dropped;
+      await this.flush();
+      if (this.stats.written + this.stats.dropped === before && this.size > 0) {
+        // Nenhum progresso (banco indisponível): descarta para não travar o encerramento
+        this.stats.dropped += this.size;
+        this.shift(this.size);
+      }
+    }
+
+    logger.info(`[Audit] Buffer descarregado: ${this.stats.written} gravados, ${this.stats.dropped} descartados`);
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      buffered: this.size,
+      capacity: AUDIT_BUFFER_CAPACITY,
+    };
+  }
+
+  private shift(count: number): AuditEntry[] {
+    const entries: AuditEntry[] = [];
+    for (let i = 0; i < count; i++) {
+      entries.push(this.buffer[this.head]!);
+      this.buffer[this.head] = undefined;
+      this.head = (this.head + 1) % AUDIT_BUFFER_CAPACITY;
+    }
+    this.size -= count;
+    return entries;
+  }
+
+  private async writeBatches(): Promise<void> {
+    while (this.size > 0) {
+      const batch = this.shift(Math.min(this.size, AUDIT_FLUSH_SIZE));
 
-    // Log assíncrono para não bloquear resposta
-    setImmediate(async () => {
       try {
-        const responseTime = Date.now() - startTime;
-
-        await prisma.auditLog.create({
-          data: {
-            userId: auditData.userId || 'system',
-            action: auditData.action || 'unknown',
-            entity: auditData.entity || 'unknown',
-            entityId: auditData.entityId,
-            details: JSON.stringify({
-              request: {
-                method: req.method,
-                path: req.path,
-                query: req.query,
-                body: req.body,
-                headers: {
-                  'user-agent': req.get('user-agent'),
-                  'content-type': req.get('content-type')
-                }
-              },
-              response: {
-                statusCode: res.statusCode,
-                data: res.statusCode === 200 ? data : undefined,
-                responseTime: `${responseTime}ms`
-              },
-              user: {
-                id: req.user?.id,
-                email: req.user?.email,
-                role: req.user?.role
-              },
-              metadata: {
-                ipAddress: auditData.ipAddress,
-                timestamp: auditData.timestamp
-              }
-            })
-          }
+        const { count } = await prisma.auditLog.createMany({
+          data: batch.map(({ attempts: _attempts, ...entry }) => entry),
         });
-
-        console.log(`[Audit] ${req.user?.email || 'anonymous'} - ${req.method} ${req.path} - ${res.statusCode} - ${responseTime}ms`);
-      } catch (error) {
-        console.error('[Audit] Erro ao registrar auditoria:', error);
+        this.stats.written += count;
+        this.stats.flushes++;
+        this.stats.lastFlushAt = new Date();
+      } catch (error: any) {
+        this.stats.failedBatches++;
+        this.stats.lastError = error.message;
+        logger.error('[Audit] Erro ao gravar lote de auditoria:', error);
+        this.requeue(batch);
+        // Tenta de novo no próximo ciclo
+        return;
       }
-    });
+    }
+  }
+
+  /**
+   * Devolve um lote com falha para o início do buffer, respeitando o limite de tentativas e a capacidade
+   */
+  private requeue(batch: AuditEntry[]): void {
+    const retry = batch
+      .map(entry => ({ ...entry, attempts: entry.attempts + 1 }))
+      .filter(entry => entry.attempts < AUDIT_MAX_ATTEMPTS);
+
+    this.stats.dropped += batch.length - retry.length;
+
+    const space = AUDIT_BUFFER_CAPACITY - this.size;
+    const kept = retry.slice(retry.length - Math.min(space, retry.length));
+    this.stats.dropped += retry.length - kept.length;
+
+    for (let i = kept.length - 1; i >= 0; i--) {
+      this.head = (this.head - 1 + AUDIT_BUFFER_CAPACITY) % AUDIT_BUFFER_CAPACITY;
+      this.buffer[this.head] = kept[i];
+      this.size++;
+    }
+  }
+}
+
+export const auditLogWriter = new AuditLogWriter();
+
+// Descarrega o buffer antes de o banco ser desconectado no encerramento
+db.onBeforeDisconnect(() => auditLogWriter.stop());
+
+// Middleware para registrar as operações de escrita
+export function auditLog(
+  req: Request,
+  res: Response,
+  next: NextFunction
+): void {
+  if (!MODIFYING_METHODS.includes(req.method)) {
+    return next();
+  }
+
+  const startTime = Date.now();
+  const originalJson = res.json;
+  const path = req.originalUrl.split('?')[0];
+
+  // Determina a entidade baseada no path
+  // Ex: /api/v1/cattle-purchases/123 -> cattle-purchases / 123
+  const pathParts = path.split('/');
+  const entity = pathParts[3] || 'unknown';
+  const entityId = pathParts[4] || '';
+
+  // Sobrescreve res.json para registrar após a resposta
+  res.json = function(data: any) {
+    res.json = originalJson; // Restaura função original
+
+    const { value: body, truncated } = limitAuditPayload(req.body);
+
+    auditLogWriter.enqueue({
+      userId: req.user?.id || 'anonymous',
+      action: `${req.method} ${path}`,
+      entity,
+      entityId,
+      newData: {
+        body,
+        query: req.query as Prisma.InputJsonValue,
+        statusCode: res.statusCode,
+        durationMs: Date.now() - startTime,
+      },
+      ipAddress: req.ip || req.socket.remoteAddress || 'unknown',
+      userAgent: req.get('user-agent') || 'unknown',
+      createdAt: new Date(),
+    }, truncated);
 
-    return originalSend.call(res, data);
+    return originalJson.call(res, data);
   };
 
   next();
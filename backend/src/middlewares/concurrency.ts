@@ -20,6 +20,28 @@ export async function handleConcurrency(
   next();
 }
 
+/**
+ * Indica se o registro foi alterado no servidor depois da versão que o cliente conhecia
+ * (`lastUpdatedAt`). Sem uma das datas não há como detectar o conflito.
+ */
+export function hasConcurrentUpdate(
+  serverUpdatedAt?: Date | string | null,
+  clientLastUpdatedAt?: Date | string | null
+): boolean {
+  if (!serverUpdatedAt || !clientLastUpdatedAt) {
+    return false;
+  }
+
+  const server = new Date(serverUpdatedAt).getTime();
+  const client = new Date(clientLastUpdatedAt).getTime();
+
+  if (Number.isNaN(server) || Number.isNaN(client)) {
+    return false;
+  }
+
+  return server > client;
+}
+
 // Middleware para operações financeiras críticas com lock
 export async function financialLock(
   req: Request,
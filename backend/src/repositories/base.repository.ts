@@ -1,23 +1,60 @@
-import { PrismaClient } from '@prisma/client';
+import { Prisma, PrismaClient } from '@prisma/client';
 import { prisma } from '@/config/database';
+import { ValidationError } from '@/utils/AppError';
+
+// Como calcular `total`: contagem exata, estimativa das estatísticas do Postgres ou nenhuma
+export type CountMode = 'exact' | 'estimated' | 'none';
 
 export interface PaginationParams {
   page: number;
   limit: number;
   orderBy?: string;
   orderDirection?: 'asc' | 'desc';
+  // Nomes usados pelos controllers (`?sortBy=&sortOrder=`)
+  sortBy?: string;
+  sortOrder?: 'asc' | 'desc';
+  // Cursor devolvido em `nextCursor`: a página seguinte é buscada por keyset, sem OFFSET
+  cursor?: string;
+  count?: CountMode;
 }
 
 export interface PaginatedResult<T> {
   items: T[];
-  total: number;
+  // `null` quando a contagem foi dispensada (`count=none`)
+  total: number | null;
   page: number;
   limit: number;
-  totalPages: number;
+  totalPages: number | null;
   hasNext: boolean;
   hasPrev: boolean;
+  nextCursor?: string | null;
+}
+
+interface SortSpec {
+  field: string;
+  direction: 'asc' | 'desc';
 }
 
+interface CursorPayload extends SortSpec {
+  value: unknown;
+  isDate?: boolean;
+  id: string;
+}
+
+const encodeCursor = (payload: CursorPayload): string =>
+  Buffer.from(JSON.stringify(payload)).toString('base64url');
+
+const isEmptyWhere = (where: any): boolean =>
+  !where || Object.values(where).every(value => value === undefined);
+
+/**
+ * Lê `cursor` e `count` da query string no formato esperado por `PaginationParams`
+ */
+export const readCursorParams = (query: any): Pick<PaginationParams, 'cursor' | 'count'> => ({
+  cursor: typeof query?.cursor === 'string' && query.cursor ? query.cursor : undefined,
+  count: ['exact', 'estimated', 'none'].includes(query?.count) ? query.count : undefined,
+});
+
 export interface QueryOptions {
   where?: any;
   include?: any;
@@ -28,6 +65,10 @@ export interface QueryOptions {
 export abstract class BaseRepository<T> {
   protected prisma: PrismaClient;
   protected modelName: string;
+  // Campos aceitos na ordenação vinda da query string; os demais caem no padrão
+  protected sortableFields: string[] = ['createdAt', 'updatedAt'];
+  protected defaultSort: SortSpec = { field: 'createdAt', direction: 'desc' };
+  protected defaultLimit = 50;
 
   constructor(modelName: string) {
     this.prisma = prisma;
@@ -63,44 +104,182 @@ export abstract class BaseRepository<T> {
     where: any = {},
     pagination?: PaginationParams,
     options?: QueryOptions
+  ): Promise<PaginatedResult<T>> {
+    return this.paginate(where, pagination, options);
+  }
+
+  /**
+   * Página ordenada de forma estável (campo pedido + `id` como desempate).
+   *
+   * Com `cursor` a busca continua a partir da última linha da página anterior
+   * (`(campo, id) > (valor, id)`), então o custo não cresce com a profundidade como
+   * no OFFSET. Uma linha a mais é lida para saber se há próxima página sem depender
+   * do `count`, que pode ser exato, estimado ou dispensado.
+   */
+  protected async paginate(
+    where: any = {},
+    pagination?: PaginationParams,
+    options: QueryOptions = {}
   ): Promise<PaginatedResult<T>> {
     const page = pagination?.page || 1;
-    const limit = pagination?.limit || 50;
-    const skip = (page - 1) * limit;
-
-    const orderBy = pagination?.orderBy
-      ? { [pagination.orderBy]: pagination.orderDirection || 'desc' }
-      : { createdAt: 'desc' };
-
-    // Debug para identificar o problema
-    console.log('BaseRepository.findAll - modelName:', this.modelName);
-    console.log('BaseRepository.findAll - where:', JSON.stringify(where, null, 2));
-    console.log('BaseRepository.findAll - options:', JSON.stringify(options, null, 2));
-    
-    const [items, total] = await Promise.all([
-      this.model.findMany({
-        ...options,
-        where,
-        skip,
-        take: limit,
-        orderBy,
-      }),
-      this.model.count({ where }),
+    const limit = pagination?.limit || this.defaultLimit;
+    const sort = this.resolveSort(pagination);
+    const cursor = pagination?.cursor ? this.decodeCursor(pagination.cursor, sort) : null;
+
+    const query: any = {
+      ...options,
+      where: cursor ? { AND: [where, this.buildKeysetWhere(sort, cursor)] } : where,
+      take: limit + 1,
+      orderBy: this.buildOrderBy(pagination),
+    };
+    if (!cursor) {
+      query.skip = (page - 1) * limit;
+    }
+    if (options.select) {
+      // O cursor precisa do campo de ordenação e do id
+      query.select = { ...options.select, [sort.field]: true, id: true };
+    }
+
+    const [rows, total] = await Promise.all([
+      this.model.findMany(query),
+      this.countRows(where, pagination?.count),
     ]);
 
-    const totalPages = Math.ceil(total / limit);
+    const hasNext = rows.length > limit;
+    const items = hasNext ? rows.slice(0, limit) : rows;
+    const last: any = items[items.length - 1];
 
     return {
       items,
       total,
       page,
       limit,
-      totalPages,
-      hasNext: page < totalPages,
-      hasPrev: page > 1,
+      totalPages: total === null ? null : Math.ceil(total / limit),
+      hasNext,
+      hasPrev: Boolean(cursor) || page > 1,
+      nextCursor: hasNext && last ? this.buildCursor(sort, last) : null,
     };
   }
 
+  /**
+   * Ordenação pedida pelo cliente, restrita a `sortableFields`
+   */
+  protected resolveSort(pagination?: PaginationParams): SortSpec {
+    const field = pagination?.orderBy || pagination?.sortBy;
+    const direction = pagination?.orderDirection || pagination?.sortOrder || this.defaultSort.direction;
+
+    if (!field || !this.sortableFields.includes(field)) {
+      return this.defaultSort;
+    }
+
+    return { field, direction };
+  }
+
+  /**
+   * Ordenação pedida pelo cliente, com o `id` como desempate para que a ordem
+   * seja estável entre páginas
+   */
+  protected buildOrderBy(pagination?: PaginationParams): any {
+    const { field, direction } = this.resolveSort(pagination);
+    return [{ [field]: direction }, { id: direction }];
+  }
+
+  protected buildCursor(sort: SortSpec, row: any): string {
+    const value = row[sort.field] ?? null;
+    return encodeCursor({
+      ...sort,
+      value: value instanceof Date ? value.toISOString() : value !== null && typeof value === 'object' ? String(value) : value,
+      isDate: value instanceof Date || undefined,
+      id: row.id,
+    });
+  }
+
+  protected decodeCursor(cursor: string, sort: SortSpec): CursorPayload {
+    let payload: CursorPayload;
+    try {
+      payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    } catch {
+      throw new ValidationError('Cursor de paginação inválido');
+    }
+
+    if (!payload?.id || payload.field !== sort.field || payload.direction !== sort.direction) {
+      throw new ValidationError('Cursor de paginação não corresponde à ordenação pedida');
+    }
+
+    return payload;
+  }
+
+  /**
+   * Linhas depois do cursor na ordem `(campo, id)`. No Postgres os NULLs vêm por
+   * último em ASC e primeiro em DESC; os ramos com `null` só existem para campos opcionais.
+   */
+  protected buildKeysetWhere({ field, direction }: SortSpec, cursor: CursorPayload): any {
+    const op = direction === 'desc' ? 'lt' : 'gt';
+    const nullable = this.isNullableField(field);
+    const value = cursor.value === null ? null : cursor.isDate ? new Date(cursor.value as string) : cursor.value;
+
+    if (value === null) {
+      const sameNull = { [field]: null, id: { [op]: cursor.id } };
+      return direction === 'desc' ? { OR: [sameNull, { [field]: { not: null } }] } : sameNull;
+    }
+
+    const after: any[] = [
+      { [field]: { [op]: value } },
+      { [field]: value, id: { [op]: cursor.id } },
+    ];
+    if (nullable && direction === 'asc') {
+      after.push({ [field]: null });
+    }
+
+    return { OR: after };
+  }
+
+  /**
+   * `count` exato, estimado (`pg_class.reltuples`, só sem filtros) ou dispensado
+   */
+  protected async countRows(where: any, mode: CountMode = 'exact'): Promise<number | null> {
+    if (mode === 'none') {
+      return null;
+    }
+
+    if (mode === 'estimated' && isEmptyWhere(where)) {
+      const estimate = await this.estimateRowCount();
+      if (estimate !== null) {
+        return estimate;
+      }
+    }
+
+    return this.model.count({ where });
+  }
+
+  protected async estimateRowCount(): Promise<number | null> {
+    const rows = await this.prisma.$queryRaw<Array<{ estimate: bigint | number }>>`
+      SELECT reltuples::bigint AS estimate
+      FROM pg_class
+      WHERE oid = to_regclass(quote_ident(${this.tableName}))
+    `;
+    const estimate = Number(rows[0]?.estimate ?? -1);
+
+    // reltuples é -1 em tabelas que nunca passaram por ANALYZE
+    return estimate >= 0 ? estimate : null;
+  }
+
+  private get modelMeta() {
+    return Prisma.dmmf.datamodel.models.find(
+      model => model.name.toLowerCase() === this.modelName.toLowerCase()
+    );
+  }
+
+  protected get tableName(): string {
+    const meta = this.modelMeta;
+    return meta?.dbName || meta?.name || this.modelName;
+  }
+
+  private isNullableField(field: string): boolean {
+    const meta = this.modelMeta?.fields.find(candidate => candidate.name === field);
+    return meta ? !meta.isRequired : false;
+  }
+
   async create(data: any): Promise<T> {
     return await this.model.create({ data });
   }
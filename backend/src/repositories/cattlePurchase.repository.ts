@@ -1,82 +1,75 @@
 import { CattlePurchase, PurchaseStatus, Prisma } from '@prisma/client';
-import { BaseRepository } from './base.repository';
+import { BaseRepository, PaginationParams, QueryOptions } from './base.repository';
+
+export const CATTLE_PURCHASE_SORT_FIELDS = [
+  'createdAt',
+  'updatedAt',
+  'lotCode',
+  'purchaseDate',
+  'initialQuantity',
+  'currentQuantity',
+  'purchaseWeight',
+  'pricePerArroba',
+  'purchaseValue',
+  'totalCost',
+  'status',
+];
 
 export class CattlePurchaseRepository extends BaseRepository<CattlePurchase> {
+  protected sortableFields = CATTLE_PURCHASE_SORT_FIELDS;
+
   constructor() {
     super('cattlePurchase');
   }
 
-  // Método findAll específico para bypass problema com BaseRepository
-  async findAll(where: any = {}, pagination?: any, _options?: any) {
-    const page = pagination?.page || 1;
-    const limit = pagination?.limit || 50;
-    const skip = (page - 1) * limit;
-
-    const [items, total] = await Promise.all([
-      this.prisma.cattlePurchase.findMany({
-        where,
-        skip,
-        take: limit,
-        orderBy: { createdAt: 'desc' },
-        include: {
-          vendor: {
-            select: {
-              id: true,
-              name: true,
-              type: true
-            }
-          },
-          penAllocations: {
-            where: { status: 'ACTIVE' },
-            include: {
-              pen: {
-                select: {
-                  id: true,
-                  penNumber: true,
-                  capacity: true,
-                  status: true
-                }
+  // Listagem com os relacionamentos exibidos na tabela de compras
+  async findAll(where: any = {}, pagination?: PaginationParams, _options?: QueryOptions) {
+    return this.paginate(where, pagination, {
+      include: {
+        vendor: {
+          select: {
+            id: true,
+            name: true,
+            type: true
+          }
+        },
+        penAllocations: {
+          where: { status: 'ACTIVE' },
+          include: {
+            pen: {
+              select: {
+                id: true,
+                penNumber: true,
+                capacity: true,
+                status: true
               }
             }
-          },
-          payerAccount: {
-            select: {
-              id: true,
-              accountName: true,
-              accountNumber: true,
-              bankName: true
-            }
-          },
-          broker: {
-            select: {
-              id: true,
-              name: true,
-              type: true
-            }
-          },
-          transportCompany: {
-            select: {
-              id: true,
-              name: true,
-              type: true
-            }
+          }
+        },
+        payerAccount: {
+          select: {
+            id: true,
+            accountName: true,
+            accountNumber: true,
+            bankName: true
+          }
+        },
+        broker: {
+          select: {
+            id: true,
+            name: true,
+            type: true
+          }
+        },
+        transportCompany: {
+          select: {
+            id: true,
+            name: true,
+            type: true
           }
         }
-      }),
-      this.prisma.cattlePurchase.count({ where })
-    ]);
-
-    const totalPages = Math.ceil(total / limit);
-
-    return {
-      items,
-      total,
-      page,
-      limit,
-      totalPages,
-      hasNext: page < totalPages,
-      hasPrev: page > 1
-    };
+      }
+    });
   }
 
   async findByStatus(status: PurchaseStatus) {
@@ -1,8 +1,22 @@
 import { Expense, Prisma } from '@prisma/client';
 import { BaseRepository } from './base.repository';
+import { accountLedgerService } from '@/services/accountLedger.service';
 // import { prisma } from '@/config/database';
 
+export const EXPENSE_SORT_FIELDS = [
+  'createdAt',
+  'updatedAt',
+  'dueDate',
+  'paymentDate',
+  'totalAmount',
+  'description',
+  'category',
+  'isPaid',
+];
+
 export class ExpenseRepository extends BaseRepository<Expense> {
+  protected sortableFields = EXPENSE_SORT_FIELDS;
+
   constructor() {
     super('expense');
   }
@@ -109,16 +123,16 @@ export class ExpenseRepository extends BaseRepository<Expense> {
         },
       });
 
-      // Atualiza saldo da conta se impacta caixa
-      if (expense.impactsCashFlow && expense.payerAccountId) {
-        await tx.payerAccount.update({
-          where: { id: expense.payerAccountId },
-          data: {
-            balance: {
-              decrement: expense.totalAmount,
-            },
-          },
-        });
+      // Lança a saída no extrato da conta (o saldo é atualizado junto)
+      if (expense.impactsCashFlow && updatedExpense.payerAccountId) {
+        await accountLedgerService.post({
+          accountId: updatedExpense.payerAccountId,
+          amount: -expense.totalAmount,
+          entryDate: paymentData.paymentDate,
+          sourceType: 'EXPENSE',
+          sourceId: expense.id,
+          description: expense.description,
+        }, tx);
       }
 
       return updatedExpense;
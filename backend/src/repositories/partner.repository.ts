@@ -1,7 +1,11 @@
 import { Partner, PartnerType } from '@prisma/client';
 import { BaseRepository } from './base.repository';
 
+export const PARTNER_SORT_FIELDS = ['createdAt', 'updatedAt', 'name', 'type', 'isActive'];
+
 export class PartnerRepository extends BaseRepository<Partner> {
+  protected sortableFields = PARTNER_SORT_FIELDS;
+
   constructor() {
     super('partner');
   }
@@ -14,17 +14,6 @@ export class PayerAccountRepository extends BaseRepository<PayerAccount> {
     });
   }
 
-  async updateBalance(id: string, amount: number) {
-    return this.model.update({
-      where: { id },
-      data: {
-        balance: {
-          increment: amount,
-        },
-      },
-    });
-  }
-
   async getAccountWithTransactions(id: string, startDate?: Date, endDate?: Date) {
     const where: any = { id };
     const dateFilter: any = {};
@@ -1,7 +1,13 @@
 import { Pen, PenStatus, PenType, Prisma } from '@prisma/client';
-import { BaseRepository } from './base.repository';
+import { BaseRepository, PaginationParams } from './base.repository';
+
+export const PEN_SORT_FIELDS = ['penNumber', 'capacity', 'status', 'type', 'createdAt', 'updatedAt'];
 
 export class PenRepository extends BaseRepository<Pen> {
+  protected sortableFields = PEN_SORT_FIELDS;
+  protected defaultSort = { field: 'penNumber', direction: 'asc' as const };
+  protected defaultLimit = 100;
+
   constructor() {
     super('pen');
   }
@@ -33,41 +39,30 @@ export class PenRepository extends BaseRepository<Pen> {
   }
 
   // Método findAll específico para incluir ocupação calculada
-  async findAll(where: any = {}, pagination?: any) {
-    const page = pagination?.page || 1;
-    const limit = pagination?.limit || 100;
-    const skip = (page - 1) * limit;
-
-    const [items, total] = await Promise.all([
-      this.prisma.pen.findMany({
-        where,
-        skip,
-        take: limit,
-        orderBy: { penNumber: 'asc' },
-        include: {
-          lotAllocations: {
-            where: { status: 'ACTIVE' },
-            include: {
-              purchase: {
-                select: {
-                  id: true,
-                  lotCode: true,
-                  vendor: {
-                    select: {
-                      name: true
-                    }
+  async findAll(where: any = {}, pagination?: PaginationParams) {
+    const result = await this.paginate(where, pagination, {
+      include: {
+        lotAllocations: {
+          where: { status: 'ACTIVE' },
+          include: {
+            purchase: {
+              select: {
+                id: true,
+                lotCode: true,
+                vendor: {
+                  select: {
+                    name: true
                   }
                 }
               }
             }
           }
         }
-      }),
-      this.prisma.pen.count({ where })
-    ]);
+      }
+    });
 
     // Calcular ocupação para cada curral
-    const itemsWithOccupancy = items.map(pen => {
+    const itemsWithOccupancy = result.items.map(pen => {
       const allocations = (pen as any).lotAllocations || [];
       const currentOccupancy = allocations.reduce(
         (sum: number, alloc: any) => sum + (alloc.quantity || 0),
@@ -81,17 +76,7 @@ export class PenRepository extends BaseRepository<Pen> {
       };
     });
 
-    const totalPages = Math.ceil(total / limit);
-
-    return {
-      items: itemsWithOccupancy,
-      total,
-      page,
-      limit,
-      totalPages,
-      hasNext: page < totalPages,
-      hasPrev: page > 1
-    };
+    return { ...result, items: itemsWithOccupancy };
   }
 
   async findAvailable(minCapacity?: number) {
@@ -1,8 +1,22 @@
 import { Revenue, Prisma } from '@prisma/client';
 import { BaseRepository } from './base.repository';
+import { accountLedgerService } from '@/services/accountLedger.service';
 // import { prisma } from '@/config/database';
 
+export const REVENUE_SORT_FIELDS = [
+  'createdAt',
+  'updatedAt',
+  'dueDate',
+  'receiptDate',
+  'totalAmount',
+  'description',
+  'category',
+  'isReceived',
+];
+
 export class RevenueRepository extends BaseRepository<Revenue> {
+  protected sortableFields = REVENUE_SORT_FIELDS;
+
   constructor() {
     super('revenue');
   }
@@ -99,16 +113,16 @@ export class RevenueRepository extends BaseRepository<Revenue> {
         },
       });
 
-      // Atualiza saldo da conta
-      if (revenue.payerAccountId) {
-        await tx.payerAccount.update({
-          where: { id: revenue.payerAccountId },
-          data: {
-            balance: {
-              increment: revenue.totalAmount,
-            },
-          },
-        });
+      // Lança a entrada no extrato da conta (o saldo é atualizado junto)
+      if (updatedRevenue.payerAccountId) {
+        await accountLedgerService.post({
+          accountId: updatedRevenue.payerAccountId,
+          amount: revenue.totalAmount,
+          entryDate: receiptData.receiptDate,
+          sourceType: 'REVENUE',
+          sourceId: revenue.id,
+          description: revenue.description,
+        }, tx);
       }
 
       return updatedRevenue;
@@ -1,6 +1,20 @@
 import { BaseRepository, PaginationParams, QueryOptions } from './base.repository';
 
+export const SALE_RECORD_SORT_FIELDS = [
+  'createdAt',
+  'updatedAt',
+  'saleDate',
+  'paymentDate',
+  'quantity',
+  'totalValue',
+  'netValue',
+  'status',
+];
+
 export class SaleRecordRepository extends BaseRepository<any> {
+  protected sortableFields = SALE_RECORD_SORT_FIELDS;
+  protected defaultLimit = 20;
+
   constructor() {
     super('saleRecord');
   }
@@ -80,15 +94,15 @@ export class SaleRecordRepository extends BaseRepository<any> {
       if (endDate) where.saleDate.lte = endDate;
     }
 
-    const sales = await (this as any).model.findMany({ where });
+    const totals = await this.getTotals(where);
     
     const stats = {
-      totalSales: sales.length,
-      totalQuantity: sales.reduce((sum: number, s: any) => sum + s.quantity, 0),
-      totalWeight: sales.reduce((sum: number, s: any) => sum + s.exitWeight, 0),
-      totalCarcassWeight: sales.reduce((sum: number, s: any) => sum + s.carcassWeight, 0),
-      totalGrossValue: sales.reduce((sum: number, s: any) => sum + s.totalValue, 0),
-      totalNetValue: sales.reduce((sum: number, s: any) => sum + s.netValue, 0),
+      totalSales: totals.count,
+      totalQuantity: totals.quantity,
+      totalWeight: totals.exitWeight,
+      totalCarcassWeight: totals.carcassWeight,
+      totalGrossValue: totals.totalValue,
+      totalNetValue: totals.netValue,
       averagePrice: 0,
     };
 
@@ -99,49 +113,98 @@ export class SaleRecordRepository extends BaseRepository<any> {
     return stats;
   }
 
-  async getSalesByStatus() {
-    const sales = await (this as any).model.findMany({});
-    
+  async getSalesByStatus(where: any = {}) {
+    const groups = await (this as any).model.groupBy({
+      by: ['status'],
+      where,
+      _count: { _all: true },
+    });
+
+    const counts: Record<string, number> = {
+      PENDING: 0,
+      CONFIRMED: 0,
+      DELIVERED: 0,
+      PAID: 0,
+      CANCELLED: 0,
+    };
+    groups.forEach((group: any) => {
+      counts[group.status] = group._count._all;
+    });
+
+    return counts;
+  }
+
+  /**
+   * Totais das vendas que atendem ao filtro, somados no banco
+   */
+  async getTotals(where: any = {}) {
+    const result = await (this as any).model.aggregate({
+      where,
+      _count: { _all: true },
+      _sum: {
+        quantity: true,
+        exitWeight: true,
+        carcassWeight: true,
+        totalValue: true,
+        netValue: true,
+      },
+    });
+
     return {
-      PENDING: sales.filter((s: any) => s.status === 'PENDING').length,
-      CONFIRMED: sales.filter((s: any) => s.status === 'CONFIRMED').length,
-      DELIVERED: sales.filter((s: any) => s.status === 'DELIVERED').length,
-      PAID: sales.filter((s: any) => s.status === 'PAID').length,
-      CANCELLED: sales.filter((s: any) => s.status === 'CANCELLED').length,
+      count: result._count._all as number,
+      quantity: (result._sum.quantity ?? 0) as number,
+      exitWeight: (result._sum.exitWeight ?? 0) as number,
+      carcassWeight: (result._sum.carcassWeight ?? 0) as number,
+      totalValue: (result._sum.totalValue ?? 0) as number,
+      netValue: (result._sum.netValue ?? 0) as number,
     };
   }
 
+  /**
+   * Totais por comprador, do maior valor líquido para o menor
+   */
+  async getTotalsByBuyer(where: any = {}, limit = 10) {
+    const groups = await (this as any).model.groupBy({
+      by: ['buyerId'],
+      where,
+      _count: { _all: true },
+      _sum: { quantity: true, netValue: true },
+      orderBy: { _sum: { netValue: 'desc' } },
+      take: limit,
+    });
+
+    const buyers = await this.prisma.partner.findMany({
+      where: { id: { in: groups.map((group: any) => group.buyerId) } },
+      select: { id: true, name: true },
+    });
+    const names = new Map(buyers.map(buyer => [buyer.id, buyer.name]));
+
+    return groups.map((group: any) => ({
+      buyerId: group.buyerId,
+      buyerName: names.get(group.buyerId) ?? null,
+      sales: group._count._all,
+      quantity: group._sum.quantity ?? 0,
+      netValue: group._sum.netValue ?? 0,
+    }));
+  }
+
   async findAll(where: any = {}, pagination?: PaginationParams, options?: QueryOptions) {
-    const query: any = { where };
-    
-    if (pagination) {
-      const { page = 1, limit = 20 } = pagination;
-      query.skip = (page - 1) * limit;
-      query.take = limit;
+    // Sem paginação devolve todos os registros (usado nas consultas por lote)
+    if (!pagination) {
+      const items = await (this as any).model.findMany({ where, include: options?.include });
+      return {
+        items,
+        total: items.length,
+        page: 1,
+        limit: items.length,
+        totalPages: 1,
+        hasNext: false,
+        hasPrev: false,
+        nextCursor: null
+      };
     }
-    
-    if (options?.include) {
-      query.include = options.include;
-    }
-    
-    const [items, total] = await Promise.all([
-      (this as any).model.findMany(query),
-      (this as any).model.count({ where })
-    ]);
-    
-    const page = pagination?.page || 1;
-    const limit = pagination?.limit || 20;
-    const totalPages = Math.ceil(total / limit);
-    
-    return { 
-      items, 
-      total,
-      page,
-      limit,
-      totalPages,
-      hasNext: page < totalPages,
-      hasPrev: page > 1
-    };
+
+    return this.paginate(where, pagination, options?.include ? { include: options.include } : {});
   }
 
   async create(data: any) {
@@ -1,6 +1,6 @@
 import { Router } from 'express';
 import { AnalyticsController } from '../controllers/analytics.controller';
-import { authenticate } from '../middlewares/auth';
+import { authenticate, authorize } from '../middlewares/auth';
 
 const router = Router();
 const analyticsController = new AnalyticsController();
@@ -24,6 +24,11 @@ router.get('/mortality/treatments', analyticsController.getTreatmentEffectivenes
 router.get('/mortality/risk/:cattlePurchaseId', analyticsController.predictMortalityRisk);
 router.get('/mortality/report/:cattlePurchaseId', analyticsController.getLotMortalityReport);
 
+// ===== RISK MODEL =====
+router.get('/risk/open-lots', analyticsController.scoreOpenLots);
+router.get('/risk/model', analyticsController.getRiskModel);
+router.post('/risk/model/fit', authorize('ADMIN', 'MANAGER'), analyticsController.fitRiskModel);
+
 // ===== COMBINED ANALYTICS =====
 router.get('/dashboard', analyticsController.getAnalyticsDashboard);
 
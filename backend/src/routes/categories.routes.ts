@@ -1,8 +1,7 @@
 import { Router, Request, Response } from 'express';
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 
 const router = Router();
-const prisma = new PrismaClient();
 
 // Listar todas as categorias
 router.get('/', async (req: Request, res: Response) => {
@@ -68,6 +68,11 @@ const confinedValidation = [
 
 // Rotas - Usando validação robusta Joi
 router.post('/', validate(cattlePurchaseValidation.create), cattlePurchaseController.create);
+// Operações em lote (antes das rotas com :id)
+router.post('/import', cattlePurchaseController.importCsv);
+router.post('/batch/reception', validate(cattlePurchaseValidation.batchReception), cattlePurchaseController.registerReceptionBatch);
+router.post('/batch/confined', validate(cattlePurchaseValidation.batchConfined), cattlePurchaseController.markAsConfinedBatch);
+router.post('/sync-expenses', validate(cattlePurchaseValidation.syncExpenses), cattlePurchaseController.syncExpensesBulk);
 router.get('/', cattlePurchaseController.findAll);
 router.get('/statistics', cattlePurchaseController.getStatistics);
 router.get('/:id', cattlePurchaseController.findById);
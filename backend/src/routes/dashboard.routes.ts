@@ -1,6 +1,7 @@
 import { Router } from 'express';
 import { DashboardController } from '@/controllers/dashboard.controller';
 import { authenticate } from '@/middlewares/auth';
+import { catchAsync } from '@/utils/catchAsync';
 
 const router = Router();
 const dashboardController = new DashboardController();
@@ -9,11 +10,11 @@ const dashboardController = new DashboardController();
 router.use(authenticate);
 
 // Rota principal - retorna todos os dados
-router.get('/', dashboardController.index);
+router.get('/', catchAsync(dashboardController.index));
 
 // Rotas específicas
-router.get('/metrics', dashboardController.metrics);
-router.get('/charts', dashboardController.charts);
-router.get('/alerts', dashboardController.alerts);
+router.get('/metrics', catchAsync(dashboardController.metrics));
+router.get('/charts', catchAsync(dashboardController.charts));
+router.get('/alerts', catchAsync(dashboardController.alerts));
 
 export default router; 
\ No newline at end of file
@@ -9,6 +9,7 @@ router.use(authMiddleware);
 
 // Rotas principais
 router.post('/', deathRecordController.create);
+router.post('/batch', deathRecordController.createBatch);
 router.get('/', deathRecordController.findAll);
 router.get('/statistics', deathRecordController.getStatistics);
 router.get('/analysis/period', deathRecordController.getAnalysisByPeriod);
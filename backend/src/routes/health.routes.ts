@@ -1,6 +1,8 @@
 import { Router } from 'express';
 import { db } from '@/lib/prisma';
 import { logger } from '@/config/logger';
+import { auditLogWriter } from '@/middlewares/audit';
+import { notificationQueue } from '@/services/notificationQueue.service';
 
 const router = Router();
 
@@ -20,6 +22,8 @@ router.get('/', async (_req, res) => {
         ...healthStatus.details,
         stats
       },
+      audit: auditLogWriter.getStats(),
+      notifications: notificationQueue.getMetrics(),
       server: {
         node: process.version,
         memory: process.memoryUsage(),
@@ -1,6 +1,6 @@
 import { Router } from 'express';
 import integratedInterventionController from '@/controllers/integratedIntervention.controller';
-import { authMiddleware } from '@/middlewares/auth';
+import { authMiddleware, authorize } from '@/middlewares/auth';
 
 const router = Router();
 
@@ -21,5 +21,7 @@ router.post('/health-protocol/register', integratedInterventionController.regist
 router.patch('/health-protocol/:id/payment-status', integratedInterventionController.updateProtocolPaymentStatus);
 router.get('/health-protocols', integratedInterventionController.getProtocolsWithFinancial);
 router.get('/health-protocol/roi', integratedInterventionController.calculateHealthROI);
+router.get('/health-protocol/analytics', integratedInterventionController.getProtocolAnalytics);
+router.post('/health-protocol/analytics/refresh', authorize('ADMIN', 'MANAGER'), integratedInterventionController.refreshProtocolAnalytics);
 
 export default router;
\ No newline at end of file
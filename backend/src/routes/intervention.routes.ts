@@ -40,6 +40,16 @@ const weightReadingValidation = [
   body('weighingDate').isISO8601().withMessage('Data de pesagem inválida')
 ];
 
+const weighingSessionValidation = [
+  body('readingDate').isISO8601().withMessage('Data de pesagem inválida'),
+  body('entries').isArray({ min: 1, max: 10000 }).withMessage('Informe de 1 a 10000 pesos'),
+  body('entries.*.weight').isFloat().withMessage('Peso deve ser numérico'),
+  body('entries.*.cattlePurchaseId').optional().isString(),
+  body('entries.*.lotCode').optional().isString(),
+  body('entries.*.animalTag').optional().isString(),
+  body('dryRun').optional().isBoolean()
+];
+
 // Rotas
 router.post(
   '/health',
@@ -69,6 +79,13 @@ router.post(
   interventionController.createWeightReading
 );
 
+router.post(
+  '/weight-sessions',
+  weighingSessionValidation,
+  validateRequest,
+  interventionController.createWeighingSession
+);
+
 router.get(
   '/history',
   [
@@ -76,7 +93,9 @@ router.get(
     query('penId').optional(),
     query('startDate').optional().isISO8601(),
     query('endDate').optional().isISO8601(),
-    query('type').optional().isIn(['health', 'mortality', 'movement', 'weight'])
+    query('type').optional().isIn(['health', 'mortality', 'movement', 'weight']),
+    query('cursor').optional().isString().isLength({ max: 1024 }),
+    query('limit').optional().isInt({ min: 1, max: 500 })
   ],
   validateRequest,
   interventionController.getInterventionHistory
@@ -85,7 +104,8 @@ router.get(
 router.get(
   '/statistics',
   [
-    query('cycleId').optional()
+    query('startDate').optional().isISO8601(),
+    query('endDate').optional().isISO8601()
   ],
   validateRequest,
   interventionController.getInterventionStatistics
@@ -0,0 +1,19 @@
+import { Router } from 'express';
+import { OfflineSyncController } from '@/controllers/offlineSync.controller';
+import { authenticate } from '@/middlewares/auth';
+import { validate } from '@/middlewares/validation';
+import { offlineSyncValidation } from '@/validations/offlineSync.validation';
+
+const router = Router();
+const offlineSyncController = new OfflineSyncController();
+
+// Todas as rotas requerem autenticação
+router.use(authenticate);
+
+// Reprodução em lote da fila offline do frontend
+router.post('/operations',
+  validate(offlineSyncValidation.operations),
+  offlineSyncController.applyOperations
+);
+
+export default router;
@@ -43,6 +43,12 @@ router.get(
   payerAccountController.transactions
 );
 
+router.get(
+  '/:id/balance',
+  validate(payerAccountValidation.balanceAt, 'query'),
+  payerAccountController.balanceAt
+);
+
 router.post(
   '/',
   authorize('ADMIN'),
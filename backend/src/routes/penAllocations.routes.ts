@@ -1,8 +1,7 @@
 import { Router } from 'express';
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 
 const router = Router();
-const prisma = new PrismaClient();
 
 // Função auxiliar para calcular ocupação do curral
 async function calculatePenOccupancy(penId: string): Promise<number> {
@@ -5,12 +5,32 @@ import { logger } from '@/config/logger';
 import { initializeSocket } from '@/config/socket';
 import { ensureAdminUser } from '@/utils/ensureAdminUser';
 import { backupService } from '@/services/backup.service';
+import { prisma } from '@/config/database';
+import { domainEventsMiddleware } from '@/utils/domainEvents';
+import { dashboardSnapshotService } from '@/services/dashboardSnapshot.service';
+import { chartSeriesService } from '@/services/chartSeries.service';
+import { penOccupancyPublisher } from '@/services/penOccupancyPublisher.service';
+import { calendarEventSync } from '@/services/calendarEventSync.service';
+import { herdSummaryService } from '@/services/herdSummary.service';
+import { healthProtocolAnalyticsService } from '@/services/healthProtocolAnalytics.service';
+import { saleRecordStatsCache } from '@/services/saleRecord.service';
+import { riskModelService } from '@/services/riskModel.service';
 
 async function startServer(): Promise<void> {
   try {
     // Garante que existe um usuário administrador
     await ensureAdminUser();
 
+    // Publica eventos de domínio nas gravações e mantém o snapshot do dashboard atualizado
+    await prisma.$use(domainEventsMiddleware);
+    dashboardSnapshotService.start();
+    chartSeriesService.start();
+    calendarEventSync.start();
+    herdSummaryService.start();
+    healthProtocolAnalyticsService.start();
+    saleRecordStatsCache.start();
+    riskModelService.start();
+
     // Cria a aplicação Express
     const app = createApp();
 
@@ -20,6 +40,9 @@ async function startServer(): Promise<void> {
     // Inicializa Socket.io
     initializeSocket(httpServer);
 
+    // Publica variações de ocupação dos currais na sala pen-occupancy
+    penOccupancyPublisher.start();
+
     // Inicializa o serviço de backup
     await backupService.initialize({
       frequency: 'daily',
@@ -40,6 +63,15 @@ async function startServer(): Promise<void> {
     // Graceful shutdown
     const gracefulShutdown = async (signal: string): Promise<void> => {
       logger.info(`${signal} received. Starting graceful shutdown...`);
+
+      dashboardSnapshotService.stop();
+      chartSeriesService.stop();
+      calendarEventSync.stop();
+      herdSummaryService.stop();
+      healthProtocolAnalyticsService.stop();
+      saleRecordStatsCache.stop();
+      riskModelService.stop();
+      penOccupancyPublisher.stop();
       
       server.close(() => {
         logger.info('HTTP server closed');
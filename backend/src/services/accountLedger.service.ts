@@ -0,0 +1,195 @@
+import { AccountLedgerEntry, Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import { NotFoundError, ValidationError } from '@/utils/AppError';
+
+/**
+ * Extrato das contas pagadoras.
+ *
+ * Toda movimentação de saldo vira um lançamento em `account_ledger_entries` com o saldo
+ * acumulado já calculado (`balanceAfter`), na ordem (entryDate, sequence). Extrato,
+ * saldo em uma data e paginação leem só o trecho pedido pelo índice
+ * (accountId, entryDate, sequence), sem percorrer o histórico da conta.
+ */
+
+export type LedgerSource = 'OPENING' | 'EXPENSE' | 'REVENUE' | 'CASH_FLOW' | 'ADJUSTMENT';
+
+export interface LedgerPosting {
+  accountId: string;
+  amount: number; // Positivo entra na conta, negativo sai
+  entryDate: Date;
+  sourceType: LedgerSource;
+  sourceId?: string | null;
+  description: string;
+}
+
+export interface StatementParams {
+  startDate?: Date;
+  endDate?: Date;
+  cursor?: string;
+  limit?: number;
+}
+
+export interface Statement {
+  entries: AccountLedgerEntry[];
+  openingBalance: number;
+  closingBalance: number;
+  hasNext: boolean;
+  nextCursor: string | null;
+}
+
+interface StatementCursor {
+  entryDate: string;
+  sequence: number;
+}
+
+const DEFAULT_STATEMENT_LIMIT = 50;
+const MAX_STATEMENT_LIMIT = 500;
+
+export class AccountLedgerService {
+  /**
+   * Registra um lançamento e atualiza o saldo da conta na mesma transação.
+   *
+   * Lançamentos da conta são serializados pelo lock da linha em `payer_accounts`.
+   * Um lançamento retroativo desloca o saldo acumulado dos posteriores com um único UPDATE.
+   */
+  async post(posting: LedgerPosting, tx?: Prisma.TransactionClient): Promise<AccountLedgerEntry> {
+    if (!tx) {
+      return prisma.$transaction(inner => this.post(posting, inner));
+    }
+
+    const { accountId, amount, entryDate } = posting;
+
+    const [account] = await tx.$queryRaw<Array<{ id: string }>>`
+      SELECT "id" FROM "payer_accounts" WHERE "id" = ${accountId} FOR UPDATE
+    `;
+    if (!account) {
+      throw new NotFoundError('Conta não encontrada');
+    }
+
+    const previous = await tx.accountLedgerEntry.findFirst({
+      where: { accountId, entryDate: { lte: entryDate } },
+      orderBy: [{ entryDate: 'desc' }, { sequence: 'desc' }],
+      select: { balanceAfter: true },
+    });
+
+    const entry = await tx.accountLedgerEntry.create({
+      data: {
+        accountId,
+        amount,
+        entryDate,
+        balanceAfter: (previous?.balanceAfter ?? 0) + amount,
+        sourceType: posting.sourceType,
+        sourceId: posting.sourceId ?? null,
+        description: posting.description,
+      },
+    });
+
+    await tx.$executeRaw`
+      UPDATE "account_ledger_entries"
+      SET "balanceAfter" = "balanceAfter" + ${amount}
+      WHERE "accountId" = ${accountId}
+        AND ("entryDate" > ${entryDate} OR ("entryDate" = ${entryDate} AND "sequence" > ${entry.sequence}))
+    `;
+
+    await tx.payerAccount.update({
+      where: { id: accountId },
+      data: { balance: { increment: amount } },
+    });
+
+    return entry;
+  }
+
+  /**
+   * Saldo da conta ao final de `date`: o saldo acumulado do último lançamento até ali
+   */
+  async getBalanceAt(accountId: string, date: Date): Promise<number> {
+    const entry = await prisma.accountLedgerEntry.findFirst({
+      where: { accountId, entryDate: { lte: date } },
+      orderBy: [{ entryDate: 'desc' }, { sequence: 'desc' }],
+      select: { balanceAfter: true },
+    });
+
+    return entry?.balanceAfter ?? 0;
+  }
+
+  /**
+   * Página do extrato, do lançamento mais recente para o mais antigo.
+   * A próxima página é buscada por keyset a partir de `nextCursor`.
+   */
+  async getStatement(accountId: string, params: StatementParams = {}): Promise<Statement> {
+    const limit = Math.min(Math.max(params.limit || DEFAULT_STATEMENT_LIMIT, 1), MAX_STATEMENT_LIMIT);
+    const where: Prisma.AccountLedgerEntryWhereInput = { accountId };
+
+    if (params.startDate || params.endDate) {
+      where.entryDate = {
+        ...(params.startDate && { gte: params.startDate }),
+        ...(params.endDate && { lte: params.endDate }),
+      };
+    }
+
+    if (params.cursor) {
+      const cursor = this.decodeCursor(params.cursor);
+      const entryDate = new Date(cursor.entryDate);
+      where.OR = [
+        { entryDate: { lt: entryDate } },
+        { entryDate, sequence: { lt: cursor.sequence } },
+      ];
+    }
+
+    const [rows, openingBalance, closingBalance] = await Promise.all([
+      prisma.accountLedgerEntry.findMany({
+        where,
+        orderBy: [{ entryDate: 'desc' }, { sequence: 'desc' }],
+        take: limit + 1,
+      }),
+      params.startDate
+        ? this.getBalanceAt(accountId, new Date(params.startDate.getTime() - 1))
+        : Promise.resolve(0),
+      params.endDate
+        ? this.getBalanceAt(accountId, params.endDate)
+        : this.getCurrentBalance(accountId),
+    ]);
+
+    const hasNext = rows.length > limit;
+    const entries = hasNext ? rows.slice(0, limit) : rows;
+    const last = entries[entries.length - 1];
+
+    return {
+      entries,
+      openingBalance,
+      closingBalance,
+      hasNext,
+      nextCursor: hasNext && last ? this.encodeCursor(last) : null,
+    };
+  }
+
+  private async getCurrentBalance(accountId: string): Promise<number> {
+    const entry = await prisma.accountLedgerEntry.findFirst({
+      where: { accountId },
+      orderBy: [{ entryDate: 'desc' }, { sequence: 'desc' }],
+      select: { balanceAfter: true },
+    });
+
+    return entry?.balanceAfter ?? 0;
+  }
+
+  private encodeCursor(entry: AccountLedgerEntry): string {
+    const payload: StatementCursor = { entryDate: entry.entryDate.toISOString(), sequence: entry.sequence };
+    return Buffer.from(JSON.stringify(payload)).toString('base64url');
+  }
+
+  private decodeCursor(cursor: string): StatementCursor {
+    try {
+      const payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+      if (typeof payload.entryDate === 'string' && Number.isInteger(payload.sequence)
+        && !Number.isNaN(Date.parse(payload.entryDate))) {
+        return payload;
+      }
+    } catch {
+      // Cai no erro abaixo
+    }
+    throw new ValidationError('Cursor inválido');
+  }
+}
+
+export const accountLedgerService = new AccountLedgerService();
@@ -1,6 +1,5 @@
-import { PrismaClient, CalendarEvent, EventType, EventStatus, EventPriority, Prisma } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { CalendarEvent, EventType, EventStatus, EventPriority, Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
 
 export interface CreateCalendarEventData {
   title: string;
@@ -59,6 +58,46 @@ export interface CalendarEventStats {
   highPriorityEvents: number;
 }
 
+export type FinancialEventSource = 'expense' | 'revenue';
+
+export interface FinancialEventScope {
+  userId?: string;
+  sources?: FinancialEventSource[];
+  // Restringe a sincronização aos lançamentos gravados (sincronização incremental)
+  ids?: Partial<Record<FinancialEventSource, string[]>>;
+}
+
+export interface FinancialEventSyncResult {
+  created: CalendarEvent[];
+  updated: number;
+  completed: number;
+  removed: number;
+}
+
+// Lançamentos financeiros que geram eventos automáticos (relatedId = ID do lançamento)
+const FINANCIAL_EVENT_SOURCES: Record<FinancialEventSource, {
+  table: Prisma.Sql;
+  settledColumn: Prisma.Sql;
+  titlePrefix: string;
+  descriptionPrefix: string;
+  overduePriority: EventPriority;
+}> = {
+  expense: {
+    table: Prisma.raw('"expenses"'),
+    settledColumn: Prisma.raw('"isPaid"'),
+    titlePrefix: 'Vencimento: ',
+    descriptionPrefix: 'Despesa de ',
+    overduePriority: EventPriority.HIGH,
+  },
+  revenue: {
+    table: Prisma.raw('"revenues"'),
+    settledColumn: Prisma.raw('"isReceived"'),
+    titlePrefix: 'Recebimento: ',
+    descriptionPrefix: 'Receita de ',
+    overduePriority: EventPriority.MEDIUM,
+  },
+};
+
 export class CalendarEventService {
 
   /**
@@ -274,81 +313,90 @@ export class CalendarEventService {
    * Gera eventos automáticos baseados em outros dados do sistema
    */
   async generateAutomaticEvents(userId?: string): Promise<CalendarEvent[]> {
-    const generatedEvents: CalendarEvent[] = [];
-
-    // Buscar despesas com vencimento
-    const expenses = await prisma.expense.findMany({
-      where: {
-        isPaid: false,
-        dueDate: { not: null },
-        userId: userId
-      }
-    });
-
-    for (const expense of expenses) {
-      if (!expense.dueDate) continue;
+    const result = await this.syncFinancialEvents({ userId });
+    return result.created;
+  }
 
-      const existingEvent = await prisma.calendarEvent.findFirst({
-        where: {
-          relatedId: expense.id,
-          autoGenerated: true
+  /**
+   * Sincroniza os eventos automáticos de vencimentos (despesas) e recebimentos (receitas)
+   * com poucas consultas por origem, independente do número de lançamentos:
+   * - cria, via anti-join, os eventos que ainda não existem;
+   * - atualiza data, valor, status e prioridade dos que mudaram;
+   * - conclui os eventos de lançamentos quitados;
+   * - remove os eventos de lançamentos excluídos (só quando os IDs são informados).
+   *
+   * Sem IDs, a sincronização cobre todos os lançamentos (opcionalmente de um usuário).
+   */
+  async syncFinancialEvents(scope: FinancialEventScope = {}): Promise<FinancialEventSyncResult> {
+    const sources = (scope.sources || Object.keys(FINANCIAL_EVENT_SOURCES) as FinancialEventSource[])
+      .filter(source => !scope.ids || (scope.ids[source]?.length ?? 0) > 0);
+
+    return prisma.$transaction(async (tx) => {
+      // Uma sincronização por vez, mesmo com várias instâncias da API
+      await tx.$executeRaw`SELECT pg_advisory_xact_lock(hashtext('calendar_financial_events'))`;
+
+      const result: FinancialEventSyncResult = { created: [], updated: 0, completed: 0, removed: 0 };
+      const now = new Date();
+
+      for (const source of sources) {
+        const config = FINANCIAL_EVENT_SOURCES[source];
+        const ids = scope.ids?.[source];
+        const filter = Prisma.sql`${scope.userId ? Prisma.sql`AND s."userId" = ${scope.userId}` : Prisma.empty}
+          ${ids ? Prisma.sql`AND s."id" IN (${Prisma.join(ids)})` : Prisma.empty}`;
+        const status = Prisma.sql`(CASE WHEN s."dueDate" < ${now} THEN 'OVERDUE' ELSE 'SCHEDULED' END)::"EventStatus"`;
+        const priority = Prisma.sql`(CASE WHEN s."dueDate" < ${now} THEN ${config.overduePriority} ELSE 'MEDIUM' END)::"EventPriority"`;
+
+        const created = await tx.$queryRaw<CalendarEvent[]>`
+          INSERT INTO "calendar_events"
+            ("id", "title", "description", "type", "date", "participants", "status", "priority",
+             "recurring", "tags", "relatedId", "amount", "autoGenerated", "userId", "updatedAt")
+          SELECT gen_random_uuid()::text, ${config.titlePrefix} || s."description",
+                 ${config.descriptionPrefix} || s."category", 'FINANCE'::"EventType", s."dueDate",
+                 '{}', ${status}, ${priority}, false, '{}', s."id", s."totalAmount", true, s."userId", ${now}
+          FROM ${config.table} s
+          WHERE NOT s.${config.settledColumn} ${filter}
+            AND NOT EXISTS (
+              SELECT 1 FROM "calendar_events" c WHERE c."relatedId" = s."id" AND c."autoGenerated"
+            )
+          RETURNING *
+        `;
+        result.created.push(...created);
+
+        // Eventos concluídos ou cancelados manualmente não são alterados
+        result.updated += await tx.$executeRaw`
+          UPDATE "calendar_events" c
+          SET "date" = t."dueDate", "amount" = t."totalAmount", "status" = t."status",
+              "priority" = t."priority", "updatedAt" = ${now}
+          FROM (
+            SELECT s."id", s."dueDate", s."totalAmount", ${status} AS "status", ${priority} AS "priority"
+            FROM ${config.table} s
+            WHERE NOT s.${config.settledColumn} ${filter}
+          ) t
+          WHERE c."relatedId" = t."id" AND c."autoGenerated"
+            AND c."status" NOT IN ('COMPLETED', 'CANCELLED')
+            AND (c."date" IS DISTINCT FROM t."dueDate" OR c."amount" IS DISTINCT FROM t."totalAmount"
+              OR c."status" <> t."status" OR c."priority" <> t."priority")
+        `;
+
+        result.completed += await tx.$executeRaw`
+          UPDATE "calendar_events" c
+          SET "status" = 'COMPLETED', "updatedAt" = ${now}
+          FROM ${config.table} s
+          WHERE c."relatedId" = s."id" AND c."autoGenerated" AND s.${config.settledColumn} ${filter}
+            AND c."status" NOT IN ('COMPLETED', 'CANCELLED')
+        `;
+
+        if (ids) {
+          result.removed += await tx.$executeRaw`
+            DELETE FROM "calendar_events" c
+            WHERE c."autoGenerated" AND c."relatedId" IN (${Prisma.join(ids)})
+              AND NOT EXISTS (SELECT 1 FROM ${config.table} s WHERE s."id" = c."relatedId")
+          `;
         }
-      });
-
-      if (!existingEvent) {
-        const event = await this.createEvent({
-          title: `Vencimento: ${expense.description}`,
-          description: `Despesa de ${expense.category}`,
-          type: EventType.FINANCE,
-          date: expense.dueDate,
-          status: expense.dueDate < new Date() ? EventStatus.OVERDUE : EventStatus.SCHEDULED,
-          priority: expense.dueDate < new Date() ? EventPriority.HIGH : EventPriority.MEDIUM,
-          relatedId: expense.id,
-          amount: expense.totalAmount,
-          autoGenerated: true,
-          userId: expense.userId
-        });
-        generatedEvents.push(event);
       }
-    }
 
-    // Buscar receitas programadas
-    const revenues = await prisma.revenue.findMany({
-      where: {
-        isReceived: false,
-        dueDate: { not: null },
-        userId: userId
-      }
+      return result;
     });
-
-    for (const revenue of revenues) {
-      if (!revenue.dueDate) continue;
-
-      const existingEvent = await prisma.calendarEvent.findFirst({
-        where: {
-          relatedId: revenue.id,
-          autoGenerated: true
-        }
-      });
-
-      if (!existingEvent) {
-        const event = await this.createEvent({
-          title: `Recebimento: ${revenue.description}`,
-          description: `Receita de ${revenue.category}`,
-          type: EventType.FINANCE,
-          date: revenue.dueDate,
-          status: EventStatus.SCHEDULED,
-          priority: EventPriority.MEDIUM,
-          relatedId: revenue.id,
-          amount: revenue.totalAmount,
-          autoGenerated: true,
-          userId: revenue.userId
-        });
-        generatedEvents.push(event);
-      }
-    }
-
-    return generatedEvents;
   }
 
   /**
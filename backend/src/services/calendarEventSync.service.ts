@@ -0,0 +1,117 @@
+import { logger } from '@/config/logger';
+import { CalendarEventService, FinancialEventSource } from '@/services/calendarEvent.service';
+import { DomainEntity, onDomainEvent } from '@/utils/domainEvents';
+
+const SOURCE_ENTITIES: Partial<Record<DomainEntity, FinancialEventSource>> = {
+  expense: 'expense',
+  revenue: 'revenue',
+};
+
+// Agrupa rajadas (importações, baixas em lote) em uma única sincronização
+const SYNC_DEBOUNCE_MS = 500;
+// Teto da espera após falhas consecutivas (SYNC_DEBOUNCE_MS dobrando a cada falha)
+const RETRY_MAX_DELAY_MS = 5 * 60 * 1000;
+
+/**
+ * Mantém os eventos automáticos do calendário em dia a cada gravação de despesa ou
+ * receita, sincronizando só os lançamentos alterados. Gravações em lote sem IDs
+ * (updateMany, createMany) disparam a sincronização completa da origem. Se a sincronização
+ * falhar, os lançamentos voltam para a fila e a próxima tentativa espera um backoff exponencial.
+ */
+export class CalendarEventSync {
+  private calendarEventService = new CalendarEventService();
+  private pending = new Map<FinancialEventSource, Set<string> | 'all'>();
+  private timer: NodeJS.Timeout | null = null;
+  private syncing: Promise<void> | null = null;
+  private failures = 0;
+  private unsubscribe: (() => void) | null = null;
+
+  start(): void {
+    if (this.unsubscribe) return;
+    this.unsubscribe = onDomainEvent(event => {
+      const source = SOURCE_ENTITIES[event.entity];
+      if (!source) return;
+
+      this.markPending(source, event.ids ?? 'all');
+      this.scheduleSync();
+    });
+  }
+
+  stop(): void {
+    this.unsubscribe?.();
+    this.unsubscribe = null;
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+  }
+
+  private markPending(source: FinancialEventSource, ids: Iterable<string> | 'all'): void {
+    const current = this.pending.get(source);
+    if (ids === 'all' || current === 'all') {
+      this.pending.set(source, 'all');
+      return;
+    }
+
+    const merged = current || new Set<string>();
+    for (const id of ids) merged.add(id);
+    this.pending.set(source, merged);
+  }
+
+  private scheduleSync(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+    }
+
+    const delay = this.failures === 0
+      ? SYNC_DEBOUNCE_MS
+      : Math.min(SYNC_DEBOUNCE_MS * 2 ** this.failures, RETRY_MAX_DELAY_MS);
+
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.flush().catch(error => {
+        logger.error('Erro ao sincronizar eventos financeiros do calendário:', error);
+      });
+    }, delay);
+    this.timer.unref?.();
+  }
+
+  private async flush(): Promise<void> {
+    // Uma sincronização por vez; o que chegar durante ela fica para a próxima
+    if (this.syncing) {
+      await this.syncing;
+      if (this.pending.size > 0) this.scheduleSync();
+      return;
+    }
+
+    const pending = this.pending;
+    this.pending = new Map();
+
+    this.syncing = (async () => {
+      for (const [source, ids] of pending) {
+        await this.calendarEventService.syncFinancialEvents({
+          ids: ids === 'all' ? undefined : { [source]: [...ids] },
+          sources: [source],
+        });
+        pending.delete(source);
+      }
+    })();
+
+    try {
+      await this.syncing;
+      this.failures = 0;
+    } catch (error) {
+      // O que não foi sincronizado volta para a fila junto com o que chegou durante a tentativa
+      this.failures++;
+      for (const [source, ids] of pending) {
+        this.markPending(source, ids);
+      }
+      this.scheduleSync();
+      throw error;
+    } finally {
+      this.syncing = null;
+    }
+  }
+}
+
+export const calendarEventSync = new CalendarEventSync();
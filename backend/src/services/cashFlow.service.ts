@@ -1,8 +1,10 @@
-import { PrismaClient, CashFlow, FinancialType, PaymentStatus } from '@prisma/client';
+import { Prisma, CashFlow, FinancialType, PaymentStatus } from '@prisma/client';
+import { prisma } from '@/config/database';
 import { logger } from '@/config/logger';
 import { CalendarEventService } from './calendarEvent.service';
+import { accountLedgerService } from './accountLedger.service';
+import { nextBucket, truncateDate } from './chartSeries.service';
 
-const prisma = new PrismaClient();
 const calendarEventService = new CalendarEventService();
 
 export interface CashFlowFilters {
@@ -12,8 +14,14 @@ export interface CashFlowFilters {
   categoryId?: string;
   accountId?: string;
   status?: PaymentStatus;
+  search?: string;
+  sortBy?: string;
+  sortOrder?: 'asc' | 'desc';
 }
 
+// Colunas aceitas em `sortBy`; as demais caem na ordenação padrão por data
+export const CASH_FLOW_SORT_FIELDS = ['date', 'dueDate', 'paymentDate', 'amount', 'description', 'status', 'type', 'createdAt'];
+
 export interface CashFlowCreateInput {
   type: FinancialType;
   categoryId: string;
@@ -35,21 +43,44 @@ export interface CashFlowCreateInput {
 
 export interface CashFlowUpdateInput extends Partial<CashFlowCreateInput> {}
 
+// Advisory lock que coordena as rollups mensais com o trigger de cash_flows (ver migração
+// 20251025_cash_flow_monthly_rollups); a segunda chave é o mês (ano * 12 + mês - 1)
+const ROLLUP_LOCK_KEY = 4207;
+
+interface SummaryTotal {
+  type: FinancialType;
+  status: PaymentStatus;
+  amount: number;
+}
+
+// Intervalo [from, to) de datas; extremos ausentes ficam em aberto
+interface DateRange {
+  from?: Date;
+  to?: Date;
+}
+
+const monthKey = (month: Date) => month.getUTCFullYear() * 12 + month.getUTCMonth();
+
 class CashFlowService {
   async create(data: CashFlowCreateInput): Promise<CashFlow> {
     try {
-      const cashFlow = await prisma.cashFlow.create({
-        data,
-        include: {
-          // category removida - agora é apenas string
-          account: true,
-        },
-      });
+      // Movimentação e lançamento no extrato gravados juntos: se o lançamento falhar, nada é salvo
+      const cashFlow = await prisma.$transaction(async (tx) => {
+        const created = await tx.cashFlow.create({
+          data,
+          include: {
+            // category removida - agora é apenas string
+            account: true,
+          },
+        });
 
-      // Atualizar saldo da conta se já foi pago/recebido
-      if (data.status === 'PAID' || data.status === 'RECEIVED') {
-        await this.updateAccountBalance(data.accountId, data.amount, data.type);
-      }
+        // Atualizar saldo da conta se já foi pago/recebido
+        if (data.status === 'PAID' || data.status === 'RECEIVED') {
+          await this.postToLedger(tx, created, 'settle');
+        }
+
+        return created;
+      });
 
       // Criar evento no calendário para a movimentação
       try {
@@ -117,6 +148,16 @@ class CashFlowService {
       if (filters.categoryId) where.categoryId = filters.categoryId;
       if (filters.accountId) where.accountId = filters.accountId;
       if (filters.status) where.status = filters.status;
+      if (filters.search) {
+        where.OR = [
+          { description: { contains: filters.search, mode: 'insensitive' } },
+          { supplier: { contains: filters.search, mode: 'insensitive' } },
+          { reference: { contains: filters.search, mode: 'insensitive' } },
+        ];
+      }
+
+      const sortField = filters.sortBy && CASH_FLOW_SORT_FIELDS.includes(filters.sortBy) ? filters.sortBy : 'date';
+      const sortOrder = filters.sortOrder || 'desc';
 
       const cashFlows = await prisma.cashFlow.findMany({
         where,
@@ -124,9 +165,8 @@ class CashFlowService {
           // category removida - agora é apenas string
           account: true,
         },
-        orderBy: {
-          date: 'desc',
-        },
+        // `id` como desempate mantém a ordem estável entre recargas
+        orderBy: [{ [sortField]: sortOrder }, { id: sortOrder }],
       });
 
       return cashFlows;
@@ -161,28 +201,28 @@ class CashFlowService {
     try {
       const oldCashFlow = await this.findById(id);
       
-      const cashFlow = await prisma.cashFlow.update({
-        where: { id },
-        data,
-        include: {
-          // category removida - agora é apenas string
-          account: true,
-        },
-      });
+      const cashFlow = await prisma.$transaction(async (tx) => {
+        const updated = await tx.cashFlow.update({
+          where: { id },
+          data,
+          include: {
+            // category removida - agora é apenas string
+            account: true,
+          },
+        });
 
-      // Atualizar saldo da conta se mudou o status
-      if (oldCashFlow.status !== cashFlow.status) {
-        if (cashFlow.status === 'PAID' || cashFlow.status === 'RECEIVED') {
-          await this.updateAccountBalance(cashFlow.accountId, cashFlow.amount, cashFlow.type);
-        } else if (oldCashFlow.status === 'PAID' || oldCashFlow.status === 'RECEIVED') {
-          // Reverter o saldo
-          await this.updateAccountBalance(
-            oldCashFlow.accountId, 
-            -oldCashFlow.amount, 
-            oldCashFlow.type
-          );
+        // Atualizar saldo da conta se mudou o status
+        if (oldCashFlow.status !== updated.status) {
+          if (updated.status === 'PAID' || updated.status === 'RECEIVED') {
+            await this.postToLedger(tx, updated, 'settle');
+          } else if (oldCashFlow.status === 'PAID' || oldCashFlow.status === 'RECEIVED') {
+            // Reverter o saldo
+            await this.postToLedger(tx, oldCashFlow, 'reverse');
+          }
         }
-      }
+
+        return updated;
+      });
 
       // Atualizar evento no calendário se existir
       try {
@@ -214,17 +254,15 @@ class CashFlowService {
     try {
       const cashFlow = await this.findById(id);
 
-      // Reverter saldo se estava pago/recebido
-      if (cashFlow.status === 'PAID' || cashFlow.status === 'RECEIVED') {
-        await this.updateAccountBalance(
-          cashFlow.accountId, 
-          -cashFlow.amount, 
-          cashFlow.type
-        );
-      }
+      await prisma.$transaction(async (tx) => {
+        // Reverter saldo se estava pago/recebido
+        if (cashFlow.status === 'PAID' || cashFlow.status === 'RECEIVED') {
+          await this.postToLedger(tx, cashFlow, 'reverse');
+        }
 
-      await prisma.cashFlow.delete({
-        where: { id },
+        await tx.cashFlow.delete({
+          where: { id },
+        });
       });
 
       // Deletar evento do calendário se existir
@@ -259,9 +297,29 @@ class CashFlowService {
     }
   }
 
+  /**
+   * Totais do período por tipo e status, somados no banco.
+   *
+   * Meses fechados inteiramente dentro do período vêm de `cash_flow_monthly_rollups`
+   * (materializados na primeira leitura); só as bordas do período, o mês aberto e os meses
+   * ainda sem rollup são agregados em `cash_flows`. Com busca textual tudo é agregado ao vivo.
+   */
   async getSummary(filters: CashFlowFilters = {}) {
     try {
-      const cashFlows = await this.findAll(filters);
+      const totals: SummaryTotal[] = [];
+      let liveRanges: DateRange[] = [{}];
+      let rolledUpMonths = 0;
+
+      const window = filters.search ? null : await this.getRollupWindow(filters);
+      if (window) {
+        await this.ensureRollups(window.from, window.to);
+        const rollups = await this.readRollups(window.from, window.to, filters);
+        totals.push(...rollups.totals);
+        rolledUpMonths = rollups.months.size;
+        liveRanges = this.uncoveredRanges(window.from, window.to, rollups.months);
+      }
+
+      totals.push(...await this.aggregateLive(filters, liveRanges));
 
       const summary = {
         totalIncome: 0,
@@ -271,22 +329,23 @@ class CashFlowService {
         paidIncome: 0,
         paidExpense: 0,
         balance: 0,
+        rolledUpMonths,
       };
 
-      cashFlows.forEach((cf) => {
-        if (cf.type === 'INCOME') {
-          summary.totalIncome += cf.amount;
-          if (cf.status === 'RECEIVED') {
-            summary.paidIncome += cf.amount;
-          } else if (cf.status === 'PENDING') {
-            summary.pendingIncome += cf.amount;
+      totals.forEach(({ type, status, amount }) => {
+        if (type === 'INCOME') {
+          summary.totalIncome += amount;
+          if (status === 'RECEIVED') {
+            summary.paidIncome += amount;
+          } else if (status === 'PENDING') {
+            summary.pendingIncome += amount;
           }
         } else {
-          summary.totalExpense += cf.amount;
-          if (cf.status === 'PAID') {
-            summary.paidExpense += cf.amount;
-          } else if (cf.status === 'PENDING') {
-            summary.pendingExpense += cf.amount;
+          summary.totalExpense += amount;
+          if (status === 'PAID') {
+            summary.paidExpense += amount;
+          } else if (status === 'PENDING') {
+            summary.pendingExpense += amount;
           }
         }
       });
@@ -301,22 +360,189 @@ class CashFlowService {
     }
   }
 
-  private async updateAccountBalance(accountId: string, amount: number, type: FinancialType) {
-    try {
-      const adjustment = type === 'INCOME' ? amount : -amount;
-      
-      await prisma.payerAccount.update({
-        where: { id: accountId },
-        data: {
-          balance: {
-            increment: adjustment,
-          },
-        },
-      });
-    } catch (error) {
-      logger.error('Error updating account balance:', error);
-      throw error;
+  /**
+   * Meses fechados [from, to) que cabem inteiros no período; sem período, desde o primeiro lançamento
+   */
+  private async getRollupWindow(filters: CashFlowFilters): Promise<{ from: Date; to: Date } | null> {
+    let from: Date;
+    let to = truncateDate(new Date(), 'month');
+
+    if (filters.startDate && filters.endDate) {
+      from = truncateDate(filters.startDate, 'month');
+      if (from < filters.startDate) from = nextBucket(from, 'month');
+      const afterEnd = truncateDate(new Date(filters.endDate.getTime() + 1), 'month');
+      if (afterEnd < to) to = afterEnd;
+    } else {
+      const { _min } = await prisma.cashFlow.aggregate({ _min: { date: true } });
+      if (!_min.date) return null;
+      from = truncateDate(_min.date, 'month');
+    }
+
+    return from < to ? { from, to } : null;
+  }
+
+  /**
+   * Materializa os meses do intervalo que ainda não têm rollup. Meses com gravação em
+   * andamento (lock ocupado pelo trigger) ficam para a próxima leitura e são somados ao vivo.
+   */
+  private async ensureRollups(from: Date, to: Date): Promise<void> {
+    const existing = await prisma.$queryRaw<Array<{ month: Date }>>`
+      SELECT DISTINCT "month" FROM "cash_flow_monthly_rollups"
+      WHERE "month" >= ${from} AND "month" < ${to}
+    `;
+    const materialized = new Set(existing.map(row => row.month.getTime()));
+
+    const missing: Date[] = [];
+    for (let month = from; month < to; month = nextBucket(month, 'month')) {
+      if (!materialized.has(month.getTime())) missing.push(month);
     }
+    if (missing.length === 0) return;
+
+    await prisma.$transaction(async (tx) => {
+      const locked = await tx.$queryRaw<Array<{ key: number }>>`
+        SELECT k AS "key" FROM unnest(${missing.map(monthKey)}::int[]) AS k
+        WHERE pg_try_advisory_xact_lock(${ROLLUP_LOCK_KEY}::int, k)
+      `;
+      const lockedKeys = new Set(locked.map(row => row.key));
+      const months = missing.filter(month => lockedKeys.has(monthKey(month)));
+      if (months.length === 0) return;
+
+      const ranges = months.map(month => Prisma.sql`("date" >= ${month} AND "date" < ${nextBucket(month, 'month')})`);
+      await tx.$executeRaw`
+        INSERT INTO "cash_flow_monthly_rollups"
+          ("id", "month", "type", "status", "accountId", "categoryId", "totalAmount", "entryCount", "refreshedAt")
+        SELECT gen_random_uuid()::text, date_trunc('month', "date"), "type", "status", "accountId", "categoryId",
+               SUM("amount"), COUNT(*)::int, CURRENT_TIMESTAMP
+        FROM "cash_flows"
+        WHERE ${Prisma.join(ranges, ' OR ')}
+        GROUP BY 2, 3, 4, 5, 6
+        ON CONFLICT ("month", "type", "status", "accountId", "categoryId") DO NOTHING
+      `;
+
+      // Mês fechado sem lançamentos: uma linha zerada (conta e categoria vazias) marca o mês como
+      // coberto, para não ser recalculado a cada leitura. O trigger a remove se o mês receber gravações.
+      await tx.$executeRaw`
+        INSERT INTO "cash_flow_monthly_rollups"
+          ("id", "month", "type", "status", "accountId", "categoryId", "totalAmount", "entryCount", "refreshedAt")
+        SELECT gen_random_uuid()::text, m, 'INCOME'::"FinancialType", 'PENDING'::"PaymentStatus", '', '', 0, 0, CURRENT_TIMESTAMP
+        FROM unnest(${months}::timestamp[]) AS m
+        WHERE NOT EXISTS (SELECT 1 FROM "cash_flow_monthly_rollups" r WHERE r."month" = m)
+        ON CONFLICT ("month", "type", "status", "accountId", "categoryId") DO NOTHING
+      `;
+    });
+  }
+
+  /**
+   * Totais das rollups do intervalo e os meses cobertos por elas, lidos na mesma consulta
+   * para que um mês invalidado no meio da leitura não fique de fora das duas partes
+   */
+  private async readRollups(from: Date, to: Date, filters: CashFlowFilters) {
+    const conditions = [Prisma.sql`r."month" = m."month"`];
+    if (filters.type) conditions.push(Prisma.sql`r."type" = ${filters.type}::"FinancialType"`);
+    if (filters.status) conditions.push(Prisma.sql`r."status" = ${filters.status}::"PaymentStatus"`);
+    if (filters.accountId) conditions.push(Prisma.sql`r."accountId" = ${filters.accountId}`);
+    if (filters.categoryId) conditions.push(Prisma.sql`r."categoryId" = ${filters.categoryId}`);
+
+    const rows = await prisma.$queryRaw<Array<{
+      month: Date;
+      type: FinancialType | null;
+      status: PaymentStatus | null;
+      amount: number | null;
+    }>>`
+      WITH months AS (
+        SELECT DISTINCT "month" FROM "cash_flow_monthly_rollups"
+        WHERE "month" >= ${from} AND "month" < ${to}
+      )
+      SELECT m."month", r."type", r."status", SUM(r."totalAmount")::double precision AS "amount"
+      FROM months m
+      LEFT JOIN "cash_flow_monthly_rollups" r ON ${Prisma.join(conditions, ' AND ')}
+      GROUP BY 1, 2, 3
+    `;
+
+    const totals: SummaryTotal[] = [];
+    rows.forEach(row => {
+      if (row.type && row.status) totals.push({ type: row.type, status: row.status, amount: row.amount || 0 });
+    });
+
+    return { totals, months: new Set(rows.map(row => row.month.getTime())) };
+  }
+
+  /**
+   * Trechos fora das rollups: antes e depois da janela e os meses sem rollup dentro dela
+   */
+  private uncoveredRanges(from: Date, to: Date, covered: Set<number>): DateRange[] {
+    const ranges: DateRange[] = [{ to: from }];
+
+    for (let month = from; month < to; month = nextBucket(month, 'month')) {
+      if (covered.has(month.getTime())) continue;
+      const last = ranges[ranges.length - 1];
+      if (last.to && last.to.getTime() === month.getTime()) {
+        last.to = nextBucket(month, 'month');
+      } else {
+        ranges.push({ from: month, to: nextBucket(month, 'month') });
+      }
+    }
+
+    const last = ranges[ranges.length - 1];
+    if (last.to && last.to.getTime() === to.getTime()) {
+      delete last.to;
+    } else {
+      ranges.push({ from: to });
+    }
+
+    return ranges;
+  }
+
+  private async aggregateLive(filters: CashFlowFilters, ranges: DateRange[]): Promise<SummaryTotal[]> {
+    const where: Prisma.CashFlowWhereInput = {
+      AND: [{
+        OR: ranges.map(range => ({
+          date: { ...(range.from && { gte: range.from }), ...(range.to && { lt: range.to }) },
+        })),
+      }],
+    };
+
+    if (filters.startDate && filters.endDate) {
+      where.date = { gte: filters.startDate, lte: filters.endDate };
+    }
+    if (filters.type) where.type = filters.type;
+    if (filters.categoryId) where.categoryId = filters.categoryId;
+    if (filters.accountId) where.accountId = filters.accountId;
+    if (filters.status) where.status = filters.status;
+    if (filters.search) {
+      where.OR = [
+        { description: { contains: filters.search, mode: 'insensitive' } },
+        { supplier: { contains: filters.search, mode: 'insensitive' } },
+        { reference: { contains: filters.search, mode: 'insensitive' } },
+      ];
+    }
+
+    const groups = await prisma.cashFlow.groupBy({
+      by: ['type', 'status'],
+      where,
+      _sum: { amount: true },
+    });
+
+    return groups.map(group => ({ type: group.type, status: group.status, amount: group._sum.amount || 0 }));
+  }
+
+  /**
+   * Lança a movimentação no extrato da conta (que também atualiza o saldo).
+   * Estornos são novos lançamentos com o valor invertido, datados do momento do estorno.
+   * Roda na transação da escrita da movimentação; uma falha aqui desfaz a escrita inteira.
+   */
+  private async postToLedger(tx: Prisma.TransactionClient, cashFlow: CashFlow, operation: 'settle' | 'reverse') {
+    const signed = cashFlow.type === 'INCOME' ? cashFlow.amount : -cashFlow.amount;
+    const reversing = operation === 'reverse';
+
+    await accountLedgerService.post({
+      accountId: cashFlow.accountId,
+      amount: reversing ? -signed : signed,
+      entryDate: reversing ? new Date() : cashFlow.paymentDate || cashFlow.date,
+      sourceType: 'CASH_FLOW',
+      sourceId: cashFlow.id,
+      description: reversing ? `Estorno - ${cashFlow.description}` : cashFlow.description,
+    }, tx);
   }
 }
 
@@ -1,4 +1,4 @@
-import { PurchaseStatus } from '@prisma/client';
+import { Prisma, PurchaseStatus } from '@prisma/client';
 import { CattlePurchaseRepository } from '@/repositories/cattlePurchase.repository';
 import { PenRepository } from '@/repositories/pen.repository';
 import { AppError } from '@/utils/AppError';
@@ -6,6 +6,7 @@ import { prisma } from '@/config/database';
 import { CodeGeneratorService } from '@/services/codeGenerator.service';
 import { ExpenseService } from '@/services/expense.service';
 import { CattlePurchaseCashFlowService } from '@/services/cattlePurchaseCashFlow.service';
+import { purchaseFinancialSyncService } from '@/services/purchaseFinancialSync.service';
 
 interface CreateCattlePurchaseData {
   vendorId: string;
@@ -54,6 +55,29 @@ interface MarkAsConfinedData {
   notes?: string;
 }
 
+interface BatchReceptionItem extends RegisterReceptionData {
+  purchaseId: string;
+}
+
+interface BatchConfinementItem extends MarkAsConfinedData {
+  purchaseId: string;
+}
+
+interface BatchLotResult {
+  purchaseId: string;
+  lotCode?: string;
+  success: boolean;
+  status?: PurchaseStatus;
+  allocatedPens?: number;
+  error?: string;
+}
+
+interface PenAvailability {
+  penNumber: string;
+  capacity: number;
+  occupied: number;
+}
+
 export class CattlePurchaseService {
   private repository: CattlePurchaseRepository;
   private penRepository: PenRepository;
@@ -68,83 +92,12 @@ export class CattlePurchaseService {
   }
 
   async create(data: CreateCattlePurchaseData) {
-    // Gerar códigos únicos
-    const lotCode = await this.generateLotCode();
+    // Gerar código único e criar a compra na mesma transação (ver reserveLotCodes)
     // Removido internalCode - usando apenas lotCode
-    
-    // IMPORTANTE: Sempre usar 50% como rendimento padrão para evitar divergências
-    const rendimentoPadrao = 50;
-    const rendimentoFinal = data.carcassYield || rendimentoPadrao;
-    
-    // Se purchaseValue foi fornecido, usa ele; senão calcula
-    let purchaseValue: number;
-    if (data.purchaseValue && data.purchaseValue > 0) {
-      // Usar valor fornecido (útil para importação)
-      purchaseValue = data.purchaseValue;
-      
-      // Validar se o valor está correto (tolerância de 1%)
-      const valorCalculado = ((data.purchaseWeight * rendimentoFinal) / 100 / 15) * data.pricePerArroba;
-      const diferenca = Math.abs(purchaseValue - valorCalculado);
-      const percentualDiferenca = (diferenca / valorCalculado) * 100;
-      
-      if (percentualDiferenca > 1) {
-        console.warn(`⚠️ AVISO: Valor fornecido diverge ${percentualDiferenca.toFixed(2)}% do calculado`);
-        console.warn(`  Fornecido: R$ ${purchaseValue.toFixed(2)}`);
-        console.warn(`  Calculado: R$ ${valorCalculado.toFixed(2)}`);
-        console.warn(`  Rendimento: ${rendimentoFinal}%`);
-      }
-    } else {
-      // Calcular valor da compra - preço por arroba é aplicado sobre peso da carcaça
-      const carcassWeight = (data.purchaseWeight * rendimentoFinal) / 100;
-      purchaseValue = (carcassWeight / 15) * data.pricePerArroba;
-    }
-    
-    // Calcular custos totais
-    const totalCost = purchaseValue + 
-                     (data.freightCost || 0) + 
-                     (data.commission || 0);
-
-    // Filtrar campos nulos/undefined para evitar violações de FK
-    const createData: any = {
-      vendorId: data.vendorId,
-      payerAccountId: data.payerAccountId,
-      userId: data.userId,
-      lotCode,
-      purchaseDate: data.purchaseDate,
-      animalType: data.animalType,
-      initialQuantity: data.initialQuantity,
-      purchaseWeight: data.purchaseWeight,
-      carcassYield: rendimentoFinal,
-      pricePerArroba: data.pricePerArroba,
-      paymentType: data.paymentType,
-      purchaseValue,
-      totalCost,
-      currentQuantity: data.initialQuantity,
-      status: 'CONFIRMED' as const,
-      deathCount: 0,
-      averageWeight: data.purchaseWeight / data.initialQuantity
-    };
-
-    // Adicionar campos opcionais apenas se existirem
-    if (data.brokerId) createData.brokerId = data.brokerId;
-    if (data.transportCompanyId) createData.transportCompanyId = data.transportCompanyId;
-    if (data.location) createData.location = data.location;
-    if (data.city) createData.city = data.city;
-    if (data.state) createData.state = data.state;
-    if (data.farm) createData.farm = data.farm;
-    if (data.animalAge) createData.animalAge = data.animalAge;
-    if (data.paymentTerms) createData.paymentTerms = data.paymentTerms;
-    if (data.freightCost) createData.freightCost = data.freightCost;
-    if (data.freightDistance) createData.freightDistance = data.freightDistance;
-    if (data.commission) createData.commission = data.commission;
-    if (data.notes) createData.notes = data.notes;
-    
-    // Mapear campos com nomes diferentes
-    if (data.paymentDate) createData.principalDueDate = data.paymentDate;
-    if (data.commissionType) createData.commissionPaymentType = data.commissionType;
-
-    // Criar a compra
-    const purchase = await this.repository.create(createData);
+    const purchase = await prisma.$transaction(async (tx) => {
+      const [lotCode] = await this.reserveLotCodes(1, tx);
+      return tx.cattlePurchase.create({ data: this.buildCreateData(data, lotCode) });
+    });
     
     // Status de integração financeira
     const integrationStatus = {
@@ -244,6 +197,85 @@ export class CattlePurchaseService {
     };
   }
 
+  /**
+   * Monta os dados de criação de uma compra (valor, custo total e campos opcionais).
+   * Compartilhado entre o cadastro unitário e a importação em lote.
+   */
+  buildCreateData(data: CreateCattlePurchaseData & Record<string, any>, lotCode: string) {
+    // IMPORTANTE: Sempre usar 50% como rendimento padrão para evitar divergências
+    const rendimentoPadrao = 50;
+    const rendimentoFinal = data.carcassYield || rendimentoPadrao;
+    
+    // Se purchaseValue foi fornecido, usa ele; senão calcula
+    let purchaseValue: number;
+    if (data.purchaseValue && data.purchaseValue > 0) {
+      // Usar valor fornecido (útil para importação)
+      purchaseValue = data.purchaseValue;
+      
+      // Validar se o valor está correto (tolerância de 1%)
+      const valorCalculado = ((data.purchaseWeight * rendimentoFinal) / 100 / 15) * data.pricePerArroba;
+      const diferenca = Math.abs(purchaseValue - valorCalculado);
+      const percentualDiferenca = (diferenca / valorCalculado) * 100;
+      
+      if (percentualDiferenca > 1) {
+        console.warn(`⚠️ AVISO: Valor fornecido diverge ${percentualDiferenca.toFixed(2)}% do calculado`);
+        console.warn(`  Fornecido: R$ ${purchaseValue.toFixed(2)}`);
+        console.warn(`  Calculado: R$ ${valorCalculado.toFixed(2)}`);
+        console.warn(`  Rendimento: ${rendimentoFinal}%`);
+      }
+    } else {
+      // Calcular valor da compra - preço por arroba é aplicado sobre peso da carcaça
+      const carcassWeight = (data.purchaseWeight * rendimentoFinal) / 100;
+      purchaseValue = (carcassWeight / 15) * data.pricePerArroba;
+    }
+    
+    // Calcular custos totais
+    const totalCost = purchaseValue + 
+                     (data.freightCost || 0) + 
+                     (data.commission || 0);
+
+    // Filtrar campos nulos/undefined para evitar violações de FK
+    const createData: any = {
+      vendorId: data.vendorId,
+      payerAccountId: data.payerAccountId,
+      userId: data.userId,
+      lotCode,
+      purchaseDate: data.purchaseDate,
+      animalType: data.animalType,
+      initialQuantity: data.initialQuantity,
+      purchaseWeight: data.purchaseWeight,
+      carcassYield: rendimentoFinal,
+      pricePerArroba: data.pricePerArroba,
+      paymentType: data.paymentType,
+      purchaseValue,
+      totalCost,
+      currentQuantity: data.initialQuantity,
+      status: 'CONFIRMED' as const,
+      deathCount: 0,
+      averageWeight: data.purchaseWeight / data.initialQuantity
+    };
+
+    // Adicionar campos opcionais apenas se existirem
+    if (data.brokerId) createData.brokerId = data.brokerId;
+    if (data.transportCompanyId) createData.transportCompanyId = data.transportCompanyId;
+    if (data.location) createData.location = data.location;
+    if (data.city) createData.city = data.city;
+    if (data.state) createData.state = data.state;
+    if (data.farm) createData.farm = data.farm;
+    if (data.animalAge) createData.animalAge = data.animalAge;
+    if (data.paymentTerms) createData.paymentTerms = data.paymentTerms;
+    if (data.freightCost) createData.freightCost = data.freightCost;
+    if (data.freightDistance) createData.freightDistance = data.freightDistance;
+    if (data.commission) createData.commission = data.commission;
+    if (data.notes) createData.notes = data.notes;
+    
+    // Mapear campos com nomes diferentes
+    if (data.paymentDate) createData.principalDueDate = data.paymentDate;
+    if (data.commissionType) createData.commissionPaymentType = data.commissionType;
+
+    return createData;
+  }
+
   async findAll(filters: any = {}, pagination?: any) {
     // Temporariamente sem include para testar
     return await this.repository.findAll(filters, pagination);
@@ -346,48 +378,37 @@ export class CattlePurchaseService {
       throw new AppError('Apenas compras confirmadas podem ser recepcionadas', 400);
     }
 
-    // Calcular quebra de peso
-    const weightBreak = purchase.purchaseWeight - data.receivedWeight;
-    const weightBreakPercentage = (weightBreak / purchase.purchaseWeight) * 100;
-    
-    // Calcular mortalidade
-    const transportMortality = data.transportMortality || 
-                              (purchase.initialQuantity - data.actualQuantity);
-
     // Se tiver alocações de curral, processar recepção e alocação juntas
     if (data.penAllocations && data.penAllocations.length > 0) {
       // Validar total de animais alocados
-      const totalAllocated = data.penAllocations.reduce((sum: number, alloc) => sum + alloc.quantity, 0);
-      if (totalAllocated !== data.actualQuantity) {
-        throw new AppError(`Total alocado (${totalAllocated}) deve ser igual à quantidade recebida (${data.actualQuantity})`, 400);
+      const totalError = this.validateAllocationTotal(data.penAllocations, data.actualQuantity, 'quantidade recebida');
+      if (totalError) {
+        throw totalError;
       }
 
       // Executar em transação
       return await prisma.$transaction(async (tx) => {
-        // Atualizar compra para ACTIVE direto
-        const updatedPurchase = await tx.cattlePurchase.update({
+        // Verificar disponibilidade de todos os currais de uma vez
+        const availability = await this.loadPenAvailability(
+          tx,
+          data.penAllocations!.map(a => a.penId)
+        );
+        const capacityError = this.reservePenCapacity(availability, data.penAllocations!);
+        if (capacityError) {
+          throw capacityError;
+        }
+
+        // Criar alocações em lote
+        await this.persistAllocations(tx, [{
+          purchaseId: id,
+          lotQuantity: data.actualQuantity,
+          penAllocations: data.penAllocations!
+        }], availability);
+
+        // Atualizar status para CONFINED quando recepcionado com alocação
+        return await tx.cattlePurchase.update({
           where: { id },
-          data: {
-            receivedDate: data.receivedDate,
-            receivedWeight: data.receivedWeight,
-            currentQuantity: data.actualQuantity,
-            transportMortality,
-            weightBreakPercentage,
-            deathCount: transportMortality,
-            freightDistance: data.freightDistance || purchase.freightDistance,
-            freightCostPerKm: data.freightCostPerKm || purchase.freightCostPerKm,
-            freightCost: data.freightValue || purchase.freightCost,
-            // transportCompanyId removido temporariamente - será tratado separadamente se necessário
-            expectedGMD: data.estimatedGMD || purchase.expectedGMD,
-            // Atualizar status para CONFINED quando recepcionado com alocação
-            status: 'CONFINED' as PurchaseStatus,
-            averageWeight: data.receivedWeight / data.actualQuantity,
-            notes: [
-              purchase.notes,
-              data.mortalityReason ? `Motivo da mortalidade: ${data.mortalityReason}` : null,
-              data.notes
-            ].filter(Boolean).join('\n').trim() || null
-          },
+          data: this.buildReceptionUpdate(purchase, data, 'CONFINED'),
           include: {
             vendor: true,
             broker: true,
@@ -396,154 +417,41 @@ export class CattlePurchaseService {
             }
           }
         });
-
-        // Criar alocações de curral
-        for (const allocation of data.penAllocations) {
-          // Buscar capacidade do curral para calcular percentageOfPen
-          const pen = await tx.pen.findUnique({
-            where: { id: allocation.penId }
-          });
-          
-          await tx.lotPenLink.create({
-            data: {
-              purchaseId: id,
-              penId: allocation.penId,
-              quantity: allocation.quantity,
-              allocationDate: new Date(),
-              status: 'ACTIVE',
-              percentageOfLot: (allocation.quantity / data.actualQuantity) * 100,
-              percentageOfPen: pen ? (allocation.quantity / pen.capacity) * 100 : 0
-            }
-          });
-
-          // Atualização de ocupação removida - currentOccupancy é calculado dinamicamente
-        }
-
-        return updatedPurchase;
       });
     } else {
       // Apenas registrar recepção sem alocação (mantém compatibilidade)
-      return await this.repository.update(id, {
-        receivedDate: data.receivedDate,
-        receivedWeight: data.receivedWeight,
-        currentQuantity: data.actualQuantity,
-        transportMortality,
-        weightBreakPercentage,
-        deathCount: transportMortality,
-        freightDistance: data.freightDistance || purchase.freightDistance,
-        freightCostPerKm: data.freightCostPerKm || purchase.freightCostPerKm,
-        freightCost: data.freightValue || purchase.freightCost,
-        // transportCompanyId removido temporariamente
-        expectedGMD: data.estimatedGMD || purchase.expectedGMD,
-        // Atualizar status para RECEIVED
-        status: 'RECEIVED' as PurchaseStatus,
-        averageWeight: data.receivedWeight / data.actualQuantity,
-        notes: [
-          purchase.notes,
-          data.mortalityReason ? `Motivo da mortalidade: ${data.mortalityReason}` : null,
-          data.notes
-        ].filter(Boolean).join('\n').trim() || null
-      });
+      // Atualizar status para RECEIVED
+      return await this.repository.update(id, this.buildReceptionUpdate(purchase, data, 'RECEIVED'));
     }
   }
   
   async syncFinancialExpenses(purchaseId: string, userId: string) {
-    // Buscar a compra
-    const purchase = await this.findById(purchaseId);
-    
-    // Verificar se já existem despesas
-    const existingExpenses = await this.expenseService.findByPurchaseId(purchaseId);
-    
-    const syncStatus = {
+    // Garante que a compra existe
+    await this.findById(purchaseId);
+
+    const result = await purchaseFinancialSyncService.syncPurchases([purchaseId], userId);
+    const changes = result.expenses.created + result.expenses.updated + result.expenses.deleted
+      + result.cashFlows.created + result.cashFlows.updated + result.cashFlows.deleted;
+
+    return {
       purchaseId,
-      expensesCreated: 0,
-      expensesExisting: existingExpenses.length,
-      errors: [] as string[],
-      success: true
+      success: true,
+      ...result,
+      message: changes > 0
+        ? `Sincronização concluída: ${result.expenses.created} despesa(s) criada(s), ${result.expenses.updated} atualizada(s), ${result.expenses.deleted} removida(s)`
+        : 'Despesas já estão sincronizadas'
     };
-    
-    // Se já existem despesas, retornar status
-    if (existingExpenses.length >= 3) {
-      return {
-        ...syncStatus,
-        message: 'Despesas já estão sincronizadas'
-      };
-    }
-    
-    const lotCode = purchase.lotCode || `LOT-${purchase.id.slice(-6)}`;
-    
-    // Verificar e criar despesa principal se não existir
-    const hasMainExpense = existingExpenses.some(exp => exp.category === 'animal_purchase');
-    if (!hasMainExpense && purchase.purchaseValue > 0) {
-      try {
-        await this.expenseService.create({
-          category: 'animal_purchase',
-          description: `Compra de gado - ${lotCode}`,
-          totalAmount: purchase.purchaseValue,
-          dueDate: purchase.principalDueDate || purchase.purchaseDate,
-          impactsCashFlow: true,
-          purchaseId: purchase.id,
-          vendorId: purchase.vendorId,
-          payerAccountId: purchase.payerAccountId,
-          notes: `Compra de ${purchase.initialQuantity} animais - ${purchase.purchaseWeight}kg total`
-        }, userId);
-        syncStatus.expensesCreated++;
-      } catch (err: any) {
-        syncStatus.errors.push(`Erro ao criar despesa principal: ${err.message}`);
-        syncStatus.success = false;
-      }
-    }
-    
-    // Verificar e criar despesa de frete se não existir
-    const hasFreightExpense = existingExpenses.some(exp => exp.category === 'freight');
-    if (!hasFreightExpense && purchase.freightCost && purchase.freightCost > 0) {
-      try {
-        await this.expenseService.create({
-          category: 'freight',
-          description: `Frete - ${lotCode}`,
-          totalAmount: purchase.freightCost,
-          dueDate: purchase.freightDueDate || purchase.purchaseDate,
-          impactsCashFlow: true,
-          purchaseId: purchase.id,
-          vendorId: purchase.transportCompanyId,
-          payerAccountId: purchase.payerAccountId,
-          notes: purchase.freightDistance ? `Distância: ${purchase.freightDistance}km` : null
-        }, userId);
-        syncStatus.expensesCreated++;
-      } catch (err: any) {
-        syncStatus.errors.push(`Erro ao criar despesa de frete: ${err.message}`);
-        syncStatus.success = false;
-      }
-    }
-    
-    // Verificar e criar despesa de comissão se não existir
-    const hasCommissionExpense = existingExpenses.some(exp => exp.category === 'commission');
-    if (!hasCommissionExpense && purchase.commission && purchase.commission > 0) {
-      try {
-        await this.expenseService.create({
-          category: 'commission',
-          description: `Comissão - ${lotCode}`,
-          totalAmount: purchase.commission,
-          dueDate: purchase.commissionDueDate || purchase.purchaseDate,
-          impactsCashFlow: true,
-          purchaseId: purchase.id,
-          vendorId: purchase.brokerId,
-          payerAccountId: purchase.payerAccountId,
-          notes: `Comissão sobre compra - ${lotCode}`
-        }, userId);
-        syncStatus.expensesCreated++;
-      } catch (err: any) {
-        syncStatus.errors.push(`Erro ao criar despesa de comissão: ${err.message}`);
-        syncStatus.success = false;
-      }
+  }
+
+  /**
+   * Sincroniza várias compras, ou todas quando nenhum id é informado (em lotes)
+   */
+  async syncFinancialExpensesBulk(purchaseIds: string[] | undefined, userId: string, batchSize?: number) {
+    if (purchaseIds && purchaseIds.length > 0) {
+      return purchaseFinancialSyncService.syncPurchases(purchaseIds, userId);
     }
-    
-    return {
-      ...syncStatus,
-      message: syncStatus.expensesCreated > 0 
-        ? `${syncStatus.expensesCreated} despesa(s) criada(s) com sucesso`
-        : 'Nenhuma despesa nova foi necessária'
-    };
+
+    return purchaseFinancialSyncService.resyncAll({ batchSize });
   }
 
   async markAsConfined(id: string, data: MarkAsConfinedData) {
@@ -554,9 +462,9 @@ export class CattlePurchaseService {
     }
 
     // Validar total de animais alocados
-    const totalAllocated = data.penAllocations.reduce((sum: number, alloc) => sum + alloc.quantity, 0);
-    if (totalAllocated !== purchase.currentQuantity) {
-      throw new AppError(`Total alocado (${totalAllocated}) deve ser igual à quantidade atual (${purchase.currentQuantity})`, 400);
+    const totalError = this.validateAllocationTotal(data.penAllocations, purchase.currentQuantity, 'quantidade atual');
+    if (totalError) {
+      throw totalError;
     }
 
     // Executar em transação
@@ -573,52 +481,23 @@ export class CattlePurchaseService {
         }
       });
 
-      // Criar novas alocações
-      const allocationDate = new Date();
-      for (const allocation of data.penAllocations) {
-        // Verificar disponibilidade do curral
-        const pen = await tx.pen.findUnique({
-          where: { id: allocation.penId },
-          include: {
-            lotAllocations: {
-              where: { status: 'ACTIVE' }
-            }
-          }
-        });
-
-        if (!pen) {
-          throw new AppError(`Curral ${allocation.penId} não encontrado`, 404);
-        }
-
-        const currentOccupation = pen.lotAllocations.reduce((sum: number, alloc: any) => sum + alloc.quantity, 0);
-        const availableSpace = pen.capacity - currentOccupation;
-
-        if (allocation.quantity > availableSpace) {
-          throw new AppError(`Curral ${pen.penNumber} não tem espaço suficiente. Disponível: ${availableSpace}`, 400);
-        }
-
-        // Criar alocação
-        await tx.lotPenLink.create({
-          data: {
-            purchaseId: id,
-            penId: allocation.penId,
-            quantity: allocation.quantity,
-            percentageOfLot: (allocation.quantity / purchase.currentQuantity) * 100,
-            percentageOfPen: (allocation.quantity / pen.capacity) * 100,
-            allocationDate,
-            status: 'ACTIVE'
-          }
-        });
-
-        // Atualizar status do curral
-        if (currentOccupation + allocation.quantity >= pen.capacity) {
-          await tx.pen.update({
-            where: { id: allocation.penId },
-            data: { status: 'OCCUPIED' }
-          });
-        }
+      // Verificar disponibilidade de todos os currais de uma vez
+      const availability = await this.loadPenAvailability(
+        tx,
+        data.penAllocations.map(a => a.penId)
+      );
+      const capacityError = this.reservePenCapacity(availability, data.penAllocations);
+      if (capacityError) {
+        throw capacityError;
       }
 
+      // Criar novas alocações em lote
+      await this.persistAllocations(tx, [{
+        purchaseId: id,
+        lotQuantity: purchase.currentQuantity,
+        penAllocations: data.penAllocations
+      }], availability);
+
       // Atualizar status da compra
       const updated = await tx.cattlePurchase.update({
         where: { id },
@@ -642,6 +521,188 @@ export class CattlePurchaseService {
     });
   }
 
+  /**
+   * Recepção em lote - registra a chegada de vários lotes (ex: comboio) em uma única requisição.
+   * A capacidade dos currais é validada uma vez contra todos os lotes e as alocações
+   * são gravadas com insert em lote. Lotes inválidos são reportados sem bloquear os demais.
+   */
+  async registerReceptionBatch(items: BatchReceptionItem[]) {
+    const purchases = await this.loadBatchPurchases(items.map(item => item.purchaseId));
+
+    const results: BatchLotResult[] = [];
+    const accepted: Array<{ item: BatchReceptionItem; purchase: any; result: BatchLotResult }> = [];
+    const seen = new Set<string>();
+
+    // Capacidade conferida e alocações gravadas na mesma transação
+    await prisma.$transaction(async (tx) => {
+      const availability = await this.loadPenAvailability(
+        tx,
+        items.flatMap(item => (item.penAllocations || []).map(a => a.penId))
+      );
+
+      for (const item of items) {
+        const purchase = purchases.get(item.purchaseId);
+        const result: BatchLotResult = {
+          purchaseId: item.purchaseId,
+          lotCode: purchase?.lotCode,
+          success: false
+        };
+        results.push(result);
+
+        const error = this.validateBatchItem(item.purchaseId, purchase, 'CONFIRMED', seen)
+          || this.validateAllocationTotal(item.penAllocations, item.actualQuantity, 'quantidade recebida')
+          || this.reservePenCapacity(availability, item.penAllocations || []);
+
+        if (error) {
+          result.error = error.message;
+          continue;
+        }
+
+        accepted.push({ item, purchase, result });
+      }
+
+      if (accepted.length === 0) {
+        return;
+      }
+
+      for (const { item, purchase, result } of accepted) {
+        const hasAllocations = !!item.penAllocations && item.penAllocations.length > 0;
+        const status: PurchaseStatus = hasAllocations ? 'CONFINED' : 'RECEIVED';
+
+        await tx.cattlePurchase.update({
+          where: { id: purchase.id },
+          data: this.buildReceptionUpdate(purchase, item, status)
+        });
+
+        result.status = status;
+      }
+
+      await this.persistAllocations(
+        tx,
+        accepted
+          .filter(({ item }) => item.penAllocations && item.penAllocations.length > 0)
+          .map(({ item }) => ({
+            purchaseId: item.purchaseId,
+            lotQuantity: item.actualQuantity,
+            penAllocations: item.penAllocations!
+          })),
+        availability
+      );
+    }, { timeout: 60000 });
+
+    accepted.forEach(({ item, result }) => {
+      result.success = true;
+      result.allocatedPens = item.penAllocations?.length || 0;
+    });
+
+    return this.summarizeBatch(results);
+  }
+
+  /**
+   * Confinamento em lote - aloca vários lotes já recepcionados em currais de uma vez.
+   */
+  async markAsConfinedBatch(items: BatchConfinementItem[]) {
+    const purchases = await this.loadBatchPurchases(items.map(item => item.purchaseId));
+
+    const results: BatchLotResult[] = [];
+    const accepted: Array<{ item: BatchConfinementItem; purchase: any; result: BatchLotResult }> = [];
+    const seen = new Set<string>();
+
+    await prisma.$transaction(async (tx) => {
+      const availability = await this.loadPenAvailability(
+        tx,
+        items.flatMap(item => item.penAllocations.map(a => a.penId))
+      );
+
+      // Alocações ativas dos lotes: só deixam de contar na ocupação quando o lote é aceito
+      // (e elas são substituídas); as de lotes recusados continuam ocupando o curral
+      const ownAllocations = await tx.lotPenLink.findMany({
+        where: { purchaseId: { in: [...purchases.keys()] }, status: 'ACTIVE' },
+        select: { purchaseId: true, penId: true, quantity: true }
+      });
+      const shiftOccupancy = (purchaseId: string, sign: 1 | -1) => ownAllocations
+        .filter(allocation => allocation.purchaseId === purchaseId)
+        .forEach(allocation => {
+          const pen = availability.get(allocation.penId);
+          if (pen) pen.occupied += sign * allocation.quantity;
+        });
+
+      for (const item of items) {
+        const purchase = purchases.get(item.purchaseId);
+        const result: BatchLotResult = {
+          purchaseId: item.purchaseId,
+          lotCode: purchase?.lotCode,
+          success: false
+        };
+        results.push(result);
+
+        let error = this.validateBatchItem(item.purchaseId, purchase, 'RECEIVED', seen)
+          || this.validateAllocationTotal(item.penAllocations, purchase.currentQuantity, 'quantidade atual');
+
+        if (!error) {
+          shiftOccupancy(purchase.id, -1);
+          error = this.reservePenCapacity(availability, item.penAllocations);
+          if (error) shiftOccupancy(purchase.id, 1);
+        }
+
+        if (error) {
+          result.error = error.message;
+          continue;
+        }
+
+        accepted.push({ item, purchase, result });
+      }
+
+      if (accepted.length === 0) {
+        return;
+      }
+
+      const acceptedIds = accepted.map(({ purchase }) => purchase.id);
+
+      await tx.lotPenLink.updateMany({
+        where: { purchaseId: { in: acceptedIds }, status: 'ACTIVE' },
+        data: { status: 'REMOVED', removalDate: new Date() }
+      });
+
+      await this.persistAllocations(
+        tx,
+        accepted.map(({ item, purchase }) => ({
+          purchaseId: purchase.id,
+          lotQuantity: purchase.currentQuantity,
+          penAllocations: item.penAllocations
+        })),
+        availability
+      );
+
+      // Lotes sem observação nova recebem o status em um único update
+      const withoutNotes = accepted.filter(({ item }) => !item.notes).map(({ purchase }) => purchase.id);
+      if (withoutNotes.length > 0) {
+        await tx.cattlePurchase.updateMany({
+          where: { id: { in: withoutNotes } },
+          data: { status: 'CONFINED' as PurchaseStatus }
+        });
+      }
+
+      for (const { item, purchase } of accepted.filter(({ item }) => !!item.notes)) {
+        await tx.cattlePurchase.update({
+          where: { id: purchase.id },
+          data: {
+            status: 'CONFINED' as PurchaseStatus,
+            notes: `${purchase.notes || ''}\n${item.notes}`.trim()
+          }
+        });
+      }
+    }, { timeout: 60000 });
+
+    accepted.forEach(({ item, result }) => {
+      result.success = true;
+      result.status = 'CONFINED';
+      result.allocatedPens = item.penAllocations.length;
+    });
+
+    return this.summarizeBatch(results);
+  }
+
   // DEPRECATED: Método antigo de registro de morte - será removido
   // Mortes agora são gerenciadas pelo DeathRecordService
   async registerDeath(id: string, count: number, date: Date) {
@@ -700,23 +761,226 @@ export class CattlePurchaseService {
     return await this.repository.getDashboardSummary(dateRange);
   }
 
-  private async generateLotCode(): Promise<string> {
+  private buildReceptionUpdate(purchase: any, data: RegisterReceptionData, status: PurchaseStatus) {
+    // Calcular quebra de peso
+    const weightBreak = purchase.purchaseWeight - data.receivedWeight;
+    const weightBreakPercentage = (weightBreak / purchase.purchaseWeight) * 100;
+
+    // Calcular mortalidade
+    const transportMortality = data.transportMortality ||
+                              (purchase.initialQuantity - data.actualQuantity);
+
+    return {
+      receivedDate: data.receivedDate,
+      receivedWeight: data.receivedWeight,
+      currentQuantity: data.actualQuantity,
+      transportMortality,
+      weightBreakPercentage,
+      deathCount: transportMortality,
+      freightDistance: data.freightDistance || purchase.freightDistance,
+      freightCostPerKm: data.freightCostPerKm || purchase.freightCostPerKm,
+      freightCost: data.freightValue || purchase.freightCost,
+      // transportCompanyId removido temporariamente - será tratado separadamente se necessário
+      expectedGMD: data.estimatedGMD || purchase.expectedGMD,
+      status,
+      averageWeight: data.receivedWeight / data.actualQuantity,
+      notes: [
+        purchase.notes,
+        data.mortalityReason ? `Motivo da mortalidade: ${data.mortalityReason}` : null,
+        data.notes
+      ].filter(Boolean).join('\n').trim() || null
+    };
+  }
+
+  private validateAllocationTotal(
+    penAllocations: Array<{ penId: string; quantity: number }> | undefined,
+    expected: number,
+    label: string
+  ): AppError | null {
+    if (!penAllocations || penAllocations.length === 0) {
+      return null;
+    }
+
+    const totalAllocated = penAllocations.reduce((sum: number, alloc) => sum + alloc.quantity, 0);
+    if (totalAllocated !== expected) {
+      return new AppError(`Total alocado (${totalAllocated}) deve ser igual à ${label} (${expected})`, 400);
+    }
+
+    return null;
+  }
+
+  private validateBatchItem(
+    purchaseId: string,
+    purchase: any,
+    expectedStatus: PurchaseStatus,
+    seen: Set<string>
+  ): AppError | null {
+    if (seen.has(purchaseId)) {
+      return new AppError('Compra repetida no mesmo lote de operações', 400);
+    }
+    seen.add(purchaseId);
+
+    if (!purchase) {
+      return new AppError('Compra não encontrada', 404);
+    }
+
+    if (purchase.status !== expectedStatus) {
+      return expectedStatus === 'CONFIRMED'
+        ? new AppError('Apenas compras confirmadas podem ser recepcionadas', 400)
+        : new AppError('Apenas compras recepcionadas podem ser confinadas', 400);
+    }
+
+    return null;
+  }
+
+  private async loadBatchPurchases(ids: string[]) {
+    const purchases = await prisma.cattlePurchase.findMany({
+      where: { id: { in: [...new Set(ids)] } }
+    });
+    return new Map(purchases.map(purchase => [purchase.id, purchase]));
+  }
+
+  /**
+   * Carrega capacidade e ocupação ativa dos currais com duas consultas, independente
+   * da quantidade de alocações.
+   */
+  private async loadPenAvailability(
+    client: Prisma.TransactionClient,
+    penIds: string[]
+  ): Promise<Map<string, PenAvailability>> {
+    const uniquePenIds = [...new Set(penIds)];
+    if (uniquePenIds.length === 0) {
+      return new Map();
+    }
+
+    const [pens, occupancy] = await Promise.all([
+      client.pen.findMany({
+        where: { id: { in: uniquePenIds } },
+        select: { id: true, penNumber: true, capacity: true }
+      }),
+      client.lotPenLink.groupBy({
+        by: ['penId'],
+        where: {
+          penId: { in: uniquePenIds },
+          status: 'ACTIVE'
+        },
+        _sum: { quantity: true }
+      })
+    ]);
+
+    const occupiedByPen = new Map(occupancy.map(row => [row.penId, row._sum.quantity || 0]));
+
+    return new Map(pens.map(pen => [pen.id, {
+      penNumber: pen.penNumber,
+      capacity: pen.capacity,
+      occupied: occupiedByPen.get(pen.id) || 0
+    }]));
+  }
+
+  /**
+   * Reserva espaço nos currais para as alocações informadas. Só altera a ocupação
+   * se todas as alocações couberem, para que um lote recusado não consuma capacidade.
+   */
+  private reservePenCapacity(
+    availability: Map<string, PenAvailability>,
+    penAllocations: Array<{ penId: string; quantity: number }>
+  ): AppError | null {
+    const requested = new Map<string, number>();
+    penAllocations.forEach(a => requested.set(a.penId, (requested.get(a.penId) || 0) + a.quantity));
+
+    for (const [penId, quantity] of requested) {
+      const pen = availability.get(penId);
+      if (!pen) {
+        return new AppError(`Curral ${penId} não encontrado`, 404);
+      }
+
+      const availableSpace = pen.capacity - pen.occupied;
+      if (quantity > availableSpace) {
+        return new AppError(`Curral ${pen.penNumber} não tem espaço suficiente. Disponível: ${availableSpace}`, 400);
+      }
+    }
+
+    requested.forEach((quantity, penId) => {
+      availability.get(penId)!.occupied += quantity;
+    });
+
+    return null;
+  }
+
+  private async persistAllocations(
+    tx: Prisma.TransactionClient,
+    lots: Array<{ purchaseId: string; lotQuantity: number; penAllocations: Array<{ penId: string; quantity: number }> }>,
+    availability: Map<string, PenAvailability>
+  ) {
+    if (lots.length === 0) {
+      return;
+    }
+
+    const allocationDate = new Date();
+
+    await tx.lotPenLink.createMany({
+      data: lots.flatMap(lot => lot.penAllocations.map(allocation => {
+        const pen = availability.get(allocation.penId)!;
+        return {
+          purchaseId: lot.purchaseId,
+          penId: allocation.penId,
+          quantity: allocation.quantity,
+          percentageOfLot: (allocation.quantity / lot.lotQuantity) * 100,
+          percentageOfPen: (allocation.quantity / pen.capacity) * 100,
+          allocationDate,
+          status: 'ACTIVE' as const
+        };
+      }))
+    });
+
+    // Atualizar status dos currais que ficaram lotados
+    const fullPenIds = [...new Set(lots.flatMap(lot => lot.penAllocations.map(a => a.penId)))]
+      .filter(penId => {
+        const pen = availability.get(penId)!;
+        return pen.occupied >= pen.capacity;
+      });
+
+    if (fullPenIds.length > 0) {
+      await tx.pen.updateMany({
+        where: { id: { in: fullPenIds } },
+        data: { status: 'OCCUPIED' }
+      });
+    }
+  }
+
+  private summarizeBatch(results: BatchLotResult[]) {
+    const succeeded = results.filter(r => r.success).length;
+    return {
+      total: results.length,
+      succeeded,
+      failed: results.length - succeeded,
+      results
+    };
+  }
+
+  /**
+   * Reserva `count` códigos de lote sequenciais do mês corrente com uma única consulta.
+   * Deve rodar na transação que insere as compras: o lock transacional serializa as
+   * reservas até o commit, para que cadastros e importações simultâneos não repitam códigos.
+   */
+  async reserveLotCodes(count: number, tx: Prisma.TransactionClient): Promise<string[]> {
     const now = new Date();
     const year = now.getFullYear().toString().slice(-2);
     const month = (now.getMonth() + 1).toString().padStart(2, '0');
-    
-    const lastPurchase = await this.repository.findOne(
-      { lotCode: { startsWith: `LOT-${year}${month}` } },
-      { orderBy: { lotCode: 'desc' } }
+    const prefix = `LOT-${year}${month}`;
+    
+    // Maior sufixo numérico do mês (ordenar lotCode como texto colocaria LOT-YYMM1000 antes de LOT-YYMM999)
+    await tx.$executeRaw`SELECT pg_advisory_xact_lock(hashtext('cattle_purchase_lot_codes'))`;
+    const [{ lastSequence }] = await tx.$queryRaw<Array<{ lastSequence: number | null }>>`
+      SELECT MAX(SUBSTRING("lotCode" FROM ${prefix.length + 1})::int) AS "lastSequence"
+      FROM "cattle_purchases"
+      WHERE "lotCode" LIKE ${`${prefix}%`}
+        AND SUBSTRING("lotCode" FROM ${prefix.length + 1}) ~ '^[0-9]+$'
+    `;
+    
+    return Array.from({ length: count }, (_, index) =>
+      `${prefix}${((lastSequence ?? 0) + index + 1).toString().padStart(3, '0')}`
     );
-    
-    let sequence = '001';
-    if (lastPurchase) {
-      const lastSequence = parseInt(lastPurchase.lotCode.slice(-3));
-      sequence = (lastSequence + 1).toString().padStart(3, '0');
-    }
-    
-    return `LOT-${year}${month}${sequence}`;
   }
 }
 
@@ -1,6 +1,30 @@
-import { PrismaClient } from '@prisma/client';
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
 
-const prisma = new PrismaClient();
+// Categorias padrão do sistema para movimentações de compra
+const PURCHASE_CATEGORY_IDS = {
+  cattle: 'cat-exp-01', // Compra de Gado
+  freight: 'cat-exp-02', // Frete de Gado
+  commission: 'cat-exp-03' // Comissão de Compra
+};
+
+type PurchaseWithPartners = Prisma.CattlePurchaseGetPayload<{
+  include: { vendor: true; broker: true; transportCompany: true };
+}>;
+
+type PurchaseCashFlowRow = ReturnType<CattlePurchaseCashFlowService['buildPurchaseCashFlows']>[number];
+
+export interface SyncCounters {
+  created: number;
+  updated: number;
+  deleted: number;
+  locked: number; // Já pagas: não são alteradas pela sincronização
+}
+
+const PURCHASE_REFERENCE_PREFIXES = ['COMPRA', 'COMISSAO', 'FRETE'];
+
+const sameAmount = (a: number | null, b: number | null) => Math.abs((a ?? 0) - (b ?? 0)) < 0.005;
+const sameDate = (a: Date | null, b: Date | null) => (a?.getTime() ?? null) === (b?.getTime() ?? null);
 
 export class CattlePurchaseCashFlowService {
   /**
@@ -23,98 +47,13 @@ export class CattlePurchaseCashFlowService {
         throw new Error('Compra não encontrada');
       }
 
+      // Compra, comissão e frete montados pela mesma regra da importação e da sincronização
       const cashFlows = [];
-      
-      // Buscar as categorias padrão do sistema
-      const categoryCompra = await prisma.category.findUnique({
-        where: { id: 'cat-exp-01' } // Compra de Gado
-      });
-      
-      const categoryComissao = await prisma.category.findUnique({
-        where: { id: 'cat-exp-03' } // Comissão de Compra
-      });
-      
-      const categoryFrete = await prisma.category.findUnique({
-        where: { id: 'cat-exp-02' } // Frete de Gado
-      });
-
-      if (!categoryCompra || !categoryComissao || !categoryFrete) {
-        console.warn('⚠️ Categorias padrão não encontradas. Execute o seed de categorias.');
-        console.warn(`Compra: ${categoryCompra?.id}, Comissão: ${categoryComissao?.id}, Frete: ${categoryFrete?.id}`);
-      } else {
-        console.log(`✅ Categorias encontradas - Compra: ${categoryCompra.id}, Comissão: ${categoryComissao.id}, Frete: ${categoryFrete.id}`);
+      for (const row of this.buildPurchaseCashFlows(purchase)) {
+        cashFlows.push(await prisma.cashFlow.create({ data: row }));
       }
 
-      // 1. Despesa principal - Compra do Gado
-      const cattleCashFlow = await prisma.cashFlow.create({
-        data: {
-          type: 'EXPENSE',
-          categoryId: categoryCompra?.id || 'cat-exp-01',
-          accountId: purchase.payerAccountId,
-          description: `Compra de Gado - ${purchase.lotCode}`,
-          amount: purchase.purchaseValue,
-          date: purchase.purchaseDate,
-          dueDate: purchase.principalDueDate || purchase.purchaseDate,
-          status: 'PENDING',
-          supplier: purchase.vendor?.name || 'Fornecedor não informado',
-          reference: `COMPRA-${purchase.lotCode}`,
-          notes: `${purchase.initialQuantity} cabeças | Peso médio: ${(purchase.purchaseWeight / purchase.initialQuantity).toFixed(2)}kg | R$ ${purchase.pricePerArroba.toFixed(2)}/@`,
-          tags: ['compra-gado', purchase.lotCode, purchase.animalType],
-          userId: purchase.userId
-        }
-      });
-      cashFlows.push(cattleCashFlow);
-      console.log(`✅ CashFlow de compra criado: R$ ${purchase.purchaseValue.toFixed(2)}`);
-
-      // 2. Despesa de Comissão (se houver)
-      if (purchase.commission > 0) {
-        const commissionCashFlow = await prisma.cashFlow.create({
-          data: {
-            type: 'EXPENSE',
-            categoryId: categoryComissao?.id || 'cat-exp-03',
-            accountId: purchase.payerAccountId,
-            description: `Comissão - ${purchase.lotCode}`,
-            amount: purchase.commission,
-            date: purchase.purchaseDate,
-            dueDate: purchase.commissionDueDate || purchase.purchaseDate,
-            status: 'PENDING',
-            supplier: purchase.broker?.name || 'Corretor não informado',
-            reference: `COMISSAO-${purchase.lotCode}`,
-            notes: `Comissão sobre compra de ${purchase.initialQuantity} cabeças`,
-            tags: ['comissao', purchase.lotCode],
-            userId: purchase.userId
-          }
-        });
-        cashFlows.push(commissionCashFlow);
-        console.log(`✅ CashFlow de comissão criado: R$ ${purchase.commission.toFixed(2)}`);
-      }
-
-      // 3. Despesa de Frete (se houver)
-      if (purchase.freightCost > 0) {
-        const freightCashFlow = await prisma.cashFlow.create({
-          data: {
-            type: 'EXPENSE',
-            categoryId: categoryFrete?.id || 'cat-exp-02',
-            accountId: purchase.payerAccountId,
-            description: `Frete - ${purchase.lotCode}`,
-            amount: purchase.freightCost,
-            date: purchase.purchaseDate,
-            dueDate: purchase.freightDueDate || purchase.purchaseDate,
-            status: 'PENDING',
-            supplier: purchase.transportCompany?.name || 'Transportadora não informada',
-            reference: `FRETE-${purchase.lotCode}`,
-            notes: purchase.freightDistance 
-              ? `Distância: ${purchase.freightDistance}km | R$ ${(purchase.freightCost / purchase.freightDistance).toFixed(2)}/km | Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'}`
-              : `Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'} | Destino: ${purchase.farm || 'Fazenda'}`,
-            tags: ['frete', purchase.lotCode],
-            userId: purchase.userId
-          }
-        });
-        cashFlows.push(freightCashFlow);
-        console.log(`✅ CashFlow de frete criado: R$ ${purchase.freightCost.toFixed(2)}`);
-      }
-
-      // 4. Criar eventos no calendário para vencimentos
+      // Criar eventos no calendário para vencimentos
       for (const cashFlow of cashFlows) {
         if (cashFlow.dueDate) {
           try {
@@ -162,6 +101,263 @@ export class CattlePurchaseCashFlowService {
     }
   }
 
+  /**
+   * Cria as movimentações de várias compras com inserts em lote.
+   * Usado pela importação, onde criar entrada por entrada multiplicaria as idas ao banco.
+   */
+  async createPurchaseCashFlowsBulk(purchaseIds: string[], client: Prisma.TransactionClient = prisma) {
+    if (purchaseIds.length === 0) {
+      return { cashFlowsCreated: 0, eventsCreated: 0 };
+    }
+
+    const purchases = await client.cattlePurchase.findMany({
+      where: { id: { in: purchaseIds } },
+      include: {
+        vendor: true,
+        broker: true,
+        transportCompany: true
+      }
+    });
+
+    const rows = purchases.flatMap(purchase => this.buildPurchaseCashFlows(purchase));
+    if (rows.length === 0) {
+      return { cashFlowsCreated: 0, eventsCreated: 0 };
+    }
+
+    const { count } = await client.cashFlow.createMany({ data: rows });
+
+    // Eventos de vencimento no calendário, também em lote
+    const created = await client.cashFlow.findMany({
+      where: { reference: { in: rows.map(row => row.reference) } },
+      select: { id: true, description: true, amount: true, dueDate: true, status: true }
+    });
+
+    const events = created
+      .filter(cashFlow => cashFlow.dueDate)
+      .map(cashFlow => ({
+        title: cashFlow.description,
+        date: cashFlow.dueDate!,
+        type: 'FINANCE' as const,
+        status: 'SCHEDULED' as const,
+        priority: 'MEDIUM' as const,
+        description: `Valor: R$ ${cashFlow.amount.toFixed(2)} | Status: ${cashFlow.status}`,
+        amount: cashFlow.amount,
+        relatedId: cashFlow.id,
+        autoGenerated: true
+      }));
+
+    if (events.length > 0) {
+      await client.calendarEvent.createMany({ data: events });
+    }
+
+    return { cashFlowsCreated: count, eventsCreated: events.length };
+  }
+
+  /**
+   * Monta as movimentações (compra, comissão e frete) esperadas para uma compra
+   */
+  buildPurchaseCashFlows(purchase: PurchaseWithPartners) {
+    const rows = [{
+      type: 'EXPENSE' as const,
+      categoryId: PURCHASE_CATEGORY_IDS.cattle,
+      accountId: purchase.payerAccountId,
+      description: `Compra de Gado - ${purchase.lotCode}`,
+      amount: purchase.purchaseValue,
+      date: purchase.purchaseDate,
+      dueDate: purchase.principalDueDate || purchase.purchaseDate,
+      status: 'PENDING' as const,
+      supplier: purchase.vendor?.name || 'Fornecedor não informado',
+      reference: `COMPRA-${purchase.lotCode}`,
+      notes: `${purchase.initialQuantity} cabeças | Peso médio: ${(purchase.purchaseWeight / purchase.initialQuantity).toFixed(2)}kg | R$ ${purchase.pricePerArroba.toFixed(2)}/@`,
+      tags: ['compra-gado', purchase.lotCode, purchase.animalType],
+      userId: purchase.userId
+    }];
+
+    if (purchase.commission > 0) {
+      rows.push({
+        type: 'EXPENSE' as const,
+        categoryId: PURCHASE_CATEGORY_IDS.commission,
+        accountId: purchase.payerAccountId,
+        description: `Comissão - ${purchase.lotCode}`,
+        amount: purchase.commission,
+        date: purchase.purchaseDate,
+        dueDate: purchase.commissionDueDate || purchase.purchaseDate,
+        status: 'PENDING' as const,
+        supplier: purchase.broker?.name || 'Corretor não informado',
+        reference: `COMISSAO-${purchase.lotCode}`,
+        notes: `Comissão sobre compra de ${purchase.initialQuantity} cabeças`,
+        tags: ['comissao', purchase.lotCode],
+        userId: purchase.userId
+      });
+    }
+
+    if (purchase.freightCost > 0) {
+      rows.push({
+        type: 'EXPENSE' as const,
+        categoryId: PURCHASE_CATEGORY_IDS.freight,
+        accountId: purchase.payerAccountId,
+        description: `Frete - ${purchase.lotCode}`,
+        amount: purchase.freightCost,
+        date: purchase.purchaseDate,
+        dueDate: purchase.freightDueDate || purchase.purchaseDate,
+        status: 'PENDING' as const,
+        supplier: purchase.transportCompany?.name || 'Transportadora não informada',
+        reference: `FRETE-${purchase.lotCode}`,
+        notes: purchase.freightDistance
+          ? `Distância: ${purchase.freightDistance}km | R$ ${(purchase.freightCost / purchase.freightDistance).toFixed(2)}/km | Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'}`
+          : `Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'} | Destino: ${purchase.farm || 'Fazenda'}`,
+        tags: ['frete', purchase.lotCode],
+        userId: purchase.userId
+      });
+    }
+
+    return rows;
+  }
+
+  /**
+   * Sincroniza as movimentações de várias compras pela diferença entre o esperado e o existente.
+   * Lê as movimentações atuais em uma única consulta e aplica inserts, updates e deletes em lote.
+   * Movimentações já pagas não são tocadas.
+   */
+  async syncPurchaseCashFlowsBulk(purchases: PurchaseWithPartners[], client: Prisma.TransactionClient = prisma): Promise<SyncCounters> {
+    const counters: SyncCounters = { created: 0, updated: 0, deleted: 0, locked: 0 };
+    if (purchases.length === 0) {
+      return counters;
+    }
+
+    const desired = new Map<string, PurchaseCashFlowRow>();
+    for (const row of purchases.flatMap(purchase => this.buildPurchaseCashFlows(purchase))) {
+      desired.set(row.reference, row);
+    }
+
+    const references = purchases.flatMap(purchase =>
+      PURCHASE_REFERENCE_PREFIXES.map(prefix => `${prefix}-${purchase.lotCode}`)
+    );
+
+    const existing = await client.cashFlow.findMany({
+      where: { reference: { in: references } },
+      orderBy: { createdAt: 'asc' }
+    });
+
+    const toCreate: PurchaseCashFlowRow[] = [];
+    const toUpdate: Array<PurchaseCashFlowRow & { id: string }> = [];
+    const toDelete: string[] = [];
+    const matched = new Set<string>();
+
+    for (const cashFlow of existing) {
+      const reference = cashFlow.reference!;
+      const row = desired.get(reference);
+
+      // Pagas ficam como estão, inclusive duplicadas
+      if (cashFlow.status === 'PAID') {
+        matched.add(reference);
+        counters.locked++;
+        continue;
+      }
+
+      // Sem valor esperado (ex.: comissão zerada) ou duplicada: remover
+      if (!row || matched.has(reference)) {
+        toDelete.push(cashFlow.id);
+        continue;
+      }
+
+      matched.add(reference);
+
+      const changed = cashFlow.categoryId !== row.categoryId
+        || cashFlow.accountId !== row.accountId
+        || cashFlow.description !== row.description
+        || !sameAmount(cashFlow.amount, row.amount)
+        || !sameDate(cashFlow.date, row.date)
+        || !sameDate(cashFlow.dueDate, row.dueDate)
+        || cashFlow.supplier !== row.supplier
+        || cashFlow.notes !== row.notes;
+
+      if (changed) {
+        toUpdate.push({ ...row, id: cashFlow.id });
+      }
+    }
+
+    for (const [reference, row] of desired) {
+      if (!matched.has(reference)) {
+        toCreate.push(row);
+      }
+    }
+
+    if (toDelete.length > 0) {
+      await client.calendarEvent.deleteMany({
+        where: { relatedId: { in: toDelete }, autoGenerated: true }
+      });
+      const { count } = await client.cashFlow.deleteMany({ where: { id: { in: toDelete } } });
+      counters.deleted = count;
+    }
+
+    if (toUpdate.length > 0) {
+      const values = Prisma.join(toUpdate.map(row => Prisma.sql`(
+        ${row.id}::text, ${row.categoryId}::text, ${row.accountId}::text, ${row.description}::text,
+        ${row.amount}::double precision, ${row.date}::timestamp(3), ${row.dueDate}::timestamp(3),
+        ${row.supplier}::text, ${row.notes}::text
+      )`));
+
+      counters.updated = await client.$executeRaw`
+        UPDATE "cash_flows" AS cf SET
+          "categoryId" = v."categoryId",
+          "accountId" = v."accountId",
+          "description" = v."description",
+          "amount" = v."amount",
+          "date" = v."date",
+          "dueDate" = v."dueDate",
+          "supplier" = v."supplier",
+          "notes" = v."notes",
+          "updatedAt" = NOW()
+        FROM (VALUES ${values}) AS v("id", "categoryId", "accountId", "description", "amount", "date", "dueDate", "supplier", "notes")
+        WHERE cf."id" = v."id"
+      `;
+
+      // Manter os eventos de vencimento alinhados com a movimentação
+      await client.$executeRaw`
+        UPDATE "calendar_events" AS ce SET
+          "title" = v."description",
+          "date" = COALESCE(v."dueDate", ce."date"),
+          "amount" = v."amount",
+          "description" = 'Valor: R$ ' || to_char(v."amount", 'FM999999999990.00') || ' | Status: ' || cf."status",
+          "updatedAt" = NOW()
+        FROM (VALUES ${values}) AS v("id", "categoryId", "accountId", "description", "amount", "date", "dueDate", "supplier", "notes"),
+          "cash_flows" AS cf
+        WHERE ce."relatedId" = v."id" AND cf."id" = v."id" AND ce."autoGenerated" = true
+      `;
+    }
+
+    if (toCreate.length > 0) {
+      const { count } = await client.cashFlow.createMany({ data: toCreate });
+      counters.created = count;
+
+      const created = await client.cashFlow.findMany({
+        where: { reference: { in: toCreate.map(row => row.reference) }, status: 'PENDING' },
+        select: { id: true, description: true, amount: true, dueDate: true, status: true }
+      });
+
+      const events = created
+        .filter(cashFlow => cashFlow.dueDate)
+        .map(cashFlow => ({
+          title: cashFlow.description,
+          date: cashFlow.dueDate!,
+          type: 'FINANCE' as const,
+          status: 'SCHEDULED' as const,
+          priority: 'MEDIUM' as const,
+          description: `Valor: R$ ${cashFlow.amount.toFixed(2)} | Status: ${cashFlow.status}`,
+          amount: cashFlow.amount,
+          relatedId: cashFlow.id,
+          autoGenerated: true
+        }));
+
+      if (events.length > 0) {
+        await client.calendarEvent.createMany({ data: events });
+      }
+    }
+
+    return counters;
+  }
+
   /**
    * Atualiza movimentações quando a compra é alterada
    */
@@ -180,132 +376,14 @@ export class CattlePurchaseCashFlowService {
         throw new Error('Compra não encontrada');
       }
 
-      // Buscar movimentações existentes pela referência
-      const existingCashFlows = await prisma.cashFlow.findMany({
-        where: {
-          OR: [
-            { reference: `COMPRA-${purchase.lotCode}` },
-            { reference: `COMISSAO-${purchase.lotCode}` },
-            { reference: `FRETE-${purchase.lotCode}` }
-          ]
-        }
-      });
-
-      // Atualizar movimentação de compra
-      const cattleCashFlow = existingCashFlows.find(cf => cf.reference === `COMPRA-${purchase.lotCode}`);
-      if (cattleCashFlow) {
-        await prisma.cashFlow.update({
-          where: { id: cattleCashFlow.id },
-          data: {
-            amount: purchase.purchaseValue,
-            dueDate: purchase.principalDueDate || purchase.purchaseDate,
-            supplier: purchase.vendor?.name || cattleCashFlow.supplier,
-            notes: `${purchase.initialQuantity} cabeças | Peso médio: ${(purchase.purchaseWeight / purchase.initialQuantity).toFixed(2)}kg | R$ ${purchase.pricePerArroba.toFixed(2)}/@`
-          }
-        });
-        console.log(`✅ CashFlow de compra atualizado`);
-      }
-
-      // Atualizar movimentação de comissão
-      const commissionCashFlow = existingCashFlows.find(cf => cf.reference === `COMISSAO-${purchase.lotCode}`);
-      if (purchase.commission > 0) {
-        if (commissionCashFlow) {
-          await prisma.cashFlow.update({
-            where: { id: commissionCashFlow.id },
-            data: {
-              amount: purchase.commission,
-              dueDate: purchase.commissionDueDate || purchase.purchaseDate,
-              supplier: purchase.broker?.name || commissionCashFlow.supplier
-            }
-          });
-        } else {
-          // Criar nova movimentação de comissão
-          const categoryComissao = await prisma.category.findUnique({
-            where: { id: 'cat-exp-03' }
-          });
-          
-          await prisma.cashFlow.create({
-            data: {
-              type: 'EXPENSE',
-              categoryId: categoryComissao?.id || 'cat-exp-03',
-              accountId: purchase.payerAccountId,
-              description: `Comissão - ${purchase.lotCode}`,
-              amount: purchase.commission,
-              date: purchase.purchaseDate,
-              dueDate: purchase.commissionDueDate || purchase.purchaseDate,
-              status: 'PENDING',
-              supplier: purchase.broker?.name || 'Corretor não informado',
-              reference: `COMISSAO-${purchase.lotCode}`,
-              notes: `Comissão sobre compra de ${purchase.initialQuantity} cabeças`,
-              tags: ['comissao', purchase.lotCode],
-              userId: purchase.userId
-            }
-          });
-        }
-        console.log(`✅ CashFlow de comissão atualizado`);
-      } else if (commissionCashFlow) {
-        // Remover movimentação de comissão se valor for zero
-        await prisma.cashFlow.delete({
-          where: { id: commissionCashFlow.id }
-        });
-        console.log(`🗑️ CashFlow de comissão removido`);
-      }
-
-      // Atualizar movimentação de frete
-      const freightCashFlow = existingCashFlows.find(cf => cf.reference === `FRETE-${purchase.lotCode}`);
-      if (purchase.freightCost > 0) {
-        if (freightCashFlow) {
-          await prisma.cashFlow.update({
-            where: { id: freightCashFlow.id },
-            data: {
-              amount: purchase.freightCost,
-              dueDate: purchase.freightDueDate || purchase.purchaseDate,
-              supplier: purchase.transportCompany?.name || freightCashFlow.supplier,
-              notes: purchase.freightDistance 
-                ? `Distância: ${purchase.freightDistance}km | R$ ${(purchase.freightCost / purchase.freightDistance).toFixed(2)}/km | Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'}`
-                : `Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'} | Destino: ${purchase.farm || 'Fazenda'}`
-            }
-          });
-        } else {
-          // Criar nova movimentação de frete
-          const categoryFrete = await prisma.category.findUnique({
-            where: { id: 'cat-exp-02' }
-          });
-          
-          await prisma.cashFlow.create({
-            data: {
-              type: 'EXPENSE',
-              categoryId: categoryFrete?.id || 'cat-exp-02',
-              accountId: purchase.payerAccountId,
-              description: `Frete - ${purchase.lotCode}`,
-              amount: purchase.freightCost,
-              date: purchase.purchaseDate,
-              dueDate: purchase.freightDueDate || purchase.purchaseDate,
-              status: 'PENDING',
-              supplier: purchase.transportCompany?.name || 'Transportadora não informada',
-              reference: `FRETE-${purchase.lotCode}`,
-              notes: purchase.freightDistance 
-                ? `Distância: ${purchase.freightDistance}km | R$ ${(purchase.freightCost / purchase.freightDistance).toFixed(2)}/km`
-                : `Origem: ${purchase.city || 'N/A'}-${purchase.state || 'N/A'}`,
-              tags: ['frete', purchase.lotCode],
-              userId: purchase.userId
-            }
-          });
-        }
-        console.log(`✅ CashFlow de frete atualizado`);
-      } else if (freightCashFlow) {
-        // Remover movimentação de frete se valor for zero
-        await prisma.cashFlow.delete({
-          where: { id: freightCashFlow.id }
-        });
-        console.log(`🗑️ CashFlow de frete removido`);
-      }
+      const counters = await prisma.$transaction(tx => this.syncPurchaseCashFlowsBulk([purchase], tx));
 
-      console.log(`\n✅ Movimentações do Lote ${purchase.lotCode} atualizadas com sucesso`);
+      console.log(`✅ Movimentações do Lote ${purchase.lotCode} sincronizadas: ${counters.created} criadas, ${counters.updated} atualizadas, ${counters.deleted} removidas`);
 
       return {
         success: true,
-        message: 'Movimentações atualizadas com sucesso'
+        message: 'Movimentações atualizadas com sucesso',
+        ...counters
       };
 
     } catch (error) {
@@ -0,0 +1,471 @@
+import { randomUUID } from 'crypto';
+import { Readable } from 'stream';
+import { Partner, PartnerType, PayerAccount, Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import { readCsvRows, normalizeHeader } from '@/utils/csvStream';
+import { cattlePurchaseValidation } from '@/validations/cattlePurchase.validation';
+import { cattlePurchaseService } from '@/services/cattlePurchase.service';
+import cattlePurchaseCashFlowService from '@/services/cattlePurchaseCashFlow.service';
+
+export interface ImportOptions {
+  userId?: string;
+  payerAccountId?: string;
+  resumeFromRow?: number;
+  batchSize?: number;
+  dryRun?: boolean;
+  createMissingPartners?: boolean;
+}
+
+export interface ImportRowError {
+  row: number;
+  field?: string;
+  message: string;
+  value?: string;
+}
+
+export interface ImportReport {
+  totalRows: number;
+  imported: number;
+  skipped: number;
+  duplicates: number;
+  failed: number;
+  partnersCreated: number;
+  lastCommittedRow: number;
+  dryRun: boolean;
+  aborted: boolean;
+  abortReason?: string;
+  durationMs: number;
+  errors: ImportRowError[];
+}
+
+interface PendingRow {
+  row: number;
+  data: Record<string, any>;
+  fingerprint: string;
+}
+
+const DEFAULT_BATCH_SIZE = 250;
+const MAX_BATCH_SIZE = 1000;
+
+// Cabeçalhos aceitos (normalizados) -> campo interno.
+// Inclui o modelo cattle-purchases-import.csv e os nomes dos campos da API.
+const COLUMN_ALIASES: Record<string, string> = {
+  'data da compra': 'purchaseDate',
+  'estado': 'state',
+  'cidade': 'city',
+  'fazenda': 'farm',
+  'localizacao': 'location',
+  'nome do fornecedor': 'vendorName',
+  'fornecedor': 'vendorName',
+  'cpf/cnpj do fornecedor': 'vendorDocument',
+  'quantidade de animais': 'initialQuantity',
+  'peso total (kg)': 'purchaseWeight',
+  'tipo de animal': 'animalType',
+  'idade (meses)': 'animalAge',
+  'rendimento (%)': 'carcassYield',
+  'preco por arroba': 'pricePerArroba',
+  'valor da compra': 'purchaseValue',
+  'comissao': 'commission',
+  'corretor': 'brokerName',
+  'frete': 'freightCost',
+  'distancia (km)': 'freightDistance',
+  'tipo de pagamento': 'paymentType',
+  'transportadora': 'transportCompanyName',
+  'conta pagadora': 'payerAccountName',
+  'observacoes': 'notes',
+};
+
+const API_FIELDS = [
+  'purchaseDate', 'state', 'city', 'farm', 'location', 'vendorId', 'vendorName', 'vendorDocument',
+  'initialQuantity', 'purchaseWeight', 'animalType', 'animalAge', 'carcassYield', 'pricePerArroba',
+  'purchaseValue', 'commission', 'brokerId', 'brokerName', 'freightCost', 'freightDistance',
+  'paymentType', 'transportCompanyId', 'transportCompanyName', 'payerAccountId', 'payerAccountName', 'notes',
+];
+API_FIELDS.forEach(field => {
+  COLUMN_ALIASES[normalizeHeader(field)] = field;
+});
+
+const NUMERIC_FIELDS = [
+  'initialQuantity', 'purchaseWeight', 'animalAge', 'carcassYield', 'pricePerArroba',
+  'purchaseValue', 'commission', 'freightCost', 'freightDistance',
+];
+
+function normalizeName(value: string): string {
+  return normalizeHeader(value).replace(/[^a-z0-9 ]/g, '');
+}
+
+/**
+ * Converte números nos formatos "1234.56", "1.234,56" e "1234,56"
+ */
+function parseNumber(value: string): number | undefined {
+  if (!value) return undefined;
+
+  let normalized = value.replace(/[R$\s]/g, '');
+  if (normalized.includes(',')) {
+    normalized = normalized.replace(/\./g, '').replace(',', '.');
+  }
+
+  const parsed = Number(normalized);
+  return Number.isFinite(parsed) ? parsed : NaN;
+}
+
+/**
+ * Aceita datas ISO (2025-06-03) ou no formato brasileiro (03/06/2025)
+ */
+function parseDate(value: string): string | undefined {
+  if (!value) return undefined;
+
+  const br = value.match(/^(\d{2})\/(\d{2})\/(\d{4})$/);
+  if (br) {
+    return `${br[3]}-${br[2]}-${br[1]}`;
+  }
+
+  return value;
+}
+
+function purchaseFingerprint(vendorId: string, purchaseDate: Date, quantity: number, weight: number): string {
+  return `${vendorId}|${purchaseDate.toISOString().slice(0, 10)}|${quantity}|${Number(weight).toFixed(2)}`;
+}
+
+/**
+ * Índice em memória de parceiros e contas pagadoras, carregado uma única vez por importação
+ */
+class PartnerLookupIndex {
+  private partnersById = new Map<string, Partner>();
+  private partnersByName = new Map<string, Partner[]>();
+  private partnersByDocument = new Map<string, Partner>();
+  private accountsById = new Map<string, PayerAccount>();
+  private accountsByName = new Map<string, PayerAccount>();
+  // Parceiros novos ainda não gravados: entram no banco junto com a primeira compra aceita que os usa
+  private stagedPartners = new Map<string, Prisma.PartnerCreateManyInput>();
+
+  async load() {
+    const [partners, accounts] = await Promise.all([
+      prisma.partner.findMany({ where: { isActive: true } }),
+      prisma.payerAccount.findMany({ where: { isActive: true } }),
+    ]);
+
+    partners.forEach(partner => this.addPartner(partner));
+    accounts.forEach(account => {
+      this.accountsById.set(account.id, account);
+      this.accountsByName.set(normalizeName(account.accountName), account);
+      if (!this.accountsByName.has(normalizeName(account.bankName))) {
+        this.accountsByName.set(normalizeName(account.bankName), account);
+      }
+    });
+  }
+
+  addPartner(partner: Partner) {
+    this.partnersById.set(partner.id, partner);
+    const key = normalizeName(partner.name);
+    this.partnersByName.set(key, [...(this.partnersByName.get(key) || []), partner]);
+    if (partner.cpfCnpj) {
+      this.partnersByDocument.set(partner.cpfCnpj.replace(/\D/g, ''), partner);
+    }
+  }
+
+  /**
+   * Registra um parceiro a criar, já com ID, para que as próximas linhas o encontrem
+   */
+  stagePartner(data: { name: string; type: PartnerType; cpfCnpj?: string | null }): Partner {
+    const staged = { id: randomUUID(), name: data.name, type: data.type, cpfCnpj: data.cpfCnpj || null };
+    this.stagedPartners.set(staged.id, staged);
+    this.addPartner(staged as Partner);
+    return staged as Partner;
+  }
+
+  stagedAmong(ids: Array<string | undefined>): Prisma.PartnerCreateManyInput[] {
+    return [...new Set(ids)]
+      .filter((id): id is string => !!id && this.stagedPartners.has(id))
+      .map(id => this.stagedPartners.get(id)!);
+  }
+
+  markCreated(partners: Prisma.PartnerCreateManyInput[]) {
+    partners.forEach(partner => this.stagedPartners.delete(partner.id!));
+  }
+
+  findPartner(options: { id?: string; name?: string; document?: string; type: PartnerType }): Partner | undefined {
+    if (options.id) {
+      return this.partnersById.get(options.id);
+    }
+
+    if (options.document) {
+      const byDocument = this.partnersByDocument.get(options.document.replace(/\D/g, ''));
+      if (byDocument) return byDocument;
+    }
+
+    if (options.name) {
+      const candidates = this.partnersByName.get(normalizeName(options.name)) || [];
+      return candidates.find(partner => partner.type === options.type) || candidates[0];
+    }
+
+    return undefined;
+  }
+
+  findAccount(options: { id?: string; name?: string }): PayerAccount | undefined {
+    if (options.id) {
+      return this.accountsById.get(options.id);
+    }
+    if (options.name) {
+      return this.accountsByName.get(normalizeName(options.name));
+    }
+    return undefined;
+  }
+}
+
+export class CattlePurchaseImportService {
+  /**
+   * Importa compras a partir de um CSV lido incrementalmente.
+   *
+   * Cada linha é validada com as mesmas regras de `POST /cattle-purchases`, parceiros são
+   * resolvidos por um índice em memória e as linhas válidas são gravadas em lotes
+   * (uma transação por lote). A importação é retomável: `lastCommittedRow` indica a última
+   * linha já processada e linhas já importadas são detectadas e ignoradas como duplicadas.
+   */
+  async importCsv(input: Readable, options: ImportOptions = {}): Promise<ImportReport> {
+    const startedAt = Date.now();
+    const batchSize = Math.min(Math.max(options.batchSize || DEFAULT_BATCH_SIZE, 1), MAX_BATCH_SIZE);
+    const resumeFromRow = options.resumeFromRow || 0;
+
+    const report: ImportReport = {
+      totalRows: 0,
+      imported: 0,
+      skipped: 0,
+      duplicates: 0,
+      failed: 0,
+      partnersCreated: 0,
+      lastCommittedRow: resumeFromRow,
+      dryRun: !!options.dryRun,
+      aborted: false,
+      durationMs: 0,
+      errors: [],
+    };
+
+    const index = new PartnerLookupIndex();
+    await index.load();
+
+    let batch: PendingRow[] = [];
+    let lastRowRead = resumeFromRow;
+
+    const flush = async () => {
+      if (batch.length > 0) {
+        await this.commitBatch(batch, index, report, options);
+        batch = [];
+      }
+      report.lastCommittedRow = lastRowRead;
+    };
+
+    try {
+      for await (const { rowNumber, values } of readCsvRows(input)) {
+        report.totalRows++;
+
+        // Linhas já processadas em uma execução anterior
+        if (rowNumber <= resumeFromRow) {
+          report.skipped++;
+          continue;
+        }
+
+        lastRowRead = rowNumber;
+        const pending = await this.prepareRow(rowNumber, values, index, report, options);
+        if (pending) {
+          batch.push(pending);
+        }
+
+        if (batch.length >= batchSize) {
+          await flush();
+        }
+      }
+
+      await flush();
+    } catch (error: any) {
+      // Linhas do lote em andamento não foram gravadas; a retomada parte de lastCommittedRow
+      report.aborted = true;
+      report.abortReason = error.message;
+    }
+
+    report.durationMs = Date.now() - startedAt;
+    return report;
+  }
+
+  private async prepareRow(
+    row: number,
+    values: Record<string, string>,
+    index: PartnerLookupIndex,
+    report: ImportReport,
+    options: ImportOptions
+  ): Promise<PendingRow | null> {
+    const raw: Record<string, string> = {};
+    Object.entries(values).forEach(([header, value]) => {
+      const field = COLUMN_ALIASES[header];
+      if (field && value !== '') raw[field] = value;
+    });
+
+    const errors: ImportRowError[] = [];
+    const fail = (field: string, message: string) => errors.push({ row, field, message, value: raw[field] });
+
+    // Números
+    const numbers: Record<string, number | undefined> = {};
+    NUMERIC_FIELDS.forEach(field => {
+      const parsed = parseNumber(raw[field]);
+      if (Number.isNaN(parsed)) {
+        fail(field, 'Valor numérico inválido');
+      }
+      numbers[field] = parsed;
+    });
+
+    // Parceiros e conta pagadora
+    let vendor = index.findPartner({
+      id: raw.vendorId,
+      name: raw.vendorName,
+      document: raw.vendorDocument,
+      type: 'VENDOR',
+    });
+
+    if (!vendor && !raw.vendorId && raw.vendorName && options.createMissingPartners && !options.dryRun) {
+      vendor = index.stagePartner({ name: raw.vendorName, type: 'VENDOR', cpfCnpj: raw.vendorDocument });
+    }
+
+    if (!vendor) {
+      fail(raw.vendorId ? 'vendorId' : 'vendorName', 'Fornecedor não encontrado');
+    }
+
+    const account = index.findAccount({
+      id: raw.payerAccountId || (!raw.payerAccountName ? options.payerAccountId : undefined),
+      name: raw.payerAccountName,
+    });
+    if (!account) {
+      fail(raw.payerAccountName ? 'payerAccountName' : 'payerAccountId', 'Conta pagadora não encontrada');
+    }
+
+    const broker = raw.brokerId || raw.brokerName
+      ? index.findPartner({ id: raw.brokerId, name: raw.brokerName, type: 'BROKER' })
+      : undefined;
+    if ((raw.brokerId || raw.brokerName) && !broker) {
+      fail(raw.brokerId ? 'brokerId' : 'brokerName', 'Corretor não encontrado');
+    }
+
+    let transportCompany = raw.transportCompanyId || raw.transportCompanyName
+      ? index.findPartner({ id: raw.transportCompanyId, name: raw.transportCompanyName, type: 'FREIGHT_CARRIER' })
+      : undefined;
+    if (!transportCompany && raw.transportCompanyName && options.createMissingPartners && !options.dryRun) {
+      transportCompany = index.stagePartner({ name: raw.transportCompanyName, type: 'FREIGHT_CARRIER' });
+    }
+    if ((raw.transportCompanyId || raw.transportCompanyName) && !transportCompany) {
+      fail(raw.transportCompanyId ? 'transportCompanyId' : 'transportCompanyName', 'Transportadora não encontrada');
+    }
+
+    // Regras de validação do cadastro unitário
+    const { error, value } = cattlePurchaseValidation.create.validate({
+      vendorId: vendor?.id,
+      payerAccountId: account?.id,
+      purchaseDate: parseDate(raw.purchaseDate),
+      animalType: (raw.animalType || 'MALE').toUpperCase(),
+      initialQuantity: numbers.initialQuantity,
+      purchaseWeight: numbers.purchaseWeight,
+      carcassYield: numbers.carcassYield ?? 50,
+      pricePerArroba: numbers.pricePerArroba,
+      paymentType: (raw.paymentType || 'CASH').toUpperCase(),
+      notes: raw.notes,
+      location: raw.location,
+      farm: raw.farm,
+    }, { abortEarly: false, stripUnknown: true });
+
+    if (error) {
+      error.details
+        // Erros de parceiro/conta já foram reportados com o nome da coluna
+        .filter(detail => !['vendorId', 'payerAccountId'].includes(String(detail.path[0])))
+        .forEach(detail => fail(String(detail.path[0]), detail.message));
+    }
+
+    if (errors.length > 0) {
+      report.failed++;
+      report.errors.push(...errors);
+      return null;
+    }
+
+    const data = {
+      ...value,
+      userId: options.userId,
+      city: raw.city,
+      state: raw.state,
+      animalAge: numbers.animalAge,
+      purchaseValue: numbers.purchaseValue,
+      commission: numbers.commission,
+      freightCost: numbers.freightCost,
+      freightDistance: numbers.freightDistance,
+      brokerId: broker?.id,
+      transportCompanyId: transportCompany?.id,
+    };
+
+    return {
+      row,
+      data,
+      fingerprint: purchaseFingerprint(data.vendorId, data.purchaseDate, data.initialQuantity, data.purchaseWeight),
+    };
+  }
+
+  /**
+   * Grava um lote: descarta duplicadas com uma consulta e, na mesma transação, cria os
+   * parceiros novos usados pelo lote, reserva os códigos, insere as compras com createMany
+   * e gera as movimentações de caixa do lote inteiro.
+   */
+  private async commitBatch(batch: PendingRow[], index: PartnerLookupIndex, report: ImportReport, options: ImportOptions) {
+    const dates = batch.map(pending => pending.data.purchaseDate.getTime());
+    const existing = await prisma.cattlePurchase.findMany({
+      where: {
+        vendorId: { in: [...new Set(batch.map(pending => pending.data.vendorId))] },
+        purchaseDate: { gte: new Date(Math.min(...dates)), lte: new Date(Math.max(...dates) + 86400000) },
+      },
+      select: { vendorId: true, purchaseDate: true, initialQuantity: true, purchaseWeight: true },
+    });
+
+    const known = new Set(existing.map(purchase =>
+      purchaseFingerprint(purchase.vendorId, purchase.purchaseDate, purchase.initialQuantity, purchase.purchaseWeight)
+    ));
+
+    const fresh: PendingRow[] = [];
+    batch.forEach(pending => {
+      if (known.has(pending.fingerprint)) {
+        report.duplicates++;
+        report.errors.push({ row: pending.row, message: 'Compra já importada (ignorada)' });
+        return;
+      }
+      known.add(pending.fingerprint);
+      fresh.push(pending);
+    });
+
+    if (fresh.length === 0) return;
+
+    if (options.dryRun) {
+      report.imported += fresh.length;
+      return;
+    }
+
+    const partners = index.stagedAmong(
+      fresh.flatMap(pending => [pending.data.vendorId, pending.data.transportCompanyId])
+    );
+
+    await prisma.$transaction(async (tx) => {
+      if (partners.length > 0) {
+        await tx.partner.createMany({ data: partners });
+      }
+
+      const lotCodes = await cattlePurchaseService.reserveLotCodes(fresh.length, tx);
+      const rows = fresh.map((pending, i) => cattlePurchaseService.buildCreateData(pending.data as any, lotCodes[i]));
+      await tx.cattlePurchase.createMany({ data: rows });
+
+      const created = await tx.cattlePurchase.findMany({
+        where: { lotCode: { in: lotCodes } },
+        select: { id: true },
+      });
+
+      await cattlePurchaseCashFlowService.createPurchaseCashFlowsBulk(created.map(purchase => purchase.id), tx);
+    }, { timeout: 120000 });
+
+    index.markCreated(partners);
+    report.partnersCreated += partners.length;
+    report.imported += fresh.length;
+  }
+}
+
+export const cattlePurchaseImportService = new CattlePurchaseImportService();
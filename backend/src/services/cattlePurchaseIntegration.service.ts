@@ -1,8 +1,6 @@
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 import { Decimal } from '@prisma/client/runtime/library';
 
-const prisma = new PrismaClient();
-
 export class CattlePurchaseIntegrationService {
   /**
    * Cria despesas financeiras automaticamente quando uma compra de gado é cadastrada
@@ -0,0 +1,273 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import { DomainEntity, onDomainEvent } from '@/utils/domainEvents';
+
+/**
+ * Motor de séries temporais para os gráficos do dashboard.
+ *
+ * Cada métrica é uma consulta que produz linhas (ts, value, key); o motor agrupa por
+ * `date_trunc` no tamanho de bucket pedido, preenche os buckets vazios com zero e guarda
+ * em cache os buckets fechados (ex.: meses passados). Em uma nova leitura só o bucket
+ * aberto é consultado, então um gráfico anual custa o mesmo que um semanal.
+ */
+
+export type BucketSize = 'day' | 'week' | 'month' | 'quarter' | 'year';
+
+export const BUCKET_SIZES: BucketSize[] = ['day', 'week', 'month', 'quarter', 'year'];
+
+export type ChartMetric = 'revenue' | 'cost' | 'sales' | 'occupancy';
+
+export interface SeriesPoint {
+  date: string; // Início do bucket (YYYY-MM-DD, UTC)
+  amount: number;
+  breakdown?: Record<string, number>;
+}
+
+interface BucketValue {
+  amount: number;
+  breakdown: Record<string, number>;
+}
+
+interface MetricDefinition {
+  entity: DomainEntity;
+  // Linhas com as colunas "ts" (timestamp), "value" (numérico) e "key" (texto ou NULL) no intervalo [from, to)
+  source: (from: Date, to: Date) => Prisma.Sql;
+  // Série acumulada (saldo): soma os valores anteriores ao intervalo como saldo inicial
+  cumulative?: boolean;
+}
+
+const MAX_BUCKETS = 1000;
+
+const METRICS: Record<ChartMetric, MetricDefinition> = {
+  revenue: {
+    entity: 'revenue',
+    source: (from, to) => Prisma.sql`
+      SELECT "receiptDate" AS ts, "totalAmount" AS value, NULL::text AS key
+      FROM "revenues"
+      WHERE "isReceived" = true AND "receiptDate" >= ${from} AND "receiptDate" < ${to}
+    `,
+  },
+  cost: {
+    entity: 'expense',
+    source: (from, to) => Prisma.sql`
+      SELECT "paymentDate" AS ts, "totalAmount" AS value, "category" AS key
+      FROM "expenses"
+      WHERE "isPaid" = true AND "impactsCashFlow" = true
+        AND "paymentDate" >= ${from} AND "paymentDate" < ${to}
+    `,
+  },
+  sales: {
+    entity: 'sale',
+    source: (from, to) => Prisma.sql`
+      SELECT "saleDate" AS ts, "totalValue" AS value, NULL::text AS key
+      FROM "sale_records"
+      WHERE "status" <> 'CANCELLED' AND "saleDate" >= ${from} AND "saleDate" < ${to}
+    `,
+  },
+  occupancy: {
+    entity: 'pen',
+    cumulative: true,
+    // Entradas somam e saídas subtraem animais alocados
+    source: (from, to) => Prisma.sql`
+      SELECT "allocationDate" AS ts, "quantity" AS value, NULL::text AS key
+      FROM "lot_pen_links"
+      WHERE "allocationDate" >= ${from} AND "allocationDate" < ${to}
+      UNION ALL
+      SELECT "removalDate" AS ts, -"quantity" AS value, NULL::text AS key
+      FROM "lot_pen_links"
+      WHERE "removalDate" IS NOT NULL AND "removalDate" >= ${from} AND "removalDate" < ${to}
+    `,
+  },
+};
+
+/**
+ * Início (UTC) do bucket que contém a data
+ */
+export function truncateDate(date: Date, bucket: BucketSize): Date {
+  const year = date.getUTCFullYear();
+  const month = date.getUTCMonth();
+
+  switch (bucket) {
+    case 'day':
+      return new Date(Date.UTC(year, month, date.getUTCDate()));
+    case 'week': {
+      // Semanas começam na segunda-feira, como o date_trunc do PostgreSQL
+      const daysSinceMonday = (date.getUTCDay() + 6) % 7;
+      return new Date(Date.UTC(year, month, date.getUTCDate() - daysSinceMonday));
+    }
+    case 'month':
+      return new Date(Date.UTC(year, month, 1));
+    case 'quarter':
+      return new Date(Date.UTC(year, month - (month % 3), 1));
+    case 'year':
+      return new Date(Date.UTC(year, 0, 1));
+  }
+}
+
+export function nextBucket(start: Date, bucket: BucketSize): Date {
+  const next = new Date(start);
+
+  switch (bucket) {
+    case 'day':
+      next.setUTCDate(next.getUTCDate() + 1);
+      break;
+    case 'week':
+      next.setUTCDate(next.getUTCDate() + 7);
+      break;
+    case 'month':
+      next.setUTCMonth(next.getUTCMonth() + 1);
+      break;
+    case 'quarter':
+      next.setUTCMonth(next.getUTCMonth() + 3);
+      break;
+    case 'year':
+      next.setUTCFullYear(next.getUTCFullYear() + 1);
+      break;
+  }
+
+  return next;
+}
+
+const bucketKey = (date: Date) => date.toISOString().split('T')[0];
+
+export class ChartSeriesService {
+  // Buckets fechados por métrica e tamanho: `${metric}:${bucket}` -> data do bucket -> valor
+  private closedBuckets = new Map<string, Map<string, BucketValue>>();
+  // Saldo acumulado antes de uma data (métricas acumuladas)
+  private openingBalances = new Map<string, number>();
+  private unsubscribe: (() => void) | null = null;
+
+  /**
+   * Descarta o cache de uma métrica quando a entidade de origem é gravada,
+   * já que lançamentos retroativos podem alterar buckets fechados
+   */
+  start(): void {
+    if (this.unsubscribe) return;
+    this.unsubscribe = onDomainEvent(event => {
+      (Object.keys(METRICS) as ChartMetric[])
+        .filter(metric => METRICS[metric].entity === event.entity)
+        .forEach(metric => this.invalidate(metric));
+    });
+  }
+
+  stop(): void {
+    this.unsubscribe?.();
+    this.unsubscribe = null;
+  }
+
+  invalidate(metric?: ChartMetric): void {
+    if (!metric) {
+      this.closedBuckets.clear();
+      this.openingBalances.clear();
+      return;
+    }
+
+    for (const key of [...this.closedBuckets.keys()]) {
+      if (key.startsWith(`${metric}:`)) this.closedBuckets.delete(key);
+    }
+    for (const key of [...this.openingBalances.keys()]) {
+      if (key.startsWith(`${metric}:`)) this.openingBalances.delete(key);
+    }
+  }
+
+  /**
+   * Série da métrica entre `startDate` e `endDate`, com um ponto por bucket (vazios = 0).
+   * Em métricas acumuladas, `amount` é o saldo ao final de cada bucket.
+   */
+  async getSeries(metric: ChartMetric, startDate: Date, endDate: Date, bucket: BucketSize): Promise<SeriesPoint[]> {
+    const definition = METRICS[metric];
+    const now = new Date();
+    const openBucket = truncateDate(now, bucket);
+
+    const buckets: Date[] = [];
+    for (let cursor = truncateDate(startDate, bucket); cursor <= endDate; cursor = nextBucket(cursor, bucket)) {
+      buckets.push(cursor);
+      if (buckets.length > MAX_BUCKETS) {
+        throw new Error(`Intervalo muito grande para buckets de ${bucket}`);
+      }
+    }
+
+    if (buckets.length === 0) {
+      return [];
+    }
+
+    const cacheKey = `${metric}:${bucket}`;
+    let cache = this.closedBuckets.get(cacheKey);
+    if (!cache) {
+      cache = new Map();
+      this.closedBuckets.set(cacheKey, cache);
+    }
+
+    // Consulta a partir do primeiro bucket que não está em cache (no mínimo o aberto)
+    const firstMissing = buckets.find(start => start >= openBucket || !cache!.has(bucketKey(start)));
+    const values = new Map<string, BucketValue>();
+
+    if (firstMissing) {
+      const rangeEnd = nextBucket(buckets[buckets.length - 1], bucket);
+      const rows = await this.queryBuckets(definition, firstMissing, rangeEnd, bucket);
+
+      for (const row of rows) {
+        const key = bucketKey(row.bucket);
+        const value = values.get(key) || { amount: 0, breakdown: {} };
+        value.amount += row.value;
+        if (row.key !== null) {
+          value.breakdown[row.key] = (value.breakdown[row.key] || 0) + row.value;
+        }
+        values.set(key, value);
+      }
+
+      // Buckets fechados (inclusive os vazios) ficam em cache
+      for (const start of buckets) {
+        if (start >= firstMissing && start < openBucket) {
+          cache.set(bucketKey(start), values.get(bucketKey(start)) || { amount: 0, breakdown: {} });
+        }
+      }
+    }
+
+    let balance = definition.cumulative ? await this.getOpeningBalance(metric, definition, buckets[0]) : 0;
+
+    return buckets.map(start => {
+      const key = bucketKey(start);
+      const value = values.get(key) || cache!.get(key) || { amount: 0, breakdown: {} };
+
+      if (definition.cumulative) {
+        balance += value.amount;
+        return { date: key, amount: balance };
+      }
+
+      const point: SeriesPoint = { date: key, amount: value.amount };
+      if (Object.keys(value.breakdown).length > 0) {
+        point.breakdown = { ...value.breakdown };
+      }
+      return point;
+    });
+  }
+
+  private async queryBuckets(definition: MetricDefinition, from: Date, to: Date, bucket: BucketSize) {
+    return prisma.$queryRaw<Array<{ bucket: Date; key: string | null; value: number }>>`
+      SELECT date_trunc(${bucket}, s.ts) AS bucket, s.key AS key, SUM(s.value)::double precision AS value
+      FROM (${definition.source(from, to)}) AS s
+      GROUP BY 1, 2
+      ORDER BY 1
+    `;
+  }
+
+  private async getOpeningBalance(metric: ChartMetric, definition: MetricDefinition, before: Date): Promise<number> {
+    const cacheKey = `${metric}:${before.toISOString()}`;
+    const cached = this.openingBalances.get(cacheKey);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    const [row] = await prisma.$queryRaw<Array<{ value: number | null }>>`
+      SELECT SUM(s.value)::double precision AS value
+      FROM (${definition.source(new Date(0), before)}) AS s
+    `;
+
+    const balance = row?.value || 0;
+    this.openingBalances.set(cacheKey, balance);
+    return balance;
+  }
+}
+
+export const chartSeriesService = new ChartSeriesService();
@@ -1,10 +1,25 @@
 import { prisma } from '@/config/database';
+import { BucketSize, chartSeriesService } from '@/services/chartSeries.service';
+
+// Lotes com animais na propriedade
+const ACTIVE_PURCHASE_STATUSES = ['RECEIVED', 'CONFINED'] as const;
+
+// Bucket padrão de cada período dos gráficos
+const PERIOD_BUCKETS: Record<string, BucketSize> = {
+  week: 'day',
+  month: 'day',
+  quarter: 'week',
+  year: 'month',
+};
+
+const clampScore = (value: number) => Math.round(Math.min(Math.max(value, 0), 10) * 10) / 10;
 
 export class DashboardService {
   /**
-   * Retorna métricas principais do dashboard
+   * Calcula as métricas principais do dashboard.
+   * Usado pelo snapshot (dashboardSnapshot.service); a leitura deve passar por ele.
    */
-  async getMetrics() {
+  async computeMetrics() {
     const [
       totalAnimals,
       activeLots,
@@ -42,28 +57,144 @@ export class DashboardService {
   }
 
   /**
-   * Retorna gráficos do dashboard
+   * Calcula os indicadores servidos em /api/v1/stats (ano corrente)
+   */
+  async computeStats() {
+    const now = new Date();
+    const startOfYear = new Date(now.getFullYear(), 0, 1);
+    const endOfYear = new Date(now.getFullYear(), 11, 31, 23, 59, 59, 999);
+    const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1);
+    const startOfPreviousMonth = new Date(now.getFullYear(), now.getMonth() - 1, 1);
+
+    const [
+      herd,
+      activeLots,
+      occupiedPens,
+      occupancyRate,
+      revenueTotal,
+      expenseTotal,
+      inflow,
+      outflow,
+      inflowThisMonth,
+      inflowPreviousMonth,
+    ] = await Promise.all([
+      prisma.cattlePurchase.aggregate({
+        where: { status: { in: [...ACTIVE_PURCHASE_STATUSES] } },
+        _sum: { currentQuantity: true, initialQuantity: true, deathCount: true },
+        _avg: { averageWeight: true },
+      }),
+      this.getActiveLots(),
+      prisma.lotPenLink.groupBy({
+        by: ['penId'],
+        where: { status: 'ACTIVE' },
+      }),
+      this.getOccupancyRate(),
+      prisma.revenue.aggregate({
+        where: { dueDate: { gte: startOfYear, lte: endOfYear } },
+        _sum: { totalAmount: true },
+      }),
+      prisma.expense.aggregate({
+        where: { dueDate: { gte: startOfYear, lte: endOfYear }, impactsCashFlow: true },
+        _sum: { totalAmount: true },
+      }),
+      prisma.revenue.aggregate({
+        where: { isReceived: true, receiptDate: { gte: startOfYear, lte: endOfYear } },
+        _sum: { totalAmount: true },
+      }),
+      prisma.expense.aggregate({
+        where: { isPaid: true, paymentDate: { gte: startOfYear, lte: endOfYear }, impactsCashFlow: true },
+        _sum: { totalAmount: true },
+      }),
+      prisma.revenue.aggregate({
+        where: { isReceived: true, receiptDate: { gte: startOfMonth } },
+        _sum: { totalAmount: true },
+      }),
+      prisma.revenue.aggregate({
+        where: { isReceived: true, receiptDate: { gte: startOfPreviousMonth, lt: startOfMonth } },
+        _sum: { totalAmount: true },
+      }),
+    ]);
+
+    const totalRevenue = revenueTotal._sum.totalAmount || 0;
+    const totalExpenses = expenseTotal._sum.totalAmount || 0;
+    const netProfit = totalRevenue - totalExpenses;
+    const initialQuantity = herd._sum.initialQuantity || 0;
+    const mortalityRate = initialQuantity > 0 ? ((herd._sum.deathCount || 0) / initialQuantity) * 100 : 0;
+
+    const cashInflow = inflow._sum.totalAmount || 0;
+    const cashOutflow = outflow._sum.totalAmount || 0;
+    const previousInflow = inflowPreviousMonth._sum.totalAmount || 0;
+    const trend = previousInflow > 0 ? (inflowThisMonth._sum.totalAmount || 0) / previousInflow : 1;
+
+    // Índices de 0 a 10
+    const profitMargin = totalRevenue > 0 ? (netProfit / totalRevenue) * 100 : 0;
+    const efficiency = clampScore(occupancyRate / 10);
+    const profitability = clampScore(profitMargin / 5);
+    const growth = clampScore(trend * 5);
+    const sustainability = clampScore(10 - mortalityRate * 2);
+
+    return {
+      totalCattle: herd._sum.currentQuantity || 0,
+      activeLots,
+      occupiedPens: occupiedPens.length,
+      totalRevenue,
+      totalExpenses,
+      netProfit,
+      averageWeight: herd._avg.averageWeight || 0,
+      mortalityRate,
+      dateRange: `${startOfYear.toISOString().split('T')[0]} to ${endOfYear.toISOString().split('T')[0]}`,
+      cashFlow: {
+        inflow: cashInflow,
+        outflow: cashOutflow,
+        balance: cashInflow - cashOutflow,
+        trend,
+      },
+      performanceIndex: {
+        overall: clampScore((efficiency + profitability + growth + sustainability) / 4),
+        efficiency,
+        profitability,
+        growth,
+        sustainability,
+      },
+    };
+  }
+
+  /**
+   * Retorna gráficos do dashboard, agrupados por bucket de tempo
    */
-  async getCharts(period: 'week' | 'month' | 'quarter' | 'year' = 'month') {
+  async getCharts(period: 'week' | 'month' | 'quarter' | 'year' = 'month', bucket?: BucketSize) {
     const endDate = new Date();
     const startDate = this.getStartDate(period);
+    const bucketSize = bucket || PERIOD_BUCKETS[period] || 'day';
 
     const [
       revenueChart,
       costChart,
       occupancyChart,
       salesChart,
+      capacity,
     ] = await Promise.all([
-      this.getRevenueChart(startDate, endDate),
-      this.getCostChart(startDate, endDate),
-      this.getOccupancyChart(startDate, endDate),
-      this.getSalesChart(startDate, endDate),
+      chartSeriesService.getSeries('revenue', startDate, endDate, bucketSize),
+      chartSeriesService.getSeries('cost', startDate, endDate, bucketSize),
+      chartSeriesService.getSeries('occupancy', startDate, endDate, bucketSize),
+      chartSeriesService.getSeries('sales', startDate, endDate, bucketSize),
+      prisma.pen.aggregate({
+        where: { isActive: true },
+        _sum: { capacity: true },
+      }),
     ]);
 
+    const totalCapacity = capacity._sum.capacity || 0;
+
     return {
+      bucket: bucketSize,
       revenue: revenueChart,
       costs: costChart,
-      occupancy: occupancyChart,
+      occupancy: occupancyChart.map(point => ({
+        date: point.date,
+        occupied: point.amount,
+        rate: totalCapacity > 0 ? (point.amount / totalCapacity) * 100 : 0,
+      })),
       sales: salesChart,
     };
   }
@@ -161,7 +292,7 @@ export class DashboardService {
 
   private async getTotalAnimals() {
     const result = await prisma.cattlePurchase.aggregate({
-      where: { status: 'AVAILABLE' as any },
+      where: { status: { in: [...ACTIVE_PURCHASE_STATUSES] } },
       _sum: { currentQuantity: true },
     });
     return result._sum.currentQuantity || 0;
@@ -169,24 +300,24 @@ export class DashboardService {
 
   private async getActiveLots() {
     return prisma.cattlePurchase.count({
-      where: { status: 'AVAILABLE' as any },
+      where: { status: { in: [...ACTIVE_PURCHASE_STATUSES] } },
     });
   }
 
   private async getOccupancyRate() {
-    const pens = await prisma.pen.findMany({
-      where: { status: 'AVAILABLE' as any },
-      include: {
-        lotAllocations: {
-          where: {},
-        },
-      },
-    });
+    const [capacity, occupied] = await Promise.all([
+      prisma.pen.aggregate({
+        where: { isActive: true },
+        _sum: { capacity: true },
+      }),
+      prisma.lotPenLink.aggregate({
+        where: { status: 'ACTIVE' },
+        _sum: { quantity: true },
+      }),
+    ]);
 
-    const totalCapacity = pens.reduce((sum: number, p) => sum + p.capacity, 0);
-    const totalOccupied = pens.reduce((sum: number, p: any) => 
-      sum + (p.lotAllocations ? p.lotAllocations.reduce((s: number, a: any) => s + a.quantity, 0) : 0), 0
-    );
+    const totalCapacity = capacity._sum.capacity || 0;
+    const totalOccupied = occupied._sum.quantity || 0;
 
     return totalCapacity > 0 ? (totalOccupied / totalCapacity) * 100 : 0;
   }
@@ -281,109 +412,4 @@ export class DashboardService {
     
     return date;
   }
-
-  private async getRevenueChart(startDate: Date, endDate: Date) {
-    const revenues = await prisma.revenue.findMany({
-      where: {
-        receiptDate: {
-          gte: startDate,
-          lte: endDate,
-        },
-        isReceived: true,
-      },
-      orderBy: { receiptDate: 'asc' },
-    });
-
-    // Agrupa por dia
-    const dailyRevenue: Record<string, number> = {};
-    
-    revenues.forEach(revenue => {
-      const date = revenue.receiptDate!.toISOString().split('T')[0];
-      dailyRevenue[date] = (dailyRevenue[date] || 0) + revenue.totalAmount;
-    });
-
-    return Object.entries(dailyRevenue).map(([date, amount]) => ({
-      date,
-      amount,
-    }));
-  }
-
-  private async getCostChart(startDate: Date, endDate: Date) {
-    const expenses = await prisma.expense.findMany({
-      where: {
-        paymentDate: {
-          gte: startDate,
-          lte: endDate,
-        },
-        isPaid: true,
-        impactsCashFlow: true,
-      },
-    });
-
-    // Agrupa por categoria
-    const byCategory: Record<string, number> = {};
-    
-    expenses.forEach(expense => {
-      byCategory[expense.category] = (byCategory[expense.category] || 0) + expense.totalAmount;
-    });
-
-    return Object.entries(byCategory).map(([category, amount]) => ({
-      category,
-      amount,
-    }));
-  }
-
-  private async getOccupancyChart(startDate: Date, endDate: Date) {
-    // Simula dados históricos de ocupação (em produção, isso viria de uma tabela de histórico)
-    const days = Math.floor((endDate.getTime() - startDate.getTime()) / (1000 * 60 * 60 * 24));
-    const data = [];
-    
-    for (let i = 0; i <= days; i++) {
-      const date = new Date(startDate);
-      date.setDate(date.getDate() + i);
-      
-      // Por enquanto, retorna a ocupação atual para todos os dias
-      const rate = await this.getOccupancyRate();
-      
-      data.push({
-        date: date.toISOString().split('T')[0],
-        rate: rate + (Math.random() * 10 - 5), // Adiciona variação aleatória
-      });
-    }
-    
-    return data;
-  }
-
-  private async getSalesChart(startDate: Date, endDate: Date) {
-    const sales = await prisma.saleRecord.findMany({
-      where: {
-        createdAt: {
-          gte: startDate,
-          lte: endDate,
-        },
-        status: { not: 'CANCELLED' },
-      },
-      include: {
-        buyer: true,
-      },
-    });
-
-    // Agrupa por comprador
-    const byBuyer: Record<string, { name: string; amount: number }> = {};
-    
-    sales.forEach(sale => {
-      const buyerId = sale.buyerId;
-      if (!byBuyer[buyerId]) {
-        byBuyer[buyerId] = {
-          name: (sale as any).buyer?.name || "Unknown",
-          amount: 0,
-        };
-      }
-      byBuyer[buyerId].amount += sale.totalValue;
-    });
-
-    return Object.values(byBuyer)
-      .sort((a, b) => b.amount - a.amount)
-      .slice(0, 10); // Top 10 compradores
-  }
-} 
\ No newline at end of file
+}
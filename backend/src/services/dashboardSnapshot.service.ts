@@ -0,0 +1,139 @@
+import { DashboardSnapshot, Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import { logger } from '@/config/logger';
+import { DashboardService } from '@/services/dashboard.service';
+import { onDomainEvent } from '@/utils/domainEvents';
+
+const SNAPSHOT_ID = 'global';
+
+// Agrupa rajadas de gravações (importações, lotes) em um único recálculo
+const REFRESH_DEBOUNCE_MS = 2000;
+
+// Alguns indicadores dependem do relógio (mês corrente, vencimentos da semana),
+// então o snapshot também expira mesmo sem eventos
+const MAX_AGE_MS = 15 * 60 * 1000;
+
+export type SnapshotSource = 'snapshot' | 'stale' | 'refreshed';
+
+export interface SnapshotRead {
+  snapshot: DashboardSnapshot;
+  source: SnapshotSource;
+}
+
+const toJson = (value: unknown) => JSON.parse(JSON.stringify(value)) as Prisma.InputJsonValue;
+
+/**
+ * Mantém os KPIs do dashboard pré-calculados em `dashboard_snapshots`.
+ * A leitura é uma única consulta; o recálculo acontece quando compras, vendas,
+ * mortes, despesas ou receitas são gravadas.
+ */
+export class DashboardSnapshotService {
+  private dashboardService = new DashboardService();
+  private refreshing: Promise<DashboardSnapshot> | null = null;
+  private refreshTimer: NodeJS.Timeout | null = null;
+  private dirty = false;
+  private unsubscribe: (() => void) | null = null;
+
+  /**
+   * Passa a recalcular o snapshot a cada evento de domínio
+   */
+  start(): void {
+    if (this.unsubscribe) return;
+    this.unsubscribe = onDomainEvent(() => this.scheduleRefresh());
+  }
+
+  stop(): void {
+    this.unsubscribe?.();
+    this.unsubscribe = null;
+    if (this.refreshTimer) {
+      clearTimeout(this.refreshTimer);
+      this.refreshTimer = null;
+    }
+  }
+
+  /**
+   * Lê o snapshot. Se não existir, calcula na hora; se estiver velho,
+   * devolve o atual e agenda o recálculo em segundo plano.
+   */
+  async get(): Promise<SnapshotRead> {
+    const snapshot = await prisma.dashboardSnapshot.findUnique({ where: { id: SNAPSHOT_ID } });
+
+    if (!snapshot) {
+      return { snapshot: await this.refresh(), source: 'refreshed' };
+    }
+
+    if (Date.now() - snapshot.computedAt.getTime() > MAX_AGE_MS) {
+      this.scheduleRefresh(0);
+      return { snapshot, source: 'stale' };
+    }
+
+    return { snapshot, source: 'snapshot' };
+  }
+
+  scheduleRefresh(delayMs: number = REFRESH_DEBOUNCE_MS): void {
+    if (this.refreshTimer) {
+      clearTimeout(this.refreshTimer);
+    }
+
+    this.refreshTimer = setTimeout(() => {
+      this.refreshTimer = null;
+      this.refresh().catch(error => {
+        logger.error('Erro ao recalcular snapshot do dashboard:', error);
+      });
+    }, delayMs);
+    this.refreshTimer.unref?.();
+  }
+
+  /**
+   * Recalcula e grava o snapshot. Chamadas concorrentes compartilham o mesmo cálculo;
+   * eventos recebidos durante o cálculo disparam uma nova rodada ao final.
+   */
+  async refresh(): Promise<DashboardSnapshot> {
+    if (this.refreshing) {
+      this.dirty = true;
+      return this.refreshing;
+    }
+
+    this.refreshing = this.compute().finally(() => {
+      this.refreshing = null;
+      if (this.dirty) {
+        this.dirty = false;
+        this.scheduleRefresh();
+      }
+    });
+
+    return this.refreshing;
+  }
+
+  private async compute(): Promise<DashboardSnapshot> {
+    const startedAt = Date.now();
+
+    const [metrics, stats] = await Promise.all([
+      this.dashboardService.computeMetrics(),
+      this.dashboardService.computeStats(),
+    ]);
+
+    const computeMs = Date.now() - startedAt;
+    const computedAt = new Date();
+
+    return prisma.dashboardSnapshot.upsert({
+      where: { id: SNAPSHOT_ID },
+      create: {
+        id: SNAPSHOT_ID,
+        metrics: toJson(metrics),
+        stats: toJson(stats),
+        computeMs,
+        computedAt,
+      },
+      update: {
+        metrics: toJson(metrics),
+        stats: toJson(stats),
+        computeMs,
+        computedAt,
+        version: { increment: 1 },
+      },
+    });
+  }
+}
+
+export const dashboardSnapshotService = new DashboardSnapshotService();
@@ -1,7 +1,7 @@
-import { PrismaClient, DeathType } from '@prisma/client';
+import { DeathType, CattlePurchase } from '@prisma/client';
+import { prisma } from '../config/database';
 import { AppError } from '../utils/AppError';
-
-const prisma = new PrismaClient();
+import { publishDomainEvent } from '../utils/domainEvents';
 
 interface CreateDeathRecordData {
   purchaseId: string;
@@ -15,6 +15,32 @@ interface CreateDeathRecordData {
   userId?: string;
 }
 
+interface DeathBatchEntry {
+  purchaseId: string;
+  penId: string;
+  quantity: number;
+  deathType: DeathType;
+  deathDate?: Date;
+  cause?: string;
+  veterinaryNotes?: string;
+  estimatedLoss?: number;
+}
+
+interface CreateDeathBatchData {
+  deathDate: Date;
+  entries: DeathBatchEntry[];
+  userId?: string;
+}
+
+interface DeathBatchError {
+  index: number;
+  purchaseId: string;
+  penId: string;
+  message: string;
+}
+
+export const MAX_DEATH_BATCH_ENTRIES = 1000;
+
 interface DeathStatistics {
   totalDeaths: number;
   deathsByType: Record<string, number>;
@@ -60,12 +86,7 @@ class DeathRecordService {
     }
 
     // Calcular perda estimada se não fornecida
-    let estimatedLoss = data.estimatedLoss;
-    if (!estimatedLoss) {
-      const averageWeight = purchase.averageWeight || purchase.purchaseWeight / purchase.initialQuantity;
-      const pricePerKg = purchase.totalCost / (purchase.initialQuantity * purchase.purchaseWeight);
-      estimatedLoss = data.quantity * averageWeight * pricePerKg;
-    }
+    const estimatedLoss = data.estimatedLoss || this.estimateLoss(purchase, data.quantity);
 
     // Criar registro de morte
     const deathRecord = await prisma.deathRecord.create({
@@ -105,9 +126,131 @@ class DeathRecordService {
       }
     });
 
+    // O middleware publica as gravações de mortes; a ocupação ao vivo precisa do curral afetado
+    publishDomainEvent('pen', 'update', [data.penId]);
+
     return deathRecord;
   }
 
+  // Registrar várias mortes de uma vez (ex.: após um temporal). Todos os registros são
+  // gravados em uma transação, e curral e compra são atualizados uma vez por lote/curral
+  async createBatch(data: CreateDeathBatchData) {
+    if (data.entries.length === 0) {
+      throw new AppError('Informe ao menos um registro de morte', 400);
+    }
+    if (data.entries.length > MAX_DEATH_BATCH_ENTRIES) {
+      throw new AppError(`Lote com mais de ${MAX_DEATH_BATCH_ENTRIES} registros; divida o envio`, 400);
+    }
+
+    const pairKey = (purchaseId: string, penId: string) => `${purchaseId}:${penId}`;
+
+    // Quantidade pedida por lote/curral e por lote
+    const byAllocation = new Map<string, number>();
+    const byPurchase = new Map<string, number>();
+    for (const entry of data.entries) {
+      const key = pairKey(entry.purchaseId, entry.penId);
+      byAllocation.set(key, (byAllocation.get(key) || 0) + entry.quantity);
+      byPurchase.set(entry.purchaseId, (byPurchase.get(entry.purchaseId) || 0) + entry.quantity);
+    }
+    const purchaseIds = [...byPurchase.keys()];
+    const penIds = [...new Set(data.entries.map(entry => entry.penId))];
+
+    const result = await prisma.$transaction(async (tx) => {
+      const [purchases, allocations] = await Promise.all([
+        tx.cattlePurchase.findMany({ where: { id: { in: purchaseIds } } }),
+        tx.lotPenLink.findMany({
+          where: { purchaseId: { in: purchaseIds }, penId: { in: penIds }, status: 'ACTIVE' },
+          orderBy: { allocationDate: 'asc' }
+        })
+      ]);
+
+      const purchaseById = new Map(purchases.map(purchase => [purchase.id, purchase]));
+      const allocationByPair = new Map<string, typeof allocations[number]>();
+      for (const allocation of allocations) {
+        const key = pairKey(allocation.purchaseId, allocation.penId);
+        if (!allocationByPair.has(key)) allocationByPair.set(key, allocation);
+      }
+
+      // Valida o lote inteiro antes de gravar: ou todos os registros entram, ou nenhum
+      const errors: DeathBatchError[] = [];
+      data.entries.forEach((entry, index) => {
+        const allocation = allocationByPair.get(pairKey(entry.purchaseId, entry.penId));
+        let message: string | null = null;
+        if (!purchaseById.has(entry.purchaseId)) {
+          message = 'Compra não encontrada';
+        } else if (!allocation) {
+          message = 'Lote sem alocação ativa no curral';
+        } else if (allocation.quantity < byAllocation.get(pairKey(entry.purchaseId, entry.penId))!) {
+          message = `Quantidade de animais insuficiente no curral (disponível: ${allocation.quantity})`;
+        }
+        if (message) errors.push({ index, purchaseId: entry.purchaseId, penId: entry.penId, message });
+      });
+      if (errors.length > 0) {
+        const [first] = errors;
+        throw new AppError(
+          `${errors.length} registro(s) de morte inválido(s). Registro ${first.index + 1}: ${first.message}`,
+          400,
+          true,
+          errors
+        );
+      }
+
+      const { count } = await tx.deathRecord.createMany({
+        data: data.entries.map(entry => ({
+          purchaseId: entry.purchaseId,
+          penId: entry.penId,
+          quantity: entry.quantity,
+          deathDate: entry.deathDate || data.deathDate,
+          deathType: entry.deathType,
+          cause: entry.cause,
+          veterinaryNotes: entry.veterinaryNotes,
+          estimatedLoss: entry.estimatedLoss || this.estimateLoss(purchaseById.get(entry.purchaseId)!, entry.quantity),
+          userId: data.userId
+        }))
+      });
+
+      for (const [key, quantity] of byAllocation) {
+        await tx.lotPenLink.update({
+          where: { id: allocationByPair.get(key)!.id },
+          data: { quantity: { decrement: quantity } }
+        });
+      }
+
+      for (const [purchaseId, quantity] of byPurchase) {
+        await tx.cattlePurchase.update({
+          where: { id: purchaseId },
+          data: {
+            currentQuantity: { decrement: quantity },
+            deathCount: { increment: quantity }
+          }
+        });
+      }
+
+      return {
+        records: count,
+        totalDeaths: data.entries.reduce((sum, entry) => sum + entry.quantity, 0),
+        lots: [...byPurchase].map(([purchaseId, deaths]) => ({
+          purchaseId,
+          lotCode: purchaseById.get(purchaseId)!.lotCode,
+          deaths
+        })),
+        pens: penIds.length
+      };
+    }, { timeout: 30000 });
+
+    // O middleware publica as gravações de mortes; a ocupação ao vivo precisa dos currais afetados
+    publishDomainEvent('pen', 'updateMany', penIds);
+
+    return result;
+  }
+
+  // Perda estimada pelo peso médio e preço por kg da compra
+  private estimateLoss(purchase: CattlePurchase, quantity: number) {
+    const averageWeight = purchase.averageWeight || purchase.purchaseWeight / purchase.initialQuantity;
+    const pricePerKg = purchase.totalCost / (purchase.initialQuantity * purchase.purchaseWeight);
+    return quantity * averageWeight * pricePerKg;
+  }
+
   // Listar registros de morte
   async findAll(filters?: {
     purchaseId?: string;
@@ -237,6 +380,10 @@ class DeathRecordService {
       }
     });
 
+    if (data.quantity && data.quantity !== existingRecord.quantity) {
+      publishDomainEvent('pen', 'update', [existingRecord.penId]);
+    }
+
     return updatedRecord;
   }
 
@@ -281,70 +428,79 @@ class DeathRecordService {
       where: { id }
     });
 
+    publishDomainEvent('pen', 'update', [record.penId]);
+
     return { message: 'Registro de morte removido com sucesso' };
   }
 
-  // Obter estatísticas de mortes
+  // Obter estatísticas de mortes (a partir da rollup diária)
   async getStatistics(filters?: {
     startDate?: Date;
     endDate?: Date;
     purchaseId?: string;
     penId?: string;
   }): Promise<DeathStatistics> {
-    const where: any = {};
-    
-    if (filters?.purchaseId) where.purchaseId = filters.purchaseId;
-    if (filters?.penId) where.penId = filters.penId;
-    
-    if (filters?.startDate || filters?.endDate) {
-      where.deathDate = {};
-      if (filters.startDate) where.deathDate.gte = filters.startDate;
-      if (filters.endDate) where.deathDate.lte = filters.endDate;
-    }
-
-    // Buscar todos os registros
-    const records = await prisma.deathRecord.findMany({
-      where,
-      include: {
-        purchase: true,
-        pen: true
-      }
-    });
+    const where = this.rollupWhere(filters);
+
+    const [totals, byType, byPen, byPurchase] = await Promise.all([
+      prisma.deathRecordDailyRollup.aggregate({
+        where,
+        _sum: { deaths: true, estimatedLoss: true }
+      }),
+      prisma.deathRecordDailyRollup.groupBy({
+        by: ['deathType'],
+        where,
+        _sum: { deaths: true }
+      }),
+      prisma.deathRecordDailyRollup.groupBy({
+        by: ['penId'],
+        where,
+        _sum: { deaths: true }
+      }),
+      prisma.deathRecordDailyRollup.groupBy({
+        by: ['purchaseId'],
+        where,
+        _sum: { deaths: true }
+      })
+    ]);
+
+    const [pens, purchases] = await Promise.all([
+      prisma.pen.findMany({
+        where: { id: { in: byPen.map(group => group.penId) } },
+        select: { id: true, penNumber: true }
+      }),
+      prisma.cattlePurchase.findMany({
+        where: { id: { in: byPurchase.map(group => group.purchaseId) } },
+        select: { id: true, lotCode: true }
+      })
+    ]);
+    const penNumbers = new Map(pens.map(pen => [pen.id, pen.penNumber]));
+    const lotCodes = new Map(purchases.map(purchase => [purchase.id, purchase.lotCode]));
 
     // Calcular estatísticas
     const stats: DeathStatistics = {
-      totalDeaths: 0,
+      totalDeaths: totals._sum.deaths || 0,
       deathsByType: {},
       deathsByPen: {},
       deathsByPurchase: {},
       mortalityRate: 0,
-      totalEstimatedLoss: 0
+      totalEstimatedLoss: totals._sum.estimatedLoss || 0
     };
 
-    // Processar registros
-    for (const record of records) {
-      stats.totalDeaths += record.quantity;
-      stats.totalEstimatedLoss += record.estimatedLoss || 0;
-
-      // Por tipo
-      if (!stats.deathsByType[record.deathType]) {
-        stats.deathsByType[record.deathType] = 0;
-      }
-      stats.deathsByType[record.deathType] += record.quantity;
+    for (const group of byType) {
+      stats.deathsByType[group.deathType] = group._sum.deaths || 0;
+    }
 
-      // Por curral
-      const penKey = record.pen.penNumber;
-      if (!stats.deathsByPen[penKey]) {
-        stats.deathsByPen[penKey] = 0;
-      }
-      stats.deathsByPen[penKey] += record.quantity;
+    // Por curral
+    for (const group of byPen) {
+      const penKey = penNumbers.get(group.penId) ?? group.penId;
+      stats.deathsByPen[penKey] = (stats.deathsByPen[penKey] || 0) + (group._sum.deaths || 0);
+    }
 
-      // Por compra
-      const purchaseKey = record.purchase.lotCode;
-      if (!stats.deathsByPurchase[purchaseKey]) {
-        stats.deathsByPurchase[purchaseKey] = 0;
-      }
-      stats.deathsByPurchase[purchaseKey] += record.quantity;
+    // Por compra
+    for (const group of byPurchase) {
+      const purchaseKey = lotCodes.get(group.purchaseId) ?? group.purchaseId;
+      stats.deathsByPurchase[purchaseKey] = (stats.deathsByPurchase[purchaseKey] || 0) + (group._sum.deaths || 0);
     }
 
     // Calcular taxa de mortalidade
@@ -370,45 +526,75 @@ class DeathRecordService {
     return stats;
   }
 
-  // Análise de mortes por período
-  async getAnalysisByPeriod(startDate: Date, endDate: Date) {
-    const records = await prisma.deathRecord.findMany({
-      where: {
-        deathDate: {
-          gte: startDate,
-          lte: endDate
-        }
-      },
-      include: {
-        purchase: true,
-        pen: true
-      },
-      orderBy: {
-        deathDate: 'asc'
-      }
+  // Análise de mortes por período: totais por dia da rollup; os registros de cada dia
+  // só são carregados quando pedidos
+  async getAnalysisByPeriod(startDate: Date, endDate: Date, includeRecords = false) {
+    const days = await prisma.deathRecordDailyRollup.groupBy({
+      by: ['day'],
+      where: this.rollupWhere({ startDate, endDate }),
+      _sum: { deaths: true, estimatedLoss: true },
+      orderBy: { day: 'asc' }
     });
 
-    // Agrupar por dia
-    const byDay: Record<string, any> = {};
-    
-    for (const record of records) {
-      const day = record.deathDate.toISOString().split('T')[0];
-      
-      if (!byDay[day]) {
-        byDay[day] = {
-          date: day,
-          totalDeaths: 0,
-          records: [],
-          estimatedLoss: 0
-        };
+    const byDay = new Map<string, { date: string; totalDeaths: number; estimatedLoss: number; records?: any[] }>();
+    for (const group of days) {
+      const day = group.day.toISOString().split('T')[0];
+      byDay.set(day, {
+        date: day,
+        totalDeaths: group._sum.deaths || 0,
+        estimatedLoss: group._sum.estimatedLoss || 0,
+        ...(includeRecords && { records: [] })
+      });
+    }
+
+    if (includeRecords && byDay.size > 0) {
+      const records = await prisma.deathRecord.findMany({
+        where: {
+          deathDate: {
+            gte: this.toDay(startDate),
+            lt: new Date(this.toDay(endDate).getTime() + 24 * 60 * 60 * 1000)
+          }
+        },
+        include: {
+          purchase: true,
+          pen: true
+        },
+        orderBy: {
+          deathDate: 'asc'
+        }
+      });
+
+      for (const record of records) {
+        byDay.get(record.deathDate.toISOString().split('T')[0])?.records!.push(record);
       }
-      
-      byDay[day].totalDeaths += record.quantity;
-      byDay[day].estimatedLoss += record.estimatedLoss || 0;
-      byDay[day].records.push(record);
     }
 
-    return Object.values(byDay);
+    return [...byDay.values()];
+  }
+
+  // Filtro da rollup; as datas valem pelo dia (UTC) inteiro
+  private rollupWhere(filters?: {
+    startDate?: Date;
+    endDate?: Date;
+    purchaseId?: string;
+    penId?: string;
+  }) {
+    const where: any = {};
+
+    if (filters?.purchaseId) where.purchaseId = filters.purchaseId;
+    if (filters?.penId) where.penId = filters.penId;
+
+    if (filters?.startDate || filters?.endDate) {
+      where.day = {};
+      if (filters.startDate) where.day.gte = this.toDay(filters.startDate);
+      if (filters.endDate) where.day.lte = this.toDay(filters.endDate);
+    }
+
+    return where;
+  }
+
+  private toDay(date: Date) {
+    return new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate()));
   }
 }
 
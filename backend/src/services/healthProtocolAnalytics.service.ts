@@ -0,0 +1,397 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import { logger } from '@/config/logger';
+import { ValidationError } from '@/utils/AppError';
+import { DomainEntity, onDomainEvent } from '@/utils/domainEvents';
+
+/**
+ * Analítico de protocolos sanitários.
+ *
+ * `health_protocol_facts` guarda um fato por protocolo (tipo + produto), lote e curral com
+ * custo, cabeças tratadas, mortes e peso na janela após o tratamento. O cruzamento das
+ * aplicações com mortalidade e pesagens é feito uma vez por lote, quando alguma dessas
+ * tabelas muda; as consultas por período, protocolo e curral só agregam os fatos.
+ */
+
+export type ProtocolGroupBy = 'protocol' | 'pen' | 'lot' | 'month';
+
+export const PROTOCOL_GROUP_BY: ProtocolGroupBy[] = ['protocol', 'pen', 'lot', 'month'];
+
+export interface ProtocolSlice {
+  startDate?: Date;
+  endDate?: Date;
+  productName?: string;
+  interventionType?: string;
+  penId?: string;
+  purchaseId?: string;
+  groupBy?: ProtocolGroupBy;
+}
+
+export interface ProtocolOutcome {
+  key: string;
+  label: string;
+  lots: number;
+  applications: number;
+  cost: number;
+  treatedHead: number;
+  deathsAfter: number;
+  mortalityRate: number; // % das cabeças tratadas mortas na janela
+  costPerHead: number;
+  averageWeightGain: number | null; // kg/cabeça entre a pesagem anterior e a posterior
+  averageDailyGain: number | null;
+}
+
+export interface RefreshResult {
+  mode: 'full' | 'incremental';
+  lots: number;
+  facts: number;
+  durationMs: number;
+}
+
+// Mortes e pesagens contam como resultado até esses dias após a primeira aplicação
+export const OUTCOME_WINDOW_DAYS = 60;
+
+// Gravações feitas pouco antes do início de um refresh podem ser confirmadas depois da
+// leitura; a marca d'água recua essa margem e o lote é reprocessado por segurança
+const WATERMARK_MARGIN_MS = 5 * 60 * 1000;
+
+const REFRESH_DEBOUNCE_MS = 2000;
+
+// Exclusões não deixam rastro para a marca d'água: o refresh seguinte a uma exclusão é completo,
+// e a reconstrução periódica cobre as feitas fora do cliente compartilhado (SQL bruto)
+const DELETE_ACTIONS = new Set(['delete', 'deleteMany']);
+const FULL_REFRESH_INTERVAL_MS = 6 * 60 * 60 * 1000;
+
+const SOURCE_ENTITIES: DomainEntity[] = ['intervention', 'death', 'weighing', 'purchase'];
+
+const GROUP_COLUMNS: Record<ProtocolGroupBy, { key: Prisma.Sql; label: Prisma.Sql; join?: Prisma.Sql }> = {
+  protocol: {
+    key: Prisma.sql`f."interventionType" || ':' || f."productName"`,
+    label: Prisma.sql`f."productName"`,
+  },
+  pen: {
+    key: Prisma.sql`f."penId"`,
+    label: Prisma.sql`MIN(p."penNumber")`,
+    join: Prisma.sql`LEFT JOIN "pens" p ON p."id" = f."penId"`,
+  },
+  lot: {
+    key: Prisma.sql`f."purchaseId"`,
+    label: Prisma.sql`MIN(cp."lotCode")`,
+    join: Prisma.sql`LEFT JOIN "cattle_purchases" cp ON cp."id" = f."purchaseId"`,
+  },
+  month: {
+    key: Prisma.sql`to_char(date_trunc('month', f."firstApplication"), 'YYYY-MM')`,
+    label: Prisma.sql`to_char(date_trunc('month', f."firstApplication"), 'YYYY-MM')`,
+  },
+};
+
+const round = (value: number, digits = 2) => Number(value.toFixed(digits));
+
+export class HealthProtocolAnalyticsService {
+  private refreshing: Promise<RefreshResult> | null = null;
+  private timer: NodeJS.Timeout | null = null;
+  private dirty = false;
+  private fullPending = false;
+  private fullRefreshTimer: NodeJS.Timeout | null = null;
+  private unsubscribe: (() => void) | null = null;
+
+  /**
+   * Atualiza os fatos (em segundo plano) a cada gravação de intervenções, mortes,
+   * pesagens ou compras
+   */
+  start(): void {
+    if (this.unsubscribe) return;
+    this.unsubscribe = onDomainEvent(event => {
+      if (!SOURCE_ENTITIES.includes(event.entity)) return;
+      if (DELETE_ACTIONS.has(event.action)) this.fullPending = true;
+      this.scheduleRefresh();
+    });
+
+    this.fullRefreshTimer = setInterval(() => {
+      this.fullPending = true;
+      this.scheduleRefresh(0);
+    }, FULL_REFRESH_INTERVAL_MS);
+    this.fullRefreshTimer.unref?.();
+  }
+
+  stop(): void {
+    this.unsubscribe?.();
+    this.unsubscribe = null;
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.fullRefreshTimer) {
+      clearInterval(this.fullRefreshTimer);
+      this.fullRefreshTimer = null;
+    }
+  }
+
+  scheduleRefresh(delayMs: number = REFRESH_DEBOUNCE_MS): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+    }
+
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.refresh().catch(error => {
+        logger.error('Erro ao atualizar fatos de protocolos sanitários:', error);
+      });
+    }, delayMs);
+    this.timer.unref?.();
+  }
+
+  /**
+   * Recalcula os fatos dos lotes com aplicações, mortes ou pesagens gravadas desde o
+   * último refresh. Sem fatos ainda, com `full` ou após uma exclusão, reconstrói a tabela inteira.
+   */
+  async refresh(full = false): Promise<RefreshResult> {
+    // Um refresh por vez; pedidos durante ele geram um novo refresh ao final
+    if (this.refreshing) {
+      this.dirty = true;
+      return this.refreshing;
+    }
+
+    const rebuild = full || this.fullPending;
+    this.fullPending = false;
+
+    this.refreshing = this.runRefresh(rebuild).catch(error => {
+      // A reconstrução pendente não se perde numa falha
+      if (rebuild) this.fullPending = true;
+      throw error;
+    }).finally(() => {
+      this.refreshing = null;
+      if (this.dirty) {
+        this.dirty = false;
+        this.scheduleRefresh(0);
+      }
+    });
+    return this.refreshing;
+  }
+
+  /**
+   * Resultados agregados dos fatos no recorte pedido, agrupados por protocolo, curral,
+   * lote ou mês da primeira aplicação
+   */
+  async getOutcomes(slice: ProtocolSlice = {}): Promise<ProtocolOutcome[]> {
+    const groupBy = slice.groupBy || 'protocol';
+    const group = GROUP_COLUMNS[groupBy];
+    if (!group) {
+      throw new ValidationError(`Agrupamento inválido: ${groupBy}`);
+    }
+
+    const rows = await prisma.$queryRaw<Array<{
+      key: string;
+      label: string | null;
+      lots: number;
+      applications: number;
+      cost: number;
+      treatedHead: number;
+      deathsAfter: number;
+      weightGain: number | null;
+      adg: number | null;
+    }>>`
+      SELECT
+        ${group.key} AS "key",
+        ${group.label} AS "label",
+        COUNT(DISTINCT f."purchaseId")::int AS "lots",
+        SUM(f."applications")::int AS "applications",
+        SUM(f."cost")::double precision AS "cost",
+        SUM(f."treatedHead")::int AS "treatedHead",
+        SUM(f."deathsAfter")::int AS "deathsAfter",
+        (SUM((f."weightAfter" - f."weightBefore") * f."treatedHead")
+          / NULLIF(SUM(f."treatedHead") FILTER (WHERE f."weightAfter" IS NOT NULL AND f."weightBefore" IS NOT NULL), 0)
+        )::double precision AS "weightGain",
+        (SUM(f."averageDailyGain" * f."treatedHead")
+          / NULLIF(SUM(f."treatedHead") FILTER (WHERE f."averageDailyGain" IS NOT NULL), 0)
+        )::double precision AS "adg"
+      FROM "health_protocol_facts" f
+      ${group.join ?? Prisma.empty}
+      ${this.buildWhere(slice)}
+      GROUP BY 1${groupBy === 'protocol' || groupBy === 'month' ? Prisma.sql`, 2` : Prisma.empty}
+      ORDER BY "cost" DESC
+    `;
+
+    return rows.map(row => ({
+      key: row.key,
+      label: row.label ?? row.key,
+      lots: row.lots,
+      applications: row.applications,
+      cost: round(row.cost),
+      treatedHead: row.treatedHead,
+      deathsAfter: row.deathsAfter,
+      mortalityRate: row.treatedHead > 0 ? round((row.deathsAfter / row.treatedHead) * 100) : 0,
+      costPerHead: row.treatedHead > 0 ? round(row.cost / row.treatedHead) : 0,
+      averageWeightGain: row.weightGain !== null ? round(row.weightGain) : null,
+      averageDailyGain: row.adg !== null ? round(row.adg, 3) : null,
+    }));
+  }
+
+  /**
+   * Rebanho tratado no recorte contando cada lote/curral uma vez, mesmo com vários protocolos:
+   * cabeças do maior fato do par e mortes do curral na janela que cobre todas as aplicações
+   */
+  async getTreatedHerd(slice: ProtocolSlice = {}): Promise<{ lots: number; treatedHead: number; deathsAfter: number }> {
+    const window = Prisma.sql`make_interval(days => ${OUTCOME_WINDOW_DAYS}::int)`;
+
+    const [row] = await prisma.$queryRaw<Array<{ lots: number; treatedHead: number; deathsAfter: number }>>`
+      SELECT
+        COUNT(*)::int AS "lots",
+        COALESCE(SUM(herd."treatedHead"), 0)::int AS "treatedHead",
+        COALESCE(SUM(deaths."deaths"), 0)::int AS "deathsAfter"
+      FROM (
+        SELECT f."purchaseId", f."penId", MAX(f."treatedHead") AS "treatedHead",
+               MIN(f."firstApplication") AS "firstApplication", MAX(f."firstApplication") AS "lastStart"
+        FROM "health_protocol_facts" f
+        ${this.buildWhere(slice)}
+        GROUP BY f."purchaseId", f."penId"
+      ) herd
+      LEFT JOIN LATERAL (
+        SELECT SUM(m."quantity") AS "deaths" FROM "mortality_records" m
+        WHERE m."cattlePurchaseId" = herd."purchaseId" AND m."penId" = herd."penId"
+          AND m."deathDate" >= herd."firstApplication" AND m."deathDate" < herd."lastStart" + ${window}
+      ) deaths ON true
+    `;
+
+    return row ?? { lots: 0, treatedHead: 0, deathsAfter: 0 };
+  }
+
+  private buildWhere(slice: ProtocolSlice): Prisma.Sql {
+    const conditions: Prisma.Sql[] = [];
+    if (slice.startDate) conditions.push(Prisma.sql`f."firstApplication" >= ${slice.startDate}`);
+    if (slice.endDate) conditions.push(Prisma.sql`f."firstApplication" <= ${slice.endDate}`);
+    if (slice.productName) conditions.push(Prisma.sql`f."productName" = ${slice.productName}`);
+    if (slice.interventionType) conditions.push(Prisma.sql`f."interventionType" = ${slice.interventionType}`);
+    if (slice.penId) conditions.push(Prisma.sql`f."penId" = ${slice.penId}`);
+    if (slice.purchaseId) conditions.push(Prisma.sql`f."purchaseId" = ${slice.purchaseId}`);
+    return conditions.length ? Prisma.sql`WHERE ${Prisma.join(conditions, ' AND ')}` : Prisma.empty;
+  }
+
+  private async runRefresh(full: boolean): Promise<RefreshResult> {
+    const startedAt = Date.now();
+
+    const [state] = await prisma.$queryRaw<Array<{ watermark: Date | null }>>`
+      SELECT MAX("refreshedAt") AS "watermark" FROM "health_protocol_facts"
+    `;
+    const incremental = !full && state?.watermark;
+
+    let purchaseIds: string[] | null = null;
+    if (incremental) {
+      const since = new Date(state.watermark!.getTime() - WATERMARK_MARGIN_MS);
+      const dirty = await prisma.$queryRaw<Array<{ purchaseId: string }>>`
+        SELECT "cattlePurchaseId" AS "purchaseId" FROM "health_interventions" WHERE "updatedAt" >= ${since}
+        UNION
+        SELECT "cattlePurchaseId" FROM "mortality_records" WHERE "updatedAt" >= ${since}
+        UNION
+        SELECT "purchaseId" FROM "weight_readings" WHERE "createdAt" >= ${since}
+        UNION
+        SELECT "purchaseId" FROM "lot_pen_links" WHERE "updatedAt" >= ${since}
+        UNION
+        SELECT "id" FROM "cattle_purchases" WHERE "updatedAt" >= ${since}
+      `;
+      purchaseIds = dirty.map(row => row.purchaseId);
+
+      if (purchaseIds.length === 0) {
+        return { mode: 'incremental', lots: 0, facts: 0, durationMs: Date.now() - startedAt };
+      }
+    }
+
+    const scope = purchaseIds
+      ? Prisma.sql`WHERE "cattlePurchaseId" IN (${Prisma.join(purchaseIds)})`
+      : Prisma.empty;
+    const window = Prisma.sql`make_interval(days => ${OUTCOME_WINDOW_DAYS}::int)`;
+
+    const facts = await prisma.$transaction(async (tx) => {
+      if (purchaseIds) {
+        await tx.$executeRaw`DELETE FROM "health_protocol_facts" WHERE "purchaseId" IN (${Prisma.join(purchaseIds)})`;
+      } else {
+        await tx.$executeRaw`DELETE FROM "health_protocol_facts"`;
+      }
+
+      // Cabeças tratadas: o que as alocações do lote naquele curral (vigentes durante as aplicações)
+      // têm hoje, somado às mortes do curral desde a primeira aplicação, que já foram abatidas delas.
+      // Peso antes: última pesagem até a primeira aplicação ou, sem pesagem, o peso médio de
+      // entrada do lote. Peso depois: última pesagem da janela após a última aplicação.
+      return tx.$executeRaw`
+        INSERT INTO "health_protocol_facts" (
+          "id", "purchaseId", "penId", "interventionType", "productName",
+          "firstApplication", "lastApplication", "applications", "cost",
+          "treatedHead", "deathsAfter",
+          "weightBefore", "weightBeforeDate", "weightAfter", "weightAfterDate", "averageDailyGain",
+          "refreshedAt"
+        )
+        SELECT
+          gen_random_uuid()::text, h."purchaseId", h."penId", h."interventionType", h."productName",
+          h."firstApplication", h."lastApplication", h."applications", h."cost",
+          GREATEST(COALESCE(pen_head."quantity", 0) + COALESCE(deaths_since."deaths", 0), 0),
+          COALESCE(deaths_after."deaths", 0),
+          base."weight", base."date", weight_after."averageWeight", weight_after."readingDate",
+          CASE WHEN base."weight" IS NOT NULL AND weight_after."readingDate" > base."date"
+            THEN (weight_after."averageWeight" - base."weight")
+              / (EXTRACT(EPOCH FROM weight_after."readingDate" - base."date") / 86400)
+          END,
+          CURRENT_TIMESTAMP
+        FROM (
+          SELECT "cattlePurchaseId" AS "purchaseId", "penId", "interventionType", "productName",
+                 MIN("applicationDate") AS "firstApplication", MAX("applicationDate") AS "lastApplication",
+                 COUNT(*)::int AS "applications", COALESCE(SUM("cost"), 0) AS "cost"
+          FROM "health_interventions"
+          ${scope}
+          GROUP BY 1, 2, 3, 4
+        ) h
+        JOIN "cattle_purchases" cp ON cp."id" = h."purchaseId"
+        LEFT JOIN LATERAL (
+          SELECT SUM(l."quantity") AS "quantity" FROM "lot_pen_links" l
+          WHERE l."purchaseId" = h."purchaseId" AND l."penId" = h."penId"
+            AND l."allocationDate" <= h."lastApplication"
+            AND (l."removalDate" IS NULL OR l."removalDate" >= h."firstApplication")
+        ) pen_head ON true
+        LEFT JOIN LATERAL (
+          SELECT SUM(m."quantity") AS "deaths" FROM "mortality_records" m
+          WHERE m."cattlePurchaseId" = h."purchaseId" AND m."penId" = h."penId"
+            AND m."deathDate" >= h."firstApplication"
+        ) deaths_since ON true
+        LEFT JOIN LATERAL (
+          SELECT SUM(m."quantity") AS "deaths" FROM "mortality_records" m
+          WHERE m."cattlePurchaseId" = h."purchaseId" AND m."penId" = h."penId"
+            AND m."deathDate" >= h."firstApplication" AND m."deathDate" < h."firstApplication" + ${window}
+        ) deaths_after ON true
+        LEFT JOIN LATERAL (
+          SELECT w."averageWeight", w."readingDate" FROM "weight_readings" w
+          WHERE w."purchaseId" = h."purchaseId" AND w."readingDate" <= h."firstApplication"
+          ORDER BY w."readingDate" DESC
+          LIMIT 1
+        ) weight_before ON true
+        LEFT JOIN LATERAL (
+          SELECT w."averageWeight", w."readingDate" FROM "weight_readings" w
+          WHERE w."purchaseId" = h."purchaseId"
+            AND w."readingDate" > h."lastApplication" AND w."readingDate" < h."firstApplication" + ${window}
+          ORDER BY w."readingDate" DESC
+          LIMIT 1
+        ) weight_after ON true
+        CROSS JOIN LATERAL (
+          SELECT
+            COALESCE(weight_before."averageWeight",
+              CASE WHEN cp."initialQuantity" > 0 THEN
+                CASE WHEN cp."receivedWeight" IS NOT NULL AND cp."receivedDate" IS NOT NULL
+                  THEN cp."receivedWeight" ELSE cp."purchaseWeight" END / cp."initialQuantity"
+              END) AS "weight",
+            COALESCE(weight_before."readingDate",
+              CASE WHEN cp."receivedWeight" IS NOT NULL AND cp."receivedDate" IS NOT NULL
+                THEN cp."receivedDate" ELSE cp."purchaseDate" END) AS "date"
+        ) base
+      `;
+    }, { timeout: 60000 });
+
+    const result: RefreshResult = {
+      mode: purchaseIds ? 'incremental' : 'full',
+      lots: purchaseIds?.length ?? 0,
+      facts,
+      durationMs: Date.now() - startedAt,
+    };
+    logger.info(`[HealthProtocolAnalytics] Refresh ${result.mode}: ${facts} fato(s) em ${result.durationMs}ms`);
+    return result;
+  }
+}
+
+export const healthProtocolAnalyticsService = new HealthProtocolAnalyticsService();
@@ -1,8 +1,7 @@
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 import { logger } from '@/config/logger';
 import cashFlowService from './cashFlow.service';
-
-const prisma = new PrismaClient();
+import { healthProtocolAnalyticsService, OUTCOME_WINDOW_DAYS } from './healthProtocolAnalytics.service';
 
 export interface HealthProtocolData {
   type: 'VACINA' | 'MEDICAMENTO' | 'VERMIFUGO' | 'SUPLEMENTO' | 'TRATAMENTO';
@@ -303,35 +302,23 @@ class HealthProtocolIntegrationService {
   }
 
   /**
-   * Calcula o ROI dos investimentos em saúde
+   * Calcula o ROI dos investimentos em saúde a partir dos fatos pré-calculados por
+   * protocolo e lote (custo, cabeças tratadas e mortes na janela após o tratamento)
    */
   async calculateHealthROI(period: { start: Date; end: Date }) {
     try {
-      // Buscar investimentos em saúde
-      const { summary } = await this.getProtocolsWithFinancial({
-        startDate: period.start,
-        endDate: period.end,
-        paid: true
-      });
+      const slice = { startDate: period.start, endDate: period.end };
+      const [protocols, herd] = await Promise.all([
+        healthProtocolAnalyticsService.getOutcomes({ ...slice, groupBy: 'protocol' }),
+        // Animal tratado por mais de um protocolo conta uma vez por lote/curral
+        healthProtocolAnalyticsService.getTreatedHerd(slice)
+      ]);
 
-      // Buscar mortalidade do período (simplificado)
-      // Em produção, comparar com período anterior ou média histórica
-      const mortalityData = await prisma.cattlePurchase.aggregate({
-        where: {
-          updatedAt: {
-            gte: period.start,
-            lte: period.end
-          }
-        },
-        _sum: {
-          deathCount: true,
-          initialQuantity: true
-        }
-      });
+      const investment = protocols.reduce((sum, p) => sum + p.cost, 0);
+      const animalsTotal = herd.treatedHead;
+      const deaths = herd.deathsAfter;
 
-      const mortalityRate = mortalityData._sum.initialQuantity 
-        ? (mortalityData._sum.deathCount || 0) / mortalityData._sum.initialQuantity * 100
-        : 0;
+      const mortalityRate = animalsTotal > 0 ? (deaths / animalsTotal) * 100 : 0;
 
       // Estimar perdas evitadas (baseado em média histórica de 3% de mortalidade)
       const expectedMortalityRate = 3; // %
@@ -340,24 +327,26 @@ class HealthProtocolIntegrationService {
       
       // Valor médio por animal (simplificado)
       const avgAnimalValue = 3000; // R$ - ajustar conforme realidade
-      const animalsTotal = mortalityData._sum.initialQuantity || 0;
       const animalsSaved = animalsTotal * (mortalityReduction / 100);
       const lossAvoided = animalsSaved * avgAnimalValue;
 
       // Calcular ROI
-      const roi = summary.totalInvested > 0 
-        ? ((lossAvoided - summary.totalInvested) / summary.totalInvested) * 100
+      const roi = investment > 0 
+        ? ((lossAvoided - investment) / investment) * 100
         : 0;
 
       return {
         period,
-        investment: summary.totalInvested,
+        investment,
+        treatedAnimals: animalsTotal,
         mortalityRate: actualMortalityRate,
         expectedMortalityRate,
         mortalityReduction,
         animalsSaved: Math.round(animalsSaved),
         lossAvoided,
         roi,
+        outcomeWindowDays: OUTCOME_WINDOW_DAYS,
+        protocols,
         analysis: roi > 0 
           ? `Retorno positivo de ${roi.toFixed(1)}% sobre investimento em saúde`
           : 'Investimento em saúde ainda não gerou retorno mensurável'
@@ -0,0 +1,140 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import { logger } from '@/config/logger';
+import { DomainEntity } from '@/utils/domainEvents';
+import { DomainCache } from '@/utils/cache';
+
+/**
+ * Resumo do rebanho (animais, mortes, peso médio e contagem de intervenções) calculado
+ * em uma única consulta agregada e guardado em cache por período. O cache é descartado
+ * quando compras, mortes, pesagens ou intervenções são gravadas.
+ */
+
+export interface HerdPeriod {
+  startDate?: Date;
+  endDate?: Date;
+}
+
+export interface HerdSummary {
+  totalAnimals: number;
+  currentAnimals: number;
+  totalDeaths: number;
+  averageWeight: number;
+  healthInterventions: number;
+  movements: number;
+  weightReadings: number;
+  mortalityRecords: {
+    total: number;
+    totalQuantity: number;
+    totalLoss: number;
+  };
+  computedAt: Date;
+}
+
+const HERD_ENTITIES: DomainEntity[] = ['purchase', 'death', 'weighing', 'intervention'];
+
+// Períodos distintos guardados ao mesmo tempo (ex.: ciclos consultados no filtro)
+const MAX_CACHED_PERIODS = 50;
+// Salvaguarda para gravações que não geram evento de domínio (SQL bruto sem publicação)
+const CACHE_TTL_SECONDS = 5 * 60;
+
+const periodKey = (period: HerdPeriod) =>
+  `${period.startDate?.toISOString() ?? ''}:${period.endDate?.toISOString() ?? ''}`;
+
+/**
+ * Condição de período sobre uma coluna de data; sem período, não filtra
+ */
+function inPeriod(column: string, period: HerdPeriod): Prisma.Sql {
+  const conditions: Prisma.Sql[] = [];
+  if (period.startDate) conditions.push(Prisma.sql`${Prisma.raw(`"${column}"`)} >= ${period.startDate}`);
+  if (period.endDate) conditions.push(Prisma.sql`${Prisma.raw(`"${column}"`)} <= ${period.endDate}`);
+  return conditions.length ? Prisma.sql`WHERE ${Prisma.join(conditions, ' AND ')}` : Prisma.empty;
+}
+
+export class HerdSummaryService {
+  private cache = new DomainCache<HerdSummary>({
+    entities: HERD_ENTITIES,
+    maxEntries: MAX_CACHED_PERIODS,
+    ttlSeconds: CACHE_TTL_SECONDS,
+  });
+
+  start(): void {
+    this.cache.start();
+  }
+
+  stop(): void {
+    this.cache.stop();
+  }
+
+  invalidate(): void {
+    this.cache.invalidate();
+  }
+
+  /**
+   * Resumo do período (compras pela data de compra, demais registros pela data do evento)
+   */
+  async get(period: HerdPeriod = {}): Promise<HerdSummary> {
+    return this.cache.get(periodKey(period), () => this.compute(period));
+  }
+
+  private async compute(period: HerdPeriod): Promise<HerdSummary> {
+    const startedAt = Date.now();
+
+    const [row] = await prisma.$queryRaw<Array<{
+      totalAnimals: number;
+      currentAnimals: number;
+      totalDeaths: number;
+      averageWeight: number | null;
+      mortalityRecords: number;
+      mortalityQuantity: number;
+      mortalityLoss: number;
+      healthInterventions: number;
+      movements: number;
+      weightReadings: number;
+    }>>`
+      SELECT
+        p."totalAnimals", p."currentAnimals", p."totalDeaths", p."averageWeight",
+        m."mortalityRecords", m."mortalityQuantity", m."mortalityLoss",
+        (SELECT COUNT(*)::int FROM "health_interventions" ${inPeriod('applicationDate', period)}) AS "healthInterventions",
+        (SELECT COUNT(*)::int FROM "pen_movements" ${inPeriod('movementDate', period)}) AS "movements",
+        (SELECT COUNT(*)::int FROM "weight_readings" ${inPeriod('readingDate', period)}) AS "weightReadings"
+      FROM (
+        SELECT
+          COALESCE(SUM("initialQuantity"), 0)::int AS "totalAnimals",
+          COALESCE(SUM("currentQuantity"), 0)::int AS "currentAnimals",
+          COALESCE(SUM("deathCount"), 0)::int AS "totalDeaths",
+          AVG(COALESCE(NULLIF("currentWeight", 0), NULLIF("averageWeight", 0)))::double precision AS "averageWeight"
+        FROM "cattle_purchases"
+        ${inPeriod('purchaseDate', period)}
+      ) p,
+      (
+        SELECT
+          COUNT(*)::int AS "mortalityRecords",
+          COALESCE(SUM("quantity"), 0)::int AS "mortalityQuantity",
+          COALESCE(SUM("total_loss"), 0)::double precision AS "mortalityLoss"
+        FROM "mortality_analyses"
+        ${inPeriod('mortality_date', period)}
+      ) m
+    `;
+
+    logger.debug(`[HerdSummary] Resumo calculado em ${Date.now() - startedAt}ms`);
+
+    return {
+      totalAnimals: row.totalAnimals,
+      currentAnimals: row.currentAnimals,
+      totalDeaths: row.totalDeaths,
+      averageWeight: row.averageWeight ?? 0,
+      healthInterventions: row.healthInterventions,
+      movements: row.movements,
+      weightReadings: row.weightReadings,
+      mortalityRecords: {
+        total: row.mortalityRecords,
+        totalQuantity: row.mortalityQuantity,
+        totalLoss: row.mortalityLoss,
+      },
+      computedAt: new Date(),
+    };
+  }
+}
+
+export const herdSummaryService = new HerdSummaryService();
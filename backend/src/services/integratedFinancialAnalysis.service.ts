@@ -1,6 +1,5 @@
-import { PrismaClient, FinancialTransaction, IntegratedFinancialAnalysis, FinancialTransactionCategory, CashFlowClassification, IntegratedAnalysisStatus } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { FinancialTransaction, IntegratedFinancialAnalysis, FinancialTransactionCategory, CashFlowClassification, IntegratedAnalysisStatus } from '@prisma/client';
+import { prisma } from '@/config/database';
 
 interface IntegratedAnalysisData {
   referenceMonth: Date;
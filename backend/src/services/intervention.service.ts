@@ -1,6 +1,8 @@
+import { Prisma } from '@prisma/client';
 import { prisma } from '@/config/database';
-import { AppError } from '@/utils/AppError';
+import { AppError, ValidationError } from '@/utils/AppError';
 import { logger } from '@/config/logger';
+import { herdSummaryService, HerdPeriod } from '@/services/herdSummary.service';
 
 // Tipos para as intervenções
 export interface HealthInterventionData {
@@ -58,6 +60,148 @@ export interface WeightReadingData {
   notes?: string;
 }
 
+export type InterventionTimelineType = 'health' | 'mortality' | 'movement' | 'weight';
+
+export interface InterventionHistoryFilters {
+  cattlePurchaseId?: string;
+  penId?: string;
+  startDate?: Date;
+  endDate?: Date;
+  type?: InterventionTimelineType;
+  cursor?: string;
+  limit?: number;
+}
+
+interface TimelineRow {
+  id: string;
+  type: InterventionTimelineType;
+  date: Date;
+  cattlePurchaseId: string;
+  penId: string | null;
+  quantity: number | null;
+  amount: number | null;
+  createdAt: Date;
+  details: Record<string, unknown>;
+  lotCode: string | null;
+  penNumber: string | null;
+}
+
+export interface InterventionTimelinePage {
+  items: Array<Record<string, unknown>>;
+  limit: number;
+  hasNext: boolean;
+  nextCursor: string | null;
+}
+
+const DEFAULT_TIMELINE_LIMIT = 100;
+const MAX_TIMELINE_LIMIT = 500;
+
+const TIMELINE_DATE_FIELDS: Record<InterventionTimelineType, string> = {
+  health: 'applicationDate',
+  mortality: 'deathDate',
+  movement: 'movementDate',
+  weight: 'readingDate',
+};
+
+interface TimelineBranch {
+  type: InterventionTimelineType;
+  idColumn: Prisma.Sql;
+  dateColumn: Prisma.Sql;
+  lotColumn: Prisma.Sql;
+  penFilter?: (penId: string) => Prisma.Sql;
+  // Projeção comum: id, type, date, cattlePurchaseId, penId, quantity, amount, createdAt, details
+  select: Prisma.Sql;
+}
+
+// Datas dentro de `details` vão como timestamptz para o JSON sair com fuso (UTC)
+const TIMELINE_BRANCHES: TimelineBranch[] = [
+  {
+    type: 'health',
+    idColumn: Prisma.sql`h."id"`,
+    dateColumn: Prisma.sql`h."applicationDate"`,
+    lotColumn: Prisma.sql`h."cattlePurchaseId"`,
+    penFilter: penId => Prisma.sql`h."penId" = ${penId}`,
+    select: Prisma.sql`
+      SELECT h."id", 'health'::text AS "type", h."applicationDate" AS "date", h."cattlePurchaseId",
+             h."penId", NULL::int AS "quantity", h."cost" AS "amount", h."createdAt",
+             jsonb_build_object(
+               'interventionType', h."interventionType", 'productName', h."productName",
+               'dose', h."dose", 'unit', h."unit", 'veterinarian', h."veterinarian",
+               'batchNumber', h."batchNumber", 'manufacturer', h."manufacturer",
+               'expirationDate', h."expirationDate" AT TIME ZONE 'UTC', 'cost', h."cost", 'notes', h."notes"
+             ) AS "details"
+      FROM "health_interventions" h`,
+  },
+  {
+    type: 'mortality',
+    idColumn: Prisma.sql`m."id"`,
+    dateColumn: Prisma.sql`m."deathDate"`,
+    lotColumn: Prisma.sql`m."cattlePurchaseId"`,
+    penFilter: penId => Prisma.sql`m."penId" = ${penId}`,
+    select: Prisma.sql`
+      SELECT m."id", 'mortality'::text, m."deathDate", m."cattlePurchaseId",
+             m."penId", m."quantity", m."estimatedLoss", m."createdAt",
+             jsonb_build_object(
+               'cause', m."cause", 'specificCause', m."specificCause",
+               'veterinarianReport', m."veterinarianReport", 'necropsy', m."necropsy",
+               'necropsyReport', m."necropsyReport", 'estimatedLoss', m."estimatedLoss", 'notes', m."notes"
+             )
+      FROM "mortality_records" m`,
+  },
+  {
+    type: 'movement',
+    idColumn: Prisma.sql`mv."id"`,
+    dateColumn: Prisma.sql`mv."movementDate"`,
+    lotColumn: Prisma.sql`mv."cattlePurchaseId"`,
+    penFilter: penId => Prisma.sql`(mv."fromPenId" = ${penId} OR mv."toPenId" = ${penId})`,
+    select: Prisma.sql`
+      SELECT mv."id", 'movement'::text, mv."movementDate", mv."cattlePurchaseId",
+             mv."fromPenId", mv."quantity", NULL::double precision, mv."createdAt",
+             jsonb_build_object(
+               'fromPenId', mv."fromPenId", 'toPenId', mv."toPenId", 'reason', mv."reason",
+               'responsibleUser', mv."responsibleUser", 'notes', mv."notes"
+             )
+      FROM "pen_movements" mv`,
+  },
+  {
+    // Pesagens são do lote, sem curral: o filtro por curral não se aplica
+    type: 'weight',
+    idColumn: Prisma.sql`w."id"`,
+    dateColumn: Prisma.sql`w."readingDate"`,
+    lotColumn: Prisma.sql`w."purchaseId"`,
+    select: Prisma.sql`
+      SELECT w."id", 'weight'::text, w."readingDate", w."purchaseId",
+             NULL::text, w."animalCount", NULL::double precision, w."createdAt",
+             jsonb_build_object(
+               'averageWeight', w."averageWeight", 'totalWeight', w."totalWeight",
+               'animalCount', w."animalCount", 'userId', w."userId", 'notes', w."notes"
+             )
+      FROM "weight_readings" w`,
+  },
+];
+
+interface TimelineCursor {
+  date: Date;
+  type: InterventionTimelineType;
+  id: string;
+}
+
+const encodeTimelineCursor = (row: TimelineRow) =>
+  Buffer.from(JSON.stringify({ date: row.date.toISOString(), type: row.type, id: row.id })).toString('base64url');
+
+const decodeTimelineCursor = (cursor: string): TimelineCursor => {
+  try {
+    const payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    const date = new Date(payload.date);
+    if (!Number.isNaN(date.getTime()) && payload.type in TIMELINE_DATE_FIELDS && typeof payload.id === 'string') {
+      return { date, type: payload.type, id: payload.id };
+    }
+  } catch {
+    // Cai no erro abaixo
+  }
+  throw new ValidationError('Cursor inválido');
+};
+
 export class InterventionService {
   // Intervenções de Saúde
   async createHealthIntervention(data: HealthInterventionData) {
@@ -589,124 +733,80 @@ export class InterventionService {
   }
 
   // Buscar histórico de intervenções
-  async getInterventionHistory(filters: {
-    cattlePurchaseId?: string;
-    penId?: string;
-    startDate?: Date;
-    endDate?: Date;
-    type?: 'health' | 'mortality' | 'movement' | 'weight';
-  }) {
+  /**
+   * Linha do tempo unificada de intervenções (saúde, mortes, movimentações e pesagens).
+   *
+   * Uma única consulta UNION ALL com projeção comum, ordenada por (data, tipo, id) e
+   * paginada por keyset no banco. Cada ramo aplica filtro, cursor e LIMIT sobre o próprio
+   * índice (lote + data, curral + data ou data), então uma página custa O(página) mesmo
+   * em lotes grandes. Lote e curral vêm só como código/número, não como objetos completos.
+   */
+  async getInterventionHistory(filters: InterventionHistoryFilters): Promise<InterventionTimelinePage> {
     try {
-      const results: any[] = [];
+      const limit = Math.min(Math.max(filters.limit || DEFAULT_TIMELINE_LIMIT, 1), MAX_TIMELINE_LIMIT);
+      const cursor = filters.cursor ? decodeTimelineCursor(filters.cursor) : undefined;
+      const take = limit + 1;
 
-      // Buscar intervenções de saúde
-      if (!filters.type || filters.type === 'health') {
-        const healthInterventions = await prisma.healthIntervention.findMany({
-          where: {
-            ...(filters.cattlePurchaseId && { cattlePurchaseId: filters.cattlePurchaseId }),
-            ...(filters.penId && { penId: filters.penId }),
-            ...(filters.startDate && filters.endDate && {
-              applicationDate: {
-                gte: filters.startDate,
-                lte: filters.endDate
-              }
-            })
-          },
-          include: {
-            cattlePurchase: true,
-            pen: true
-          },
-          orderBy: {
-            applicationDate: 'desc'
-          }
-        });
-        results.push(...healthInterventions.map(i => ({ ...i, type: 'health' })));
-      }
+      const branches = TIMELINE_BRANCHES
+        .filter(branch => !filters.type || filters.type === branch.type)
+        .map(branch => {
+          const conditions: Prisma.Sql[] = [Prisma.sql`TRUE`];
 
-      // Buscar registros de mortalidade
-      if (!filters.type || filters.type === 'mortality') {
-        const mortalityRecords = await prisma.mortalityRecord.findMany({
-          where: {
-            ...(filters.cattlePurchaseId && { cattlePurchaseId: filters.cattlePurchaseId }),
-            ...(filters.penId && { penId: filters.penId }),
-            ...(filters.startDate && filters.endDate && {
-              deathDate: {
-                gte: filters.startDate,
-                lte: filters.endDate
-              }
-            })
-          },
-          include: {
-            cattlePurchase: true,
-            pen: true
-          },
-          orderBy: {
-            deathDate: 'desc'
+          if (filters.cattlePurchaseId) {
+            conditions.push(Prisma.sql`${branch.lotColumn} = ${filters.cattlePurchaseId}`);
           }
-        });
-        results.push(...mortalityRecords.map(m => ({ ...m, type: 'mortality' })));
-      }
-
-      // Buscar movimentações
-      if (!filters.type || filters.type === 'movement') {
-        const movements = await prisma.penMovement.findMany({
-          where: {
-            ...(filters.cattlePurchaseId && { cattlePurchaseId: filters.cattlePurchaseId }),
-            ...(filters.penId && {
-              OR: [
-                { fromPenId: filters.penId },
-                { toPenId: filters.penId }
-              ]
-            }),
-            ...(filters.startDate && filters.endDate && {
-              movementDate: {
-                gte: filters.startDate,
-                lte: filters.endDate
-              }
-            })
-          },
-          include: {
-            cattlePurchase: true,
-            fromPen: true,
-            toPen: true
-          },
-          orderBy: {
-            movementDate: 'desc'
+          if (filters.penId && branch.penFilter) {
+            conditions.push(branch.penFilter(filters.penId));
           }
-        });
-        results.push(...movements.map(m => ({ ...m, type: 'movement' })));
-      }
-
-      // Buscar leituras de peso
-      if (!filters.type || filters.type === 'weight') {
-        const weightReadings = await prisma.weightReading.findMany({
-          where: {
-            ...(filters.cattlePurchaseId && { purchaseId: filters.cattlePurchaseId }),
-            ...(filters.startDate && filters.endDate && {
-              readingDate: {
-                gte: filters.startDate,
-                lte: filters.endDate
-              }
-            })
-          },
-          include: {
-            cattle_purchases: true
-          },
-          orderBy: {
-            readingDate: 'desc'
+          if (filters.startDate) {
+            conditions.push(Prisma.sql`${branch.dateColumn} >= ${filters.startDate}`);
           }
+          if (filters.endDate) {
+            conditions.push(Prisma.sql`${branch.dateColumn} <= ${filters.endDate}`);
+          }
+          if (cursor) {
+            // O limite superior na data deixa o índice fazer o trabalho; a comparação de
+            // linha resolve os empates
+            conditions.push(Prisma.sql`${branch.dateColumn} <= ${cursor.date}`);
+            conditions.push(Prisma.sql`(${branch.dateColumn}, ${branch.type}::text, ${branch.idColumn}) < (${cursor.date}, ${cursor.type}, ${cursor.id})`);
+          }
+
+          return Prisma.sql`(
+            ${branch.select}
+            WHERE ${Prisma.join(conditions, ' AND ')}
+            ORDER BY ${branch.dateColumn} DESC, ${branch.idColumn} DESC
+            LIMIT ${take}
+          )`;
         });
-        results.push(...weightReadings.map(w => ({ ...w, type: 'weight' })));
+
+      if (branches.length === 0) {
+        return { items: [], limit, hasNext: false, nextCursor: null };
       }
 
-      // Ordenar por data
-      results.sort((a, b) => {
-        const dateA = a.applicationDate || a.deathDate || a.movementDate || a.weighingDate;
-        const dateB = b.applicationDate || b.deathDate || b.movementDate || b.weighingDate;
-        return new Date(dateB).getTime() - new Date(dateA).getTime();
-      });
+      const rows = await prisma.$queryRaw<TimelineRow[]>`
+        SELECT t.*, cp."lotCode", p."penNumber"
+        FROM (${Prisma.join(branches, ' UNION ALL ')}) t
+        LEFT JOIN "cattle_purchases" cp ON cp."id" = t."cattlePurchaseId"
+        LEFT JOIN "pens" p ON p."id" = t."penId"
+        ORDER BY t."date" DESC, t."type" DESC, t."id" DESC
+        LIMIT ${take}
+      `;
+
+      const hasNext = rows.length > limit;
+      const page = hasNext ? rows.slice(0, limit) : rows;
+      const last = page[page.length - 1];
 
-      return results;
+      return {
+        items: page.map(({ details, ...row }) => ({
+          ...details,
+          ...row,
+          // Nome original da data de cada tipo, usado pelas telas existentes
+          [TIMELINE_DATE_FIELDS[row.type]]: row.date,
+        })),
+        limit,
+        hasNext,
+        nextCursor: hasNext && last ? encodeTimelineCursor(last) : null,
+      };
     } catch (error) {
       console.error('Erro ao buscar histórico de intervenções:', error);
       throw error;
@@ -714,66 +814,27 @@ export class InterventionService {
   }
 
   // Estatísticas de intervenções
-  async getInterventionStatistics(cycleId?: string) {
+  async getInterventionStatistics(period: HerdPeriod = {}) {
     try {
-      // Como ainda não temos modelos específicos de intervenções, vamos usar MortalityAnalysis
-      // e dados dos CattlePurchases para calcular as estatísticas
-      
-      // Buscar estatísticas de mortalidade do mortality_analyses
-      const mortalityStats = await prisma.mortality_analyses.aggregate({
-        _count: true,
-        _sum: {
-          quantity: true,
-          total_loss: true
-        }
-      });
-
-      // Buscar total de animais e calcular taxa de mortalidade
-      const cattlePurchases = await prisma.cattlePurchase.findMany({
-        select: {
-          initialQuantity: true,
-          currentQuantity: true,
-          deathCount: true,
-          currentWeight: true,
-          averageWeight: true
-        }
-      });
+      // Resumo agregado em uma consulta e mantido em cache até a próxima gravação de
+      // compras, mortes, pesagens ou intervenções
+      const herd = await herdSummaryService.get(period);
 
-      const totalAnimals = cattlePurchases.reduce((sum, cp) => sum + (cp.initialQuantity || 0), 0);
-      const currentAnimals = cattlePurchases.reduce((sum, cp) => sum + (cp.currentQuantity || 0), 0);
-      const totalDeaths = cattlePurchases.reduce((sum, cp) => sum + (cp.deathCount || 0), 0);
-      
-      // Calcular peso médio atual
-      const weights = cattlePurchases
-        .filter(cp => cp.currentWeight || cp.averageWeight)
-        .map(cp => cp.currentWeight || cp.averageWeight || 0);
-      const averageWeight = weights.length > 0 
-        ? weights.reduce((sum, w) => sum + w, 0) / weights.length 
-        : 0;
+      return {
+        healthInterventions: herd.healthInterventions,
+        totalMortalities: herd.totalDeaths,
+        movements: herd.movements,
+        weightReadings: herd.weightReadings,
 
-      // Taxa de mortalidade
-      const mortalityRate = totalAnimals > 0 ? totalDeaths / totalAnimals : 0;
+        mortalityRate: herd.totalAnimals > 0 ? herd.totalDeaths / herd.totalAnimals : 0,
+        totalFinancialLoss: herd.mortalityRecords.totalLoss,
+        averageWeight: herd.averageWeight,
 
-      return {
-        // Por enquanto, valores padrão para intervenções não implementadas
-        healthInterventions: 0,
-        totalMortalities: totalDeaths,
-        movements: 0,
-        weightReadings: 0,
-        
-        // Dados reais calculados
-        mortalityRate,
-        totalFinancialLoss: mortalityStats._sum?.total_loss || 0,
-        averageWeight,
-        
         // Dados adicionais
-        totalAnimals,
-        currentAnimals,
-        mortalityRecords: {
-          total: mortalityStats._count || 0,
-          totalQuantity: mortalityStats._sum?.quantity || 0,
-          totalLoss: mortalityStats._sum?.total_loss || 0
-        }
+        totalAnimals: herd.totalAnimals,
+        currentAnimals: herd.currentAnimals,
+        mortalityRecords: herd.mortalityRecords,
+        computedAt: herd.computedAt
       };
     } catch (error) {
       console.error('❌ Erro ao buscar estatísticas de intervenções:', error);
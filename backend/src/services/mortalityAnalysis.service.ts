@@ -1,8 +1,8 @@
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 import { ExpenseService } from './expense.service';
 import { logger } from '@/config/logger';
+import { riskModelService } from '@/services/riskModel.service';
 
-const prisma = new PrismaClient();
 const expenseService = new ExpenseService();
 
 interface MortalityRegistration {
@@ -447,67 +447,22 @@ export class MortalityAnalysisService {
     return treatmentAnalysis;
   }
 
-  // Prever risco de mortalidade
+  // Prever risco de mortalidade (coeficientes ajustados pelo job do riskModelService)
   async predictMortalityRisk(cattlePurchaseId: string) {
     const purchase = await prisma.cattlePurchase.findUnique({
       where: { id: cattlePurchaseId },
-      include: { vendor: true }
+      select: { vendorId: true, freightDistance: true }
     });
 
     if (!purchase) {
       throw new Error('Compra não encontrada');
     }
 
-    // Buscar histórico do vendedor
-    const vendorHistory = await prisma.$queryRaw<any[]>(
-      `SELECT 
-        AVG(ma.quantity::float / cp.initial_quantity * 100) as avg_mortality_rate,
-        COUNT(DISTINCT ma.cattle_purchase_id) as total_purchases
-      FROM mortality_analyses ma
-      JOIN cattle_purchases cp ON ma.cattle_purchase_id = cp.id
-      WHERE cp.vendor_id = $1`,
-      purchase.vendorId
-    );
-
-    // Buscar histórico da época do ano
-    const currentMonth = new Date().getMonth() + 1;
-    const seasonalHistory = await prisma.$queryRaw<any[]>(
-      `SELECT 
-        AVG(ma.quantity::float / cp.initial_quantity * 100) as avg_mortality_rate
-      FROM mortality_analyses ma
-      JOIN cattle_purchases cp ON ma.cattle_purchase_id = cp.id
-      WHERE EXTRACT(MONTH FROM ma.mortality_date) = $1`,
-      currentMonth
-    );
-
-    // Calcular risco baseado em múltiplos fatores
-    const vendorRisk = vendorHistory[0]?.avg_mortality_rate || 1.5;
-    const seasonalRisk = seasonalHistory[0]?.avg_mortality_rate || 1.5;
-    
-    // Fatores de risco adicionais
-    let riskScore = (vendorRisk + seasonalRisk) / 2;
-    
-    // Ajustar baseado na distância de transporte
-    if (purchase.freightDistance && purchase.freightDistance > 500) {
-      riskScore *= 1.2; // 20% maior risco para longas distâncias
-    }
-
-    // Classificar risco
-    let riskLevel: 'low' | 'medium' | 'high';
-    if (riskScore < 1) riskLevel = 'low';
-    else if (riskScore < 2) riskLevel = 'medium';
-    else riskLevel = 'high';
+    const score = await riskModelService.scoreMortality(purchase);
 
     return {
-      riskScore,
-      riskLevel,
-      expectedMortalityRate: riskScore,
-      factors: {
-        vendorHistoricalRate: vendorRisk,
-        seasonalAverageRate: seasonalRisk,
-        transportDistance: purchase.freightDistance
-      },
-      recommendations: this.getMortalityPreventionRecommendations(riskLevel)
+      ...score,
+      recommendations: this.getMortalityPreventionRecommendations(score.riskLevel)
     };
   }
 
@@ -1,8 +1,6 @@
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 import { logger } from '@/config/logger';
 
-const prisma = new PrismaClient();
-
 export interface MortalityCalculationResult {
   totalLoss: number;
   averageCostPerHead: number;
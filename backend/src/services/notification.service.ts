@@ -1,5 +1,6 @@
+import { NotificationType, Prisma } from '@prisma/client';
 import { prisma } from '@/config/database';
-import websocketService from './websocket.service';
+import { notificationQueue, NotificationRecipients } from '@/services/notificationQueue.service';
 
 export interface NotificationConfig {
   title: string;
@@ -29,82 +30,36 @@ export interface NotificationPreferences {
   };
 }
 
+// Tipo gravado em `notifications`; avisos e erros viram ALERT
+const NOTIFICATION_TYPES: Record<NotificationConfig['type'], NotificationType> = {
+  info: NotificationType.INFO,
+  success: NotificationType.INFO,
+  warning: NotificationType.ALERT,
+  error: NotificationType.ALERT,
+};
+
 class NotificationService {
-  private notificationQueue: Map<string, NotificationConfig[]> = new Map();
   private userPreferences: Map<string, NotificationPreferences> = new Map();
 
   /**
    * Enviar notificação para usuário
    */
-  async sendToUser(userId: string, notification: NotificationConfig) {
-    try {
-      // Salvar no banco de dados
-      const saved = await prisma.notification.create({
-        data: {
-          userId,
-          title: notification.title,
-          message: notification.message,
-          type: notification.type,
-          priority: notification.priority as any,
-          data: JSON.stringify({
-            actions: notification.actions,
-            persistent: notification.persistent,
-            sound: notification.sound,
-            vibrate: notification.vibrate
-          }),
-          read: false,
-          createdAt: new Date()
-        }
-      });
-
-      // Verificar se usuário está online
-      if (websocketService.isUserOnline(userId)) {
-        // Enviar via WebSocket (tempo real)
-        websocketService.notifyUser(userId, 'notification', {
-          id: saved.id,
-          ...notification
-        });
-      } else {
-        // Adicionar à fila para quando o usuário se conectar
-        this.addToQueue(userId, notification);
-      }
-
-      // Se for crítica, também enviar por outros canais
-      if (notification.priority === 'critical') {
-        await this.sendCriticalNotification(userId, notification);
-      }
-
-      return saved;
-    } catch (error) {
-      console.error('Erro ao enviar notificação:', error);
-      throw error;
-    }
+  async sendToUser(userId: string, notification: NotificationConfig, channel = `user:${userId}`) {
+    return this.dispatch(channel, [userId], notification);
   }
 
   /**
-   * Enviar notificação para múltiplos usuários
+   * Enviar notificação para múltiplos usuários (uma gravação e um emit por sala)
    */
-  async sendToMultiple(userIds: string[], notification: NotificationConfig) {
-    const results = await Promise.allSettled(
-      userIds.map(userId => this.sendToUser(userId, notification))
-    );
-
-    return results;
+  async sendToMultiple(userIds: string[], notification: NotificationConfig, channel = 'direct') {
+    return this.dispatch(channel, userIds, notification);
   }
 
   /**
-   * Broadcast para todos os usuários
+   * Broadcast para todos os usuários ativos
    */
-  async broadcast(notification: NotificationConfig) {
-    const users = await prisma.user.findMany({
-      where: { isActive: true },
-      select: { id: true }
-    });
-
-    return this.sendToMultiple(
-      users.map(u => u.id),
-      notification
-    );
+  async broadcast(notification: NotificationConfig, channel = 'broadcast') {
+    return this.dispatch(channel, 'all', notification);
   }
 
   /**
@@ -175,28 +130,20 @@ class NotificationService {
     };
 
     const notificationConfig = notifications[event];
-    if (!notificationConfig) return;
+    if (!notificationConfig) return false;
 
     // Determinar destinatários baseado no tipo de evento
-    let recipients: string[] = [];
+    let recipients: NotificationRecipients;
 
     if (event.includes(':critical') || event === 'system:maintenance') {
-      // Notificar todos os admins
-      const admins = await prisma.user.findMany({
-        where: { role: 'ADMIN', isActive: true },
-        select: { id: true }
-      });
-      recipients = admins.map(a => a.id);
+      recipients = 'admins';
     } else if (data.userId) {
-      // Notificar usuário específico
       recipients = [data.userId];
     } else {
-      // Notificar todos os usuários ativos
-      await this.broadcast(notificationConfig());
-      return;
+      recipients = 'all';
     }
 
-    await this.sendToMultiple(recipients, notificationConfig());
+    return this.dispatch(event, recipients, notificationConfig());
   }
 
   /**
@@ -209,7 +156,7 @@ class NotificationService {
         userId
       },
       data: {
-        read: true,
+        isRead: true,
         readAt: new Date()
       }
     });
@@ -222,10 +169,10 @@ class NotificationService {
     return prisma.notification.updateMany({
       where: {
         userId,
-        read: false
+        isRead: false
       },
       data: {
-        read: true,
+        isRead: true,
         readAt: new Date()
       }
     });
@@ -240,11 +187,11 @@ class NotificationService {
     priority?: string;
     limit?: number;
   }) {
-    const where: any = { userId };
+    const where: Prisma.NotificationWhereInput = { userId };
 
-    if (filters?.read !== undefined) where.read = filters.read;
-    if (filters?.type) where.type = filters.type;
-    if (filters?.priority) where.priority = filters.priority;
+    if (filters?.read !== undefined) where.isRead = filters.read;
+    if (filters?.type) where.type = filters.type as NotificationType;
+    if (filters?.priority) where.data = { path: ['priority'], equals: filters.priority };
 
     return prisma.notification.findMany({
       where,
@@ -263,7 +210,7 @@ class NotificationService {
     return prisma.notification.deleteMany({
       where: {
         createdAt: { lt: cutoffDate },
-        read: true
+        isRead: true
       }
     });
   }
@@ -283,39 +230,47 @@ class NotificationService {
   }
 
   /**
-   * Adicionar à fila de notificações offline
+   * Enfileira o envio; a fila grava as linhas em lote e emite nas salas do Socket.IO.
+   * Retorna false com a fila encerrada (encerramento do servidor) ou cheia.
    */
-  private addToQueue(userId: string, notification: NotificationConfig) {
-    const queue = this.notificationQueue.get(userId) || [];
-    queue.push(notification);
-    this.notificationQueue.set(userId, queue);
-  }
-
-  /**
-   * Processar fila quando usuário se conectar
-   */
-  async processQueueForUser(userId: string) {
-    const queue = this.notificationQueue.get(userId);
-    if (!queue || queue.length === 0) return;
+  private async dispatch(channel: string, recipients: NotificationRecipients, notification: NotificationConfig) {
+    const enqueued = notificationQueue.enqueue({
+      channel,
+      recipients,
+      notification: {
+        title: notification.title,
+        message: notification.message,
+        type: NOTIFICATION_TYPES[notification.type] || NotificationType.INFO,
+        data: {
+          kind: notification.type,
+          priority: notification.priority,
+          actions: notification.actions,
+          persistent: notification.persistent,
+          sound: notification.sound,
+          vibrate: notification.vibrate
+        } as Prisma.InputJsonObject
+      }
+    });
 
-    for (const notification of queue) {
-      await this.sendToUser(userId, notification);
+    // Se for crítica, também enviar por outros canais
+    if (enqueued && notification.priority === 'critical') {
+      await this.sendCriticalNotification(recipients, notification);
     }
 
-    this.notificationQueue.delete(userId);
+    return enqueued;
   }
 
   /**
    * Enviar notificação crítica por múltiplos canais
    */
-  private async sendCriticalNotification(userId: string, notification: NotificationConfig) {
+  private async sendCriticalNotification(recipients: NotificationRecipients, notification: NotificationConfig) {
     // Aqui você pode implementar:
     // - Envio de email
     // - SMS (Twilio)
     // - Push notification (Firebase)
     // - WhatsApp Business API
 
-    console.log(`[CRITICAL] Notificação crítica para usuário ${userId}:`, notification);
+    console.log(`[CRITICAL] Notificação crítica para ${Array.isArray(recipients) ? recipients.join(', ') : recipients}:`, notification);
 
     // Exemplo de integração com email (precisa configurar SMTP)
     // await emailService.send({
@@ -333,17 +288,19 @@ class NotificationService {
 
     const [total, unread, byType, byPriority] = await Promise.all([
       prisma.notification.count({ where }),
-      prisma.notification.count({ where: { ...where, read: false } }),
+      prisma.notification.count({ where: { ...where, isRead: false } }),
       prisma.notification.groupBy({
         by: ['type'],
         where,
         _count: true
       }),
-      prisma.notification.groupBy({
-        by: ['priority'],
-        where,
-        _count: true
-      })
+      // A prioridade fica no JSON de dados
+      prisma.$queryRaw<Array<{ priority: string | null; count: number }>>`
+        SELECT "data"->>'priority' AS "priority", COUNT(*)::int AS "count"
+        FROM "notifications"
+        WHERE ${userId ?? null}::text IS NULL OR "userId" = ${userId ?? null}
+        GROUP BY 1
+      `
     ]);
 
     return {
@@ -0,0 +1,375 @@
+import { randomUUID } from 'crypto';
+import { NotificationType, Prisma } from '@prisma/client';
+import { prisma, db } from '@/config/database';
+import { logger } from '@/config/logger';
+import { getSocketServer } from '@/config/socket';
+
+/**
+ * Fila de distribuição (fan-out) de notificações.
+ *
+ * Cada envio entra na fila como um único item com seus destinatários ('all', 'admins' ou
+ * uma lista de IDs). No flush, os itens acumulados viram as linhas de `notifications`
+ * gravadas com `createMany` em lotes, e cada item é emitido uma vez por sala do Socket.IO
+ * (`users`, `admins` ou `user:<id>`), em vez de um INSERT e um emit por usuário.
+ * Todo envio aceito é gravado. O limite por canal vale só para a emissão em tempo real:
+ * acima dele, os envios da janela são agrupados em um único evento por sala a cada flush.
+ * Se a gravação falhar, o lote volta à fila com espera exponencial entre as tentativas; o envio
+ * que esgota MAX_ATTEMPTS sai da fila e fica registrado no log, e com a fila cheia novos envios
+ * são recusados.
+ */
+
+export type NotificationRecipients = string[] | 'all' | 'admins';
+
+export interface QueuedNotification {
+  title: string;
+  message: string;
+  type: NotificationType;
+  data?: Prisma.InputJsonObject;
+}
+
+export interface FanOutRequest {
+  channel: string;
+  recipients: NotificationRecipients;
+  notification: QueuedNotification;
+}
+
+interface FanOutJob extends FanOutRequest {
+  batchId: string;
+  enqueuedAt: number;
+  attempts: number;
+  // Acima do limite do canal: gravado normalmente, emitido em um evento agrupado
+  coalesced: boolean;
+}
+
+// Profundidade máxima da fila: acima dela novos envios são recusados e registrados no log
+const QUEUE_CAPACITY = 1000;
+// Tentativas de gravação por envio antes de descartá-lo (registrado no log)
+const MAX_ATTEMPTS = 5;
+// Teto da espera entre flushes após falhas consecutivas (FLUSH_DEBOUNCE_MS dobrando a cada falha)
+const RETRY_MAX_DELAY_MS = 60 * 1000;
+// Agrupa envios próximos em um único flush...
+const FLUSH_DEBOUNCE_MS = 250;
+// ...ou grava assim que a fila atingir esse tamanho
+const FLUSH_SIZE = 50;
+// Linhas por createMany
+const INSERT_BATCH_SIZE = 1000;
+// Emissões individuais por canal dentro da janela
+const CHANNEL_RATE_LIMIT = 30;
+const CHANNEL_RATE_WINDOW_MS = 60 * 1000;
+// Validade da lista de usuários ativos/admins usada nos envios para 'all' e 'admins'
+const RECIPIENTS_CACHE_TTL_MS = 60 * 1000;
+// Amostras de latência (enfileiramento até a emissão) mantidas para os percentis
+const LATENCY_SAMPLES = 500;
+
+const ROOM_BY_RECIPIENTS = { all: 'users', admins: 'admins' } as const;
+
+export class NotificationFanOutQueue {
+  private queue: FanOutJob[] = [];
+  private timer: NodeJS.Timeout | null = null;
+  private flushing: Promise<void> | null = null;
+  private stopped = false;
+  private consecutiveFailures = 0;
+
+  private channelWindows = new Map<string, number[]>();
+  private recipientsCache = new Map<'all' | 'admins', { ids: string[]; expiresAt: number }>();
+  private latencies: number[] = [];
+  private latencyIndex = 0;
+
+  private stats = {
+    enqueued: 0,
+    persisted: 0,
+    emitted: 0,
+    coalesced: 0,
+    requeued: 0,
+    dropped: 0,
+    rejected: 0,
+    deadLettered: 0,
+    failedBatches: 0,
+    flushes: 0,
+    lastFlushAt: null as Date | null,
+    lastError: null as string | null,
+  };
+  private channelStats = new Map<string, { enqueued: number; coalesced: number }>();
+
+  /**
+   * Enfileira um envio. Retorna false com a fila encerrada ou cheia.
+   */
+  enqueue(request: FanOutRequest): boolean {
+    const channelStats = this.channelStats.get(request.channel) || { enqueued: 0, coalesced: 0 };
+    this.channelStats.set(request.channel, channelStats);
+
+    if (this.stopped) {
+      this.stats.dropped++;
+      logger.warn(`[Notifications] Envio do canal ${request.channel} recusado: fila encerrada`, {
+        title: request.notification.title,
+      });
+      return false;
+    }
+
+    if (Array.isArray(request.recipients) && request.recipients.length === 0) {
+      return true;
+    }
+
+    if (this.queue.length >= QUEUE_CAPACITY) {
+      this.stats.rejected++;
+      logger.error(`[Notifications] Envio do canal ${request.channel} recusado: fila com ${this.queue.length} envios pendentes`, {
+        title: request.notification.title,
+        lastError: this.stats.lastError,
+      });
+      return false;
+    }
+
+    const coalesced = !this.acquire(request.channel);
+    if (coalesced) {
+      channelStats.coalesced++;
+      this.stats.coalesced++;
+    }
+
+    this.queue.push({ ...request, batchId: randomUUID(), enqueuedAt: Date.now(), attempts: 0, coalesced });
+    channelStats.enqueued++;
+    this.stats.enqueued++;
+
+    // Após uma falha, o flush espera o backoff mesmo com a fila grande
+    if (this.queue.length >= FLUSH_SIZE && this.consecutiveFailures === 0) {
+      this.flush();
+    } else {
+      this.scheduleFlush();
+    }
+    return true;
+  }
+
+  /**
+   * Grava e emite o que estiver na fila. Só um flush roda por vez; chamadas concorrentes aguardam o atual.
+   */
+  flush(): Promise<void> {
+    if (this.flushing) return this.flushing;
+    if (this.queue.length === 0) return Promise.resolve();
+
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+
+    this.flushing = this.processQueue().finally(() => {
+      this.flushing = null;
+      if (this.queue.length > 0 && !this.stopped) this.scheduleFlush(this.retryDelay());
+    });
+    return this.flushing;
+  }
+
+  /**
+   * Para de aceitar envios e grava o que restou (encerramento do servidor)
+   */
+  async stop(): Promise<void> {
+    this.stopped = true;
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+
+    while (this.queue.length > 0 || this.flushing) {
+      await this.flush();
+    }
+  }
+
+  getMetrics() {
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const percentile = (p: number) =>
+      sorted.length ? sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)] : null;
+
+    return {
+      ...this.stats,
+      depth: this.queue.length,
+      capacity: QUEUE_CAPACITY,
+      consecutiveFailures: this.consecutiveFailures,
+      nextRetryMs: this.consecutiveFailures > 0 ? this.retryDelay() : 0,
+      oldestAgeMs: this.queue.length ? Date.now() - this.queue[0].enqueuedAt : 0,
+      latencyMs: {
+        p50: percentile(50),
+        p95: percentile(95),
+        max: sorted.length ? sorted[sorted.length - 1] : null,
+        samples: sorted.length,
+      },
+      channels: Object.fromEntries(this.channelStats),
+    };
+  }
+
+  private scheduleFlush(delayMs: number = FLUSH_DEBOUNCE_MS): void {
+    if (this.timer) return;
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.flush();
+    }, delayMs);
+    this.timer.unref?.();
+  }
+
+  private retryDelay(): number {
+    if (this.consecutiveFailures === 0) return FLUSH_DEBOUNCE_MS;
+    return Math.min(FLUSH_DEBOUNCE_MS * 2 ** this.consecutiveFailures, RETRY_MAX_DELAY_MS);
+  }
+
+  /**
+   * Janela deslizante por canal: até CHANNEL_RATE_LIMIT envios a cada CHANNEL_RATE_WINDOW_MS
+   */
+  private acquire(channel: string): boolean {
+    const now = Date.now();
+    const window = (this.channelWindows.get(channel) || []).filter(at => now - at < CHANNEL_RATE_WINDOW_MS);
+
+    if (window.length >= CHANNEL_RATE_LIMIT) {
+      this.channelWindows.set(channel, window);
+      return false;
+    }
+
+    window.push(now);
+    this.channelWindows.set(channel, window);
+    return true;
+  }
+
+  private async processQueue(): Promise<void> {
+    const jobs = this.queue.splice(0, this.queue.length);
+
+    try {
+      const rows: Prisma.NotificationCreateManyInput[] = [];
+      for (const job of jobs) {
+        const userIds = await this.resolveRecipients(job.recipients);
+        const createdAt = new Date(job.enqueuedAt);
+        userIds.forEach(userId => rows.push({
+          userId,
+          title: job.notification.title,
+          message: job.notification.message,
+          type: job.notification.type,
+          data: { ...job.notification.data, batchId: job.batchId, channel: job.channel },
+          createdAt,
+        }));
+      }
+
+      // Lotes na mesma transação: numa falha nada fica gravado e os itens podem voltar à fila sem duplicar
+      const persisted = await prisma.$transaction(async (tx) => {
+        let total = 0;
+        for (let i = 0; i < rows.length; i += INSERT_BATCH_SIZE) {
+          const { count } = await tx.notification.createMany({ data: rows.slice(i, i + INSERT_BATCH_SIZE) });
+          total += count;
+        }
+        return total;
+      });
+      this.stats.persisted += persisted;
+      this.stats.flushes++;
+      this.consecutiveFailures = 0;
+      this.stats.lastFlushAt = new Date();
+    } catch (error: any) {
+      this.stats.failedBatches++;
+      this.stats.lastError = error.message;
+      this.consecutiveFailures++;
+      logger.error('[Notifications] Erro ao gravar lote de notificações:', error);
+      // Sem gravação não há o que emitir: o cliente buscaria notificações inexistentes.
+      // Os itens voltam para o início da fila e entram no próximo flush, após o backoff; os que esgotaram
+      // as tentativas e, no encerramento, todos os restantes ficam registrados no log
+      if (this.stopped) {
+        this.stats.dropped += jobs.length;
+        logger.error(`[Notifications] ${jobs.length} envios não gravados no encerramento`, {
+          batches: jobs.map(job => ({ batchId: job.batchId, channel: job.channel, title: job.notification.title })),
+        });
+        return;
+      }
+
+      jobs.forEach(job => job.attempts++);
+      const exhausted = jobs.filter(job => job.attempts >= MAX_ATTEMPTS);
+      const retry = jobs.filter(job => job.attempts < MAX_ATTEMPTS);
+      if (exhausted.length > 0) {
+        this.stats.deadLettered += exhausted.length;
+        logger.error(`[Notifications] ${exhausted.length} envios descartados após ${MAX_ATTEMPTS} tentativas de gravação`, {
+          batches: exhausted.map(job => ({
+            batchId: job.batchId,
+            channel: job.channel,
+            recipients: job.recipients,
+            notification: job.notification,
+          })),
+        });
+      }
+      this.queue.unshift(...retry);
+      this.stats.requeued += retry.length;
+      return;
+    }
+
+    const io = getSocketServer();
+    const now = Date.now();
+    const digests = new Map<string, { channel: string; rooms: string | string[]; jobs: FanOutJob[] }>();
+    for (const job of jobs) {
+      const rooms = Array.isArray(job.recipients)
+        ? job.recipients.map(userId => `user:${userId}`)
+        : ROOM_BY_RECIPIENTS[job.recipients];
+
+      if (job.coalesced) {
+        const key = `${job.channel}|${Array.isArray(rooms) ? rooms.join(',') : rooms}`;
+        const digest = digests.get(key) || { channel: job.channel, rooms, jobs: [] };
+        digest.jobs.push(job);
+        digests.set(key, digest);
+        continue;
+      }
+
+      if (io) {
+        io.to(rooms).emit('notification', {
+          batchId: job.batchId,
+          channel: job.channel,
+          title: job.notification.title,
+          message: job.notification.message,
+          type: job.notification.type,
+          data: job.notification.data,
+          createdAt: new Date(job.enqueuedAt),
+        });
+        this.stats.emitted++;
+      }
+      this.recordLatency(now - job.enqueuedAt);
+    }
+
+    // Envios acima do limite: um evento por canal e sala, apontando para as notificações já gravadas
+    for (const { channel, rooms, jobs: grouped } of digests.values()) {
+      const latest = grouped[grouped.length - 1];
+      if (io) {
+        io.to(rooms).emit('notification', {
+          batchId: latest.batchId,
+          channel,
+          title: `${grouped.length} novas notificações`,
+          message: latest.notification.title,
+          type: latest.notification.type,
+          data: { coalesced: true, count: grouped.length, batchIds: grouped.map(job => job.batchId) },
+          createdAt: new Date(latest.enqueuedAt),
+        });
+        this.stats.emitted++;
+      }
+      grouped.forEach(job => this.recordLatency(now - job.enqueuedAt));
+    }
+  }
+
+  private async resolveRecipients(recipients: NotificationRecipients): Promise<string[]> {
+    if (Array.isArray(recipients)) return [...new Set(recipients)];
+
+    const cached = this.recipientsCache.get(recipients);
+    if (cached && cached.expiresAt > Date.now()) return cached.ids;
+
+    const users = await prisma.user.findMany({
+      where: recipients === 'admins'
+        ? { isActive: true, role: 'ADMIN' }
+        : { isActive: true },
+      select: { id: true },
+    });
+
+    const ids = users.map(user => user.id);
+    this.recipientsCache.set(recipients, { ids, expiresAt: Date.now() + RECIPIENTS_CACHE_TTL_MS });
+    return ids;
+  }
+
+  private recordLatency(ms: number): void {
+    if (this.latencies.length < LATENCY_SAMPLES) {
+      this.latencies.push(ms);
+    } else {
+      this.latencies[this.latencyIndex] = ms;
+      this.latencyIndex = (this.latencyIndex + 1) % LATENCY_SAMPLES;
+    }
+  }
+}
+
+export const notificationQueue = new NotificationFanOutQueue();
+
+// Grava a fila antes de o banco ser desconectado no encerramento
+db.onBeforeDisconnect(() => notificationQueue.stop());
@@ -0,0 +1,308 @@
+import Joi from 'joi';
+import { prisma } from '@/config/database';
+import { hasConcurrentUpdate } from '@/middlewares/concurrency';
+import { cache } from '@/utils/cache';
+import { cattlePurchaseService } from '@/services/cattlePurchase.service';
+import { SaleRecordService } from '@/services/saleRecord.service';
+import { ExpenseService } from '@/services/expense.service';
+import { RevenueService } from '@/services/revenue.service';
+import { deathRecordService } from '@/services/deathRecord.service';
+import { PartnerService } from '@/services/partner.service';
+import { PenService } from '@/services/pen.service';
+import { PayerAccountService } from '@/services/payerAccount.service';
+import { costCenterService } from '@/services/costCenter.service';
+import calendarEventService from '@/services/calendarEvent.service';
+import { cattlePurchaseValidation } from '@/validations/cattlePurchase.validation';
+import { expenseValidation } from '@/validations/expense.validation';
+import { revenueValidation } from '@/validations/revenue.validation';
+import { partnerValidation } from '@/validations/partner.validation';
+import { penValidation } from '@/validations/pen.validation';
+import { deathRecordValidation } from '@/validations/deathRecord.validation';
+import { payerAccountValidation } from '@/validations/payerAccount.validation';
+import { calendarEventValidation } from '@/validations/calendarEvent.validation';
+
+export type OfflineOperationType = 'create' | 'update' | 'delete';
+
+export interface OfflineOperation {
+  clientId: string;
+  type: OfflineOperationType;
+  entity: string;
+  id?: string;
+  data?: Record<string, any>;
+  lastUpdatedAt?: Date | string;
+  force?: boolean;
+}
+
+export type OfflineOperationStatus = 'applied' | 'conflict' | 'failed' | 'skipped';
+
+export interface OfflineOperationResult {
+  clientId: string;
+  status: OfflineOperationStatus;
+  entityId?: string;
+  serverUpdatedAt?: Date | null;
+  serverData?: any;
+  error?: string;
+}
+
+interface SyncUser {
+  id: string;
+  role: string;
+}
+
+interface EntityHandler {
+  // Delegate do Prisma usado para ler o `updatedAt` atual dos registros
+  model: string;
+  create: (data: any, user: SyncUser) => Promise<any>;
+  update: (id: string, data: any, user: SyncUser) => Promise<any>;
+  delete: (id: string, user: SyncUser) => Promise<any>;
+  schemas?: { create?: Joi.Schema; update?: Joi.Schema };
+  // Mesmas restrições de perfil das rotas REST da entidade
+  roles?: Partial<Record<OfflineOperationType, string[]>>;
+}
+
+// Resultados já aplicados ficam guardados para que um reenvio não duplique a gravação
+const RESULT_TTL_SECONDS = 24 * 60 * 60;
+
+const VALIDATION_OPTIONS: Joi.ValidationOptions = {
+  abortEarly: false,
+  stripUnknown: true,
+  errors: { wrap: { label: '' } }
+};
+
+const saleRecordService = new SaleRecordService();
+const expenseService = new ExpenseService();
+const revenueService = new RevenueService();
+const partnerService = new PartnerService();
+const penService = new PenService();
+const payerAccountService = new PayerAccountService();
+
+const saleRecordHandler: EntityHandler = {
+  model: 'saleRecord',
+  create: (data) => saleRecordService.create(data),
+  update: (id, data) => saleRecordService.update(id, data),
+  delete: (id) => saleRecordService.delete(id),
+  roles: { update: ['ADMIN', 'MANAGER'], delete: ['ADMIN'] }
+};
+
+const HANDLERS: Record<string, EntityHandler> = {
+  'cattle-purchases': {
+    model: 'cattlePurchase',
+    create: (data, user) => cattlePurchaseService.create({ ...data, userId: user.id }),
+    update: (id, data) => cattlePurchaseService.update(id, data),
+    delete: (id) => cattlePurchaseService.delete(id),
+    schemas: { create: cattlePurchaseValidation.create, update: cattlePurchaseValidation.update }
+  },
+  'sale-records': saleRecordHandler,
+  sales: saleRecordHandler,
+  expenses: {
+    model: 'expense',
+    create: (data, user) => expenseService.create(data, user.id),
+    update: (id, data) => expenseService.update(id, data),
+    delete: (id) => expenseService.delete(id),
+    schemas: { create: expenseValidation.create, update: expenseValidation.update }
+  },
+  revenues: {
+    model: 'revenue',
+    create: (data, user) => revenueService.create(data, user.id),
+    update: (id, data) => revenueService.update(id, data),
+    delete: (id) => revenueService.delete(id),
+    schemas: { create: revenueValidation.create, update: revenueValidation.update }
+  },
+  'death-records': {
+    model: 'deathRecord',
+    create: (data, user) => deathRecordService.create({
+      ...data,
+      deathDate: data.deathDate ? new Date(data.deathDate) : new Date(),
+      userId: user.id
+    }),
+    update: (id, data) => deathRecordService.update(id, data),
+    delete: (id) => deathRecordService.delete(id),
+    schemas: { create: deathRecordValidation.create, update: deathRecordValidation.update }
+  },
+  partners: {
+    model: 'partner',
+    create: (data) => partnerService.create(data),
+    update: (id, data) => partnerService.update(id, data),
+    delete: (id) => partnerService.delete(id),
+    schemas: { create: partnerValidation.create, update: partnerValidation.update },
+    roles: { create: ['ADMIN', 'MANAGER'], update: ['ADMIN', 'MANAGER'], delete: ['ADMIN'] }
+  },
+  pens: {
+    model: 'pen',
+    create: (data) => penService.create(data),
+    update: (id, data) => penService.update(id, data),
+    delete: (id) => penService.delete(id),
+    schemas: { create: penValidation.create, update: penValidation.update },
+    roles: { create: ['ADMIN', 'MANAGER'], update: ['ADMIN', 'MANAGER'], delete: ['ADMIN'] }
+  },
+  'payer-accounts': {
+    model: 'payerAccount',
+    create: (data) => payerAccountService.create(data),
+    update: (id, data) => payerAccountService.update(id, data),
+    delete: (id) => payerAccountService.delete(id),
+    schemas: { create: payerAccountValidation.create, update: payerAccountValidation.update },
+    roles: { create: ['ADMIN'], update: ['ADMIN'], delete: ['ADMIN'] }
+  },
+  'cost-centers': {
+    model: 'costCenter',
+    create: (data) => costCenterService.create(data),
+    update: (id, data) => costCenterService.update(id, data),
+    delete: (id) => costCenterService.delete(id),
+    roles: { create: ['ADMIN', 'MANAGER'], update: ['ADMIN', 'MANAGER'], delete: ['ADMIN'] }
+  },
+  'calendar-events': {
+    model: 'calendarEvent',
+    create: (data, user) => calendarEventService.createEvent({
+      ...data,
+      date: new Date(data.date),
+      userId: user.id
+    }),
+    update: (id, data) => calendarEventService.updateEvent(id, {
+      ...data,
+      ...(data.date ? { date: new Date(data.date) } : {})
+    }),
+    delete: (id) => calendarEventService.deleteEvent(id),
+    schemas: { create: calendarEventValidation.createEvent, update: calendarEventValidation.updateEvent }
+  }
+};
+
+export const OFFLINE_SYNC_ENTITIES = Object.keys(HANDLERS);
+
+const resultCacheKey = (userId: string, clientId: string) => `offline-op:${userId}:${clientId}`;
+
+/**
+ * Aplica em lote as operações gravadas offline pelo frontend.
+ *
+ * O `updatedAt` atual dos registros é lido com uma consulta por entidade; cada operação
+ * passa pelo mesmo serviço da rota REST correspondente. Atualizações e exclusões de
+ * registros alterados no servidor depois do `lastUpdatedAt` do cliente viram conflito
+ * (o servidor prevalece), a menos que o cliente envie `force`.
+ */
+export class OfflineSyncService {
+  async applyOperations(operations: OfflineOperation[], user: SyncUser): Promise<OfflineOperationResult[]> {
+    const current = await this.loadCurrentVersions(operations);
+    const results: OfflineOperationResult[] = [];
+
+    for (const operation of operations) {
+      const previous = cache.get(resultCacheKey(user.id, operation.clientId)) as OfflineOperationResult | null;
+      if (previous) {
+        results.push(previous);
+        continue;
+      }
+
+      const result = await this.applyOperation(operation, user, current);
+      if (result.status === 'applied') {
+        cache.set(resultCacheKey(user.id, operation.clientId), result, RESULT_TTL_SECONDS);
+      }
+      results.push(result);
+    }
+
+    return results;
+  }
+
+  /**
+   * `updatedAt` atual dos registros afetados, agrupados por entidade
+   */
+  private async loadCurrentVersions(operations: OfflineOperation[]): Promise<Map<string, Map<string, Date>>> {
+    const idsByModel = new Map<string, Set<string>>();
+
+    for (const operation of operations) {
+      const handler = HANDLERS[operation.entity];
+      if (!handler || operation.type === 'create' || !operation.id) continue;
+
+      const ids = idsByModel.get(handler.model) || new Set<string>();
+      ids.add(operation.id);
+      idsByModel.set(handler.model, ids);
+    }
+
+    const versions = new Map<string, Map<string, Date>>();
+
+    await Promise.all([...idsByModel.entries()].map(async ([model, ids]) => {
+      const rows: Array<{ id: string; updatedAt: Date }> = await (prisma as any)[model].findMany({
+        where: { id: { in: [...ids] } },
+        select: { id: true, updatedAt: true }
+      });
+      versions.set(model, new Map(rows.map(row => [row.id, row.updatedAt])));
+    }));
+
+    return versions;
+  }
+
+  private async applyOperation(
+    operation: OfflineOperation,
+    user: SyncUser,
+    current: Map<string, Map<string, Date>>
+  ): Promise<OfflineOperationResult> {
+    const { clientId, type, entity, id } = operation;
+    const handler = HANDLERS[entity];
+
+    if (!handler) {
+      return { clientId, status: 'skipped', error: `Entidade não suportada: ${entity}` };
+    }
+
+    const allowedRoles = handler.roles?.[type];
+    if (allowedRoles && !allowedRoles.includes(user.role)) {
+      return { clientId, status: 'failed', entityId: id, error: 'Permissão insuficiente' };
+    }
+
+    let data = operation.data || {};
+    const schema = type === 'delete' ? undefined : handler.schemas?.[type];
+    if (schema) {
+      const { error, value } = schema.validate(data, VALIDATION_OPTIONS);
+      if (error) {
+        return {
+          clientId,
+          status: 'failed',
+          entityId: id,
+          error: error.details.map(detail => `${detail.path.join('.')}: ${detail.message}`).join(', ')
+        };
+      }
+      data = value;
+    }
+
+    try {
+      if (type === 'create') {
+        const created = await handler.create(data, user);
+        return { clientId, status: 'applied', entityId: created?.id, serverUpdatedAt: created?.updatedAt ?? null };
+      }
+
+      if (!id) {
+        return { clientId, status: 'failed', error: 'ID do registro é obrigatório' };
+      }
+
+      const serverUpdatedAt = current.get(handler.model)?.get(id);
+
+      if (!serverUpdatedAt) {
+        // Excluir algo que já não existe tem o mesmo efeito final
+        return type === 'delete'
+          ? { clientId, status: 'applied', entityId: id, serverUpdatedAt: null }
+          : { clientId, status: 'failed', entityId: id, error: 'Registro não encontrado' };
+      }
+
+      if (!operation.force && hasConcurrentUpdate(serverUpdatedAt, operation.lastUpdatedAt)) {
+        const serverData = await (prisma as any)[handler.model].findUnique({ where: { id } });
+        return {
+          clientId,
+          status: 'conflict',
+          entityId: id,
+          serverUpdatedAt,
+          serverData,
+          error: 'Registro alterado por outro usuário após a edição offline'
+        };
+      }
+
+      if (type === 'delete') {
+        await handler.delete(id, user);
+        current.get(handler.model)?.delete(id);
+        return { clientId, status: 'applied', entityId: id, serverUpdatedAt: null };
+      }
+
+      const updated = await handler.update(id, data, user);
+      return { clientId, status: 'applied', entityId: id, serverUpdatedAt: updated?.updatedAt ?? null };
+    } catch (error: any) {
+      return { clientId, status: 'failed', entityId: id, error: error.message };
+    }
+  }
+}
+
+export const offlineSyncService = new OfflineSyncService();
@@ -2,6 +2,8 @@ import { AccountType } from '@prisma/client';
 import { PayerAccountRepository } from '@/repositories/payerAccount.repository';
 import { NotFoundError, ValidationError } from '@/utils/AppError';
 import { PaginationParams } from '@/repositories/base.repository';
+import { prisma } from '@/config/database';
+import { accountLedgerService } from '@/services/accountLedger.service';
 
 interface CreateAccountData {
   bankName: string;
@@ -66,9 +68,27 @@ export class PayerAccountService {
   }
 
   async create(data: CreateAccountData) {
-    return this.accountRepository.create({
-      ...data,
-      balance: data.balance || 0,
+    const { balance, ...accountData } = data;
+
+    // O saldo inicial entra como lançamento de abertura do extrato
+    return prisma.$transaction(async (tx) => {
+      const account = await tx.payerAccount.create({
+        data: { ...accountData, balance: 0 },
+      });
+
+      if (!balance) {
+        return account;
+      }
+
+      await accountLedgerService.post({
+        accountId: account.id,
+        amount: balance,
+        entryDate: account.createdAt,
+        sourceType: 'OPENING',
+        description: 'Saldo de abertura',
+      }, tx);
+
+      return tx.payerAccount.findUniqueOrThrow({ where: { id: account.id } });
     });
   }
 
@@ -76,7 +96,32 @@ export class PayerAccountService {
     // Verifica se a conta existe
     await this.findById(id);
 
-    return this.accountRepository.update(id, data);
+    const { balance, ...accountData } = data;
+    if (balance === undefined) {
+      return this.accountRepository.update(id, accountData);
+    }
+
+    // Um novo saldo informado na edição vira lançamento de ajuste, para o extrato continuar batendo com a conta
+    return prisma.$transaction(async (tx) => {
+      const [current] = await tx.$queryRaw<Array<{ balance: number }>>`
+        SELECT "balance" FROM "payer_accounts" WHERE "id" = ${id} FOR UPDATE
+      `;
+
+      await tx.payerAccount.update({ where: { id }, data: accountData });
+
+      const difference = Math.round((balance - current.balance) * 100) / 100;
+      if (difference !== 0) {
+        await accountLedgerService.post({
+          accountId: id,
+          amount: difference,
+          entryDate: new Date(),
+          sourceType: 'ADJUSTMENT',
+          description: difference > 0 ? 'Ajuste de saldo (crédito)' : 'Ajuste de saldo (débito)',
+        }, tx);
+      }
+
+      return tx.payerAccount.findUniqueOrThrow({ where: { id } });
+    });
   }
 
   async updateBalance(id: string, amount: number, operation: 'add' | 'subtract') {
@@ -90,7 +135,15 @@ export class PayerAccountService {
       throw new ValidationError('Saldo insuficiente');
     }
 
-    return this.accountRepository.updateBalance(id, finalAmount);
+    await accountLedgerService.post({
+      accountId: id,
+      amount: finalAmount,
+      entryDate: new Date(),
+      sourceType: 'ADJUSTMENT',
+      description: operation === 'add' ? 'Ajuste manual (crédito)' : 'Ajuste manual (débito)',
+    });
+
+    return this.findById(id);
   }
 
   async delete(id: string) {
@@ -147,40 +200,16 @@ export class PayerAccountService {
     return stats;
   }
 
-  async getTransactions(id: string, startDate?: Date, endDate?: Date) {
-    const account = await this.accountRepository.getAccountWithTransactions(id, startDate, endDate);
-    
-    if (!account) {
-      throw new NotFoundError('Conta não encontrada');
-    }
+  async getTransactions(id: string, startDate?: Date, endDate?: Date, page: { cursor?: string; limit?: number } = {}) {
+    const account = await this.findById(id);
 
-    // Formata as transações em ordem cronológica
-    const transactions = [
-      ...account.expenses.map((e: any) => ({
-        id: e.id,
-        type: 'expense' as const,
-        date: e.paymentDate || e.dueDate,
-        description: e.description,
-        amount: -e.totalAmount,
-        status: e.isPaid ? 'paid' : 'pending',
-      })),
-      ...account.revenues.map((r: any) => ({
-        id: r.id,
-        type: 'revenue' as const,
-        date: r.receiptDate || r.dueDate,
-        description: r.description,
-        amount: r.totalAmount,
-        status: r.isReceived ? 'received' : 'pending',
-      })),
-      ...account.contributions.map((c: any) => ({
-        id: c.id,
-        type: 'contribution' as const,
-        date: c.contributionDate,
-        description: `Aporte - ${c.partner.name}`,
-        amount: c.amount,
-        status: 'completed',
-      })),
-    ].sort((a, b) => b.date.getTime() - a.date.getTime());
+    // Extrato lido do ledger: só a página pedida, com o saldo acumulado de cada lançamento
+    const statement = await accountLedgerService.getStatement(id, {
+      startDate,
+      endDate,
+      cursor: page.cursor,
+      limit: page.limit,
+    });
 
     return {
       account: {
@@ -189,7 +218,29 @@ export class PayerAccountService {
         accountName: account.accountName,
         balance: account.balance,
       },
-      transactions,
+      openingBalance: statement.openingBalance,
+      closingBalance: statement.closingBalance,
+      transactions: statement.entries.map(entry => ({
+        id: entry.id,
+        type: entry.sourceType.toLowerCase(),
+        sourceId: entry.sourceId,
+        date: entry.entryDate,
+        description: entry.description,
+        amount: entry.amount,
+        balance: entry.balanceAfter,
+      })),
+      hasNext: statement.hasNext,
+      nextCursor: statement.nextCursor,
+    };
+  }
+
+  async getBalanceAt(id: string, date: Date) {
+    await this.findById(id);
+
+    return {
+      accountId: id,
+      date,
+      balance: await accountLedgerService.getBalanceAt(id, date),
     };
   }
 } 
\ No newline at end of file
@@ -0,0 +1,178 @@
+import { prisma } from '@/config/database';
+import { logger } from '@/config/logger';
+import { emitPenOccupancyUpdate, getSocketServer } from '@/config/socket';
+import { DomainEntity, onDomainEvent } from '@/utils/domainEvents';
+
+export interface PenOccupancySnapshot {
+  penId: string;
+  penNumber: string;
+  capacity: number;
+  currentOccupancy: number;
+  percentageOccupied: number;
+  availableSpace: number;
+  activeLots: number;
+  status: string;
+}
+
+// Gravações que podem alterar a ocupação: alocações, mortes, vendas e status de lotes/currais
+const OCCUPANCY_ENTITIES: DomainEntity[] = ['pen', 'death', 'sale', 'purchase'];
+
+// Agrupa rajadas (ex.: confinamento em lote) em uma única publicação
+const PUBLISH_DEBOUNCE_MS = 500;
+
+const PEN_OCCUPANCY_ROOM = 'pen-occupancy';
+
+const sameOccupancy = (a: PenOccupancySnapshot, b: PenOccupancySnapshot) =>
+  a.currentOccupancy === b.currentOccupancy
+  && a.capacity === b.capacity
+  && a.activeLots === b.activeLots
+  && a.status === b.status
+  && a.penNumber === b.penNumber;
+
+/**
+ * Publica no Socket.IO apenas os currais cuja ocupação mudou, em vez de os clientes
+ * recarregarem a ocupação completa periodicamente.
+ */
+export class PenOccupancyPublisher {
+  private lastState = new Map<string, PenOccupancySnapshot>();
+  private version = 0;
+  private timer: NodeJS.Timeout | null = null;
+  private publishing: Promise<void> | null = null;
+  private pending = false;
+  private unsubscribe: (() => void) | null = null;
+
+  start(): void {
+    if (this.unsubscribe) return;
+    this.unsubscribe = onDomainEvent(event => {
+      if (OCCUPANCY_ENTITIES.includes(event.entity)) {
+        this.schedulePublish();
+      }
+    });
+  }
+
+  stop(): void {
+    this.unsubscribe?.();
+    this.unsubscribe = null;
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+  }
+
+  schedulePublish(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+    }
+
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.publish().catch(error => {
+        logger.error('Erro ao publicar ocupação dos currais:', error);
+      });
+    }, PUBLISH_DEBOUNCE_MS);
+    this.timer.unref?.();
+  }
+
+  /**
+   * Recalcula a ocupação e emite os currais alterados desde a última publicação
+   */
+  async publish(): Promise<void> {
+    if (this.publishing) {
+      this.pending = true;
+      return this.publishing;
+    }
+
+    this.publishing = this.computeAndEmit().finally(() => {
+      this.publishing = null;
+      if (this.pending) {
+        this.pending = false;
+        this.schedulePublish();
+      }
+    });
+
+    return this.publishing;
+  }
+
+  private hasSubscribers(): boolean {
+    const io = getSocketServer();
+    return !!io && (io.sockets.adapter.rooms.get(PEN_OCCUPANCY_ROOM)?.size || 0) > 0;
+  }
+
+  private async computeAndEmit(): Promise<void> {
+    // Sem ninguém inscrito não há o que publicar; a base é refeita quando alguém voltar
+    if (!this.hasSubscribers()) {
+      this.lastState.clear();
+      return;
+    }
+
+    const current = await this.loadOccupancy();
+    const changes: PenOccupancySnapshot[] = [];
+    const removed: string[] = [];
+
+    for (const pen of current.values()) {
+      const previous = this.lastState.get(pen.penId);
+      if (!previous || !sameOccupancy(previous, pen)) {
+        changes.push(pen);
+      }
+    }
+
+    for (const penId of this.lastState.keys()) {
+      if (!current.has(penId)) {
+        removed.push(penId);
+      }
+    }
+
+    this.lastState = current;
+
+    if (changes.length === 0 && removed.length === 0) {
+      return;
+    }
+
+    this.version++;
+    emitPenOccupancyUpdate({
+      type: 'pen_delta',
+      version: this.version,
+      changes,
+      removed,
+      emittedAt: new Date().toISOString(),
+    });
+  }
+
+  private async loadOccupancy(): Promise<Map<string, PenOccupancySnapshot>> {
+    const [pens, allocations] = await Promise.all([
+      prisma.pen.findMany({
+        where: { isActive: true },
+        select: { id: true, penNumber: true, capacity: true, status: true },
+      }),
+      prisma.lotPenLink.groupBy({
+        by: ['penId'],
+        where: { status: 'ACTIVE' },
+        _sum: { quantity: true },
+        _count: { _all: true },
+      }),
+    ]);
+
+    const byPen = new Map(allocations.map(allocation => [allocation.penId, allocation]));
+    const occupancy = new Map<string, PenOccupancySnapshot>();
+
+    for (const pen of pens) {
+      const allocation = byPen.get(pen.id);
+      const currentOccupancy = allocation?._sum.quantity || 0;
+
+      occupancy.set(pen.id, {
+        penId: pen.id,
+        penNumber: pen.penNumber,
+        capacity: pen.capacity,
+        currentOccupancy,
+        percentageOccupied: pen.capacity > 0 ? (currentOccupancy / pen.capacity) * 100 : 0,
+        availableSpace: pen.capacity - currentOccupancy,
+        activeLots: allocation?._count._all || 0,
+        status: pen.status,
+      });
+    }
+
+    return occupancy;
+  }
+}
+
+export const penOccupancyPublisher = new PenOccupancyPublisher();
@@ -0,0 +1,303 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/config/database';
+import cattlePurchaseCashFlowService, { SyncCounters } from '@/services/cattlePurchaseCashFlow.service';
+import { publishDomainEvent } from '@/utils/domainEvents';
+
+// Categorias de despesa geradas automaticamente a partir de uma compra
+const PURCHASE_EXPENSE_CATEGORIES = ['animal_purchase', 'freight', 'commission'];
+
+const DEFAULT_BATCH_SIZE = 100;
+const MAX_BATCH_SIZE = 500;
+
+type PurchaseWithPartners = Prisma.CattlePurchaseGetPayload<{
+  include: { vendor: true; broker: true; transportCompany: true };
+}>;
+
+interface DesiredExpense {
+  purchaseId: string;
+  category: string;
+  description: string;
+  totalAmount: number;
+  dueDate: Date;
+  impactsCashFlow: boolean;
+  vendorId: string | null;
+  payerAccountId: string | null;
+  notes: string | null;
+  userId: string;
+}
+
+export interface FinancialSyncResult {
+  purchases: number;
+  expenses: SyncCounters;
+  cashFlows: SyncCounters;
+}
+
+export interface ResyncAllResult extends FinancialSyncResult {
+  batches: number;
+  failedBatches: Array<{ afterId: string | null; error: string }>;
+  durationMs: number;
+}
+
+const emptyCounters = (): SyncCounters => ({ created: 0, updated: 0, deleted: 0, locked: 0 });
+
+const addCounters = (target: SyncCounters, source: SyncCounters) => {
+  target.created += source.created;
+  target.updated += source.updated;
+  target.deleted += source.deleted;
+  target.locked += source.locked;
+};
+
+const sameAmount = (a: number, b: number) => Math.abs(a - b) < 0.005;
+
+/**
+ * Sincroniza despesas e movimentações de compras de gado pela diferença
+ * entre o estado esperado e o que já existe no banco.
+ */
+export class PurchaseFinancialSyncService {
+  /**
+   * Despesas esperadas para uma compra (gado, frete e comissão)
+   */
+  buildPurchaseExpenses(purchase: PurchaseWithPartners, userId?: string): DesiredExpense[] {
+    const lotCode = purchase.lotCode || `LOT-${purchase.id.slice(-6)}`;
+    const base = {
+      purchaseId: purchase.id,
+      impactsCashFlow: true,
+      payerAccountId: purchase.payerAccountId,
+      userId: userId || purchase.userId
+    };
+    const expenses: DesiredExpense[] = [];
+
+    if (purchase.purchaseValue > 0) {
+      expenses.push({
+        ...base,
+        category: 'animal_purchase',
+        description: `Compra de gado - ${lotCode}`,
+        totalAmount: purchase.purchaseValue,
+        dueDate: purchase.principalDueDate || purchase.purchaseDate,
+        vendorId: purchase.vendorId,
+        notes: `Compra de ${purchase.initialQuantity} animais - ${purchase.purchaseWeight}kg total`
+      });
+    }
+
+    if (purchase.freightCost > 0) {
+      expenses.push({
+        ...base,
+        category: 'freight',
+        description: `Frete - ${lotCode}`,
+        totalAmount: purchase.freightCost,
+        dueDate: purchase.freightDueDate || purchase.purchaseDate,
+        vendorId: purchase.transportCompanyId,
+        notes: purchase.freightDistance ? `Distância: ${purchase.freightDistance}km` : null
+      });
+    }
+
+    if (purchase.commission > 0) {
+      expenses.push({
+        ...base,
+        category: 'commission',
+        description: `Comissão - ${lotCode}`,
+        totalAmount: purchase.commission,
+        dueDate: purchase.commissionDueDate || purchase.purchaseDate,
+        vendorId: purchase.brokerId,
+        notes: `Comissão sobre compra - ${lotCode}`
+      });
+    }
+
+    return expenses;
+  }
+
+  /**
+   * Sincroniza despesas e movimentações de uma ou mais compras em uma única transação
+   */
+  async syncPurchases(purchaseIds: string[], userId?: string): Promise<FinancialSyncResult> {
+    const result: FinancialSyncResult = {
+      purchases: 0,
+      expenses: emptyCounters(),
+      cashFlows: emptyCounters()
+    };
+
+    if (purchaseIds.length === 0) {
+      return result;
+    }
+
+    const purchases = await prisma.cattlePurchase.findMany({
+      where: { id: { in: purchaseIds } },
+      include: {
+        vendor: true,
+        broker: true,
+        transportCompany: true
+      }
+    });
+
+    result.purchases = purchases.length;
+    if (purchases.length === 0) {
+      return result;
+    }
+
+    await prisma.$transaction(async (tx) => {
+      result.expenses = await this.syncExpenses(tx, purchases, userId);
+      result.cashFlows = await cattlePurchaseCashFlowService.syncPurchaseCashFlowsBulk(purchases, tx);
+    }, { timeout: 60000 });
+
+    return result;
+  }
+
+  /**
+   * Ressincroniza todas as compras em lotes limitados, cada um na sua própria transação,
+   * para não manter linhas bloqueadas durante toda a execução.
+   */
+  async resyncAll(options: { batchSize?: number; userId?: string } = {}): Promise<ResyncAllResult> {
+    const startedAt = Date.now();
+    const batchSize = Math.min(Math.max(options.batchSize || DEFAULT_BATCH_SIZE, 1), MAX_BATCH_SIZE);
+
+    const result: ResyncAllResult = {
+      purchases: 0,
+      expenses: emptyCounters(),
+      cashFlows: emptyCounters(),
+      batches: 0,
+      failedBatches: [],
+      durationMs: 0
+    };
+
+    let cursor: string | null = null;
+
+    while (true) {
+      const page: Array<{ id: string }> = await prisma.cattlePurchase.findMany({
+        select: { id: true },
+        orderBy: { id: 'asc' },
+        take: batchSize,
+        ...(cursor ? { cursor: { id: cursor }, skip: 1 } : {})
+      });
+
+      if (page.length === 0) {
+        break;
+      }
+
+      const afterId = cursor;
+      cursor = page[page.length - 1].id;
+      result.batches++;
+
+      try {
+        const batch = await this.syncPurchases(page.map(purchase => purchase.id), options.userId);
+        result.purchases += batch.purchases;
+        addCounters(result.expenses, batch.expenses);
+        addCounters(result.cashFlows, batch.cashFlows);
+      } catch (error: any) {
+        // Um lote com falha não interrompe os demais
+        console.error(`❌ Erro ao sincronizar lote após ${afterId ?? 'início'}:`, error);
+        result.failedBatches.push({ afterId, error: error.message });
+      }
+
+      if (page.length < batchSize) {
+        break;
+      }
+    }
+
+    result.durationMs = Date.now() - startedAt;
+    return result;
+  }
+
+  /**
+   * Compara as despesas esperadas com as existentes (uma consulta) e aplica a diferença em lote.
+   * Despesas pagas, rateadas ou conciliadas não são alteradas.
+   */
+  private async syncExpenses(
+    tx: Prisma.TransactionClient,
+    purchases: PurchaseWithPartners[],
+    userId?: string
+  ): Promise<SyncCounters> {
+    const counters = emptyCounters();
+
+    const desired = new Map<string, DesiredExpense>();
+    for (const purchase of purchases) {
+      for (const expense of this.buildPurchaseExpenses(purchase, userId)) {
+        desired.set(`${expense.purchaseId}|${expense.category}`, expense);
+      }
+    }
+
+    const existing = await tx.expense.findMany({
+      where: {
+        purchaseId: { in: purchases.map(purchase => purchase.id) },
+        category: { in: PURCHASE_EXPENSE_CATEGORIES }
+      },
+      include: {
+        _count: { select: { allocations: true, reconciliations: true } }
+      },
+      orderBy: { createdAt: 'asc' }
+    });
+
+    const toUpdate: Array<DesiredExpense & { id: string }> = [];
+    const toDelete: string[] = [];
+    const matched = new Set<string>();
+
+    for (const expense of existing) {
+      const key = `${expense.purchaseId}|${expense.category}`;
+      const row = desired.get(key);
+
+      if (expense.isPaid || expense._count.allocations > 0 || expense._count.reconciliations > 0) {
+        matched.add(key);
+        counters.locked++;
+        continue;
+      }
+
+      // Sem valor esperado ou duplicada: remover
+      if (!row || matched.has(key)) {
+        toDelete.push(expense.id);
+        continue;
+      }
+
+      matched.add(key);
+
+      const changed = expense.description !== row.description
+        || !sameAmount(expense.totalAmount, row.totalAmount)
+        || expense.dueDate.getTime() !== row.dueDate.getTime()
+        || expense.vendorId !== row.vendorId
+        || expense.payerAccountId !== row.payerAccountId
+        || expense.notes !== row.notes;
+
+      if (changed) {
+        toUpdate.push({ ...row, id: expense.id });
+      }
+    }
+
+    const toCreate = [...desired.entries()]
+      .filter(([key]) => !matched.has(key))
+      .map(([, row]) => ({ ...row, isPaid: false }));
+
+    if (toDelete.length > 0) {
+      const { count } = await tx.expense.deleteMany({ where: { id: { in: toDelete } } });
+      counters.deleted = count;
+    }
+
+    if (toUpdate.length > 0) {
+      const values = Prisma.join(toUpdate.map(row => Prisma.sql`(
+        ${row.id}::text, ${row.description}::text, ${row.totalAmount}::double precision,
+        ${row.dueDate}::timestamp(3), ${row.vendorId}::text, ${row.payerAccountId}::text, ${row.notes}::text
+      )`));
+
+      counters.updated = await tx.$executeRaw`
+        UPDATE "expenses" AS e SET
+          "description" = v."description",
+          "totalAmount" = v."totalAmount",
+          "dueDate" = v."dueDate",
+          "vendorId" = v."vendorId",
+          "payerAccountId" = v."payerAccountId",
+          "notes" = v."notes",
+          "updatedAt" = NOW()
+        FROM (VALUES ${values}) AS v("id", "description", "totalAmount", "dueDate", "vendorId", "payerAccountId", "notes")
+        WHERE e."id" = v."id"
+      `;
+      // O UPDATE bruto não passa pelo middleware de eventos; dentro do $transaction o evento só sai após o commit
+      publishDomainEvent('expense', 'updateMany', toUpdate.map(row => row.id));
+    }
+
+    if (toCreate.length > 0) {
+      const { count } = await tx.expense.createMany({ data: toCreate });
+      counters.created = count;
+    }
+
+    return counters;
+  }
+}
+
+export const purchaseFinancialSyncService = new PurchaseFinancialSyncService();
@@ -0,0 +1,365 @@
+import cron from 'node-cron';
+import { prisma } from '@/config/database';
+import { logger } from '@/config/logger';
+
+/**
+ * Modelos de risco ajustados em lote.
+ *
+ * O job noturno lê o histórico (mortality_analyses, cattle_purchases e
+ * weight_break_analyses) e grava em `risk_model_coefficients` poucos coeficientes:
+ * - mortalidade: taxa média por vendedor e por mês (suavizadas em direção à média
+ *   geral quando há poucas amostras) e multiplicador por faixa de distância do frete;
+ * - quebra de peso: média e desvio por vendedor + estação + faixa de 100 km, e por estação.
+ * As previsões viram consultas a um Map em memória, e `scoreOpenLots` pontua todos os
+ * lotes em aberto com uma única consulta ao banco.
+ */
+
+export type RiskLevel = 'low' | 'medium' | 'high';
+export type BreakConfidence = 'low' | 'medium' | 'high';
+
+export interface MortalityRiskScore {
+  riskScore: number;
+  riskLevel: RiskLevel;
+  expectedMortalityRate: number;
+  factors: {
+    vendorHistoricalRate: number;
+    seasonalAverageRate: number;
+    transportDistance: number | null;
+    distanceMultiplier: number;
+  };
+}
+
+export interface ExpectedBreak {
+  expectedBreak: number;
+  confidence: BreakConfidence;
+  sampleSize: number;
+  rangeMin: number;
+  rangeMax: number;
+}
+
+interface Coefficient {
+  value: number;
+  stdDev: number | null;
+  sampleSize: number;
+}
+
+type CoefficientRow = Coefficient & { model: string; dimension: string; key: string };
+
+// Taxa (%) usada quando não há histórico
+const DEFAULT_MORTALITY_RATE = 1.5;
+// Peso (em amostras) da média geral ao suavizar vendedor e mês
+const PRIOR_WEIGHT = 3;
+// Limites das faixas de distância do frete (km) do multiplicador de mortalidade
+const DISTANCE_BANDS_KM = [200, 500, 1000];
+// Multiplicador sem histórico na faixa: 20% a mais de risco para longas distâncias
+const LONG_DISTANCE_KM = 500;
+const LONG_DISTANCE_MULTIPLIER = 1.2;
+// Lotes mínimos na faixa para usar o multiplicador ajustado
+const MIN_DISTANCE_SAMPLES = 3;
+
+const DEFAULT_BREAK = 2.5;
+const BREAK_BAND_KM = 100;
+const MIN_BREAK_SAMPLES = 3;
+const HIGH_CONFIDENCE_SAMPLES = 10;
+
+// Reajuste diário antes do expediente; na partida, reajusta se o último tiver mais de um dia
+const FIT_SCHEDULE = '0 4 * * *';
+const MAX_MODEL_AGE_MS = 24 * 60 * 60 * 1000;
+
+const OPEN_STATUSES = ['CONFIRMED', 'RECEIVED', 'CONFINED'] as const;
+
+/**
+ * Estação do ano (hemisfério sul), como gravada em weight_break_analyses.season
+ */
+export function seasonOf(date: Date): string {
+  const month = date.getMonth();
+  if (month >= 2 && month <= 4) return 'autumn';
+  if (month >= 5 && month <= 7) return 'winter';
+  if (month >= 8 && month <= 10) return 'spring';
+  return 'summer';
+}
+
+const distanceBand = (distance: number) => {
+  const band = DISTANCE_BANDS_KM.findIndex(limit => distance < limit);
+  return String(band === -1 ? DISTANCE_BANDS_KM.length : band);
+};
+
+const breakBand = (distance: number) => String(Math.floor(distance / BREAK_BAND_KM));
+
+const riskLevelOf = (score: number): RiskLevel => (score < 1 ? 'low' : score < 2 ? 'medium' : 'high');
+
+export class RiskModelService {
+  private coefficients = new Map<string, Coefficient>();
+  private fittedAt: Date | null = null;
+  private loaded = false;
+  private loading: Promise<void> | null = null;
+  private fitting: Promise<{ coefficients: number; durationMs: number }> | null = null;
+  private job: cron.ScheduledTask | null = null;
+
+  start(): void {
+    if (this.job) return;
+    this.job = cron.schedule(FIT_SCHEDULE, () => {
+      this.fit().catch(error => logger.error('[RiskModel] Erro no ajuste agendado:', error));
+    });
+
+    this.ensureLoaded()
+      .then(() => {
+        if (!this.fittedAt || Date.now() - this.fittedAt.getTime() > MAX_MODEL_AGE_MS) return this.fit();
+      })
+      .catch(error => logger.error('[RiskModel] Erro ao carregar coeficientes:', error));
+  }
+
+  stop(): void {
+    this.job?.stop();
+    this.job = null;
+  }
+
+  /**
+   * Reajusta todos os coeficientes a partir do histórico e substitui os gravados
+   */
+  fit(): Promise<{ coefficients: number; durationMs: number }> {
+    if (!this.fitting) {
+      this.fitting = this.runFit().finally(() => {
+        this.fitting = null;
+      });
+    }
+    return this.fitting;
+  }
+
+  getModelInfo() {
+    const counts: Record<string, number> = {};
+    for (const key of this.coefficients.keys()) {
+      const [model, dimension] = key.split(':');
+      counts[`${model}.${dimension}`] = (counts[`${model}.${dimension}`] || 0) + 1;
+    }
+    return { fittedAt: this.fittedAt, coefficients: this.coefficients.size, byDimension: counts };
+  }
+
+  async scoreMortality(
+    lot: { vendorId: string; freightDistance: number | null },
+    month = new Date().getMonth() + 1
+  ): Promise<MortalityRiskScore> {
+    await this.ensureLoaded();
+    return this.mortalityScore(lot, month);
+  }
+
+  async predictExpectedBreak(vendorId: string, transportDistance: number, season: string): Promise<ExpectedBreak> {
+    await this.ensureLoaded();
+    return this.expectedBreak(vendorId, transportDistance, season);
+  }
+
+  /**
+   * Pontua todos os lotes em aberto: risco de mortalidade para todos e quebra esperada
+   * para os que ainda não foram recebidos. Ordenado do maior risco para o menor.
+   */
+  async scoreOpenLots() {
+    await this.ensureLoaded();
+
+    const lots = await prisma.cattlePurchase.findMany({
+      where: { status: { in: [...OPEN_STATUSES] }, currentQuantity: { gt: 0 } },
+      select: {
+        id: true,
+        lotCode: true,
+        status: true,
+        vendorId: true,
+        vendor: { select: { name: true } },
+        purchaseDate: true,
+        receivedDate: true,
+        freightDistance: true,
+        currentQuantity: true
+      }
+    });
+
+    const month = new Date().getMonth() + 1;
+    const scored = lots.map(lot => {
+      const mortality = this.mortalityScore(lot, month);
+      return {
+        purchaseId: lot.id,
+        lotCode: lot.lotCode,
+        status: lot.status,
+        vendorName: lot.vendor.name,
+        currentQuantity: lot.currentQuantity,
+        ...mortality,
+        expectedDeaths: (lot.currentQuantity * mortality.riskScore) / 100,
+        expectedBreak: lot.receivedDate || lot.freightDistance == null
+          ? null
+          : this.expectedBreak(lot.vendorId, lot.freightDistance, seasonOf(lot.purchaseDate))
+      };
+    });
+
+    scored.sort((a, b) => b.riskScore - a.riskScore);
+
+    return {
+      fittedAt: this.fittedAt,
+      scoredAt: new Date(),
+      lots: scored
+    };
+  }
+
+  private mortalityScore(lot: { vendorId: string; freightDistance: number | null }, month: number): MortalityRiskScore {
+    const vendorRate = this.coefficients.get(`mortality:vendor:${lot.vendorId}`)?.value
+      ?? this.coefficients.get('mortality:global:all')?.value
+      ?? DEFAULT_MORTALITY_RATE;
+    const seasonalRate = this.coefficients.get(`mortality:month:${month}`)?.value
+      ?? this.coefficients.get('mortality:global:all')?.value
+      ?? DEFAULT_MORTALITY_RATE;
+
+    let distanceMultiplier = 1;
+    if (lot.freightDistance != null) {
+      const fitted = this.coefficients.get(`mortality:distance:${distanceBand(lot.freightDistance)}`);
+      distanceMultiplier = fitted && fitted.sampleSize >= MIN_DISTANCE_SAMPLES
+        ? fitted.value
+        : lot.freightDistance > LONG_DISTANCE_KM ? LONG_DISTANCE_MULTIPLIER : 1;
+    }
+
+    const riskScore = ((vendorRate + seasonalRate) / 2) * distanceMultiplier;
+
+    return {
+      riskScore,
+      riskLevel: riskLevelOf(riskScore),
+      expectedMortalityRate: riskScore,
+      factors: {
+        vendorHistoricalRate: vendorRate,
+        seasonalAverageRate: seasonalRate,
+        transportDistance: lot.freightDistance,
+        distanceMultiplier
+      }
+    };
+  }
+
+  private expectedBreak(vendorId: string, transportDistance: number, season: string): ExpectedBreak {
+    const fitted = this.coefficients.get(`weight_break:vendor_season_distance:${vendorId}|${season}|${breakBand(transportDistance)}`);
+
+    if (!fitted || fitted.sampleSize < MIN_BREAK_SAMPLES) {
+      // Se não há dados suficientes, usar média da estação
+      return {
+        expectedBreak: this.coefficients.get(`weight_break:season:${season}`)?.value ?? DEFAULT_BREAK,
+        confidence: 'low',
+        sampleSize: 0,
+        rangeMin: 1.5,
+        rangeMax: 4.0
+      };
+    }
+
+    const stdDev = fitted.stdDev || 0.5;
+    return {
+      expectedBreak: fitted.value,
+      confidence: fitted.sampleSize >= HIGH_CONFIDENCE_SAMPLES ? 'high' : 'medium',
+      sampleSize: fitted.sampleSize,
+      rangeMin: Math.max(0, fitted.value - stdDev),
+      rangeMax: fitted.value + stdDev
+    };
+  }
+
+  private ensureLoaded(): Promise<void> {
+    if (this.loaded) return Promise.resolve();
+    if (!this.loading) {
+      this.loading = this.load().finally(() => {
+        this.loading = null;
+      });
+    }
+    return this.loading;
+  }
+
+  private async load(): Promise<void> {
+    const rows = await prisma.riskModelCoefficient.findMany();
+    this.apply(rows, rows.reduce<Date | null>((latest, row) => (!latest || row.fittedAt > latest ? row.fittedAt : latest), null));
+  }
+
+  private apply(rows: CoefficientRow[], fittedAt: Date | null): void {
+    this.coefficients = new Map(rows.map(row => [
+      `${row.model}:${row.dimension}:${row.key}`,
+      { value: row.value, stdDev: row.stdDev, sampleSize: row.sampleSize }
+    ]));
+    this.fittedAt = fittedAt;
+    this.loaded = true;
+  }
+
+  private async runFit() {
+    const startedAt = Date.now();
+
+    const [mortalityEvents, distanceRates, breakRows] = await Promise.all([
+      // Taxa (%) de cada evento de mortalidade sobre o lote, por vendedor e mês do evento
+      prisma.$queryRaw<Array<{ dimension: string; key: string; value: number; stdDev: number | null; sampleSize: number }>>`
+        WITH events AS (
+          SELECT cp."vendorId" AS vendor_id,
+                 EXTRACT(MONTH FROM ma.mortality_date)::int AS month,
+                 ma.quantity::float / cp."initialQuantity" * 100 AS rate
+          FROM mortality_analyses ma
+          JOIN cattle_purchases cp ON cp.id = ma.cattle_purchase_id
+          WHERE cp."initialQuantity" > 0
+        )
+        SELECT 'global' AS dimension, 'all' AS key, AVG(rate) AS value, STDDEV(rate) AS "stdDev", COUNT(*)::int AS "sampleSize"
+        FROM events
+        HAVING COUNT(*) > 0
+        UNION ALL
+        SELECT 'vendor', vendor_id, AVG(rate), STDDEV(rate), COUNT(*)::int FROM events GROUP BY vendor_id
+        UNION ALL
+        SELECT 'month', month::text, AVG(rate), STDDEV(rate), COUNT(*)::int FROM events GROUP BY month
+      `,
+      // Taxa de mortes por lote (deathCount mantido nas compras), por distância do frete
+      prisma.$queryRaw<Array<{ distance: number; rate: number }>>`
+        SELECT "freightDistance" AS distance, "deathCount"::float / "initialQuantity" * 100 AS rate
+        FROM cattle_purchases
+        WHERE "freightDistance" IS NOT NULL AND "initialQuantity" > 0 AND status <> 'CANCELLED'
+      `,
+      // Quebra (%) por vendedor + estação + faixa de distância, e por estação
+      prisma.$queryRaw<Array<{ dimension: string; key: string; value: number; stdDev: number | null; sampleSize: number }>>`
+        WITH samples AS (
+          SELECT vendor_id, season, break_percentage,
+                 FLOOR(transport_distance / ${BREAK_BAND_KM})::int AS band
+          FROM weight_break_analyses
+        )
+        SELECT 'vendor_season_distance' AS dimension, vendor_id || '|' || season || '|' || band AS key,
+               AVG(break_percentage) AS value, STDDEV(break_percentage) AS "stdDev", COUNT(*)::int AS "sampleSize"
+        FROM samples
+        WHERE band IS NOT NULL
+        GROUP BY vendor_id, season, band
+        UNION ALL
+        SELECT 'season', season, AVG(break_percentage), STDDEV(break_percentage), COUNT(*)::int
+        FROM samples
+        GROUP BY season
+      `
+    ]);
+
+    const rows: CoefficientRow[] = [];
+
+    // Vendedor e mês suavizados em direção à média geral: (n * média + k * geral) / (n + k)
+    const global = mortalityEvents.find(row => row.dimension === 'global');
+    for (const row of mortalityEvents) {
+      const value = global && row.dimension !== 'global'
+        ? (row.sampleSize * row.value + PRIOR_WEIGHT * global.value) / (row.sampleSize + PRIOR_WEIGHT)
+        : row.value;
+      rows.push({ model: 'mortality', dimension: row.dimension, key: row.key, value, stdDev: row.stdDev, sampleSize: row.sampleSize });
+    }
+
+    // Multiplicador da faixa = taxa média da faixa / taxa média de todos os lotes com frete
+    const overallRate = distanceRates.reduce((sum, lot) => sum + lot.rate, 0) / (distanceRates.length || 1);
+    if (overallRate > 0) {
+      const bands = new Map<string, number[]>();
+      distanceRates.forEach(lot => {
+        const band = distanceBand(lot.distance);
+        bands.set(band, [...(bands.get(band) || []), lot.rate]);
+      });
+      for (const [band, rates] of bands) {
+        const average = rates.reduce((sum, rate) => sum + rate, 0) / rates.length;
+        rows.push({ model: 'mortality', dimension: 'distance', key: band, value: average / overallRate, stdDev: null, sampleSize: rates.length });
+      }
+    }
+
+    breakRows.forEach(row => rows.push({ model: 'weight_break', ...row }));
+
+    const fittedAt = new Date();
+    await prisma.$transaction([
+      prisma.riskModelCoefficient.deleteMany({}),
+      prisma.riskModelCoefficient.createMany({ data: rows.map(row => ({ ...row, fittedAt })) })
+    ]);
+    this.apply(rows, fittedAt);
+
+    const durationMs = Date.now() - startedAt;
+    logger.info(`[RiskModel] ${rows.length} coeficiente(s) ajustado(s) em ${durationMs}ms`);
+    return { coefficients: rows.length, durationMs };
+  }
+}
+
+export const riskModelService = new RiskModelService();
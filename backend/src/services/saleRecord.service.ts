@@ -5,6 +5,7 @@ import { prisma } from '@/config/database';
 import cashFlowService from '@/services/cashFlow.service';
 import calendarEventService from '@/services/calendarEvent.service';
 import { CattlePurchaseRepository } from '@/repositories/cattlePurchase.repository';
+import { DomainCache } from '@/utils/cache';
 
 interface CreateSaleRecordData {
   purchaseId: string;
@@ -37,6 +38,23 @@ interface SaleRecordFilters {
   search?: string;
 }
 
+// Estatísticas e resumo ficam em cache por filtro por pouco tempo: o Kanban de vendas
+// consulta os totais a cada atualização, e qualquer gravação de venda descarta o cache
+const STATS_CACHE_TTL_SECONDS = 30;
+const MAX_CACHED_FILTERS = 100;
+
+export const saleRecordStatsCache = new DomainCache({
+  entities: ['sale'],
+  maxEntries: MAX_CACHED_FILTERS,
+  ttlSeconds: STATS_CACHE_TTL_SECONDS,
+});
+
+const filterKey = (prefix: string, values: Record<string, unknown>) =>
+  `${prefix}:${Object.entries(values)
+    .filter(([, value]) => value !== undefined && value !== null && value !== '')
+    .map(([name, value]) => `${name}=${value instanceof Date ? value.toISOString() : value}`)
+    .join('&')}`;
+
 export class SaleRecordService {
   private saleRecordRepository: SaleRecordRepository;
   private cattlePurchaseRepository: CattlePurchaseRepository;
@@ -47,40 +65,7 @@ export class SaleRecordService {
   }
 
   async findAll(filters: SaleRecordFilters, pagination?: PaginationParams) {
-    const where: any = {};
-
-    if (filters.purchaseId) {
-      where.purchaseId = filters.purchaseId;
-    }
-
-    if (filters.buyerId) {
-      where.buyerId = filters.buyerId;
-    }
-    
-    if (filters.cycleId) {
-      where.cycleId = filters.cycleId;
-    }
-
-    if (filters.status) {
-      where.status = filters.status;
-    }
-
-    if (filters.startDate || filters.endDate) {
-      where.saleDate = {};
-      if (filters.startDate) {
-        where.saleDate.gte = filters.startDate;
-      }
-      if (filters.endDate) {
-        where.saleDate.lte = filters.endDate;
-      }
-    }
-
-    if (filters.search) {
-      where.OR = [
-        { deliveryLocation: { contains: filters.search, mode: 'insensitive' } },
-        { notes: { contains: filters.search, mode: 'insensitive' } },
-      ];
-    }
+    const where = this.buildWhere(filters);
 
     const options = {
       include: {
@@ -305,7 +290,9 @@ export class SaleRecordService {
       // Adicionar lógica para reverter estoque se necessário
     }
 
-    return this.saleRecordRepository.update(id, data);
+    const updatedRecord = await this.saleRecordRepository.update(id, data);
+
+    return updatedRecord;
   }
 
   async updateStatus(id: string, status: string) {
@@ -368,44 +355,91 @@ export class SaleRecordService {
       throw new ValidationError('Não é possível excluir vendas completas');
     }
 
-    return this.saleRecordRepository.delete(id);
+    const deletedRecord = await this.saleRecordRepository.delete(id);
+
+    return deletedRecord;
   }
 
   async getStats(startDate?: Date, endDate?: Date) {
-    const stats = await this.saleRecordRepository.getStatsByPeriod(startDate, endDate);
-    const statusStats = await this.saleRecordRepository.getSalesByStatus();
-    
-    return {
-      ...stats,
-      byStatus: statusStats,
-    };
+    return saleRecordStatsCache.get(filterKey('stats', { startDate, endDate }), async () => {
+      const [stats, statusStats] = await Promise.all([
+        this.saleRecordRepository.getStatsByPeriod(startDate, endDate),
+        this.saleRecordRepository.getSalesByStatus(),
+      ]);
+
+      return {
+        ...stats,
+        byStatus: statusStats,
+      };
+    });
   }
 
-  async getSummary(filters?: SaleRecordFilters) {
-    const records = await this.findAll(filters || {}, { page: 1, limit: 1000 });
-
-    const summary = {
-      total: records.total,
-      totalQuantity: records.items.reduce((sum: number, r) => sum + r.quantity, 0),
-      totalWeight: records.items.reduce((sum: number, r) => sum + (r.exitWeight || 0), 0),
-      totalCarcassWeight: records.items.reduce((sum: number, r) => sum + (r.carcassWeight || 0), 0),
-      totalGrossValue: records.items.reduce((sum: number, r) => sum + (r.totalValue || 0), 0),
-      totalNetValue: records.items.reduce((sum: number, r) => sum + r.netValue, 0),
-      averagePrice: 0,
-      byStatus: {
-        pending: records.items.filter(r => r.status === 'PENDING').length,
-        confirmed: records.items.filter(r => r.status === 'CONFIRMED').length,
-        delivered: records.items.filter(r => r.status === 'DELIVERED').length,
-        paid: records.items.filter(r => r.status === 'PAID').length,
-        cancelled: records.items.filter(r => r.status === 'CANCELLED').length,
-        completed: records.items.filter(r => r.status === 'PAID').length, // Usar PAID como completed
-      },
-    };
+  async getSummary(filters: SaleRecordFilters = {}) {
+    return saleRecordStatsCache.get(filterKey('summary', { ...filters }), async () => {
+      const where = this.buildWhere(filters);
+      const [totals, byStatus, byBuyer] = await Promise.all([
+        this.saleRecordRepository.getTotals(where),
+        this.saleRecordRepository.getSalesByStatus(where),
+        this.saleRecordRepository.getTotalsByBuyer(where),
+      ]);
+
+      return {
+        total: totals.count,
+        totalQuantity: totals.quantity,
+        totalWeight: totals.exitWeight,
+        totalCarcassWeight: totals.carcassWeight,
+        totalGrossValue: totals.totalValue,
+        totalNetValue: totals.netValue,
+        averagePrice: totals.exitWeight > 0 ? totals.netValue / totals.exitWeight : 0,
+        byStatus: {
+          pending: byStatus.PENDING,
+          confirmed: byStatus.CONFIRMED,
+          delivered: byStatus.DELIVERED,
+          paid: byStatus.PAID,
+          cancelled: byStatus.CANCELLED,
+          completed: byStatus.PAID, // Usar PAID como completed
+        },
+        byBuyer,
+      };
+    });
+  }
+
+  private buildWhere(filters: SaleRecordFilters) {
+    const where: any = {};
+
+    if (filters.purchaseId) {
+      where.purchaseId = filters.purchaseId;
+    }
+
+    if (filters.buyerId) {
+      where.buyerId = filters.buyerId;
+    }
+    
+    if (filters.cycleId) {
+      where.cycleId = filters.cycleId;
+    }
 
-    if (summary.totalWeight > 0) {
-      summary.averagePrice = summary.totalNetValue / summary.totalWeight;
+    if (filters.status) {
+      where.status = filters.status;
+    }
+
+    if (filters.startDate || filters.endDate) {
+      where.saleDate = {};
+      if (filters.startDate) {
+        where.saleDate.gte = filters.startDate;
+      }
+      if (filters.endDate) {
+        where.saleDate.lte = filters.endDate;
+      }
+    }
+
+    if (filters.search) {
+      where.OR = [
+        { deliveryLocation: { contains: filters.search, mode: 'insensitive' } },
+        { notes: { contains: filters.search, mode: 'insensitive' } },
+      ];
     }
 
-    return summary;
+    return where;
   }
-}
\ No newline at end of file
+}
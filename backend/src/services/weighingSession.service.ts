@@ -0,0 +1,289 @@
+import { prisma } from '@/config/database';
+import { logger } from '@/config/logger';
+import { ValidationError } from '@/utils/AppError';
+
+/**
+ * Sessão de pesagem: centenas de pesos individuais (exportados pela balança) gravados de
+ * uma vez. Em uma única passada os pesos são validados e agregados por lote; cada lote
+ * ganha uma leitura (`weight_readings`) com média, total e GMD, os pesos individuais vão
+ * para `animal_weights` em lotes de inserção e o peso do lote é atualizado uma vez só.
+ */
+
+export interface WeighingSessionEntry {
+  row?: number; // Linha no arquivo da balança, usada nos erros
+  cattlePurchaseId?: string;
+  lotCode?: string;
+  animalTag?: string;
+  weight: number;
+}
+
+export interface WeighingSessionInput {
+  readingDate: Date;
+  entries: WeighingSessionEntry[];
+  notes?: string;
+  dryRun?: boolean;
+}
+
+export interface WeighingSessionError {
+  row: number;
+  field: string;
+  message: string;
+  value?: unknown;
+}
+
+export interface WeighingLotSummary {
+  cattlePurchaseId: string;
+  lotCode: string;
+  readingId: string | null;
+  animalCount: number;
+  averageWeight: number;
+  totalWeight: number;
+  minWeight: number;
+  maxWeight: number;
+  baselineWeight: number | null;
+  baselineDate: Date | null;
+  days: number | null;
+  averageDailyGain: number | null;
+}
+
+export interface WeighingSessionReport {
+  readingDate: Date;
+  dryRun: boolean;
+  totalRows: number;
+  accepted: number;
+  failed: number;
+  errors: WeighingSessionError[];
+  lots: WeighingLotSummary[];
+  durationMs: number;
+}
+
+// Faixa aceitável para o peso vivo de um animal (kg)
+export const MIN_ANIMAL_WEIGHT = 30;
+export const MAX_ANIMAL_WEIGHT = 1500;
+export const MAX_SESSION_ENTRIES = 10000;
+
+const INSERT_BATCH_SIZE = 500;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+interface LotAccumulator {
+  purchase: { id: string; lotCode: string; currentQuantity: number };
+  entries: Array<{ animalTag: string | null; weight: number }>;
+  tags: Set<string>;
+  total: number;
+  min: number;
+  max: number;
+}
+
+const round = (value: number, digits = 2) => Number(value.toFixed(digits));
+
+export class WeighingSessionService {
+  async ingest(input: WeighingSessionInput, userId: string): Promise<WeighingSessionReport> {
+    const startedAt = Date.now();
+
+    if (input.entries.length === 0) {
+      throw new ValidationError('A sessão de pesagem não tem pesos');
+    }
+    if (input.entries.length > MAX_SESSION_ENTRIES) {
+      throw new ValidationError(`Sessão com mais de ${MAX_SESSION_ENTRIES} pesos; divida o arquivo`);
+    }
+
+    const purchases = await this.resolvePurchases(input.entries);
+    const errors: WeighingSessionError[] = [];
+    const lots = new Map<string, LotAccumulator>();
+
+    // Passada única: valida, resolve o lote e acumula os agregados
+    input.entries.forEach((entry, index) => {
+      const row = entry.row ?? index + 1;
+      const purchase = entry.cattlePurchaseId
+        ? purchases.byId.get(entry.cattlePurchaseId)
+        : entry.lotCode ? purchases.byCode.get(entry.lotCode) : undefined;
+
+      if (!purchase) {
+        errors.push({
+          row,
+          field: entry.cattlePurchaseId ? 'cattlePurchaseId' : 'lotCode',
+          message: entry.cattlePurchaseId || entry.lotCode ? 'Lote não encontrado' : 'Lote não informado',
+          value: entry.cattlePurchaseId || entry.lotCode,
+        });
+        return;
+      }
+
+      if (!Number.isFinite(entry.weight) || entry.weight < MIN_ANIMAL_WEIGHT || entry.weight > MAX_ANIMAL_WEIGHT) {
+        errors.push({
+          row,
+          field: 'weight',
+          message: `Peso fora da faixa (${MIN_ANIMAL_WEIGHT}-${MAX_ANIMAL_WEIGHT} kg)`,
+          value: entry.weight,
+        });
+        return;
+      }
+
+      let lot = lots.get(purchase.id);
+      if (!lot) {
+        lot = { purchase, entries: [], tags: new Set(), total: 0, min: Infinity, max: -Infinity };
+        lots.set(purchase.id, lot);
+      }
+
+      const animalTag = entry.animalTag?.trim() || null;
+      if (animalTag) {
+        if (lot.tags.has(animalTag)) {
+          errors.push({ row, field: 'animalTag', message: 'Animal pesado mais de uma vez na sessão', value: animalTag });
+          return;
+        }
+        lot.tags.add(animalTag);
+      }
+
+      lot.entries.push({ animalTag, weight: entry.weight });
+      lot.total += entry.weight;
+      lot.min = Math.min(lot.min, entry.weight);
+      lot.max = Math.max(lot.max, entry.weight);
+    });
+
+    const baselines = await this.loadBaselines([...lots.keys()], input.readingDate);
+
+    const summaries: WeighingLotSummary[] = [...lots.values()].map(lot => {
+      const averageWeight = lot.total / lot.entries.length;
+      const baseline = baselines.get(lot.purchase.id);
+      const days = baseline ? Math.floor((input.readingDate.getTime() - baseline.date.getTime()) / DAY_MS) : null;
+
+      return {
+        cattlePurchaseId: lot.purchase.id,
+        lotCode: lot.purchase.lotCode,
+        readingId: null,
+        animalCount: lot.entries.length,
+        averageWeight: round(averageWeight),
+        totalWeight: round(lot.total),
+        minWeight: lot.min,
+        maxWeight: lot.max,
+        baselineWeight: baseline ? round(baseline.weight) : null,
+        baselineDate: baseline?.date ?? null,
+        days,
+        averageDailyGain: baseline && days && days > 0 ? round((averageWeight - baseline.weight) / days, 3) : null,
+      };
+    });
+
+    if (!input.dryRun && summaries.length > 0) {
+      await prisma.$transaction(async (tx) => {
+        for (const summary of summaries) {
+          const lot = lots.get(summary.cattlePurchaseId)!;
+
+          const reading = await tx.weightReading.create({
+            data: {
+              purchaseId: summary.cattlePurchaseId,
+              readingDate: input.readingDate,
+              averageWeight: summary.averageWeight,
+              totalWeight: summary.totalWeight,
+              animalCount: summary.animalCount,
+              averageDailyGain: summary.averageDailyGain,
+              userId,
+              notes: input.notes,
+            },
+          });
+          summary.readingId = reading.id;
+
+          for (let i = 0; i < lot.entries.length; i += INSERT_BATCH_SIZE) {
+            await tx.animalWeight.createMany({
+              data: lot.entries.slice(i, i + INSERT_BATCH_SIZE).map(entry => ({
+                readingId: reading.id,
+                purchaseId: summary.cattlePurchaseId,
+                animalTag: entry.animalTag,
+                weight: entry.weight,
+              })),
+            });
+          }
+
+          // Peso do lote atualizado uma vez por sessão, não por animal
+          await tx.cattlePurchase.update({
+            where: { id: summary.cattlePurchaseId },
+            data: {
+              averageWeight: summary.averageWeight,
+              currentWeight: round(summary.averageWeight * lot.purchase.currentQuantity),
+            },
+          });
+        }
+      }, { timeout: 60000 });
+    }
+
+    const accepted = summaries.reduce((sum, lot) => sum + lot.animalCount, 0);
+    logger.info(`Sessão de pesagem: ${accepted} pesos em ${summaries.length} lote(s), ${errors.length} erro(s)`);
+
+    return {
+      readingDate: input.readingDate,
+      dryRun: Boolean(input.dryRun),
+      totalRows: input.entries.length,
+      accepted,
+      failed: errors.length,
+      errors,
+      lots: summaries,
+      durationMs: Date.now() - startedAt,
+    };
+  }
+
+  /**
+   * Busca de uma vez os lotes citados na sessão, por ID ou código
+   */
+  private async resolvePurchases(entries: WeighingSessionEntry[]) {
+    const ids = new Set<string>();
+    const codes = new Set<string>();
+    entries.forEach(entry => {
+      if (entry.cattlePurchaseId) ids.add(entry.cattlePurchaseId);
+      else if (entry.lotCode) codes.add(entry.lotCode);
+    });
+
+    const purchases = await prisma.cattlePurchase.findMany({
+      where: { OR: [{ id: { in: [...ids] } }, { lotCode: { in: [...codes] } }] },
+      select: { id: true, lotCode: true, currentQuantity: true },
+    });
+
+    return {
+      byId: new Map(purchases.map(purchase => [purchase.id, purchase])),
+      byCode: new Map(purchases.map(purchase => [purchase.lotCode, purchase])),
+    };
+  }
+
+  /**
+   * Referência do GMD de cada lote: a última pesagem antes da sessão ou, sem pesagens,
+   * o peso médio de entrada (recebimento ou compra)
+   */
+  private async loadBaselines(purchaseIds: string[], readingDate: Date) {
+    const baselines = new Map<string, { weight: number; date: Date }>();
+    if (purchaseIds.length === 0) return baselines;
+
+    const [readings, purchases] = await Promise.all([
+      prisma.weightReading.findMany({
+        where: { purchaseId: { in: purchaseIds }, readingDate: { lt: readingDate } },
+        orderBy: [{ purchaseId: 'asc' }, { readingDate: 'desc' }],
+        distinct: ['purchaseId'],
+        select: { purchaseId: true, readingDate: true, averageWeight: true },
+      }),
+      prisma.cattlePurchase.findMany({
+        where: { id: { in: purchaseIds } },
+        select: {
+          id: true,
+          initialQuantity: true,
+          purchaseWeight: true,
+          purchaseDate: true,
+          receivedWeight: true,
+          receivedDate: true,
+        },
+      }),
+    ]);
+
+    purchases.forEach(purchase => {
+      if (purchase.initialQuantity <= 0) return;
+      const received = purchase.receivedWeight && purchase.receivedDate;
+      baselines.set(purchase.id, {
+        weight: (received ? purchase.receivedWeight! : purchase.purchaseWeight) / purchase.initialQuantity,
+        date: received ? purchase.receivedDate! : purchase.purchaseDate,
+      });
+    });
+
+    readings.forEach(reading => {
+      baselines.set(reading.purchaseId, { weight: reading.averageWeight, date: reading.readingDate });
+    });
+
+    return baselines;
+  }
+}
+
+export const weighingSessionService = new WeighingSessionService();
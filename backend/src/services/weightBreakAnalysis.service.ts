@@ -1,7 +1,7 @@
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '@/config/database';
 import { ExpenseService } from './expense.service';
+import { riskModelService, seasonOf } from './riskModel.service';
 
-const prisma = new PrismaClient();
 const expenseService = new ExpenseService();
 
 interface WeightBreakRegistration {
@@ -214,53 +214,9 @@ export class WeightBreakAnalysisService {
     };
   }
 
-  // Prever quebra esperada
+  // Prever quebra esperada (coeficientes ajustados pelo job do riskModelService)
   async predictExpectedBreak(vendorId: string, transportDistance: number, season: string) {
-    // Buscar histórico similar
-    const historicalData = await prisma.$queryRaw<any[]>(
-      `SELECT 
-        AVG(break_percentage) as avg_break,
-        STDDEV(break_percentage) as std_dev,
-        COUNT(*) as sample_size
-      FROM weight_break_analyses
-      WHERE vendor_id = $1
-        AND season = $2
-        AND transport_distance BETWEEN $3 - 50 AND $3 + 50`,
-      vendorId, 
-      season, 
-      transportDistance
-    );
-
-    if (historicalData[0].sample_size < 3) {
-      // Se não há dados suficientes, usar média geral
-      const generalData = await prisma.$queryRaw<any[]>(
-        `SELECT 
-          AVG(break_percentage) as avg_break,
-          STDDEV(break_percentage) as std_dev
-        FROM weight_break_analyses
-        WHERE season = $1`,
-        season
-      );
-
-      return {
-        expectedBreak: generalData[0].avg_break || 2.5,
-        confidence: 'low',
-        sampleSize: 0,
-        rangeMin: 1.5,
-        rangeMax: 4.0
-      };
-    }
-
-    const avgBreak = historicalData[0].avg_break;
-    const stdDev = historicalData[0].std_dev || 0.5;
-
-    return {
-      expectedBreak: avgBreak,
-      confidence: historicalData[0].sample_size >= 10 ? 'high' : 'medium',
-      sampleSize: historicalData[0].sample_size,
-      rangeMin: Math.max(0, avgBreak - stdDev),
-      rangeMax: avgBreak + stdDev
-    };
+    return riskModelService.predictExpectedBreak(vendorId, Number(transportDistance), season);
   }
 
   // Gerar relatório customizado
@@ -344,11 +300,7 @@ export class WeightBreakAnalysisService {
 
   // Funções auxiliares
   private getSeason(date: Date): string {
-    const month = date.getMonth();
-    if (month >= 2 && month <= 4) return 'autumn';
-    if (month >= 5 && month <= 7) return 'winter';
-    if (month >= 8 && month <= 10) return 'spring';
-    return 'summer';
+    return seasonOf(date);
   }
 
   private async getVendorRegion(address: string): Promise<string> {
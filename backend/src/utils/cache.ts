@@ -3,6 +3,8 @@
  * Implementado para resolver problemas de timeout identificados pelo TestSprite
  */
 
+import { DomainEntity, onDomainEvent } from '@/utils/domainEvents';
+
 interface CacheItem {
   data: any;
   timestamp: number;
@@ -112,3 +114,72 @@ export function cached(ttlSeconds: number = 300) {
     };
   };
 }
+
+interface DomainCacheOptions {
+  // Gravações nessas entidades descartam o cache
+  entities: DomainEntity[];
+  // Chaves distintas guardadas ao mesmo tempo; ao atingir o limite o cache é esvaziado
+  maxEntries: number;
+  // Sem TTL, a entrada vale até a próxima invalidação
+  ttlSeconds?: number;
+}
+
+/**
+ * Cache por chave de resultados calculados, descartado pelos eventos de domínio.
+ * Leituras simultâneas da mesma chave compartilham o cálculo, e um cálculo iniciado
+ * antes de uma invalidação não entra no cache.
+ */
+export class DomainCache<T = unknown> {
+  private entries = new Map<string, { value: T; expiresAt: number }>();
+  private computing = new Map<string, Promise<T>>();
+  private generation = 0;
+  private unsubscribe: (() => void) | null = null;
+
+  constructor(private options: DomainCacheOptions) {}
+
+  start(): void {
+    if (this.unsubscribe) return;
+    this.unsubscribe = onDomainEvent(event => {
+      if (this.options.entities.includes(event.entity)) this.invalidate();
+    });
+  }
+
+  stop(): void {
+    this.unsubscribe?.();
+    this.unsubscribe = null;
+  }
+
+  invalidate(): void {
+    this.generation++;
+    this.entries.clear();
+    this.computing.clear();
+  }
+
+  async get<R extends T>(key: string, compute: () => Promise<R>): Promise<R> {
+    const cached = this.entries.get(key);
+    if (cached && cached.expiresAt > Date.now()) return cached.value as R;
+
+    let pending = this.computing.get(key) as Promise<R> | undefined;
+    if (!pending) {
+      const generation = this.generation;
+      const { maxEntries, ttlSeconds } = this.options;
+      pending = compute()
+        .then(value => {
+          if (generation === this.generation) {
+            if (this.entries.size >= maxEntries) this.entries.clear();
+            this.entries.set(key, {
+              value,
+              expiresAt: ttlSeconds === undefined ? Infinity : Date.now() + ttlSeconds * 1000,
+            });
+          }
+          return value;
+        })
+        .finally(() => {
+          if (this.computing.get(key) === pending) this.computing.delete(key);
+        });
+      this.computing.set(key, pending);
+    }
+
+    return pending;
+  }
+}
@@ -0,0 +1,111 @@
+import { Readable } from 'stream';
+import { createInterface } from 'readline';
+
+export interface CsvRow {
+  rowNumber: number; // Linha de dados (1 = primeira linha após o cabeçalho)
+  values: Record<string, string>;
+}
+
+/**
+ * Normaliza o nome de uma coluna: remove acentos, asteriscos de obrigatoriedade
+ * e espaços extras, em minúsculas. Ex: "Data da Compra*" -> "data da compra"
+ */
+export function normalizeHeader(header: string): string {
+  return header
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .replace(/\*/g, '')
+    .replace(/^\uFEFF/, '')
+    .trim()
+    .toLowerCase()
+    .replace(/\s+/g, ' ');
+}
+
+/**
+ * Detecta o separador pelo cabeçalho (vírgula ou ponto e vírgula, comum em planilhas BR)
+ */
+function detectDelimiter(headerLine: string): string {
+  const commas = (headerLine.match(/,/g) || []).length;
+  const semicolons = (headerLine.match(/;/g) || []).length;
+  return semicolons > commas ? ';' : ',';
+}
+
+/**
+ * Divide uma linha CSV respeitando aspas. Retorna `null` se a linha termina
+ * dentro de um campo entre aspas (campo com quebra de linha).
+ */
+function splitCsvLine(line: string, delimiter: string): string[] | null {
+  const fields: string[] = [];
+  let current = '';
+  let inQuotes = false;
+
+  for (let i = 0; i < line.length; i++) {
+    const char = line[i];
+
+    if (inQuotes) {
+      if (char === '"' && line[i + 1] === '"') {
+        current += '"';
+        i++;
+      } else if (char === '"') {
+        inQuotes = false;
+      } else {
+        current += char;
+      }
+    } else if (char === '"') {
+      inQuotes = true;
+    } else if (char === delimiter) {
+      fields.push(current);
+      current = '';
+    } else {
+      current += char;
+    }
+  }
+
+  if (inQuotes) {
+    return null;
+  }
+
+  fields.push(current);
+  return fields;
+}
+
+/**
+ * Lê um CSV de forma incremental, linha a linha, sem carregar o arquivo em memória.
+ * As chaves de `values` são os cabeçalhos normalizados.
+ */
+export async function* readCsvRows(input: Readable): AsyncGenerator<CsvRow> {
+  const lines = createInterface({ input, crlfDelay: Infinity });
+
+  let headers: string[] | null = null;
+  let delimiter = ',';
+  let pending = '';
+  let rowNumber = 0;
+
+  for await (const rawLine of lines) {
+    const line = pending ? `${pending}\n${rawLine}` : rawLine;
+
+    if (!headers) {
+      if (!line.trim()) continue;
+      delimiter = detectDelimiter(line);
+      headers = (splitCsvLine(line, delimiter) || []).map(normalizeHeader);
+      continue;
+    }
+
+    const fields = splitCsvLine(line, delimiter);
+    if (fields === null) {
+      pending = line;
+      continue;
+    }
+    pending = '';
+
+    if (fields.every(field => !field.trim())) continue;
+
+    rowNumber++;
+    const values: Record<string, string> = {};
+    headers.forEach((header, index) => {
+      values[header] = (fields[index] ?? '').trim();
+    });
+
+    yield { rowNumber, values };
+  }
+}
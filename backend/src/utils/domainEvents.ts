@@ -0,0 +1,108 @@
+import { AsyncLocalStorage } from 'async_hooks';
+import { EventEmitter } from 'events';
+import { Prisma } from '@prisma/client';
+
+/**
+ * Barramento de eventos de domínio em processo.
+ * Permite que projeções (ex.: snapshot do dashboard) reajam a gravações
+ * sem acoplar os serviços de escrita a elas.
+ *
+ * Os eventos saem do middleware do cliente compartilhado (`@/config/database`). Gravações
+ * feitas por SQL bruto ou por outro PrismaClient não passam por ele: quem as faz publica
+ * com `publishDomainEvent`. Dentro de uma transação os eventos ficam retidos e só são
+ * publicados depois do commit (ver `deferDomainEvents`).
+ */
+
+export type DomainEntity = 'purchase' | 'sale' | 'death' | 'expense' | 'revenue' | 'pen' | 'weighing' | 'intervention';
+
+export interface DomainEvent {
+  entity: DomainEntity;
+  action: string;
+  // IDs gravados, quando conhecidos (operações em lote como updateMany não informam)
+  ids?: string[];
+  occurredAt: Date;
+}
+
+type DomainEventListener = (event: DomainEvent) => void;
+
+const DOMAIN_EVENT = 'domain-event';
+
+const emitter = new EventEmitter();
+emitter.setMaxListeners(50);
+
+// Eventos retidos da transação em andamento (por contexto assíncrono)
+const transactionEvents = new AsyncLocalStorage<DomainEvent[]>();
+
+export function publishDomainEvent(entity: DomainEntity, action: string, ids?: string[]): void {
+  const event: DomainEvent = { entity, action, ids, occurredAt: new Date() };
+  const pending = transactionEvents.getStore();
+  if (pending) {
+    pending.push(event);
+    return;
+  }
+  emitter.emit(DOMAIN_EVENT, event);
+}
+
+/**
+ * Executa `run` (uma transação) retendo os eventos publicados dentro dela: saem juntos se
+ * ela terminar com sucesso e são descartados se falhar. Assim nenhum ouvinte relê o banco
+ * antes do commit e guarda um estado que não existe mais.
+ */
+export async function deferDomainEvents<T>(run: () => Promise<T>): Promise<T> {
+  // Transação aninhada: os eventos seguem com a externa
+  if (transactionEvents.getStore()) return run();
+
+  const pending: DomainEvent[] = [];
+  const result = await transactionEvents.run(pending, run);
+  pending.forEach(event => emitter.emit(DOMAIN_EVENT, event));
+  return result;
+}
+
+export function onDomainEvent(listener: DomainEventListener): () => void {
+  emitter.on(DOMAIN_EVENT, listener);
+  return () => emitter.off(DOMAIN_EVENT, listener);
+}
+
+// Modelos do Prisma cujas gravações geram eventos de domínio
+const MODEL_ENTITIES: Record<string, DomainEntity> = {
+  CattlePurchase: 'purchase',
+  LotPenLink: 'pen',
+  Pen: 'pen',
+  SaleRecord: 'sale',
+  DeathRecord: 'death',
+  MortalityRecord: 'death',
+  mortality_analyses: 'death',
+  WeightReading: 'weighing',
+  AnimalWeight: 'weighing',
+  HealthIntervention: 'intervention',
+  PenMovement: 'intervention',
+  Expense: 'expense',
+  Revenue: 'revenue',
+};
+
+const WRITE_ACTIONS = new Set([
+  'create',
+  'createMany',
+  'update',
+  'updateMany',
+  'upsert',
+  'delete',
+  'deleteMany',
+]);
+
+/**
+ * Middleware do Prisma que publica um evento de domínio após cada gravação
+ * bem-sucedida nos modelos acompanhados (inclui lotes e importações).
+ * Em transações, a publicação espera o commit.
+ */
+export const domainEventsMiddleware: Prisma.Middleware = async (params, next) => {
+  const result = await next(params);
+
+  const entity = params.model ? MODEL_ENTITIES[params.model] : undefined;
+  if (entity && WRITE_ACTIONS.has(params.action)) {
+    const id = result && typeof result === 'object' ? (result as { id?: unknown }).id : undefined;
+    publishDomainEvent(entity, params.action, typeof id === 'string' ? [id] : undefined);
+  }
+
+  return result;
+};
@@ -1,12 +1,35 @@
 import Joi from 'joi';
 import { AnimalType, PaymentType } from '@prisma/client';
 import { commonSchemas } from '@/middlewares/validation';
+import { CATTLE_PURCHASE_SORT_FIELDS } from '@/repositories/cattlePurchase.repository';
 
 /**
  * Validações robustas e estruturais para Cattle Purchase
  * Implementado para resolver problemas TC005 identificados pelo TestSprite MCP
  */
 
+const penAllocationsSchema = Joi.array().items(
+  Joi.object({
+    penId: Joi.string().required(),
+    quantity: Joi.number().integer().min(1).required(),
+  })
+);
+
+const receptionSchema = Joi.object({
+  receivedWeight: Joi.number().positive().optional(),
+  actualQuantity: Joi.number().integer().min(0).optional(),
+  receivedQuantity: Joi.number().integer().min(0).optional(),
+  freightDistance: Joi.number().positive().optional(),
+  freightCostPerKm: Joi.number().positive().optional(),
+  freightValue: Joi.number().positive().optional(),
+  transportCompanyId: Joi.string().optional(),
+  unloadingDate: Joi.date().iso().optional(),
+  estimatedGMD: Joi.number().positive().optional(),
+  mortalityReason: Joi.string().max(255).optional().allow('', null),
+  observations: Joi.string().max(500).optional().allow('', null),
+  penAllocations: penAllocationsSchema.optional(),
+});
+
 export const cattlePurchaseValidation = {
   create: Joi.object({
     // Campos obrigatórios
@@ -93,24 +116,49 @@ export const cattlePurchaseValidation = {
     status: Joi.string().valid('NEGOTIATING', 'CONFIRMED', 'RECEIVED', 'CONFINED', 'SOLD', 'CANCELLED').optional(),
   }),
 
-  reception: Joi.object({
-    receivedWeight: Joi.number().positive().optional(),
-    actualQuantity: Joi.number().integer().min(0).optional(),
-    receivedQuantity: Joi.number().integer().min(0).optional(),
-    freightDistance: Joi.number().positive().optional(),
-    freightCostPerKm: Joi.number().positive().optional(),
-    freightValue: Joi.number().positive().optional(),
-    transportCompanyId: Joi.string().optional(),
-    unloadingDate: Joi.date().iso().optional(),
-    estimatedGMD: Joi.number().positive().optional(),
-    mortalityReason: Joi.string().max(255).optional().allow('', null),
-    observations: Joi.string().max(500).optional().allow('', null),
-    penAllocations: Joi.array().items(
+  reception: receptionSchema,
+
+  // Recepção de vários lotes (comboio) em uma única requisição
+  batchReception: Joi.object({
+    lots: Joi.array().items(
+      receptionSchema.keys({
+        purchaseId: Joi.string().required().messages({
+          'any.required': 'ID da compra é obrigatório',
+        }),
+        receivedWeight: Joi.number().positive().required().messages({
+          'any.required': 'Peso recebido é obrigatório',
+        }),
+      }).or('actualQuantity', 'receivedQuantity')
+    ).min(1).max(200).required().messages({
+      'any.required': 'Lista de lotes é obrigatória',
+      'array.min': 'Informe ao menos um lote',
+      'array.max': 'Máximo de 200 lotes por requisição',
+    }),
+  }),
+
+  // Confinamento de vários lotes recepcionados em uma única requisição
+  batchConfined: Joi.object({
+    lots: Joi.array().items(
       Joi.object({
-        penId: Joi.string().required(),
-        quantity: Joi.number().integer().min(1).required(),
+        purchaseId: Joi.string().required(),
+        penAllocations: penAllocationsSchema.min(1).required().messages({
+          'any.required': 'Alocações de currais são obrigatórias',
+          'array.min': 'Alocações de currais são obrigatórias',
+        }),
+        notes: Joi.string().max(500).optional().allow('', null),
       })
-    ).optional(),
+    ).min(1).max(200).required().messages({
+      'any.required': 'Lista de lotes é obrigatória',
+      'array.min': 'Informe ao menos um lote',
+      'array.max': 'Máximo de 200 lotes por requisição',
+    }),
+  }),
+
+  syncExpenses: Joi.object({
+    purchaseIds: Joi.array().items(Joi.string()).min(1).max(500).optional().messages({
+      'array.max': 'Máximo de 500 compras por requisição',
+    }),
+    batchSize: Joi.number().integer().min(1).max(500).optional(),
   }),
 
   filters: Joi.object({
@@ -120,9 +168,12 @@ export const cattlePurchaseValidation = {
     paymentType: Joi.string().valid(...Object.values(PaymentType)).optional(),
     startDate: Joi.date().iso().optional(),
     endDate: Joi.date().iso().optional(),
+    search: Joi.string().allow('').optional(),
     page: Joi.number().integer().min(1).optional(),
     limit: Joi.number().integer().min(1).max(10000).optional(),
-    sortBy: Joi.string().optional(),
+    sortBy: Joi.string().valid(...CATTLE_PURCHASE_SORT_FIELDS).optional(),
     sortOrder: Joi.string().valid('asc', 'desc').optional(),
+    cursor: Joi.string().max(1024).optional(),
+    count: Joi.string().valid('exact', 'estimated', 'none').optional(),
   }),
 };
@@ -0,0 +1,39 @@
+import Joi from 'joi';
+import { DeathType } from '@prisma/client';
+
+export const deathRecordValidation = {
+  create: Joi.object({
+    purchaseId: Joi.string().required().messages({
+      'any.required': 'Lote é obrigatório',
+    }),
+    penId: Joi.string().required().messages({
+      'any.required': 'Curral é obrigatório',
+    }),
+    quantity: Joi.number().integer().positive().required().messages({
+      'number.positive': 'Quantidade deve ser positiva',
+      'any.required': 'Quantidade é obrigatória',
+    }),
+    deathDate: Joi.date().iso().optional(),
+    deathType: Joi.string()
+      .valid(...Object.values(DeathType))
+      .required()
+      .messages({
+        'any.required': 'Tipo de morte é obrigatório',
+        'any.only': 'Tipo de morte inválido',
+      }),
+    cause: Joi.string().max(500).optional(),
+    veterinaryNotes: Joi.string().max(1000).optional(),
+    estimatedLoss: Joi.number().min(0).precision(2).optional(),
+  }),
+
+  update: Joi.object({
+    quantity: Joi.number().integer().positive().optional(),
+    deathDate: Joi.date().iso().optional(),
+    deathType: Joi.string()
+      .valid(...Object.values(DeathType))
+      .optional(),
+    cause: Joi.string().max(500).optional(),
+    veterinaryNotes: Joi.string().max(1000).optional(),
+    estimatedLoss: Joi.number().min(0).precision(2).optional(),
+  }),
+};
@@ -1,5 +1,6 @@
 import Joi from 'joi';
 import { commonSchemas } from '@/middlewares/validation';
+import { EXPENSE_SORT_FIELDS } from '@/repositories/expense.repository';
 
 export const expenseValidation = {
   create: Joi.object({
@@ -66,8 +67,10 @@ export const expenseValidation = {
     search: Joi.string().optional(),
     page: Joi.number().integer().min(1).optional(),
     limit: Joi.number().integer().min(1).max(10000).optional(),
-    sortBy: Joi.string().optional(),
+    sortBy: Joi.string().valid(...EXPENSE_SORT_FIELDS).optional(),
     sortOrder: Joi.string().valid('asc', 'desc').optional(),
+    cursor: Joi.string().max(1024).optional(),
+    count: Joi.string().valid('exact', 'estimated', 'none').optional(),
   }),
 
   dateRange: Joi.object({
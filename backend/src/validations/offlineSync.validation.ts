@@ -0,0 +1,31 @@
+import Joi from 'joi';
+
+// Limite por requisição; o frontend envia a fila em blocos menores
+export const MAX_OPERATIONS_PER_REQUEST = 100;
+
+export const offlineSyncValidation = {
+  operations: Joi.object({
+    operations: Joi.array()
+      .items(
+        Joi.object({
+          clientId: Joi.string().required(),
+          type: Joi.string().valid('create', 'update', 'delete').required(),
+          entity: Joi.string().required(),
+          id: Joi.string().when('type', {
+            is: Joi.valid('update', 'delete'),
+            then: Joi.required(),
+            otherwise: Joi.optional(),
+          }),
+          data: Joi.object().unknown(true).default({}),
+          lastUpdatedAt: Joi.date().iso().optional(),
+          force: Joi.boolean().default(false),
+        })
+      )
+      .min(1)
+      .max(MAX_OPERATIONS_PER_REQUEST)
+      .required()
+      .messages({
+        'array.max': `Envie no máximo ${MAX_OPERATIONS_PER_REQUEST} operações por requisição`,
+      }),
+  }),
+};
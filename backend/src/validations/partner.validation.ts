@@ -46,5 +46,7 @@ export const partnerValidation = {
     limit: Joi.number().integer().min(1).max(10000).optional(),
     sortBy: Joi.string().optional(),
     sortOrder: Joi.string().valid('asc', 'desc').optional(),
+    cursor: Joi.string().max(1024).optional(),
+    count: Joi.string().valid('exact', 'estimated', 'none').optional(),
   }),
 }; 
\ No newline at end of file
@@ -54,6 +54,8 @@ export const payerAccountValidation = {
     limit: Joi.number().integer().min(1).max(10000).optional(),
     sortBy: Joi.string().optional(),
     sortOrder: Joi.string().valid('asc', 'desc').optional(),
+    cursor: Joi.string().max(1024).optional(),
+    count: Joi.string().valid('exact', 'estimated', 'none').optional(),
   }),
 
   transactions: Joi.object({
@@ -63,5 +65,11 @@ export const payerAccountValidation = {
       then: Joi.date().iso().min(Joi.ref('startDate')),
       otherwise: Joi.optional(),
     }),
+    cursor: Joi.string().max(1024).optional(),
+    limit: Joi.number().integer().min(1).max(500).optional(),
+  }),
+
+  balanceAt: Joi.object({
+    date: Joi.date().iso().optional(),
   }),
 }; 
\ No newline at end of file
@@ -0,0 +1,105 @@
+#!/usr/bin/env node
+
+/**
+ * Verifica o tamanho (gzip) de cada chunk JS do build contra bundle-budget.json
+ *
+ * Uso: npm run build && npm run bundle:budget
+ *
+ * O relatório é gravado em testsprite_tests/tmp/bundle_report.json para que os testes
+ * de interface (TC019) leiam o orçamento junto com o tempo de carregamento medido.
+ * Sai com código 1 se algum chunk ou o JS inicial estourar o orçamento.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const rootDir = path.join(__dirname, '..');
+const distDir = path.join(rootDir, 'dist');
+const assetsDir = path.join(distDir, 'assets');
+const budgetPath = path.join(rootDir, 'bundle-budget.json');
+const reportPath = path.join(rootDir, 'testsprite_tests', 'tmp', 'bundle_report.json');
+
+const toKb = (bytes) => Math.round((bytes / 1024) * 10) / 10;
+
+// "vendor-react-a1b2c3d4.js" -> "vendor-react"
+const chunkName = (file) => path.basename(file, '.js').replace(/-[\w-]{8}$/, '');
+
+// Chunks baixados antes da primeira pintura: o script de entrada e os modulepreload
+function initialChunks(html) {
+  const files = new Set();
+  const pattern = /<(?:script[^>]+src|link[^>]+rel="modulepreload"[^>]+href)="\/?(assets\/[^"]+\.js)"/g;
+  let match;
+  while ((match = pattern.exec(html)) !== null) {
+    files.add(path.basename(match[1]));
+  }
+  return files;
+}
+
+function main() {
+  if (!fs.existsSync(assetsDir)) {
+    console.error('❌ dist/assets não encontrado. Rode "npm run build" antes.');
+    process.exit(1);
+  }
+
+  const budget = JSON.parse(fs.readFileSync(budgetPath, 'utf8'));
+  const html = fs.readFileSync(path.join(distDir, 'index.html'), 'utf8');
+  const initial = initialChunks(html);
+
+  const chunks = fs.readdirSync(assetsDir)
+    .filter((file) => file.endsWith('.js'))
+    .map((file) => {
+      const content = fs.readFileSync(path.join(assetsDir, file));
+      const name = chunkName(file);
+      const limitKb = budget.chunks[name] ?? budget.defaultChunk;
+      const gzipKb = toKb(zlib.gzipSync(content, { level: 9 }).length);
+
+      return {
+        file,
+        name,
+        initial: initial.has(file),
+        sizeKb: toKb(content.length),
+        gzipKb,
+        limitKb,
+        withinBudget: gzipKb <= limitKb,
+      };
+    })
+    .sort((a, b) => b.gzipKb - a.gzipKb);
+
+  const initialGzipKb = toKb(
+    chunks.filter((chunk) => chunk.initial).reduce((sum, chunk) => sum + chunk.gzipKb * 1024, 0)
+  );
+  const overBudget = chunks.filter((chunk) => !chunk.withinBudget);
+  const initialWithinBudget = initialGzipKb <= budget.initialJs;
+
+  const report = {
+    generatedAt: new Date().toISOString(),
+    unit: budget.unit,
+    initialJs: {
+      files: chunks.filter((chunk) => chunk.initial).map((chunk) => chunk.file),
+      gzipKb: initialGzipKb,
+      limitKb: budget.initialJs,
+      withinBudget: initialWithinBudget,
+    },
+    chunks,
+    withinBudget: initialWithinBudget && overBudget.length === 0,
+  };
+
+  fs.mkdirSync(path.dirname(reportPath), { recursive: true });
+  fs.writeFileSync(reportPath, JSON.stringify(report, null, 2));
+
+  console.log('📦 Orçamento de bundle (KB gzip)\n');
+  for (const chunk of chunks) {
+    const status = chunk.withinBudget ? '✅' : '❌';
+    const marker = chunk.initial ? ' (inicial)' : '';
+    console.log(`${status} ${chunk.file}${marker}: ${chunk.gzipKb} / ${chunk.limitKb}`);
+  }
+  console.log(`\n${initialWithinBudget ? '✅' : '❌'} JS inicial: ${initialGzipKb} / ${budget.initialJs}`);
+  console.log(`📝 Relatório: ${path.relative(rootDir, reportPath)}`);
+
+  if (!report.withinBudget) {
+    process.exit(1);
+  }
+}
+
+main();
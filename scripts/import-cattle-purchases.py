@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Importa compras de gado a partir de um CSV usando POST /api/v1/cattle-purchases/import.
+
+O arquivo é enviado em streaming (sem carregar tudo em memória) e o servidor valida,
+resolve fornecedores/contas pagadoras e grava em lotes. O progresso fica salvo em
+<arquivo>.import-state.json, então uma importação interrompida pode ser retomada com --resume.
+Erros por linha são gravados em <arquivo>.errors.csv.
+
+Uso:
+    python3 scripts/import-cattle-purchases.py cattle-purchases-import.csv \\
+        --email admin@boigordo.com --password ... --payer-account-id <id>
+
+    # Simular sem gravar
+    python3 scripts/import-cattle-purchases.py compras.csv --token $TOKEN --dry-run
+
+    # Retomar uma importação interrompida
+    python3 scripts/import-cattle-purchases.py compras.csv --token $TOKEN --resume
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+import requests
+
+DEFAULT_API_URL = os.environ.get("BOVICONTROL_API_URL", "http://localhost:3001/api/v1")
+CHUNK_SIZE = 64 * 1024
+TIMEOUT = 600
+
+
+def login(api_url, email, password):
+    response = requests.post(
+        f"{api_url}/auth/login",
+        json={"email": email, "password": password},
+        timeout=30,
+    )
+    response.raise_for_status()
+    token = response.json().get("token")
+    if not token:
+        raise RuntimeError("Login não retornou token")
+    return token
+
+
+def stream_file(path):
+    """Gera o arquivo em blocos para envio com Transfer-Encoding: chunked"""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def load_state(state_path):
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state_path, state):
+    with open(state_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+def write_errors(errors_path, errors):
+    with open(errors_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["row", "field", "message", "value"])
+        writer.writeheader()
+        for error in errors:
+            writer.writerow({key: error.get(key, "") for key in writer.fieldnames})
+
+
+def run_import(args):
+    token = args.token or os.environ.get("BOVICONTROL_TOKEN")
+    if not token:
+        if not (args.email and args.password):
+            raise SystemExit("Informe --token (ou BOVICONTROL_TOKEN) ou --email e --password")
+        token = login(args.api_url, args.email, args.password)
+
+    state_path = f"{args.csv_file}.import-state.json"
+    errors_path = args.errors_out or f"{args.csv_file}.errors.csv"
+
+    state = load_state(state_path) if args.resume else {}
+    resume_from_row = state.get("lastCommittedRow", 0)
+    if resume_from_row:
+        print(f"↪️  Retomando a partir da linha {resume_from_row + 1}")
+
+    params = {
+        "resumeFromRow": resume_from_row,
+        "batchSize": args.batch_size,
+        "dryRun": str(args.dry_run).lower(),
+        "createMissingPartners": str(args.create_missing_partners).lower(),
+    }
+    if args.payer_account_id:
+        params["payerAccountId"] = args.payer_account_id
+
+    response = requests.post(
+        f"{args.api_url}/cattle-purchases/import",
+        params=params,
+        data=stream_file(args.csv_file),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "text/csv",
+        },
+        timeout=TIMEOUT,
+    )
+    response.raise_for_status()
+    report = response.json()["data"]
+
+    if not args.dry_run:
+        save_state(state_path, {
+            "file": os.path.abspath(args.csv_file),
+            "lastCommittedRow": report["lastCommittedRow"],
+            "aborted": report["aborted"],
+        })
+
+    if report["errors"]:
+        write_errors(errors_path, report["errors"])
+
+    print(f"📄 Linhas lidas:        {report['totalRows']}")
+    print(f"✅ Importadas:          {report['imported']}{' (simulação)' if report['dryRun'] else ''}")
+    print(f"⏭️  Já processadas:      {report['skipped']}")
+    print(f"♻️  Duplicadas:          {report['duplicates']}")
+    print(f"❌ Com erro:            {report['failed']}")
+    print(f"🤝 Parceiros criados:   {report['partnersCreated']}")
+    print(f"⏱️  Duração:             {report['durationMs']} ms")
+    if report["errors"]:
+        print(f"📝 Relatório de erros:  {errors_path}")
+    if report["aborted"]:
+        print(f"⚠️  Importação interrompida: {report.get('abortReason')}")
+        print("   Execute novamente com --resume para continuar")
+
+    return 1 if report["aborted"] or report["failed"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importação em lote de compras de gado (CSV)")
+    parser.add_argument("csv_file", help="Arquivo CSV no formato de cattle-purchases-import.csv")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL)
+    parser.add_argument("--token", help="Token JWT (ou variável BOVICONTROL_TOKEN)")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--payer-account-id", help="Conta pagadora padrão quando o CSV não tiver a coluna 'Conta Pagadora'")
+    parser.add_argument("--batch-size", type=int, default=250)
+    parser.add_argument("--dry-run", action="store_true", help="Valida sem gravar")
+    parser.add_argument("--create-missing-partners", action="store_true", help="Cria fornecedores/transportadoras não cadastrados")
+    parser.add_argument("--resume", action="store_true", help="Continua a partir da última linha gravada")
+    parser.add_argument("--errors-out", help="Caminho do CSV de erros")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv_file):
+        raise SystemExit(f"Arquivo não encontrado: {args.csv_file}")
+
+    sys.exit(run_import(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Registra uma sessão de pesagem a partir do arquivo exportado pela balança usando
+POST /api/v1/interventions/weight-sessions.
+
+O arquivo (CSV ou largura fixa) é lido linha a linha e validado antes do envio. O servidor
+agrega os pesos por lote em uma única passada, grava os pesos individuais em lotes e
+atualiza o peso médio/atual e o GMD de cada lote uma vez por sessão.
+Linhas rejeitadas (aqui ou no servidor) são gravadas em <arquivo>.errors.csv.
+
+Colunas reconhecidas no CSV (cabeçalho, sem diferenciar maiúsculas):
+    brinco/tag/animal   identificação do animal (opcional)
+    peso/weight/kg      peso vivo em kg (aceita vírgula decimal)
+    lote/lot/lotCode    código do lote (opcional com --lot)
+
+Uso:
+    python3 scripts/import-weighing-session.py pesagem.csv --lot LOT-2025-014 \\
+        --date 2025-10-20 --email admin@boigordo.com --password ...
+
+    # Balança com exportação em largura fixa (colunas início:fim, base 0)
+    python3 scripts/import-weighing-session.py balanca.txt --format fixed \\
+        --columns tag=0:12,weight=12:20,lot=20:34 --token $TOKEN
+
+    # Validar sem gravar
+    python3 scripts/import-weighing-session.py pesagem.csv --lot LOT-2025-014 --token $TOKEN --dry-run
+"""
+import argparse
+import csv
+import os
+import sys
+from datetime import date
+
+import requests
+
+DEFAULT_API_URL = os.environ.get("BOVICONTROL_API_URL", "http://localhost:3001/api/v1")
+TIMEOUT = 300
+
+# Mesma faixa validada pelo servidor (weighingSession.service.ts)
+MIN_ANIMAL_WEIGHT = 30
+MAX_ANIMAL_WEIGHT = 1500
+MAX_SESSION_ENTRIES = 10000
+
+COLUMN_ALIASES = {
+    "tag": {"brinco", "tag", "animal", "animaltag", "id", "identificacao", "identificação"},
+    "weight": {"peso", "weight", "kg", "peso (kg)", "peso_kg"},
+    "lot": {"lote", "lot", "lotcode", "codigo do lote", "código do lote"},
+}
+
+
+def login(api_url, email, password):
+    response = requests.post(
+        f"{api_url}/auth/login",
+        json={"email": email, "password": password},
+        timeout=30,
+    )
+    response.raise_for_status()
+    token = response.json().get("token")
+    if not token:
+        raise RuntimeError("Login não retornou token")
+    return token
+
+
+def parse_weight(value):
+    text = (value or "").strip().lower().replace("kg", "").strip()
+    if "," in text:
+        text = text.replace(".", "").replace(",", ".")
+    return float(text)
+
+
+def read_csv(path, encoding):
+    """Gera (linha, campos) de um CSV, detectando o separador (vírgula, ponto e vírgula ou tab)"""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.DictReader(f, dialect=dialect)
+
+        mapping = {}
+        for header in reader.fieldnames or []:
+            key = header.strip().lower()
+            for field, aliases in COLUMN_ALIASES.items():
+                if key in aliases:
+                    mapping[field] = header
+        if "weight" not in mapping:
+            raise SystemExit(f"Coluna de peso não encontrada no cabeçalho: {reader.fieldnames}")
+
+        for row in reader:
+            yield reader.line_num, {field: row.get(header, "") for field, header in mapping.items()}
+
+
+def parse_columns(spec):
+    columns = {}
+    for part in spec.split(","):
+        name, _, span = part.partition("=")
+        start, _, end = span.partition(":")
+        columns[name.strip()] = (int(start), int(end))
+    if "weight" not in columns:
+        raise SystemExit("--columns precisa da coluna weight (ex.: tag=0:12,weight=12:20)")
+    return columns
+
+
+def read_fixed(path, encoding, columns, skip):
+    """Gera (linha, campos) de um arquivo de largura fixa"""
+    with open(path, "r", encoding=encoding) as f:
+        for line_num, line in enumerate(f, start=1):
+            if line_num <= skip or not line.strip():
+                continue
+            yield line_num, {name: line[start:end].strip() for name, (start, end) in columns.items()}
+
+
+def build_entries(records, default_lot):
+    entries, errors = [], []
+    for line_num, fields in records:
+        lot = (fields.get("lot") or "").strip() or default_lot
+        if not lot:
+            errors.append({"row": line_num, "field": "lot", "message": "Lote não informado", "value": ""})
+            continue
+        try:
+            weight = parse_weight(fields.get("weight"))
+        except ValueError:
+            errors.append({"row": line_num, "field": "weight", "message": "Peso inválido", "value": fields.get("weight")})
+            continue
+        if not MIN_ANIMAL_WEIGHT <= weight <= MAX_ANIMAL_WEIGHT:
+            errors.append({
+                "row": line_num,
+                "field": "weight",
+                "message": f"Peso fora da faixa ({MIN_ANIMAL_WEIGHT}-{MAX_ANIMAL_WEIGHT} kg)",
+                "value": weight,
+            })
+            continue
+
+        entry = {"row": line_num, "lotCode": lot, "weight": weight}
+        if fields.get("tag"):
+            entry["animalTag"] = fields["tag"].strip()
+        entries.append(entry)
+    return entries, errors
+
+
+def write_errors(errors_path, errors):
+    with open(errors_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["row", "field", "message", "value"])
+        writer.writeheader()
+        for error in sorted(errors, key=lambda e: e.get("row", 0)):
+            writer.writerow({key: error.get(key, "") for key in writer.fieldnames})
+
+
+def run_session(args):
+    if args.format == "fixed":
+        if not args.columns:
+            raise SystemExit("Informe --columns para arquivos de largura fixa")
+        records = read_fixed(args.file, args.encoding, parse_columns(args.columns), args.skip_lines)
+    else:
+        records = read_csv(args.file, args.encoding)
+
+    entries, errors = build_entries(records, args.lot)
+    if len(entries) > MAX_SESSION_ENTRIES:
+        raise SystemExit(f"Mais de {MAX_SESSION_ENTRIES} pesos no arquivo; divida a sessão")
+    if not entries:
+        write_errors(args.errors_out or f"{args.file}.errors.csv", errors)
+        raise SystemExit("Nenhum peso válido no arquivo")
+
+    token = args.token or os.environ.get("BOVICONTROL_TOKEN")
+    if not token:
+        if not (args.email and args.password):
+            raise SystemExit("Informe --token (ou BOVICONTROL_TOKEN) ou --email e --password")
+        token = login(args.api_url, args.email, args.password)
+
+    response = requests.post(
+        f"{args.api_url}/interventions/weight-sessions",
+        json={
+            "readingDate": args.date,
+            "entries": entries,
+            "notes": args.notes,
+            "dryRun": args.dry_run,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=TIMEOUT,
+    )
+    response.raise_for_status()
+    report = response.json()["data"]
+
+    errors.extend(report["errors"])
+    errors_path = args.errors_out or f"{args.file}.errors.csv"
+    if errors:
+        write_errors(errors_path, errors)
+
+    print(f"📄 Linhas lidas:   {len(entries) + len(errors) - len(report['errors'])}")
+    print(f"✅ Pesos aceitos:  {report['accepted']}{' (simulação)' if report['dryRun'] else ''}")
+    print(f"❌ Com erro:       {len(errors)}")
+    print(f"⏱️  Duração:        {report['durationMs']} ms")
+    for lot in report["lots"]:
+        gmd = f"{lot['averageDailyGain']:.3f} kg/dia" if lot["averageDailyGain"] is not None else "sem referência"
+        print(
+            f"   {lot['lotCode']:<16} {lot['animalCount']:>5} cab  média {lot['averageWeight']:>7.1f} kg  "
+            f"({lot['minWeight']:.0f}-{lot['maxWeight']:.0f})  GMD {gmd}"
+        )
+    if errors:
+        print(f"📝 Relatório de erros: {errors_path}")
+
+    return 1 if errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sessão de pesagem a partir do arquivo da balança")
+    parser.add_argument("file", help="Arquivo exportado pela balança (CSV ou largura fixa)")
+    parser.add_argument("--format", choices=["csv", "fixed"], default="csv")
+    parser.add_argument("--columns", help="Colunas da largura fixa: tag=0:12,weight=12:20,lot=20:34")
+    parser.add_argument("--skip-lines", type=int, default=0, help="Linhas de cabeçalho a ignorar (largura fixa)")
+    parser.add_argument("--encoding", default="utf-8-sig")
+    parser.add_argument("--lot", help="Código do lote quando o arquivo não tiver a coluna de lote")
+    parser.add_argument("--date", default=date.today().isoformat(), help="Data da pesagem (AAAA-MM-DD)")
+    parser.add_argument("--notes")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL)
+    parser.add_argument("--token", help="Token JWT (ou variável BOVICONTROL_TOKEN)")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--dry-run", action="store_true", help="Valida e calcula o GMD sem gravar")
+    parser.add_argument("--errors-out", help="Caminho do CSV de erros")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        raise SystemExit(f"Arquivo não encontrado: {args.file}")
+
+    sys.exit(run_session(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Consultor de índices guiado pela carga dos testes de API (testsprite_tests).
+
+Fluxo:
+  1. capture  - repete as listagens exercitadas pela suíte Python (parceiros, compras,
+                despesas, receitas, fluxo de caixa...) medindo a latência HTTP e, em
+                seguida, lê as consultas mais caras de pg_stat_statements.
+  2. propose  - gera o plano genérico (EXPLAIN) de cada consulta capturada, procura
+                Seq Scans com filtro/ordenação e propõe índices compostos ou parciais
+                (pulando os que já existem) em uma migration do Prisma.
+  3. compare  - depois de aplicar a migration e rodar `capture` de novo, compara a
+                latência por endpoint antes/depois.
+
+Requer a extensão pg_stat_statements no banco (shared_preload_libraries +
+CREATE EXTENSION pg_stat_statements) e as bibliotecas requests e psycopg2.
+
+Uso:
+    python3 scripts/index-advisor.py capture --label antes --email admin@boigordo.com --password ...
+    python3 scripts/index-advisor.py propose --label antes --name list_indexes
+    (cd backend && npx prisma migrate deploy)
+    python3 scripts/index-advisor.py capture --label depois --email admin@boigordo.com --password ...
+    python3 scripts/index-advisor.py compare antes depois --max-regression 10
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import requests
+
+DEFAULT_API_URL = os.environ.get("BOVICONTROL_API_URL", "http://localhost:3001/api/v1")
+DATABASE_URL = os.environ.get("DATABASE_URL", "")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_DIR = os.path.join(ROOT, "testsprite_tests", "tmp", "index_advisor")
+MIGRATIONS_DIR = os.path.join(ROOT, "backend", "prisma", "migrations")
+TIMEOUT = 60
+
+# Listagens e filtros usados pela suíte Python (TC002, TC004, TC006, TC008, TC009...)
+# mais as páginas profundas que motivaram a paginação por cursor
+WORKLOAD = [
+    ("partners", "/partners", {"page": 1, "limit": 10}),
+    ("partners_vendor", "/partners", {"type": "VENDOR", "page": 1, "limit": 10}),
+    ("cattle_purchases", "/cattle-purchases", {"page": 1, "limit": 50}),
+    ("cattle_purchases_status", "/cattle-purchases", {"status": "CONFINED", "sortBy": "purchaseDate", "sortOrder": "desc"}),
+    ("expenses", "/expenses", {"page": 1, "limit": 50}),
+    ("expenses_pending", "/expenses", {"isPaid": "false", "sortBy": "dueDate", "sortOrder": "asc", "limit": 50}),
+    ("expenses_deep_page", "/expenses", {"page": 40, "limit": 50, "count": "estimated"}),
+    ("revenues", "/revenues", {"page": 1, "limit": 50}),
+    ("revenues_pending", "/revenues", {"isReceived": "false", "sortBy": "dueDate", "sortOrder": "asc", "limit": 50}),
+    ("cash_flows", "/cash-flows", {}),
+    ("cash_flows_expense_pending", "/cash-flows", {"type": "EXPENSE", "status": "PENDING"}),
+    ("pens", "/pens", {}),
+    ("sale_records", "/sale-records", {"page": 1, "limit": 50}),
+    ("death_records", "/death-records", {}),
+    ("interventions", "/interventions/history", {}),
+    ("stats", "/stats", {}),
+]
+
+# Só consultas que realmente pesam entram na análise
+MIN_TOTAL_MS = 5.0
+MIN_SCAN_ROWS = 1000
+
+
+def login(api_url, email, password):
+    response = requests.post(
+        f"{api_url}/auth/login",
+        json={"email": email, "password": password},
+        timeout=30,
+    )
+    response.raise_for_status()
+    token = response.json().get("token")
+    if not token:
+        raise RuntimeError("Login não retornou token")
+    return token
+
+
+def connect():
+    if not DATABASE_URL:
+        raise RuntimeError("Defina DATABASE_URL apontando para o banco da API")
+    try:
+        import psycopg2
+    except ImportError:
+        raise RuntimeError("psycopg2 não instalado (pip install psycopg2-binary)")
+    # O Prisma aceita ?schema= na URL, o libpq não
+    return psycopg2.connect(re.sub(r"[?&]schema=[^&]*", "", DATABASE_URL))
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def replay_workload(api_url, token, iterations):
+    """Executa cada requisição `iterations` vezes (após um aquecimento) e resume a latência"""
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    results = {}
+
+    for name, path, params in WORKLOAD:
+        timings = []
+        status = None
+        for attempt in range(iterations + 1):
+            start = time.perf_counter()
+            response = session.get(f"{api_url}{path}", params=params, timeout=TIMEOUT)
+            elapsed = (time.perf_counter() - start) * 1000
+            status = response.status_code
+            if attempt > 0:
+                timings.append(elapsed)
+
+        results[name] = {
+            "path": path,
+            "params": params,
+            "status": status,
+            "p50": round(percentile(timings, 0.5), 1),
+            "p95": round(percentile(timings, 0.95), 1),
+            "mean": round(statistics.mean(timings), 1),
+        }
+        print(f"  {name:<28} {status}  p50 {results[name]['p50']:>7} ms  p95 {results[name]['p95']:>7} ms")
+
+    return results
+
+
+def read_statements(conn, limit):
+    with conn.cursor() as cur:
+        cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'pg_stat_statements'")
+        if not cur.fetchone():
+            raise RuntimeError("Extensão pg_stat_statements não instalada no banco")
+
+        cur.execute(
+            """
+            SELECT query, calls, total_exec_time, mean_exec_time, rows
+            FROM pg_stat_statements
+            WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+              AND query ILIKE 'SELECT%%'
+              AND query NOT ILIKE '%%pg_stat_statements%%'
+              AND total_exec_time >= %s
+            ORDER BY total_exec_time DESC
+            LIMIT %s
+            """,
+            (MIN_TOTAL_MS, limit),
+        )
+        return [
+            {
+                "query": query,
+                "calls": calls,
+                "totalMs": round(total, 1),
+                "meanMs": round(mean, 2),
+                "rows": rows,
+            }
+            for query, calls, total, mean, rows in cur.fetchall()
+        ]
+
+
+def capture(args):
+    token = args.token or login(args.api_url, args.email, args.password)
+    conn = connect()
+    conn.autocommit = True
+
+    if not args.keep_stats:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_stat_statements_reset()")
+
+    print(f"Repetindo a carga ({args.iterations} iterações por endpoint)...")
+    endpoints = replay_workload(args.api_url, token, args.iterations)
+    statements = read_statements(conn, args.top)
+    conn.close()
+
+    report = {
+        "label": args.label,
+        "capturedAt": datetime.now().isoformat(timespec="seconds"),
+        "iterations": args.iterations,
+        "endpoints": endpoints,
+        "statements": statements,
+    }
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    path = os.path.join(REPORT_DIR, f"{args.label}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"{len(statements)} consultas capturadas -> {path}")
+
+
+def load_report(label):
+    path = os.path.join(REPORT_DIR, f"{label}.json")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def generic_plan(cur, query):
+    """
+    Plano genérico de uma consulta normalizada ($1, $2...): PREPARE com os parâmetros
+    inferidos e EXECUTE com NULLs sob plan_cache_mode=force_generic_plan
+    """
+    params = {int(n) for n in re.findall(r"\$(\d+)", query)}
+    args = ", ".join(["NULL"] * max(params)) if params else ""
+    cur.execute("SAVEPOINT advisor")
+    try:
+        cur.execute(f"PREPARE advisor_q AS {query}")
+        cur.execute(f"EXPLAIN (FORMAT JSON) EXECUTE advisor_q{f'({args})' if args else ''}")
+        plan = cur.fetchone()[0][0]["Plan"]
+        cur.execute("DEALLOCATE advisor_q")
+        cur.execute("RELEASE SAVEPOINT advisor")
+        return plan
+    except Exception as error:
+        cur.execute("ROLLBACK TO SAVEPOINT advisor")
+        print(f"  ! plano indisponível: {str(error).splitlines()[0]}")
+        return None
+
+
+def walk(plan, parent=None):
+    yield plan, parent
+    for child in plan.get("Plans", []):
+        yield from walk(child, plan)
+
+
+PREDICATE = re.compile(
+    r'(?:\w+\.)?"?([A-Za-z_][A-Za-z0-9_]*)"?\s*(=|<>|>=|<=|<|>|~~\*?|IS NOT NULL|IS NULL)\s*([^\s)]*)'
+)
+SORT_KEY = re.compile(r'(?:\w+\.)?"?([A-Za-z_][A-Za-z0-9_]*)"?(\s+DESC)?')
+
+
+def candidates_from_plan(plan):
+    """
+    Seq Scans filtrados viram candidatos: colunas de igualdade primeiro, depois as de
+    intervalo e por fim a ordenação do nó Sort acima (o que cobre a paginação por
+    cursor). Igualdade com constante booleana vira índice parcial.
+    """
+    found = []
+    for node, parent in walk(plan):
+        if node.get("Node Type") != "Seq Scan" or node.get("Plan Rows", 0) * 10 < MIN_SCAN_ROWS:
+            continue
+        table = node.get("Relation Name")
+        condition = node.get("Filter", "")
+        if not table or not condition:
+            continue
+
+        equality, ranges, partial = [], [], []
+        for column, operator, operand in PREDICATE.findall(condition):
+            if operator == "=" and operand.lower() in ("true", "false"):
+                partial.append(f'"{column}" = {operand.lower()}')
+            elif operator == "=":
+                equality.append(column)
+            elif operator in ("<", ">", "<=", ">="):
+                ranges.append(column)
+
+        sort = []
+        if parent and parent.get("Node Type") in ("Sort", "Incremental Sort"):
+            for key in parent.get("Sort Key", []):
+                match = SORT_KEY.match(key.strip())
+                if match:
+                    sort.append((match.group(1), bool(match.group(2))))
+
+        columns = []
+        for column in equality + ranges:
+            if column not in columns:
+                columns.append(column)
+        ordered = [(column, False) for column in columns]
+        for column, desc in sort:
+            if column not in columns:
+                ordered.append((column, desc))
+                columns.append(column)
+
+        if ordered:
+            found.append({
+                "table": table,
+                "columns": ordered,
+                "where": " AND ".join(sorted(set(partial))) or None,
+            })
+    return found
+
+
+def existing_index_prefixes(cur, table):
+    cur.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s", (table,))
+    prefixes = []
+    for (definition,) in cur.fetchall():
+        match = re.search(r"\((.*?)\)(?:\s+WHERE\s+(.*))?$", definition)
+        if not match:
+            continue
+        columns = [part.strip().split()[0].strip('"') for part in match.group(1).split(",")]
+        prefixes.append((columns, match.group(2)))
+    return prefixes
+
+
+def is_covered(candidate, prefixes):
+    wanted = [column for column, _ in candidate["columns"]]
+    for columns, where in prefixes:
+        if columns[: len(wanted)] == wanted and (where is None or candidate["where"]):
+            return True
+    return False
+
+
+def index_sql(candidate):
+    table = candidate["table"]
+    names = [column for column, _ in candidate["columns"]]
+    suffix = "_partial_idx" if candidate["where"] else "_idx"
+    name = f"{table}_{'_'.join(names)}{suffix}"[:63]
+    columns = ", ".join(f'"{column}"{" DESC" if desc else ""}' for column, desc in candidate["columns"])
+    where = f" WHERE {candidate['where']}" if candidate["where"] else ""
+    return name, f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}"({columns}){where};'
+
+
+def propose(args):
+    report = load_report(args.label)
+    conn = connect()
+    proposals = {}
+
+    with conn.cursor() as cur:
+        cur.execute("SET plan_cache_mode = force_generic_plan")
+        for statement in report["statements"]:
+            print(f"- {statement['meanMs']} ms x {statement['calls']}: {statement['query'][:90]}...")
+            plan = generic_plan(cur, statement["query"])
+            if not plan:
+                continue
+            for candidate in candidates_from_plan(plan):
+                if is_covered(candidate, existing_index_prefixes(cur, candidate["table"])):
+                    continue
+                name, sql = index_sql(candidate)
+                entry = proposals.setdefault(name, {"sql": sql, "totalMs": 0.0, "queries": 0})
+                entry["totalMs"] += statement["totalMs"]
+                entry["queries"] += 1
+        conn.rollback()
+    conn.close()
+
+    if not proposals:
+        print("Nenhum índice novo sugerido para esta carga.")
+        return
+
+    ranked = sorted(proposals.items(), key=lambda item: item[1]["totalMs"], reverse=True)
+    lines = [
+        f"-- Gerado por scripts/index-advisor.py a partir da captura '{args.label}'",
+        "-- Ordenado pelo tempo total das consultas que cada índice atende",
+        "",
+    ]
+    for name, entry in ranked:
+        lines.append(f"-- {entry['queries']} consulta(s), {entry['totalMs']:.0f} ms no total")
+        lines.append(entry["sql"])
+        lines.append("")
+
+    sql = "\n".join(lines)
+    print("\n" + sql)
+
+    if args.dry_run:
+        return
+
+    stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    directory = os.path.join(MIGRATIONS_DIR, f"{stamp}_{args.name}")
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "migration.sql"), "w", encoding="utf-8") as f:
+        f.write(sql)
+    print(f"Migration gravada em {directory}")
+    print("Índices sem WHERE devem ganhar o @@index correspondente no schema.prisma; "
+          "os parciais ficam só no SQL.")
+
+
+def compare(args):
+    before = load_report(args.before)["endpoints"]
+    after = load_report(args.after)["endpoints"]
+    regressions = []
+
+    print(f"{'endpoint':<28} {'p50 antes':>10} {'p50 depois':>11} {'p95 antes':>10} {'p95 depois':>11} {'Δ p95':>8}")
+    for name, old in before.items():
+        new = after.get(name)
+        if not new:
+            continue
+        delta = ((new["p95"] - old["p95"]) / old["p95"] * 100) if old["p95"] else 0.0
+        print(f"{name:<28} {old['p50']:>10} {new['p50']:>11} {old['p95']:>10} {new['p95']:>11} {delta:>7.1f}%")
+        if delta > args.max_regression:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\nRegressão acima de {args.max_regression}% em: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultor de índices guiado pela carga dos testes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    capture_parser = sub.add_parser("capture", help="Repete a carga e captura pg_stat_statements")
+    capture_parser.add_argument("--label", required=True)
+    capture_parser.add_argument("--api-url", default=DEFAULT_API_URL)
+    capture_parser.add_argument("--email")
+    capture_parser.add_argument("--password")
+    capture_parser.add_argument("--token", default=os.environ.get("BOVICONTROL_TOKEN"))
+    capture_parser.add_argument("--iterations", type=int, default=20)
+    capture_parser.add_argument("--top", type=int, default=30, help="Consultas mais caras a guardar")
+    capture_parser.add_argument("--keep-stats", action="store_true", help="Não zerar pg_stat_statements antes")
+
+    propose_parser = sub.add_parser("propose", help="Propõe índices e grava a migration")
+    propose_parser.add_argument("--label", required=True)
+    propose_parser.add_argument("--name", default="index_advisor")
+    propose_parser.add_argument("--dry-run", action="store_true", help="Só imprime o SQL")
+
+    compare_parser = sub.add_parser("compare", help="Compara a latência de duas capturas")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--max-regression", type=float, default=10.0,
+                                help="Falha se o p95 de algum endpoint piorar mais que isso (%%)")
+
+    args = parser.parse_args()
+
+    if args.command == "capture" and not args.token and not (args.email and args.password):
+        parser.error("informe --token ou --email e --password")
+
+    try:
+        {"capture": capture, "propose": propose, "compare": compare}[args.command](args)
+    except (RuntimeError, requests.RequestException) as error:
+        print(f"Erro: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import { NotificationProvider } from '@/components/Notifications/NotificationPro
 import { BackendProvider, useBackend } from '@/providers/BackendProvider';
 import { ProtectedRoute } from '@/components/Auth/ProtectedRoute';
 import { ThemeProvider } from '@/providers/ThemeProvider';
+import { QueryProvider } from '@/providers/QueryProvider';
 import { SettingsProvider } from '@/providers/SettingsProvider';
 import { FinancialDataProvider } from '@/providers/FinancialDataProvider';
 import { PenNavigationProvider } from '@/contexts/PenNavigationContext';
@@ -14,23 +15,23 @@ import { useStoreInitializer } from '@/hooks/useStoreInitializer';
 import { Toaster } from 'sonner';
 
 // ============================================================================
-// COMPONENTES MODERNOS (shadcn/ui) - TODOS MIGRADOS
+// PÁGINAS (chunks próprios, com prefetch pelo menu lateral)
 // ============================================================================
-const ShadcnDashboard = lazy(() => import('@/components/Dashboard/ShadcnDashboard'));
-const CompleteLots = lazy(() => import('@/components/Lots/CompleteLots'));
-const CompleteRegistrations = lazy(() => import('@/components/Registrations/CompleteRegistrations'));
-const CashFlowDashboard = lazy(() => import('@/components/CashFlow/CashFlowDashboard'));
-const IntegratedDashboard = lazy(() => import('@/components/FinancialAnalysis/IntegratedDashboard'));
-const SalesManagement = lazy(() => import('@/components/Sales/SalesManagement'));
-const PurchaseManagement = lazy(() => import('@/components/Purchases/SimplifiedPurchaseManagement'));
-const CompleteCalendar = lazy(() => import('@/components/Calendar/CompleteCalendar'));
-const Settings = lazy(() => import('@/components/System/GeneralSettings'));
-const CategoryManagement = lazy(() => import('@/components/Categories/CategoryManagement'));
-
-// Componentes de configurações
-const Reports = lazy(() => import('@/pages/Reports'));
-const FinancialSettings = lazy(() => import('@/pages/FinancialSettings'));
-const InterventionsManagement = lazy(() => import('@/components/Interventions/InterventionsManagement'));
+import {
+  ShadcnDashboard,
+  CompleteLots,
+  CompleteRegistrations,
+  CashFlowDashboard,
+  IntegratedDashboard,
+  SalesManagement,
+  PurchaseManagement,
+  CompleteCalendar,
+  Settings,
+  CategoryManagement,
+  Reports,
+  FinancialSettings,
+  InterventionsManagement,
+} from '@/pages/registry';
 
 // Página de Login
 const Login02 = lazy(() => import('@/pages/Login02'));
@@ -54,8 +55,8 @@ const AppContent: React.FC = () => {
   const [currentPage, setCurrentPage] = React.useState('dashboard');
   const { isAuthenticated, loading } = useBackend();
   
-  // Inicializar o store de forma segura
-  useStoreInitializer();
+  // Inicializar o store e carregar os domínios usados pela página atual
+  useStoreInitializer(currentPage);
 
   useEffect(() => {
     registerExistingUpdates();
@@ -130,39 +131,41 @@ const AppContent: React.FC = () => {
 // ============================================================================
 function App() {
   return (
-    <ThemeProvider defaultTheme="light" storageKey="bovicontrol-ui-theme">
-      <BackendProvider>
-        <SettingsProvider>
-          <FinancialDataProvider>
-            <NotificationProvider>
-              <PenNavigationProvider>
-                <div className="min-h-screen bg-background font-sans antialiased">
-                  <Routes>
-                    <Route path="/login" element={
-                      <Suspense fallback={<PageLoader />}>
-                        <Login02 />
-                      </Suspense>
-                    } />
-                    <Route path="/*" element={
-                      <ProtectedRoute>
-                        <AppContent />
-                      </ProtectedRoute>
-                    } />
-                  </Routes>
-                  <Toaster
-                    position="top-right"
-                    richColors
-                    closeButton
-                    duration={4000}
-                    theme="light"
-                  />
-                </div>
-              </PenNavigationProvider>
-            </NotificationProvider>
-          </FinancialDataProvider>
-        </SettingsProvider>
-      </BackendProvider>
-    </ThemeProvider>
+    <QueryProvider>
+      <ThemeProvider defaultTheme="light" storageKey="bovicontrol-ui-theme">
+        <BackendProvider>
+          <SettingsProvider>
+            <FinancialDataProvider>
+              <NotificationProvider>
+                <PenNavigationProvider>
+                  <div className="min-h-screen bg-background font-sans antialiased">
+                    <Routes>
+                      <Route path="/login" element={
+                        <Suspense fallback={<PageLoader />}>
+                          <Login02 />
+                        </Suspense>
+                      } />
+                      <Route path="/*" element={
+                        <ProtectedRoute>
+                          <AppContent />
+                        </ProtectedRoute>
+                      } />
+                    </Routes>
+                    <Toaster
+                      position="top-right"
+                      richColors
+                      closeButton
+                      duration={4000}
+                      theme="light"
+                    />
+                  </div>
+                </PenNavigationProvider>
+              </NotificationProvider>
+            </FinancialDataProvider>
+          </SettingsProvider>
+        </BackendProvider>
+      </ThemeProvider>
+    </QueryProvider>
   );
 }
 
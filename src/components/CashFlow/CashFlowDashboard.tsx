@@ -5,20 +5,6 @@ import { Button } from '@/components/ui/button';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { Badge } from '@/components/ui/badge';
 import { Input } from '@/components/ui/input';
-import {
-  Table,
-  TableBody,
-  TableCell,
-  TableHead,
-  TableHeader,
-  TableRow,
-} from '@/components/ui/table';
-import {
-  DropdownMenu,
-  DropdownMenuContent,
-  DropdownMenuItem,
-  DropdownMenuTrigger,
-} from '@/components/ui/dropdown-menu';
 import { 
   Plus, 
   TrendingUp, 
@@ -26,9 +12,7 @@ import {
   DollarSign,
   Calendar,
   RefreshCw,
-  MoreHorizontal,
-  Edit,
-  Trash2,
+  Search,
   CheckCircle,
   XCircle,
   Clock,
@@ -49,7 +33,10 @@ import { SimpleIntegratedAnalysis } from '@/components/FinancialAnalysis/SimpleI
 import { ExpandedCashFlow } from '@/components/Financial/ExpandedCashFlow';
 import { usePayerAccountsApi } from '@/hooks/api/usePayerAccountsApi';
 import { ConfirmDialog } from '@/components/Common/ConfirmDialog';
-import StatusChangeButton from './StatusChangeButton';
+import { TableSort, toggleSort } from '@/components/Common/SortableTableHead';
+import { CASH_FLOW_QUERY_KEYS, useCashFlowList } from '@/hooks/queries/useCashFlowQuery';
+import { useQueryClient } from '@tanstack/react-query';
+import { CashFlowMovementsTable } from './CashFlowMovementsTable';
 import { categoryService } from '@/services/categoryService';
 import { useEffect } from 'react';
 
@@ -211,291 +198,49 @@ export const CashFlowDashboard: React.FC<CashFlowDashboardProps> = ({
     await updateStatus(id, status, paymentDate);
   };
 
-  // Filtrar movimentações por tipo para as abas
-  const filteredCashFlows = useMemo(() => {
-    
-    return {
-      all: cashFlows || [],
-      income: cashFlows?.filter(flow => flow.type === 'INCOME') || [],
-      expense: cashFlows?.filter(flow => flow.type === 'EXPENSE') || []
-    };
-  }, [cashFlows]);
-  // Componente da Tabela de Movimentações - Reformulado
-  const CashFlowTable = ({ data, type }: { data: any[], type: 'all' | 'income' | 'expense' }) => {
-
-    // Função para obter o ícone e cor da categoria
-    const getCategoryDisplay = (cashFlow: any) => {
-      // Buscar categoria dinamicamente do CategoryService
-      let category = null;
-      let categoryName = '';
-
-      // Tentar buscar pelo categoryId ou código da categoria
-      if (cashFlow.categoryId) {
-        category = categoryService.getById(cashFlow.categoryId) || categoryService.getByCode(cashFlow.categoryId);
-      }
+  // Busca e ordenação da tabela são feitas pelo servidor; na ordem padrão sem busca
+  // a tabela usa a lista já carregada para os indicadores, sem nova requisição
+  const [searchInput, setSearchInput] = useState('');
+  const [search, setSearch] = useState('');
+  const [sort, setSort] = useState<TableSort>({ sortBy: 'date', sortOrder: 'desc' });
+  const queryClient = useQueryClient();
 
-      // Se não encontrou, tentar pelo nome da categoria
-      if (!category && cashFlow.category) {
-        const categoryValue = typeof cashFlow.category === 'string' ? cashFlow.category : cashFlow.category.name;
-        category = categoryService.getByCode(categoryValue);
-        if (!category) {
-          // Buscar pelo nome se não encontrou pelo código
-          const allCategories = categoryService.getAll();
-          category = allCategories.find(cat => cat.name === categoryValue);
-        }
-      }
+  useEffect(() => {
+    const timeoutId = setTimeout(() => setSearch(searchInput.trim()), 300);
+    return () => clearTimeout(timeoutId);
+  }, [searchInput]);
+
+  const isDefaultListQuery = !search && sort.sortBy === 'date' && sort.sortOrder === 'desc';
+  const { data: queriedCashFlows, isFetching: isFetchingList } = useCashFlowList(
+    { search, ...sort },
+    { enabled: !isDefaultListQuery }
+  );
 
-      // Definir o nome da categoria
-      if (category) {
-        categoryName = category.name;
-      } else if (cashFlow.category) {
-        categoryName = typeof cashFlow.category === 'string' ? cashFlow.category : cashFlow.category.name;
-      }
+  // Gravações recarregam `cashFlows`; as listas ordenadas em cache ficam velhas
+  useEffect(() => {
+    queryClient.invalidateQueries({ queryKey: CASH_FLOW_QUERY_KEYS.lists() });
+  }, [cashFlows, queryClient]);
 
-      // Mapear cores baseado no tipo e centro de custo da categoria
-      const getColorByCategory = (cat: any) => {
-        if (!cat) return 'bg-gray-100 text-gray-700 border-gray-300';
-
-        // Usar a cor da categoria se estiver definida
-        if (cat.color && cat.color !== '#6B7280') {
-          // Converter cor hex para classes Tailwind aproximadas
-          const colorMap: Record<string, string> = {
-            '#EF4444': 'bg-red-100 text-red-800 border-red-300',
-            '#F59E0B': 'bg-amber-100 text-amber-800 border-amber-300',
-            '#10B981': 'bg-green-100 text-green-800 border-green-300',
-            '#6B7280': 'bg-gray-100 text-gray-700 border-gray-300',
-            '#84CC16': 'bg-lime-100 text-lime-800 border-lime-300',
-            '#06B6D4': 'bg-cyan-100 text-cyan-800 border-cyan-300',
-            '#8B5CF6': 'bg-violet-100 text-violet-800 border-violet-300',
-            '#DC2626': 'bg-red-100 text-red-800 border-red-300',
-            '#F97316': 'bg-orange-100 text-orange-800 border-orange-300',
-            '#3B82F6': 'bg-blue-100 text-blue-800 border-blue-300',
-            '#EC4899': 'bg-pink-100 text-pink-800 border-pink-300',
-            '#14B8A6': 'bg-teal-100 text-teal-800 border-teal-300',
-            '#6366F1': 'bg-indigo-100 text-indigo-800 border-indigo-300'
-          };
-
-          return colorMap[cat.color] || 'bg-gray-100 text-gray-700 border-gray-300';
-        }
+  const handleSort = (field: string) => setSort(current => toggleSort(current, field));
 
-        // Cores padrão baseadas no tipo
-        if (cat.type === 'INCOME') {
-          return 'bg-green-100 text-green-800 border-green-300';
-        } else {
-          // Cores por centro de custo para despesas
-          const costCenterColors: Record<string, string> = {
-            'acquisition': 'bg-red-100 text-red-800 border-red-300',
-            'fattening': 'bg-yellow-100 text-yellow-800 border-yellow-300',
-            'administrative': 'bg-blue-100 text-blue-800 border-blue-300',
-            'financial': 'bg-purple-100 text-purple-800 border-purple-300',
-            'sales': 'bg-orange-100 text-orange-800 border-orange-300'
-          };
-
-          return costCenterColors[cat.cost_center || ''] || 'bg-gray-100 text-gray-700 border-gray-300';
-        }
-      };
+  // Filtrar movimentações por tipo para as abas (mantendo a ordem do servidor)
+  const filteredCashFlows = useMemo(() => {
+    const source = (!isDefaultListQuery && queriedCashFlows) || cashFlows || [];
 
-      const color = getColorByCategory(category);
-      const categoryInfo = categoryName ? { label: categoryName, color } : null;
-      
-      return categoryInfo ? (
-        <Badge className={cn("text-xs font-medium border", categoryInfo.color)} variant="secondary">
-          {categoryInfo.label}
-        </Badge>
-      ) : (
-        <Badge variant="outline" className="text-xs">Sem categoria</Badge>
-      );
+    return {
+      all: source,
+      income: source.filter(flow => flow.type === 'INCOME'),
+      expense: source.filter(flow => flow.type === 'EXPENSE')
     };
-    
-    return (
-    <div className="rounded-md border bg-card overflow-x-auto">
-      <div className="min-w-[640px] md:min-w-0">
-        <Table>
-          <TableHeader>
-            <TableRow className="hover:bg-transparent">
-              <TableHead className="table-header w-[25%] min-w-[150px]">Descrição</TableHead>
-              <TableHead className="table-header w-[15%] hidden md:table-cell">Categoria</TableHead>
-              <TableHead className="table-header w-[15%] hidden lg:table-cell">Conta</TableHead>
-              <TableHead className="table-header w-[12%] min-w-[100px]">Vencimento</TableHead>
-              <TableHead className="table-header w-[13%] text-right min-w-[100px]">Valor</TableHead>
-              <TableHead className="table-header w-[12%] hidden sm:table-cell">Status</TableHead>
-              <TableHead className="table-header w-[8%] text-center min-w-[60px]">Ações</TableHead>
-            </TableRow>
-          </TableHeader>
-        <TableBody>
-          {data.length === 0 ? (
-            <TableRow>
-              <TableCell colSpan={7} className="text-center py-12">
-                <div className="flex flex-col items-center gap-2">
-                  <DollarSign className="h-8 w-8 text-muted-foreground/50" />
-                  <p className="text-sm text-muted-foreground">
-                    {type === 'income' ? 'Nenhuma receita encontrada' : 
-                     type === 'expense' ? 'Nenhuma despesa encontrada' : 
-                     'Nenhuma movimentação encontrada'}
-                  </p>
-                </div>
-              </TableCell>
-            </TableRow>
-          ) : (
-            data.map((cashFlow) => (
-              <TableRow key={cashFlow.id} className="hover:bg-muted/50">
-                <TableCell className="py-3 min-w-[150px]">
-                  <div className="space-y-1">
-                    <p className="text-sm font-medium line-clamp-1">{cashFlow.description}</p>
-                    {(cashFlow.supplier || cashFlow.customer) && (
-                      <p className="text-xs text-muted-foreground flex items-center gap-1">
-                        <Building2 className="h-3 w-3" />
-                        {cashFlow.supplier || cashFlow.customer}
-                      </p>
-                    )}
-                    {/* Mostrar categoria em mobile */}
-                    <div className="md:hidden mt-1">
-                      {(() => {
-                        const category = categories.find(cat => cat.id === cashFlow.categoryId);
-                        if (category) {
-                          return (
-                            <Badge
-                              className={cn(
-                                "text-xs font-medium border",
-                                !category.color && (category.type === 'INCOME'
-                                  ? "bg-green-100 text-green-800 border-green-300"
-                                  : "bg-red-100 text-red-800 border-red-300")
-                              )}
-                              variant="secondary"
-                            >
-                              {category.name}
-                            </Badge>
-                          );
-                        }
-                        return null;
-                      })()}
-                    </div>
-                  </div>
-                </TableCell>
-                
-                <TableCell className="py-3 hidden md:table-cell">
-                  {(() => {
-                    // Busca a categoria pelo ID
-                    const category = categories.find(cat => cat.id === cashFlow.categoryId);
-
-                    if (category) {
-                      // Usar a cor da categoria se existir
-                      const badgeStyle = category.color && category.color !== '#6B7280'
-                        ? {
-                            backgroundColor: `${category.color}20`,
-                            borderColor: category.color,
-                            color: category.color
-                          }
-                        : {};
-
-                      return (
-                        <Badge
-                          className={cn(
-                            "text-xs font-medium border",
-                            !category.color && (category.type === 'INCOME'
-                              ? "bg-green-100 text-green-800 border-green-300"
-                              : "bg-red-100 text-red-800 border-red-300")
-                          )}
-                          style={badgeStyle}
-                          variant="secondary"
-                        >
-                          {category.name}
-                        </Badge>
-                      );
-                    }
-
-                    return <Badge variant="outline" className="text-xs">Sem categoria</Badge>;
-                  })()}
-                </TableCell>
-                
-                <TableCell className="py-3 hidden lg:table-cell">
-                  {cashFlow.account ? (
-                    <div className="space-y-0.5">
-                      <p className="kpi-label">{cashFlow.account.accountName}</p>
-                      <p className="kpi-variation text-muted-foreground">{cashFlow.account.bankName}</p>
-                    </div>
-                  ) : (
-                    <span className="text-xs text-muted-foreground">Não informada</span>
-                  )}
-                </TableCell>
-                
-                <TableCell className="py-3 min-w-[100px]">
-                  <div className="space-y-0.5">
-                    <p className="text-sm">
-                      {format(new Date(cashFlow.dueDate || cashFlow.date), 'dd/MM/yyyy', { locale: ptBR })}
-                    </p>
-                    {cashFlow.dueDate && cashFlow.status === 'PENDING' && (
-                      <p className="kpi-variation text-muted-foreground">
-                        {(() => {
-                          const days = Math.ceil((new Date(cashFlow.dueDate).getTime() - new Date().getTime()) / (1000 * 60 * 60 * 24));
-                          if (days < 0) return `Vencido há ${Math.abs(days)} dias`;
-                          if (days === 0) return 'Vence hoje';
-                          if (days === 1) return 'Vence amanhã';
-                          return `Em ${days} dias`;
-                        })()}
-                      </p>
-                    )}
-                  </div>
-                </TableCell>
-                
-                <TableCell className="py-3 text-right min-w-[100px]">
-                  <p className={cn(
-                    "text-sm font-semibold",
-                    cashFlow.type === 'INCOME' ? "text-green-600" : "text-red-600"
-                  )}>
-                    {cashFlow.type === 'INCOME' ? '+' : '-'} {formatCurrency(cashFlow.amount)}
-                  </p>
-                </TableCell>
-                
-                <TableCell className="py-3 hidden sm:table-cell">
-                  <StatusChangeButton
-                    currentStatus={cashFlow.status}
-                    transactionType={cashFlow.type}
-                    onStatusChange={(newStatus) => handleStatusChange(cashFlow.id, newStatus)}
-                    size="sm"
-                  />
-                </TableCell>
-                
-                <TableCell className="py-3">
-                  <DropdownMenu>
-                    <DropdownMenuTrigger asChild>
-                      <Button 
-                        variant="ghost" 
-                        size="sm" 
-                        className="h-8 w-8 p-0"
-                        aria-label={`Ações para movimentação ${cashFlow.description}`}
-                      >
-                        <MoreHorizontal className="h-4 w-4" aria-hidden="true" />
-                      </Button>
-                    </DropdownMenuTrigger>
-                    <DropdownMenuContent align="end" className="w-48">
-                      <DropdownMenuItem 
-                        onClick={() => handleEdit(cashFlow)} 
-                        className="text-sm"
-                        aria-label={`Editar movimentação ${cashFlow.description}`}
-                      >
-                        <Edit className="h-3.5 w-3.5 mr-2" aria-hidden="true" />
-                        Editar
-                      </DropdownMenuItem>
-                      <DropdownMenuItem 
-                        onClick={() => handleDelete(cashFlow.id)} 
-                        className="text-sm text-destructive focus:text-destructive"
-                        aria-label={`Excluir movimentação ${cashFlow.description}`}
-                      >
-                        <Trash2 className="h-3.5 w-3.5 mr-2" aria-hidden="true" />
-                        Excluir
-                      </DropdownMenuItem>
-                    </DropdownMenuContent>
-                  </DropdownMenu>
-                </TableCell>
-              </TableRow>
-            ))
-          )}
-        </TableBody>
-      </Table>
-      </div>
-    </div>
-    );
+  }, [cashFlows, queriedCashFlows, isDefaultListQuery]);
+
+  const tableProps = {
+    categories,
+    sort,
+    onSort: handleSort,
+    onEdit: handleEdit,
+    onDelete: handleDelete,
+    onStatusChange: handleStatusChange,
   };
 
   return (
@@ -789,13 +534,26 @@ export const CashFlowDashboard: React.FC<CashFlowDashboardProps> = ({
       <div className="space-y-6">
         {/* Tabs de Movimentações */}
         <Tabs defaultValue="all" className="space-y-4">
-            <div className="flex items-center justify-between">
+            <div className="flex flex-wrap items-center justify-between gap-4">
               <div>
                 <h2 className="text-lg font-semibold">Movimentações Financeiras</h2>
                 <p className="text-sm text-muted-foreground">
                   Gerencie todas as entradas e saídas do fluxo de caixa
                 </p>
               </div>
+              <div className="relative w-full max-w-xs">
+                <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" aria-hidden="true" />
+                <Input
+                  placeholder="Buscar descrição, fornecedor..."
+                  value={searchInput}
+                  onChange={(e) => setSearchInput(e.target.value)}
+                  className="pl-10"
+                  aria-label="Buscar movimentações"
+                />
+                {isFetchingList && (
+                  <RefreshCw className="absolute right-3 top-1/2 -translate-y-1/2 h-4 w-4 animate-spin text-muted-foreground" aria-hidden="true" />
+                )}
+              </div>
               <TabsList className="grid w-full max-w-md grid-cols-5">
                 <TabsTrigger value="all">Todas</TabsTrigger>
                 <TabsTrigger value="income">Receitas</TabsTrigger>
@@ -820,7 +578,7 @@ export const CashFlowDashboard: React.FC<CashFlowDashboardProps> = ({
                       <p className="text-muted-foreground">Carregando movimentações...</p>
                     </div>
                   ) : (
-                    <CashFlowTable data={filteredCashFlows.all} type="all" />
+                    <CashFlowMovementsTable data={filteredCashFlows.all} type="all" {...tableProps} />
                   )}
                 </CardContent>
               </Card>
@@ -844,7 +602,7 @@ export const CashFlowDashboard: React.FC<CashFlowDashboardProps> = ({
                       <p className="text-muted-foreground">Carregando receitas...</p>
                     </div>
                   ) : (
-                    <CashFlowTable data={filteredCashFlows.income} type="income" />
+                    <CashFlowMovementsTable data={filteredCashFlows.income} type="income" {...tableProps} />
                   )}
                 </CardContent>
               </Card>
@@ -868,7 +626,7 @@ export const CashFlowDashboard: React.FC<CashFlowDashboardProps> = ({
                       <p className="text-muted-foreground">Carregando despesas...</p>
                     </div>
                   ) : (
-                    <CashFlowTable data={filteredCashFlows.expense} type="expense" />
+                    <CashFlowMovementsTable data={filteredCashFlows.expense} type="expense" {...tableProps} />
                   )}
                 </CardContent>
               </Card>
@@ -0,0 +1,272 @@
+import React, { useMemo } from 'react';
+import { cn, formatCurrency } from '@/lib/utils';
+import { Button } from '@/components/ui/button';
+import { Badge } from '@/components/ui/badge';
+import {
+  TableBody,
+  TableCell,
+  TableHead,
+  TableHeader,
+  TableRow,
+} from '@/components/ui/table';
+import {
+  DropdownMenu,
+  DropdownMenuContent,
+  DropdownMenuItem,
+  DropdownMenuTrigger,
+} from '@/components/ui/dropdown-menu';
+import {
+  DollarSign,
+  MoreHorizontal,
+  Edit,
+  Trash2,
+  Building2,
+} from 'lucide-react';
+import { format } from 'date-fns';
+import { ptBR } from 'date-fns/locale';
+import { FinancialCategory } from '@/services/api/cashFlow';
+import { SortableTableHead, TableSort } from '@/components/Common/SortableTableHead';
+import { useVirtualRows } from '@/hooks/useVirtualRows';
+import StatusChangeButton from './StatusChangeButton';
+
+// Altura fixa das linhas, usada no cálculo da janela virtual
+const ROW_HEIGHT = 64;
+
+interface CashFlowMovementsTableProps {
+  data: any[];
+  type: 'all' | 'income' | 'expense';
+  categories: FinancialCategory[];
+  sort: TableSort;
+  onSort: (field: string) => void;
+  onEdit: (cashFlow: any) => void;
+  onDelete: (id: string) => void;
+  onStatusChange: (id: string, status: string) => void;
+}
+
+/**
+ * Tabela de movimentações do Centro Financeiro.
+ *
+ * As linhas têm altura fixa e só as visíveis são renderizadas, então listas de vários
+ * anos rolam sem travar; ordenação e busca são feitas pelo servidor.
+ */
+export const CashFlowMovementsTable: React.FC<CashFlowMovementsTableProps> = ({
+  data,
+  type,
+  categories,
+  sort,
+  onSort,
+  onEdit,
+  onDelete,
+  onStatusChange,
+}) => {
+  const categoriesById = useMemo(
+    () => new Map(categories.map(category => [category.id, category])),
+    [categories]
+  );
+
+  const { containerRef, onScroll, visibleItems, paddingTop, paddingBottom } = useVirtualRows(data, {
+    rowHeight: ROW_HEIGHT,
+    resetKey: `${sort.sortBy}:${sort.sortOrder}`,
+  });
+
+  return (
+    <div className="rounded-md border bg-card overflow-x-auto">
+      <div
+        ref={containerRef}
+        onScroll={onScroll}
+        className="min-w-[640px] md:min-w-0 max-h-[600px] overflow-y-auto"
+        data-testid={`cash-flow-table-${type}`}
+      >
+        <table className="w-full caption-bottom text-sm">
+          <TableHeader className="sticky top-0 z-10 bg-card">
+            <TableRow className="hover:bg-transparent">
+              <SortableTableHead field="description" sort={sort} onSort={onSort} className="table-header w-[25%] min-w-[150px]">Descrição</SortableTableHead>
+              <TableHead className="table-header w-[15%] hidden md:table-cell">Categoria</TableHead>
+              <TableHead className="table-header w-[15%] hidden lg:table-cell">Conta</TableHead>
+              <SortableTableHead field="dueDate" sort={sort} onSort={onSort} className="table-header w-[12%] min-w-[100px]">Vencimento</SortableTableHead>
+              <SortableTableHead field="amount" sort={sort} onSort={onSort} className="table-header w-[13%] text-right min-w-[100px]">Valor</SortableTableHead>
+              <SortableTableHead field="status" sort={sort} onSort={onSort} className="table-header w-[12%] hidden sm:table-cell">Status</SortableTableHead>
+              <TableHead className="table-header w-[8%] text-center min-w-[60px]">Ações</TableHead>
+            </TableRow>
+          </TableHeader>
+        <TableBody>
+          {data.length === 0 ? (
+            <TableRow>
+              <TableCell colSpan={7} className="text-center py-12">
+                <div className="flex flex-col items-center gap-2">
+                  <DollarSign className="h-8 w-8 text-muted-foreground/50" />
+                  <p className="text-sm text-muted-foreground">
+                    {type === 'income' ? 'Nenhuma receita encontrada' : 
+                     type === 'expense' ? 'Nenhuma despesa encontrada' : 
+                     'Nenhuma movimentação encontrada'}
+                  </p>
+                </div>
+              </TableCell>
+            </TableRow>
+          ) : (
+            <>
+            {paddingTop > 0 && <tr aria-hidden="true" style={{ height: paddingTop }} />}
+            {visibleItems.map((cashFlow) => (
+              <TableRow key={cashFlow.id} className="hover:bg-muted/50" style={{ height: ROW_HEIGHT }}>
+                <TableCell className="py-2 min-w-[150px]">
+                  <div className="space-y-0.5">
+                    <p className="text-sm font-medium line-clamp-1">{cashFlow.description}</p>
+                    {(cashFlow.supplier || cashFlow.customer) && (
+                      <p className="text-xs text-muted-foreground flex items-center gap-1 line-clamp-1">
+                        <Building2 className="h-3 w-3" />
+                        {cashFlow.supplier || cashFlow.customer}
+                      </p>
+                    )}
+                    {/* Mostrar categoria em mobile */}
+                    <div className="md:hidden mt-1">
+                      {(() => {
+                        const category = categoriesById.get(cashFlow.categoryId);
+                        if (category) {
+                          return (
+                            <Badge
+                              className={cn(
+                                "text-xs font-medium border",
+                                !category.color && (category.type === 'INCOME'
+                                  ? "bg-green-100 text-green-800 border-green-300"
+                                  : "bg-red-100 text-red-800 border-red-300")
+                              )}
+                              variant="secondary"
+                            >
+                              {category.name}
+                            </Badge>
+                          );
+                        }
+                        return null;
+                      })()}
+                    </div>
+                  </div>
+                </TableCell>
+                
+                <TableCell className="py-2 hidden md:table-cell">
+                  {(() => {
+                    // Busca a categoria pelo ID
+                    const category = categoriesById.get(cashFlow.categoryId);
+
+                    if (category) {
+                      // Usar a cor da categoria se existir
+                      const badgeStyle = category.color && category.color !== '#6B7280'
+                        ? {
+                            backgroundColor: `${category.color}20`,
+                            borderColor: category.color,
+                            color: category.color
+                          }
+                        : {};
+
+                      return (
+                        <Badge
+                          className={cn(
+                            "text-xs font-medium border",
+                            !category.color && (category.type === 'INCOME'
+                              ? "bg-green-100 text-green-800 border-green-300"
+                              : "bg-red-100 text-red-800 border-red-300")
+                          )}
+                          style={badgeStyle}
+                          variant="secondary"
+                        >
+                          {category.name}
+                        </Badge>
+                      );
+                    }
+
+                    return <Badge variant="outline" className="text-xs">Sem categoria</Badge>;
+                  })()}
+                </TableCell>
+                
+                <TableCell className="py-2 hidden lg:table-cell">
+                  {cashFlow.account ? (
+                    <div className="space-y-0.5">
+                      <p className="kpi-label">{cashFlow.account.accountName}</p>
+                      <p className="kpi-variation text-muted-foreground">{cashFlow.account.bankName}</p>
+                    </div>
+                  ) : (
+                    <span className="text-xs text-muted-foreground">Não informada</span>
+                  )}
+                </TableCell>
+                
+                <TableCell className="py-2 min-w-[100px]">
+                  <div className="space-y-0.5">
+                    <p className="text-sm">
+                      {format(new Date(cashFlow.dueDate || cashFlow.date), 'dd/MM/yyyy', { locale: ptBR })}
+                    </p>
+                    {cashFlow.dueDate && cashFlow.status === 'PENDING' && (
+                      <p className="kpi-variation text-muted-foreground">
+                        {(() => {
+                          const days = Math.ceil((new Date(cashFlow.dueDate).getTime() - new Date().getTime()) / (1000 * 60 * 60 * 24));
+                          if (days < 0) return `Vencido há ${Math.abs(days)} dias`;
+                          if (days === 0) return 'Vence hoje';
+                          if (days === 1) return 'Vence amanhã';
+                          return `Em ${days} dias`;
+                        })()}
+                      </p>
+                    )}
+                  </div>
+                </TableCell>
+                
+                <TableCell className="py-2 text-right min-w-[100px]">
+                  <p className={cn(
+                    "text-sm font-semibold",
+                    cashFlow.type === 'INCOME' ? "text-green-600" : "text-red-600"
+                  )}>
+                    {cashFlow.type === 'INCOME' ? '+' : '-'} {formatCurrency(cashFlow.amount)}
+                  </p>
+                </TableCell>
+                
+                <TableCell className="py-2 hidden sm:table-cell">
+                  <StatusChangeButton
+                    currentStatus={cashFlow.status}
+                    transactionType={cashFlow.type}
+                    onStatusChange={(newStatus) => onStatusChange(cashFlow.id, newStatus)}
+                    size="sm"
+                  />
+                </TableCell>
+                
+                <TableCell className="py-2">
+                  <DropdownMenu>
+                    <DropdownMenuTrigger asChild>
+                      <Button 
+                        variant="ghost" 
+                        size="sm" 
+                        className="h-8 w-8 p-0"
+                        aria-label={`Ações para movimentação ${cashFlow.description}`}
+                      >
+                        <MoreHorizontal className="h-4 w-4" aria-hidden="true" />
+                      </Button>
+                    </DropdownMenuTrigger>
+                    <DropdownMenuContent align="end" className="w-48">
+                      <DropdownMenuItem 
+                        onClick={() => onEdit(cashFlow)} 
+                        className="text-sm"
+                        aria-label={`Editar movimentação ${cashFlow.description}`}
+                      >
+                        <Edit className="h-3.5 w-3.5 mr-2" aria-hidden="true" />
+                        Editar
+                      </DropdownMenuItem>
+                      <DropdownMenuItem 
+                        onClick={() => onDelete(cashFlow.id)} 
+                        className="text-sm text-destructive focus:text-destructive"
+                        aria-label={`Excluir movimentação ${cashFlow.description}`}
+                      >
+                        <Trash2 className="h-3.5 w-3.5 mr-2" aria-hidden="true" />
+                        Excluir
+                      </DropdownMenuItem>
+                    </DropdownMenuContent>
+                  </DropdownMenu>
+                </TableCell>
+              </TableRow>
+            ))}
+            {paddingBottom > 0 && <tr aria-hidden="true" style={{ height: paddingBottom }} />}
+            </>
+          )}
+        </TableBody>
+      </table>
+      </div>
+    </div>
+  );
+};
+
+export default CashFlowMovementsTable;
@@ -1,11 +1,20 @@
 import React from 'react';
 import { useRealDataSync } from '../../hooks/useRealDataSync';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { RefreshCw, Database, CheckCircle, AlertCircle } from 'lucide-react';
 
 export const RealDataSync: React.FC = () => {
   const { loading, error, lastSync, sync, hasRealData, dataCounts } = useRealDataSync();
-  const { cycles, cattlePurchases, partners, expenses, penRegistrations, healthRecords, currentWeightReadings } = useAppStore();
+  const { cycles, cattlePurchases, partners, expenses, penRegistrations, healthRecords, currentWeightReadings } = useAppStore(useShallow(state => ({
+    cycles: state.cycles,
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    expenses: state.expenses,
+    penRegistrations: state.penRegistrations,
+    healthRecords: state.healthRecords,
+    currentWeightReadings: state.currentWeightReadings
+  })));
 
   return (
     <div className="bg-white rounded-lg shadow-sm border p-6 mb-6">
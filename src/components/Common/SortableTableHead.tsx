@@ -0,0 +1,55 @@
+import React from 'react';
+import { ArrowUpDown, ArrowUp, ArrowDown } from 'lucide-react';
+import { TableHead } from '@/components/ui/table';
+import { cn } from '@/lib/utils';
+
+export type SortOrder = 'asc' | 'desc';
+
+export interface TableSort {
+  sortBy: string;
+  sortOrder: SortOrder;
+}
+
+/**
+ * Próxima ordenação ao clicar em uma coluna: inverte a direção da coluna atual
+ * ou começa a nova coluna em ordem decrescente
+ */
+export const toggleSort = (current: TableSort, field: string): TableSort =>
+  current.sortBy === field
+    ? { sortBy: field, sortOrder: current.sortOrder === 'asc' ? 'desc' : 'asc' }
+    : { sortBy: field, sortOrder: 'desc' };
+
+interface SortableTableHeadProps {
+  field: string;
+  sort: TableSort;
+  onSort: (field: string) => void;
+  className?: string;
+  children: React.ReactNode;
+}
+
+export const SortableTableHead: React.FC<SortableTableHeadProps> = ({
+  field,
+  sort,
+  onSort,
+  className,
+  children
+}) => {
+  const active = sort.sortBy === field;
+  const Icon = !active ? ArrowUpDown : sort.sortOrder === 'asc' ? ArrowUp : ArrowDown;
+
+  return (
+    <TableHead
+      className={className}
+      aria-sort={active ? (sort.sortOrder === 'asc' ? 'ascending' : 'descending') : 'none'}
+    >
+      <button
+        type="button"
+        onClick={() => onSort(field)}
+        className="inline-flex items-center gap-1 hover:text-foreground transition-colors"
+      >
+        {children}
+        <Icon className={cn('w-3 h-3', !active && 'opacity-50')} aria-hidden="true" />
+      </button>
+    </TableHead>
+  );
+};
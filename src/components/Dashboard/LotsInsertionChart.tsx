@@ -7,7 +7,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { ChartConfig, ChartContainer, ChartTooltip, ChartTooltipContent } from "@/components/ui/chart";
 
 export const LotsInsertionChart: React.FC = () => {
-  const { cattlePurchases } = useAppStore();
+  const cattlePurchases = useAppStore(state => state.cattlePurchases);
 
   // Gerar dados para os últimos 6 meses
   const data = React.useMemo(() => {
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Eye, Edit, Calculator, Trash2, DollarSign } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { format } from 'date-fns';
 import { LotDetailModal } from '../Lots/LotDetailModal';
 import { LotEditModal } from '../Lots/LotEditModal';
@@ -12,7 +13,12 @@ import { TableWithPagination } from '../Common/TableWithPagination';
 import { CattlePurchase } from '../../types';
 
 export const LotsList: React.FC = () => {
-  const { cattlePurchases, cattlePurchases, partners, penAllocations, deleteCattlePurchase } = useAppStore();
+  const { cattlePurchases, partners, penAllocations, deleteCattlePurchase } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    penAllocations: state.penAllocations,
+    deleteCattlePurchase: state.deleteCattlePurchase
+  })));
   const [selectedLot, setSelectedLot] = useState<CattlePurchase | null>(null);
   const [editLot, setEditLot] = useState<CattlePurchase | null>(null);
   const [simulationLot, setSimulationLot] = useState<CattlePurchase | null>(null);
@@ -1,11 +1,15 @@
 import React from 'react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, ResponsiveContainer, Cell } from 'recharts';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { ChartConfig, ChartContainer, ChartTooltip, ChartTooltipContent } from "@/components/ui/chart";
 
 export const PurchaseByBrokerChart: React.FC = () => {
-  const { cattlePurchases, partners } = useAppStore();
+  const { cattlePurchases, partners } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners
+  })));
 
   // Agrupar compras por corretor
   const data = React.useMemo(() => {
@@ -1,13 +1,17 @@
 import React from 'react';
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, ResponsiveContainer } from 'recharts';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { format, subMonths, startOfMonth, endOfMonth } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { ChartConfig, ChartContainer, ChartTooltip, ChartTooltipContent } from "@/components/ui/chart";
 
 export const RevenueChart: React.FC = () => {
-  const { cattlePurchases, saleRecords } = useAppStore();
+  const { cattlePurchases, saleRecords } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    saleRecords: state.saleRecords
+  })));
 
   // Gerar dados reais baseados nas transações do sistema
   const data = React.useMemo(() => {
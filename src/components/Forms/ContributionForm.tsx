@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useStoreSlice } from '@/hooks/useStoreSlice';
 import { X, Save, Calendar, FileText, DollarSign, Users, Building2, TrendingUp, CreditCard, Calculator } from 'lucide-react';
 
 interface ContributionFormProps {
@@ -8,7 +9,9 @@ interface ContributionFormProps {
 }
 
 export const ContributionForm: React.FC<ContributionFormProps> = ({ isOpen, onClose }) => {
-  const { addFinancialContribution } = useAppStore();
+  // Baixa as ações do domínio ao abrir o formulário
+  useStoreSlice('cashFlow');
+  const addFinancialContribution = useAppStore(state => state.addFinancialContribution);
   
   const [formData, setFormData] = useState({
     type: 'aporte_socio' as 'aporte_socio' | 'emprestimo_socio' | 'financiamento_bancario' | 'investidor',
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Building2 } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 
 const costCenterSchema = z.object({
   name: z.string().min(1, 'Nome é obrigatório'),
@@ -22,7 +23,10 @@ export const CostCenterForm: React.FC<CostCenterFormProps> = ({
   isOpen,
   onClose
 }) => {
-  const { costCenters, addCostCenter } = useAppStore();
+  const { costCenters, addCostCenter } = useAppStore(useShallow(state => ({
+    costCenters: state.costCenters,
+    addCostCenter: state.addCostCenter
+  })));
 
   const {
     register,
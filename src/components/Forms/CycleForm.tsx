@@ -5,6 +5,7 @@ import { z } from 'zod';
 import { X, FileText, DollarSign } from 'lucide-react';
 import { DatePickerField } from '@/components/Common/DatePickerField';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { FatteningCycle } from '../../types';
 
 const cycleSchema = z.object({
@@ -36,7 +37,10 @@ export const CycleForm: React.FC<CycleFormProps> = ({
   onClose,
   initialData
 }) => {
-  const { addCycle, updateCycle } = useAppStore();
+  const { addCycle, updateCycle } = useAppStore(useShallow(state => ({
+    addCycle: state.addCycle,
+    updateCycle: state.updateCycle
+  })));
   const isEditing = !!initialData;
 
   const form = useForm<CycleFormData>({
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Calculator, Plus, Trash2, DollarSign, Building2, Users, FileText, CreditCard } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 
 const expenseAllocationSchema = z.object({
   date: z.date({
@@ -34,7 +35,14 @@ export const ExpenseAllocationForm: React.FC<ExpenseAllocationFormProps> = ({
   isOpen,
   onClose
 }) => {
-  const { costCenters, cattlePurchases, partners, addExpense, penRegistrations, loteCurralLinks } = useAppStore();
+  const { costCenters, cattlePurchases, partners, addExpense, penRegistrations, loteCurralLinks } = useAppStore(useShallow(state => ({
+    costCenters: state.costCenters,
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    addExpense: state.addExpense,
+    penRegistrations: state.penRegistrations,
+    loteCurralLinks: state.loteCurralLinks
+  })));
   const [equalSplitActive, setEqualSplitActive] = useState(false);
 
   const {
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Heart, AlertTriangle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { CattlePurchase, HealthProtocolFormData } from '../../types';
 
 const healthProtocolSchema = z.object({
@@ -29,7 +30,11 @@ export const HealthProtocolForm: React.FC<HealthProtocolFormProps> = ({
   onClose,
   order
 }) => {
-  const { addHealthProtocol, moveCattlePurchaseToNextStage, cattlePurchases } = useAppStore();
+  const { addHealthProtocol, moveCattlePurchaseToNextStage, cattlePurchases } = useAppStore(useShallow(state => ({
+    addHealthProtocol: state.addHealthProtocol,
+    moveCattlePurchaseToNextStage: state.moveCattlePurchaseToNextStage,
+    cattlePurchases: state.cattlePurchases
+  })));
 
   // Encontrar o lote relacionado a esta ordem
   const relatedLot = cattlePurchases.find(lot => lot.purchaseId === order.id);
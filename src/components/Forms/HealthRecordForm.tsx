@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Heart, AlertCircle, Info } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { HealthRecordFormData } from '../../types';
 
 const healthRecordSchema = z.object({
@@ -32,15 +33,15 @@ export const HealthRecordForm: React.FC<HealthRecordFormProps> = ({
   onClose,
   lotId
 }) => {
-  const { 
-    cattlePurchases, 
-    penRegistrations,
-    penStatuses, 
-    addHealthRecord, 
-    allocateCostProportionally,
-    getLotesInCurral,
-    addNotification 
-  } = useAppStore();
+  const { cattlePurchases, penRegistrations, penStatuses, addHealthRecord, allocateCostProportionally, getLotesInCurral, addNotification } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    penRegistrations: state.penRegistrations,
+    penStatuses: state.penStatuses,
+    addHealthRecord: state.addHealthRecord,
+    allocateCostProportionally: state.allocateCostProportionally,
+    getLotesInCurral: state.getLotesInCurral,
+    addNotification: state.addNotification
+  })));
 
   const {
     register,
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useForm } from 'react-hook-form';
 import { X, Plus, Trash2, AlertCircle, Check } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { Portal } from '../Common/Portal';
 
 interface LotAllocationFormData {
@@ -24,13 +25,13 @@ export const LotAllocationForm: React.FC<LotAllocationFormProps> = ({
   loteId,
   quantidadeTotal
 }) => {
-  const { 
-    penRegistrations, 
-    penStatuses, 
-    cattlePurchases,
-    allocateLotToPens,
-    getLotesInCurral 
-  } = useAppStore();
+  const { penRegistrations, penStatuses, cattlePurchases, allocateLotToPens, getLotesInCurral } = useAppStore(useShallow(state => ({
+    penRegistrations: state.penRegistrations,
+    penStatuses: state.penStatuses,
+    cattlePurchases: state.cattlePurchases,
+    allocateLotToPens: state.allocateLotToPens,
+    getLotesInCurral: state.getLotesInCurral
+  })));
   
   const [allocations, setAllocations] = useState<{ curralId: string; quantidade: number }[]>([
     { curralId: '', quantidade: 0 }
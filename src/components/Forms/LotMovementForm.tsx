@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, ArrowRight } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { LotMovementFormData } from '../../types';
 
 const lotMovementSchema = z.object({
@@ -27,7 +28,13 @@ export const LotMovementForm: React.FC<LotMovementFormProps> = ({
   onClose,
   lotId
 }) => {
-  const { cattlePurchases, penAllocations, penStatuses, addLotMovement, getAvailablePens } = useAppStore();
+  const { cattlePurchases, penAllocations, penStatuses, addLotMovement, getAvailablePens } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    penAllocations: state.penAllocations,
+    penStatuses: state.penStatuses,
+    addLotMovement: state.addLotMovement,
+    getAvailablePens: state.getAvailablePens
+  })));
 
   const {
     register,
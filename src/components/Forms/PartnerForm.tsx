@@ -69,7 +69,7 @@ export const PartnerForm: React.FC<PartnerFormProps> = ({
   isTransporter = false,
   onSubmit
 }) => {
-  const { addPartner } = useAppStore();
+  const addPartner = useAppStore(state => state.addPartner);
 
   const {
     register,
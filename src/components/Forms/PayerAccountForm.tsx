@@ -24,7 +24,7 @@ export const PayerAccountForm: React.FC<PayerAccountFormProps> = ({
   isOpen,
   onClose
 }) => {
-  const { addPayerAccount } = useAppStore();
+  const addPayerAccount = useAppStore(state => state.addPayerAccount);
 
   const {
     register,
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Home, Users } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { PenAllocationFormData } from '../../types';
 
 const penAllocationSchema = z.object({
@@ -22,7 +23,11 @@ export const PenAllocationForm: React.FC<PenAllocationFormProps> = ({
   onClose,
   penNumber
 }) => {
-  const { cattlePurchases, penStatuses, addPenAllocation } = useAppStore();
+  const { cattlePurchases, penStatuses, addPenAllocation } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    penStatuses: state.penStatuses,
+    addPenAllocation: state.addPenAllocation
+  })));
 
   const {
     register,
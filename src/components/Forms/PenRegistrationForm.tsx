@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Home } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { PenRegistrationFormData } from '../../types';
 
 const penRegistrationSchema = z.object({
@@ -23,7 +24,12 @@ export const PenRegistrationForm: React.FC<PenRegistrationFormProps> = ({
   onClose,
   penNumber
 }) => {
-  const { addPenRegistration, updatePenRegistration, penRegistrations, penStatuses } = useAppStore();
+  const { addPenRegistration, updatePenRegistration, penRegistrations, penStatuses } = useAppStore(useShallow(state => ({
+    addPenRegistration: state.addPenRegistration,
+    updatePenRegistration: state.updatePenRegistration,
+    penRegistrations: state.penRegistrations,
+    penStatuses: state.penStatuses
+  })));
 
   const existingPen = penNumber ? penRegistrations.find(pen => pen.penNumber === penNumber) : null;
 
@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useStoreSlice } from '@/hooks/useStoreSlice';
 import { X, Save, Calendar, FileText, DollarSign, Building2, TrendingUp } from 'lucide-react';
 
 interface RevenueAllocationFormProps {
@@ -8,7 +9,9 @@ interface RevenueAllocationFormProps {
 }
 
 export const RevenueAllocationForm: React.FC<RevenueAllocationFormProps> = ({ isOpen, onClose }) => {
-  const { addCashFlowEntry } = useAppStore();
+  // Baixa as ações do domínio ao abrir o formulário
+  useStoreSlice('cashFlow');
+  const addCashFlowEntry = useAppStore(state => state.addCashFlowEntry);
   
   const [formData, setFormData] = useState({
     date: new Date().toISOString().split('T')[0],
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, DollarSign, Truck, Calendar, Users, Scale, Award } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { SaleRecordFormData } from '../../types';
 
 const saleRecordSchema = z.object({
@@ -49,13 +50,13 @@ export const SaleRecordForm: React.FC<SaleRecordFormProps> = ({
   onClose,
   lotId
 }) => {
-  const { 
-    cattlePurchases, 
-    partners, 
-    addSaleRecord, 
-    calculateLotCosts,
-    calculateZootechnicalPerformance 
-  } = useAppStore();
+  const { cattlePurchases, partners, addSaleRecord, calculateLotCosts, calculateZootechnicalPerformance } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    addSaleRecord: state.addSaleRecord,
+    calculateLotCosts: state.calculateLotCosts,
+    calculateZootechnicalPerformance: state.calculateZootechnicalPerformance
+  })));
 
   const lot = cattlePurchases.find(l => l.id === lotId);
   const slaughterhouses = partners.filter(p => p.type === 'slaughterhouse' && p.isActive);
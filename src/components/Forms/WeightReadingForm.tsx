@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Scale } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { WeightReadingFormData } from '../../types';
 
 const currentWeightReadingSchema = z.object({
@@ -30,7 +31,12 @@ export const WeightReadingForm: React.FC<WeightReadingFormProps> = ({
   onClose,
   lotId
 }) => {
-  const { cattlePurchases, penAllocations, penStatuses, addWeightReading } = useAppStore();
+  const { cattlePurchases, penAllocations, penStatuses, addWeightReading } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    penAllocations: state.penAllocations,
+    penStatuses: state.penStatuses,
+    addWeightReading: state.addWeightReading
+  })));
 
   const {
     register,
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useRef } from "react";
+import React, { useState, useEffect, useRef, lazy, Suspense } from "react";
 import {
   Sidebar,
   SidebarContent,
@@ -49,7 +49,10 @@ import {
 } from "@/components/ui/dropdown-menu";
 import { Button } from "@/components/ui/button";
 import { cn } from "@/lib/utils";
-import TradingViewWidget from "@/components/TradingView/TradingViewWidget";
+import { prefetchPage } from "@/pages/registry";
+
+// O widget de cotações é carregado depois da primeira pintura, fora do bundle inicial
+const TradingViewWidget = lazy(() => import("@/components/TradingView/TradingViewWidget"));
 
 interface AppLayoutProps {
   currentPage: string;
@@ -230,6 +233,8 @@ function SidebarLayout({ currentPage, setCurrentPage, children }: { currentPage:
                   <SidebarMenuItem key={item.page}>
                     <SidebarMenuButton
                       onClick={() => setCurrentPage(item.page)}
+                      onMouseEnter={() => prefetchPage(item.page)}
+                      onFocus={() => prefetchPage(item.page)}
                       isActive={currentPage === item.page}
                       tooltip={item.title}
                     >
@@ -260,6 +265,8 @@ function SidebarLayout({ currentPage, setCurrentPage, children }: { currentPage:
                     <SidebarMenuItem key={item.page}>
                       <SidebarMenuButton
                         onClick={() => setCurrentPage(item.page)}
+                        onMouseEnter={() => prefetchPage(item.page)}
+                        onFocus={() => prefetchPage(item.page)}
                         isActive={currentPage === item.page}
                         tooltip={item.title}
                         aria-label={`Navegar para ${item.title}`}
@@ -376,7 +383,9 @@ function SidebarLayout({ currentPage, setCurrentPage, children }: { currentPage:
         <header className="flex items-center border-b px-2 py-2 flex-shrink-0 bg-background overflow-x-auto">
           {/* TradingView Widget integrado no cabeçalho - ocupa toda a largura */}
           <div className="w-full min-w-[320px]">
-            <TradingViewWidget />
+            <Suspense fallback={<div className="w-full h-8" />}>
+              <TradingViewWidget />
+            </Suspense>
           </div>
         </header>
         
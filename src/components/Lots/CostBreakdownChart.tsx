@@ -16,7 +16,7 @@ const COLORS = {
 };
 
 export const CostBreakdownChart: React.FC<CostBreakdownChartProps> = ({ lotId }) => {
-  const { calculateLotProfit } = useAppStore();
+  const calculateLotProfit = useAppStore(state => state.calculateLotProfit);
   
   const saleSimulation = calculateLotProfit(lotId, 320); // Default price for chart
   const costBreakdown = saleSimulation.costBreakdown;
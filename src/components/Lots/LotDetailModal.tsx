@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { X, Calendar, MapPin, User, DollarSign, Home, Truck, Users, TrendingUp, Package, Percent, TrendingDown, Printer, AlertTriangle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { CattlePurchase } from '../../types';
 import { format } from 'date-fns';
 import { ConfirmDialog } from '../Common/ConfirmDialog';
@@ -14,15 +15,15 @@ interface LotDetailModalProps {
 }
 
 export const LotDetailModal: React.FC<LotDetailModalProps> = ({ lot, isOpen, onClose }) => {
-  const { 
-    cattlePurchases, 
-    partners, 
-    loteCurralLinks,
-    penStatuses,
-    calculateLotCostsByCategory,
-    calculateLotProfit,
-    deleteCattlePurchase
-  } = useAppStore();
+  const { cattlePurchases, partners, loteCurralLinks, penStatuses, calculateLotCostsByCategory, calculateLotProfit, deleteCattlePurchase } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    loteCurralLinks: state.loteCurralLinks,
+    penStatuses: state.penStatuses,
+    calculateLotCostsByCategory: state.calculateLotCostsByCategory,
+    calculateLotProfit: state.calculateLotProfit,
+    deleteCattlePurchase: state.deleteCattlePurchase
+  })));
   
   const [showDeleteConfirm, setShowDeleteConfirm] = useState(false);
   const [showNonCashExpenseModal, setShowNonCashExpenseModal] = useState(false);
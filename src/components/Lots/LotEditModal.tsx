@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Edit, AlertCircle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { CattlePurchase } from '../../types';
 import { format } from 'date-fns';
 
@@ -25,13 +26,13 @@ interface LotEditModalProps {
 }
 
 export const LotEditModal: React.FC<LotEditModalProps> = ({ lot, isOpen, onClose }) => {
-  const { 
-    updateCattlePurchase, 
-    penRegistrations, 
-    loteCurralLinks,
-    partners,
-    cattlePurchases
-  } = useAppStore();
+  const { updateCattlePurchase, penRegistrations, loteCurralLinks, partners, cattlePurchases } = useAppStore(useShallow(state => ({
+    updateCattlePurchase: state.updateCattlePurchase,
+    penRegistrations: state.penRegistrations,
+    loteCurralLinks: state.loteCurralLinks,
+    partners: state.partners,
+    cattlePurchases: state.cattlePurchases
+  })));
 
   const [showFreightInfo, setShowFreightInfo] = useState(false);
 
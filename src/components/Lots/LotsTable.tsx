@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Eye, Edit, Calculator, Trash2, DollarSign, Search, Filter, Calendar, MapPin, User, Scale, AlertTriangle, Home, Clock, TrendingDown, ChevronLeft, ChevronRight } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { LotDetailModal } from './LotDetailModal';
 import { LotEditModal } from './LotEditModal';
 import { SaleSimulationModal } from './SaleSimulationModal';
@@ -12,7 +13,14 @@ import { format } from 'date-fns';
 import { clsx } from 'clsx';
 
 export const LotsTable: React.FC = () => {
-  const { cattlePurchases, cattlePurchases, partners, loteCurralLinks, calculateLotCostsByCategory, deleteCattlePurchase, cycles } = useAppStore();
+  const { cattlePurchases, partners, loteCurralLinks, calculateLotCostsByCategory, deleteCattlePurchase, cycles } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    loteCurralLinks: state.loteCurralLinks,
+    calculateLotCostsByCategory: state.calculateLotCostsByCategory,
+    deleteCattlePurchase: state.deleteCattlePurchase,
+    cycles: state.cycles
+  })));
   const [selectedLot, setSelectedLot] = useState<CattlePurchase | null>(null);
   const [editLot, setEditLot] = useState<CattlePurchase | null>(null);
   const [simulationLot, setSimulationLot] = useState<CattlePurchase | null>(null);
@@ -1,6 +1,8 @@
 import React, { useState } from 'react';
 import { X, AlertTriangle, TrendingDown } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useStoreSlice } from '@/hooks/useStoreSlice';
+import { useShallow } from 'zustand/react/shallow';
 import { CattlePurchase } from '../../types';
 import { formatWeight } from '@/utils/formatters';
 
@@ -11,7 +13,13 @@ interface NonCashExpenseModalProps {
 }
 
 export const NonCashExpenseModal: React.FC<NonCashExpenseModalProps> = ({ isOpen, onClose, lot }) => {
-  const { recordMortality, recordWeightLoss, addNotification } = useAppStore();
+  // Baixa as ações do domínio ao abrir o formulário
+  useStoreSlice('nonCash');
+  const { recordMortality, recordWeightLoss, addNotification } = useAppStore(useShallow(state => ({
+    recordMortality: state.recordMortality,
+    recordWeightLoss: state.recordWeightLoss,
+    addNotification: state.addNotification
+  })));
   const [expenseType, setExpenseType] = useState<'mortality' | 'currentWeight_loss'>('mortality');
   
   // Estados para mortalidade
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { PenRegistrationForm } from '../Forms/PenRegistrationForm';
 import { PenAllocationForm } from './PenAllocationForm';
 import { PenMovementModal } from './PenMovementModal';
@@ -12,15 +13,15 @@ import { LotMovementForm } from '../Forms/LotMovementForm';
 import { usePensApi } from '../../hooks/api/usePensApi';
 
 export const PenMap: React.FC = () => {
-  const { 
-    penRegistrations,
-    penAllocations,
-    cattlePurchases,
-    getTotalConfinedAnimals, 
-    getUnallocatedAnimals,
-    deletePenRegistration,
-    updatePenRegistration
-  } = useAppStore();
+  const { penRegistrations, penAllocations, cattlePurchases, totalAnimals, unallocatedAnimals, deletePenRegistration, updatePenRegistration } = useAppStore(useShallow(state => ({
+    penRegistrations: state.penRegistrations,
+    penAllocations: state.penAllocations,
+    cattlePurchases: state.cattlePurchases,
+    totalAnimals: state.getTotalConfinedAnimals(),
+    unallocatedAnimals: state.getUnallocatedAnimals(),
+    deletePenRegistration: state.deletePenRegistration,
+    updatePenRegistration: state.updatePenRegistration
+  })));
   
   const { pens, loading: pensLoading, refresh: refreshPens } = usePensApi();
   
@@ -34,8 +35,6 @@ export const PenMap: React.FC = () => {
   const [editPenNumber, setEditPenNumber] = useState<string>('');
   const [selectedLotId, setSelectedLotId] = useState<string>('');
 
-  const totalAnimals = getTotalConfinedAnimals();
-  const unallocatedAnimals = getUnallocatedAnimals();
   const occupiedPens = pens.filter(pen => pen.currentOccupancy > 0).length;
 
   const handlePenClick = (penNumber: string) => {
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { X, ArrowRight, Users, Home, AlertTriangle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 
 interface PenMovementModalProps {
   isOpen: boolean;
@@ -13,14 +14,14 @@ export const PenMovementModal: React.FC<PenMovementModalProps> = ({
   onClose,
   sourcePenNumber
 }) => {
-  const { 
-    penStatuses, 
-    penAllocations,
-    addLotMovement,
-    updatePenAllocation,
-    deletePenAllocation,
-    addPenAllocation
-  } = useAppStore();
+  const { penStatuses, penAllocations, addLotMovement, updatePenAllocation, deletePenAllocation, addPenAllocation } = useAppStore(useShallow(state => ({
+    penStatuses: state.penStatuses,
+    penAllocations: state.penAllocations,
+    addLotMovement: state.addLotMovement,
+    updatePenAllocation: state.updatePenAllocation,
+    deletePenAllocation: state.deletePenAllocation,
+    addPenAllocation: state.addPenAllocation
+  })));
   
   const [targetPenNumber, setTargetPenNumber] = useState<string>('');
   const [selectedAllocationId, setSelectedAllocationId] = useState<string>('');
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { X, TrendingUp, Calendar, Printer, AlertCircle, DollarSign, ArrowRight, Clock } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { CattlePurchase } from '../../types';
 import { format } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
@@ -12,13 +13,12 @@ interface SaleSimulationModalProps {
 }
 
 export const SaleSimulationModal: React.FC<SaleSimulationModalProps> = ({ lot, isOpen, onClose }) => {
-  const { 
-    calculateLotProfit,
-    cattlePurchases,
-    loteCurralLinks,
-    penRegistrations,
-    cattlePurchases
-  } = useAppStore();
+  const { calculateLotProfit, cattlePurchases, loteCurralLinks, penRegistrations } = useAppStore(useShallow(state => ({
+    calculateLotProfit: state.calculateLotProfit,
+    cattlePurchases: state.cattlePurchases,
+    loteCurralLinks: state.loteCurralLinks,
+    penRegistrations: state.penRegistrations
+  })));
   
   // Sempre buscar o lote mais atualizado do store
   const currentLot = cattlePurchases.find(l => l.id === lot.id) || lot;
@@ -12,9 +12,9 @@ export const NotificationBadge: React.FC<NotificationBadgeProps> = ({
   size = 'md',
   className = ''
 }) => {
-  const { getUnreadNotificationsCount } = useAppStore();
+  const unreadCount = useAppStore(state => state.getUnreadNotificationsCount());
   
-  const badgeCount = count !== undefined ? count : getUnreadNotificationsCount();
+  const badgeCount = count !== undefined ? count : unreadCount;
   
   if (badgeCount === 0) return null;
   
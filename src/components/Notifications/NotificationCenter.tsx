@@ -4,7 +4,7 @@ import { NotificationToast } from './NotificationToast';
 import { useAppStore } from '../../stores/useAppStore';
 
 export const NotificationCenter: React.FC = () => {
-  const { notifications } = useAppStore();
+  const notifications = useAppStore(state => state.notifications);
   const [activeToasts, setActiveToasts] = useState<string[]>([]);
   const [toastQueue, setToastQueue] = useState<string[]>([]);
   const processedNotifications = useRef<Set<string>>(new Set());
@@ -4,7 +4,7 @@ import { NotificationToast } from './NotificationToast';
 import { Notification } from '../../types';
 
 export const NotificationContainer: React.FC = () => {
-  const { notifications } = useAppStore();
+  const notifications = useAppStore(state => state.notifications);
   const [activeNotifications, setActiveNotifications] = useState<Notification[]>([]);
   const [lastNotificationId, setLastNotificationId] = useState<string | null>(null);
 
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { X, CheckCircle, Info, AlertTriangle, AlertCircle, Search, Check } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { formatDistanceToNow } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 
@@ -19,14 +20,14 @@ export const NotificationList: React.FC<NotificationListProps> = ({
   showActions = true,
   compact = false
 }) => {
-  const { 
-    notifications, 
-    markNotificationAsRead, 
-    markAllNotificationsAsRead, 
-    deleteNotification, 
-    clearAllNotifications,
-    setCurrentPage
-  } = useAppStore();
+  const { notifications, markNotificationAsRead, markAllNotificationsAsRead, deleteNotification, clearAllNotifications, setCurrentPage } = useAppStore(useShallow(state => ({
+    notifications: state.notifications,
+    markNotificationAsRead: state.markNotificationAsRead,
+    markAllNotificationsAsRead: state.markAllNotificationsAsRead,
+    deleteNotification: state.deleteNotification,
+    clearAllNotifications: state.clearAllNotifications,
+    setCurrentPage: state.setCurrentPage
+  })));
   
   const [searchQuery, setSearchQuery] = useState('');
   const [filter, setFilter] = useState<'all' | 'unread' | 'read'>('all');
@@ -17,7 +17,7 @@ export const useNotification = () => {
 };
 
 export const NotificationProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
-  const { addNotification } = useAppStore();
+  const addNotification = useAppStore(state => state.addNotification);
   const initRef = useRef(false);
   
   // Inicializar o sistema de notificações apenas uma vez
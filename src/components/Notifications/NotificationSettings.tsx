@@ -13,7 +13,7 @@ interface NotificationCategory {
 }
 
 export const NotificationSettings: React.FC = () => {
-  const { darkMode } = useAppStore();
+  const darkMode = useAppStore(state => state.darkMode);
   
   const [categories, setCategories] = useState<NotificationCategory[]>([
     {
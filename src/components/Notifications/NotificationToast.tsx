@@ -2,6 +2,7 @@ import React, { useEffect, useState } from 'react';
 import { X, CheckCircle, Info, AlertTriangle, AlertCircle } from 'lucide-react';
 import { Notification } from '../../types';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 
 interface NotificationToastProps {
   notification: Notification;
@@ -17,7 +18,10 @@ export const NotificationToast: React.FC<NotificationToastProps> = ({
   autoCloseTime = 5000
 }) => {
   const [isExiting, setIsExiting] = useState(false);
-  const { markNotificationAsRead, setCurrentPage } = useAppStore();
+  const { markNotificationAsRead, setCurrentPage } = useAppStore(useShallow(state => ({
+    markNotificationAsRead: state.markNotificationAsRead,
+    setCurrentPage: state.setCurrentPage
+  })));
   
   // Auto-close timer
   useEffect(() => {
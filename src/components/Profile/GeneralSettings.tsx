@@ -3,7 +3,7 @@ import { Settings, Globe, Clock, DollarSign, FileText, Database, Shield, Save }
 import { useAppStore } from '../../stores/useAppStore';
 
 export const GeneralSettings: React.FC = () => {
-  const { darkMode } = useAppStore();
+  const darkMode = useAppStore(state => state.darkMode);
   
   const [settings, setSettings] = useState({
     // Configurações Regionais
@@ -3,7 +3,7 @@ import { Building2, Mail, Phone, MapPin, Globe, FileText, Save } from 'lucide-re
 import { useAppStore } from '../../stores/useAppStore';
 
 export const OrganizationSettings: React.FC = () => {
-  const { darkMode } = useAppStore();
+  const darkMode = useAppStore(state => state.darkMode);
   
   const [orgData, setOrgData] = useState({
     name: 'CEAC Agropecuária e Mercantil Ltda',
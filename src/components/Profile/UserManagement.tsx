@@ -14,7 +14,7 @@ interface SystemUser {
 }
 
 export const UserManagement: React.FC = () => {
-  const { darkMode } = useAppStore();
+  const darkMode = useAppStore(state => state.darkMode);
   
   const [users, setUsers] = useState<SystemUser[]>([
     {
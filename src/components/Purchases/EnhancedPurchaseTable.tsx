@@ -1,4 +1,4 @@
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect, useRef } from 'react';
 import { 
   ChevronLeft,
   ChevronRight,
@@ -15,6 +15,8 @@ import { format } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 import { useCattlePurchasesApi } from '@/hooks/api/useCattlePurchasesApi';
 import { formatCurrency } from '@/utils/formatters';
+import { useVirtualRows } from '@/hooks/useVirtualRows';
+import { SortableTableHead, TableSort, toggleSort } from '@/components/Common/SortableTableHead';
 
 // Componentes UI
 import {
@@ -26,7 +28,6 @@ import {
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 import {
-  Table,
   TableBody,
   TableCell,
   TableHead,
@@ -47,6 +48,11 @@ import {
   TooltipTrigger,
 } from '@/components/ui/tooltip';
 
+// Altura fixa das linhas, usada no cálculo da janela virtual
+const ROW_HEIGHT = 56;
+
+const DEFAULT_SORT: TableSort = { sortBy: 'createdAt', sortOrder: 'desc' };
+
 interface EnhancedPurchaseTableProps {
   searchTerm?: string;
   
@@ -72,32 +78,46 @@ export function EnhancedPurchaseTable({
     totalItems,
     pageSize,
     changePage,
-    changePageSize
+    changePageSize,
+    changeListQuery
   } = useCattlePurchasesApi();
 
   // Estado local para controle de paginação
   const [localPageSize, setLocalPageSize] = useState(50);
+  const [sort, setSort] = useState<TableSort>(DEFAULT_SORT);
+  const changeListQueryRef = useRef(changeListQuery);
+  changeListQueryRef.current = changeListQuery;
+  // Última busca/ordenação enviada; a carga inicial (sem busca, ordem padrão) é feita pelo hook
+  const appliedQueryRef = useRef(JSON.stringify({ search: '', ...DEFAULT_SORT }));
+
+  // Busca e ordenação ficam no servidor
+  useEffect(() => {
+    const search = searchTerm.trim();
+    const queryKey = JSON.stringify({ search, ...sort });
+    if (queryKey === appliedQueryRef.current) return;
+
+    const timeoutId = setTimeout(() => {
+      appliedQueryRef.current = queryKey;
+      changeListQueryRef.current({ search: search || undefined, ...sort });
+    }, 300);
+    return () => clearTimeout(timeoutId);
+  }, [searchTerm, sort]);
+
+  const { containerRef, onScroll, visibleItems, paddingTop, paddingBottom } = useVirtualRows(purchases, {
+    rowHeight: ROW_HEIGHT,
+    resetKey: `${searchTerm}:${sort.sortBy}:${sort.sortOrder}:${currentPage}`,
+  });
 
-  // Filtrar compras
-  const filteredPurchases = useMemo(() => {
-    return purchases.filter(purchase => {
-      const matchesSearch = 
-        purchase.lotCode.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        purchase.vendor?.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        purchase.location?.toLowerCase().includes(searchTerm.toLowerCase());
-      
-      return matchesSearch;
-    });
-  }, [purchases, searchTerm]);
+  const handleSort = (field: string) => setSort(current => toggleSort(current, field));
 
-  // Calcular totalizadores apenas para os itens filtrados da página atual
+  // Calcular totalizadores apenas para os itens da página atual
   const totals = useMemo(() => {
-    const totalQuantity = filteredPurchases.reduce((sum, p) => sum + (p.initialQuantity || p.quantity || 0), 0);
-    const totalCurrentQuantity = filteredPurchases.reduce((sum, p) => sum + (p.currentQuantity || 0), 0);
-    const totalWeightSum = filteredPurchases.reduce((sum, p) => sum + (p.purchaseWeight || p.totalWeight || 0), 0);
+    const totalQuantity = purchases.reduce((sum, p) => sum + (p.initialQuantity || p.quantity || 0), 0);
+    const totalCurrentQuantity = purchases.reduce((sum, p) => sum + (p.currentQuantity || 0), 0);
+    const totalWeightSum = purchases.reduce((sum, p) => sum + (p.purchaseWeight || p.totalWeight || 0), 0);
     
     // Calcular investimento total incluindo todos os custos
-    const totalInvestment = filteredPurchases.reduce((sum, p) => {
+    const totalInvestment = purchases.reduce((sum, p) => {
       const purchaseValue = p.purchaseValue || p.totalValue || 0;
       const freight = p.freightCost || 0;
       const commission = p.commission || 0;
@@ -112,7 +132,7 @@ export function EnhancedPurchaseTable({
       investment: totalInvestment,
       averageWeight: totalQuantity > 0 ? totalWeightSum / totalQuantity : 0
     };
-  }, [filteredPurchases]);
+  }, [purchases]);
 
   // Função para mudar tamanho da página
   const handlePageSizeChange = (value: string) => {
@@ -128,7 +148,8 @@ export function EnhancedPurchaseTable({
     }
   };
 
-  if (loading) {
+  // Recargas (busca, ordenação, página) mantêm a tabela atual na tela
+  if (loading && purchases.length === 0) {
     return (
       <Card>
         <CardContent className="p-6">
@@ -154,31 +175,39 @@ export function EnhancedPurchaseTable({
       <CardContent>
         <div className="space-y-4">
           {/* Tabela */}
-          <div className="rounded-md border">
-            <Table>
-              <TableHeader>
+          <div
+            ref={containerRef}
+            onScroll={onScroll}
+            className="rounded-md border max-h-[600px] overflow-auto"
+            data-testid="purchase-table-scroll"
+          >
+            <TooltipProvider>
+            <table className="w-full caption-bottom text-sm">
+              <TableHeader className="sticky top-0 z-10 bg-card">
                 <TableRow>
-                  <TableHead className="w-[100px]">Lote</TableHead>
-                  <TableHead>Data</TableHead>
+                  <SortableTableHead field="lotCode" sort={sort} onSort={handleSort} className="w-[100px]">Lote</SortableTableHead>
+                  <SortableTableHead field="purchaseDate" sort={sort} onSort={handleSort}>Data</SortableTableHead>
                   <TableHead>Fornecedor/Local</TableHead>
-                  <TableHead className="text-center">Qtd</TableHead>
-                  <TableHead className="text-right">Peso Total/Médio</TableHead>
-                  <TableHead className="text-right">R$/@</TableHead>
-                  <TableHead className="text-right">Investimento</TableHead>
+                  <SortableTableHead field="initialQuantity" sort={sort} onSort={handleSort} className="text-center">Qtd</SortableTableHead>
+                  <SortableTableHead field="purchaseWeight" sort={sort} onSort={handleSort} className="text-right">Peso Total/Médio</SortableTableHead>
+                  <SortableTableHead field="pricePerArroba" sort={sort} onSort={handleSort} className="text-right">R$/@</SortableTableHead>
+                  <SortableTableHead field="totalCost" sort={sort} onSort={handleSort} className="text-right">Investimento</SortableTableHead>
                   
                   <TableHead className="text-center">Ações</TableHead>
                 </TableRow>
               </TableHeader>
               <TableBody>
-                {filteredPurchases.length === 0 ? (
+                {purchases.length === 0 ? (
                   <TableRow>
                     <TableCell colSpan={8} className="text-center text-muted-foreground">
                       Nenhuma compra encontrada
                     </TableCell>
                   </TableRow>
                 ) : (
-                  filteredPurchases.map((purchase) => (
-                    <TableRow key={purchase.id}>
+                  <>
+                  {paddingTop > 0 && <tr aria-hidden="true" style={{ height: paddingTop }} />}
+                  {visibleItems.map((purchase) => (
+                    <TableRow key={purchase.id} style={{ height: ROW_HEIGHT }}>
                       <TableCell className="font-medium">{purchase.lotCode}</TableCell>
                       <TableCell>
                         {format(new Date(purchase.purchaseDate), 'dd/MM/yyyy', { locale: ptBR })}
@@ -226,60 +255,57 @@ export function EnhancedPurchaseTable({
                       </TableCell>
                       <TableCell>
                         <div className="flex items-center justify-center gap-1">
-                          <TooltipProvider>
-                            <Tooltip>
-                              <TooltipTrigger asChild>
-                                <Button
-                                  variant="ghost"
-                                  size="icon"
-                                  className="h-8 w-8"
-                                  onClick={() => onView?.(purchase)}
-                                >
-                                  <Eye className="h-4 w-4" />
-                                </Button>
-                              </TooltipTrigger>
-                              <TooltipContent>Visualizar</TooltipContent>
-                            </Tooltip>
-                          </TooltipProvider>
+                          <Tooltip>
+                            <TooltipTrigger asChild>
+                              <Button
+                                variant="ghost"
+                                size="icon"
+                                className="h-8 w-8"
+                                onClick={() => onView?.(purchase)}
+                              >
+                                <Eye className="h-4 w-4" />
+                              </Button>
+                            </TooltipTrigger>
+                            <TooltipContent>Visualizar</TooltipContent>
+                          </Tooltip>
 
-                          <TooltipProvider>
-                            <Tooltip>
-                              <TooltipTrigger asChild>
-                                <Button
-                                  variant="ghost"
-                                  size="icon"
-                                  className="h-8 w-8"
-                                  onClick={() => onEdit?.(purchase)}
-                                >
-                                  <Edit className="h-4 w-4" />
-                                </Button>
-                              </TooltipTrigger>
-                              <TooltipContent>Editar</TooltipContent>
-                            </Tooltip>
-                          </TooltipProvider>
+                          <Tooltip>
+                            <TooltipTrigger asChild>
+                              <Button
+                                variant="ghost"
+                                size="icon"
+                                className="h-8 w-8"
+                                onClick={() => onEdit?.(purchase)}
+                              >
+                                <Edit className="h-4 w-4" />
+                              </Button>
+                            </TooltipTrigger>
+                            <TooltipContent>Editar</TooltipContent>
+                          </Tooltip>
 
-                          <TooltipProvider>
-                            <Tooltip>
-                              <TooltipTrigger asChild>
-                                <Button
-                                  variant="ghost"
-                                  size="icon"
-                                  className="h-8 w-8"
-                                  onClick={() => onDelete?.(purchase)}
-                                >
-                                  <Trash2 className="h-4 w-4" />
-                                </Button>
-                              </TooltipTrigger>
-                              <TooltipContent>Excluir</TooltipContent>
-                            </Tooltip>
-                          </TooltipProvider>
+                          <Tooltip>
+                            <TooltipTrigger asChild>
+                              <Button
+                                variant="ghost"
+                                size="icon"
+                                className="h-8 w-8"
+                                onClick={() => onDelete?.(purchase)}
+                              >
+                                <Trash2 className="h-4 w-4" />
+                              </Button>
+                            </TooltipTrigger>
+                            <TooltipContent>Excluir</TooltipContent>
+                          </Tooltip>
                         </div>
                       </TableCell>
                     </TableRow>
-                  ))
+                  ))}
+                  {paddingBottom > 0 && <tr aria-hidden="true" style={{ height: paddingBottom }} />}
+                  </>
                 )}
               </TableBody>
-            </Table>
+            </table>
+            </TooltipProvider>
           </div>
 
           {/* Linha de Totalizadores */}
@@ -342,6 +368,8 @@ export function EnhancedPurchaseTable({
                   <SelectItem value="30">30</SelectItem>
                   <SelectItem value="50">50</SelectItem>
                   <SelectItem value="100">100</SelectItem>
+                  <SelectItem value="500">500</SelectItem>
+                  <SelectItem value="1000">1000</SelectItem>
                 </SelectContent>
               </Select>
             </div>
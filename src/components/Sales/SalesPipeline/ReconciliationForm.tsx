@@ -33,7 +33,7 @@ export const ReconciliationForm: React.FC<ReconciliationFormProps> = ({
   onClose,
   sale
 }) => {
-  const { payerAccounts } = useAppStore();
+  const payerAccounts = useAppStore(state => state.payerAccounts);
   const [receiptFile, setReceiptFile] = React.useState<File | null>(null);
   
   const {
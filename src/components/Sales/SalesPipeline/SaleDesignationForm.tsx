@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Calendar, Users, Scale, DollarSign, Building, Home, Filter, Search, AlertTriangle, Plus, Truck } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { clsx } from 'clsx';
 
 const saleDesignationSchema = z.object({
@@ -26,7 +27,12 @@ export const SaleDesignationForm: React.FC<SaleDesignationFormProps> = ({
   isOpen,
   onClose
 }) => {
-  const { cattlePurchases, partners, penStatuses, penAllocations } = useAppStore();
+  const { cattlePurchases, partners, penStatuses, penAllocations } = useAppStore(useShallow(state => ({
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    penStatuses: state.penStatuses,
+    penAllocations: state.penAllocations
+  })));
   const [selectedPens, setSelectedPens] = useState<string[]>([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [filterSector, setFilterSector] = useState<string>('all');
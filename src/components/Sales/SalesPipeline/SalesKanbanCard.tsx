@@ -14,7 +14,7 @@ interface SalesKanbanCardProps {
 }
 
 export const SalesKanbanCard: React.FC<SalesKanbanCardProps> = ({ item, stage }) => {
-  const { partners } = useAppStore();
+  const partners = useAppStore(state => state.partners);
   const [showShipmentForm, setShowShipmentForm] = useState(false);
   const [showSlaughterForm, setShowSlaughterForm] = useState(false);
   const [showReconciliationForm, setShowReconciliationForm] = useState(false);
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, Truck, Scale, Calendar, User, MapPin, Building, Home, Plus, AlertTriangle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { PartnerForm } from '../Forms/PartnerForm';
 import { Portal } from '../Common/Portal';
 
@@ -27,7 +28,12 @@ export const ShipmentForm: React.FC<ShipmentFormProps> = ({
   onClose,
   lot
 }) => {
-  const { partners, penStatuses, penAllocations, cattlePurchases } = useAppStore();
+  const { partners, penStatuses, penAllocations, cattlePurchases } = useAppStore(useShallow(state => ({
+    partners: state.partners,
+    penStatuses: state.penStatuses,
+    penAllocations: state.penAllocations,
+    cattlePurchases: state.cattlePurchases
+  })));
   const [showTransportCompanyForm, setShowTransportCompanyForm] = useState(false);
   
   const {
@@ -4,6 +4,7 @@ import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { X, FileText, Scale, Calendar, DollarSign, Percent, Upload, AlertTriangle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 
 const slaughterSchema = z.object({
   slaughterDate: z.date(),
@@ -30,7 +31,13 @@ export const SlaughterForm: React.FC<SlaughterFormProps> = ({
   onClose,
   lot
 }) => {
-  const { partners, expenses, addFinancialAccount, addNotification, updateExpense } = useAppStore();
+  const { partners, expenses, addFinancialAccount, addNotification, updateExpense } = useAppStore(useShallow(state => ({
+    partners: state.partners,
+    expenses: state.expenses,
+    addFinancialAccount: state.addFinancialAccount,
+    addNotification: state.addNotification,
+    updateExpense: state.updateExpense
+  })));
   const [invoiceFile, setInvoiceFile] = React.useState<File | null>(null);
   const [romaneioFile, setRomaneioFile] = React.useState<File | null>(null);
   
@@ -96,7 +103,7 @@ export const SlaughterForm: React.FC<SlaughterFormProps> = ({
 
   const handleFormSubmit = (data: any) => {
     // 🆕 NOVO: Processar frete próprio quando abate for registrado
-    const { expenses, addFinancialAccount, addNotification, updateExpense } = useAppStore();
+    const { expenses, addFinancialAccount, addNotification, updateExpense } = useAppStore.getState();
     
     // Buscar despesas de frete próprio relacionadas a este lote
     const ownFreightExpenses = expenses.filter(expense => 
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { X, Star, Send, CheckCircle } from 'lucide-react';
 import { useAppStore } from '../../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 
 interface UpdateFeedbackModalProps {
   updateId: string;
@@ -13,7 +14,10 @@ export const UpdateFeedbackModal: React.FC<UpdateFeedbackModalProps> = ({
   isOpen,
   onClose
 }) => {
-  const { addUpdateFeedback, addNotification } = useAppStore();
+  const { addUpdateFeedback, addNotification } = useAppStore(useShallow(state => ({
+    addUpdateFeedback: state.addUpdateFeedback,
+    addNotification: state.addNotification
+  })));
   const [rating, setRating] = useState(0);
   const [hoveredRating, setHoveredRating] = useState(0);
   const [comment, setComment] = useState('');
@@ -1,4 +1,4 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useRef } from 'react';
 import { apiClient } from '@/services/api/apiClient';
 import { toast } from 'sonner';
 import { activityLogger } from '@/services/activityLogger';
@@ -163,6 +163,13 @@ export interface UpdateCattlePurchaseDto extends Partial<CreateCattlePurchaseDto
   estimatedSlaughterDate?: Date | string;
 }
 
+// Busca e ordenação aplicadas pelo servidor na listagem
+export interface CattlePurchaseListQuery {
+  search?: string;
+  sortBy?: string;
+  sortOrder?: 'asc' | 'desc';
+}
+
 export function useCattlePurchasesApi() {
   const [purchases, setPurchases] = useState<CattlePurchase[]>([]);
   const [loading, setLoading] = useState(false);
@@ -171,6 +178,8 @@ export function useCattlePurchasesApi() {
   const [totalPages, setTotalPages] = useState(1);
   const [totalItems, setTotalItems] = useState(0);
   const [pageSize, setPageSize] = useState(50);
+  // Ref para que recargas após gravações mantenham a busca/ordenação atuais
+  const listQueryRef = useRef<CattlePurchaseListQuery>({});
 
   // Listar todas as compras
   const loadPurchases = useCallback(async (filters?: {
@@ -185,7 +194,11 @@ export function useCattlePurchasesApi() {
       setLoading(true);
       setError(null);
 
+      const { search, sortBy, sortOrder } = listQueryRef.current;
       const params = new URLSearchParams();
+      if (search) params.append('search', search);
+      if (sortBy) params.append('sortBy', sortBy);
+      if (sortOrder) params.append('sortOrder', sortOrder);
       if (filters?.status) params.append('status', filters.status);
       if (filters?.vendorId) params.append('vendorId', filters.vendorId);
       if (filters?.startDate) params.append('startDate', filters.startDate);
@@ -444,6 +457,60 @@ export function useCattlePurchasesApi() {
     }
   }, []);
 
+  // Registrar recepção de vários lotes (comboio) em uma única requisição
+  const registerReceptionBatch = useCallback(async (lots: Array<{
+    purchaseId: string;
+    receivedDate: Date | string;
+    receivedWeight: number;
+    actualQuantity: number;
+    mortalityReason?: string;
+    observations?: string;
+    penAllocations?: Array<{ penId: string; quantity: number }>;
+  }>) => {
+    try {
+      setLoading(true);
+      setError(null);
+
+      const payload = {
+        lots: lots.map(lot => ({
+          purchaseId: lot.purchaseId,
+          receivedWeight: Number(lot.receivedWeight) || 0,
+          actualQuantity: Number(lot.actualQuantity) || 0,
+          unloadingDate: lot.receivedDate instanceof Date
+            ? lot.receivedDate.toISOString()
+            : lot.receivedDate,
+          mortalityReason: lot.mortalityReason,
+          observations: lot.observations,
+          penAllocations: lot.penAllocations || [],
+        })),
+      };
+      const response = await apiClient.post('/cattle-purchases/batch/reception', payload);
+
+      if (response.data) {
+        const { succeeded, failed, results } = response.data;
+
+        // Recarregar uma única vez após o lote em vez de atualizar compra a compra
+        await loadPurchases();
+
+        if (failed > 0) {
+          toast.warning(`${succeeded} lote(s) recepcionado(s), ${failed} com erro`);
+        } else {
+          toast.success(`${succeeded} lote(s) recepcionado(s) com sucesso!`);
+        }
+        return results;
+      } else {
+        throw new Error('Erro ao registrar recepção em lote');
+      }
+    } catch (err: any) {
+      const errorMessage = err.response?.data?.message || 'Erro ao registrar recepção em lote';
+      setError(errorMessage);
+      toast.error(errorMessage);
+      throw err;
+    } finally {
+      setLoading(false);
+    }
+  }, [loadPurchases]);
+
   // Atualizar status
   const updateStatus = useCallback(async (id: string, status: CattlePurchase['status']) => {
     try {
@@ -692,6 +759,12 @@ export function useCattlePurchasesApi() {
     loadPurchases({ page: 1, limit: size });
   }, [loadPurchases]);
 
+  const changeListQuery = useCallback((query: CattlePurchaseListQuery) => {
+    listQueryRef.current = query;
+    setCurrentPage(1);
+    loadPurchases({ page: 1, limit: pageSize });
+  }, [loadPurchases, pageSize]);
+
   // Carregar dados ao montar o hook com timeout de segurança
   React.useEffect(() => {
     let timeoutId: NodeJS.Timeout;
@@ -735,6 +808,7 @@ export function useCattlePurchasesApi() {
     createPurchase,
     updatePurchase,
     registerReception,
+    registerReceptionBatch,
     markAsConfined,
     updateStatus,
     registerDeath,
@@ -750,5 +824,6 @@ export function useCattlePurchasesApi() {
     pageSize,
     changePage,
     changePageSize,
+    changeListQuery,
   };
 }
@@ -57,6 +57,18 @@ export interface CreateDeathRecordData {
 
 export interface UpdateDeathRecordData extends Partial<CreateDeathRecordData> {}
 
+export interface CreateDeathRecordsBatchData {
+  deathDate?: Date | string;
+  entries: CreateDeathRecordData[]; // deathDate por registro sobrepõe a data do envio
+}
+
+export interface DeathRecordsBatchResult {
+  records: number;
+  totalDeaths: number;
+  lots: { purchaseId: string; lotCode: string; deaths: number }[];
+  pens: number;
+}
+
 export interface DeathStatistics {
   totalDeaths: number;
   deathsByType: Record<string, number>;
@@ -70,7 +82,7 @@ export interface DeathAnalysisByPeriod {
   date: string;
   totalDeaths: number;
   estimatedLoss: number;
-  records: DeathRecord[];
+  records?: DeathRecord[]; // Só com includeRecords
 }
 
 export interface DeathRecordFilters {
@@ -148,6 +160,26 @@ export function useDeathRecordsApi() {
     }
   }, []);
 
+  // Registrar várias mortes de uma vez (ex.: após um temporal)
+  const createDeathRecordsBatch = useCallback(async (data: CreateDeathRecordsBatchData) => {
+    setLoading(true);
+    setError(null);
+    
+    try {
+      const response = await api.post('/death-records/batch', data);
+      toast.success(response.data.message || 'Mortes registradas com sucesso');
+      
+      return response.data.data as DeathRecordsBatchResult;
+    } catch (err: any) {
+      const message = err.response?.data?.message || 'Erro ao registrar mortes';
+      setError(message);
+      toast.error(message);
+      throw err;
+    } finally {
+      setLoading(false);
+    }
+  }, []);
+
   // Atualizar registro de morte
   const updateDeathRecord = useCallback(async (id: string, data: UpdateDeathRecordData) => {
     setLoading(true);
@@ -221,12 +253,13 @@ export function useDeathRecordsApi() {
   }, []);
 
   // Análise por período
-  const getAnalysisByPeriod = useCallback(async (startDate: Date | string, endDate: Date | string) => {
+  const getAnalysisByPeriod = useCallback(async (startDate: Date | string, endDate: Date | string, includeRecords = false) => {
     try {
       const params = new URLSearchParams({
         startDate: startDate.toString(),
         endDate: endDate.toString()
       });
+      if (includeRecords) params.append('includeRecords', 'true');
       
       const response = await api.get(`/death-records/analysis/period?${params.toString()}`);
       return response.data.data as DeathAnalysisByPeriod[];
@@ -275,6 +308,7 @@ export function useDeathRecordsApi() {
     loadDeathRecords,
     getDeathRecord,
     createDeathRecord,
+    createDeathRecordsBatch,
     updateDeathRecord,
     deleteDeathRecord,
     loadStatistics,
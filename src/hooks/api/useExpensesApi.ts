@@ -1,142 +1,116 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { expenseApi, Expense, CreateExpenseData, UpdateExpenseData, ExpenseFilters, ExpenseStats } from '@/services/api/expenseApi';
 import { toast } from 'sonner';
 import { activityLogger } from '@/services/activityLogger';
+import {
+  commitEntity,
+  FetchedPage,
+  fetchEntity,
+  invalidateEntities,
+  refreshEntities,
+  removeEntity,
+  useEntityList,
+  useEntityStats,
+} from '@/hooks/queries/entityCache';
+
+const DEFAULT_PAGE_SIZE = 50;
+const EMPTY_PAGE: FetchedPage<Expense> = { items: [], total: 0, page: 1, totalPages: 1 };
+
+/**
+ * Busca uma página de despesas (compartilhada entre todas as instâncias do hook)
+ */
+const fetchExpensesPage = async (filters: ExpenseFilters): Promise<FetchedPage<Expense>> => {
+  try {
+    const response: any = await expenseApi.getAll(filters);
+
+    // Erro de autenticação ou sem resposta: lista vazia, sem notificar
+    if (!response || (response.status === 'error' && response.message === 'Usuário não autenticado')) {
+      return EMPTY_PAGE;
+    }
+
+    // Verificar primeiro se a resposta tem items (formato da nossa API)
+    if (response.items !== undefined) {
+      return {
+        items: response.items || [],
+        total: response.results || response.total || 0,
+        page: response.page || 1,
+        totalPages: response.totalPages || 1,
+      };
+    }
+
+    if (response.status === 'success') {
+      if (!response.data) return EMPTY_PAGE;
+      // Se response.data for um objeto paginado, extrair o array
+      if (Array.isArray(response.data)) return { items: response.data };
+      const items: Expense[] = response.data.items || [];
+      return {
+        items,
+        total: response.data.total || items.length,
+        page: response.data.page || 1,
+        totalPages: response.data.totalPages || Math.ceil((response.data.total || items.length) / (filters.limit || DEFAULT_PAGE_SIZE)),
+      };
+    }
+
+    // Só lançar erro se realmente for um erro, não uma mensagem informativa
+    if (response.message && !response.message.includes('Nenhuma') && !response.message.includes('encontrad')) {
+      throw new Error(response.message || 'Erro ao carregar despesas');
+    }
+    return EMPTY_PAGE;
+  } catch (err: any) {
+    // Não mostrar erro se for problema de autenticação
+    if (err?.message?.includes('autenticado')) return EMPTY_PAGE;
+    console.error('Erro ao carregar despesas:', err);
+    toast.error('Erro ao carregar despesas');
+    throw err;
+  }
+};
+
+const fetchExpenseStats = async (): Promise<ExpenseStats | null> => {
+  try {
+    const response = await expenseApi.getStats();
+    return response.status === 'success' && response.data ? response.data : null;
+  } catch (err) {
+    console.error('Erro ao carregar estatísticas:', err);
+    return null;
+  }
+};
 
 /**
  * Hook para gerenciar Expenses via API Backend
  * Substitui o hook direto do Supabase por integração via API
  */
 export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
-  const [expenses, setExpenses] = useState<Expense[]>([]);
-  const [loading, setLoading] = useState(true);
+  const queryClient = useQueryClient();
+  const [mutating, setMutating] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [stats, setStats] = useState<ExpenseStats | null>(null);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [totalItems, setTotalItems] = useState(0);
-  const [pageSize, setPageSize] = useState(50);
 
-  /**
-   * Carrega as despesas
-   */
-  const loadExpenses = useCallback(async (filters: ExpenseFilters = {}) => {
-    try {
-      setLoading(true);
-      setError(null);
-
-      const response = await expenseApi.getAll({
-        ...initialFilters,
-        ...filters,
-        page: filters.page || currentPage,
-        limit: filters.limit || pageSize
-      });
+  // `initialFilters` costuma ser um objeto literal novo a cada render
+  const initialFiltersKey = JSON.stringify(initialFilters);
+  const baseFilters = useMemo<ExpenseFilters>(() => JSON.parse(initialFiltersKey), [initialFiltersKey]);
+  const [query, setQuery] = useState<ExpenseFilters>({ page: 1, limit: DEFAULT_PAGE_SIZE });
+  const params = useMemo(() => ({ ...baseFilters, ...query }), [baseFilters, query]);
 
-      // Verificar se a resposta é de erro de autenticação
-      if (response && response.status === 'error' && response.message === 'Usuário não autenticado') {
-        // Não mostrar erro, apenas definir lista vazia
-        setExpenses([]);
-        setTotalItems(0);
-        setTotalPages(1);
-        setCurrentPage(1);
-        return;
-      }
-
-      // Verificar primeiro se a resposta tem items (formato da nossa API)
-      if (response && response.items !== undefined) {
-        setExpenses(response.items || []);
-        setTotalItems(response.results || response.total || 0);
-        setTotalPages(response.totalPages || 1);
-        setCurrentPage(response.page || 1);
-      } else if (response && response.status === 'success') {
-        // Se temos uma resposta de sucesso, processar os dados
-        if (response.data) {
-          // Se response.data for um objeto paginado, extrair o array
-          const items = Array.isArray(response.data)
-            ? response.data
-            : response.data.items || [];
-          setExpenses(items);
+  const { list, items: expenses } = useEntityList('expenses', params, fetchExpensesPage);
+  const stats = useEntityStats('expenses', fetchExpenseStats);
 
-          // Atualizar informações de paginação
-          if (response.data && !Array.isArray(response.data)) {
-            setTotalItems(response.data.total || items.length);
-            setTotalPages(response.data.totalPages || Math.ceil((response.data.total || items.length) / pageSize));
-            setCurrentPage(response.data.page || 1);
-          }
-        } else {
-          // Nenhum dado, mas ainda é sucesso (lista vazia)
-          setExpenses([]);
-          setTotalItems(0);
-          setTotalPages(1);
-          setCurrentPage(1);
-        }
-      } else if (!response) {
-        // Sem resposta (provavelmente não autenticado)
-        setExpenses([]);
-      } else {
-        // Só lançar erro se realmente for um erro, não uma mensagem informativa
-        if (response.message && !response.message.includes('Nenhuma') && !response.message.includes('encontrad')) {
-          throw new Error(response.message || 'Erro ao carregar despesas');
-        }
-        // Se for uma mensagem informativa ou resposta vazia, apenas definir lista vazia
-        setExpenses([]);
-        setTotalItems(0);
-        setTotalPages(1);
-        setCurrentPage(1);
-      }
-    } catch (err) {
-      // Não mostrar erro se for problema de autenticação
-      if (!err.message?.includes('autenticado')) {
-        const errorMessage = err instanceof Error ? err.message : 'Erro desconhecido';
-        setError(errorMessage);
-        console.error('Erro ao carregar despesas:', err);
-        toast.error('Erro ao carregar despesas');
-      }
-      setExpenses([]);
-    } finally {
-      setLoading(false);
-    }
-  }, [initialFilters]);
-
-  /**
-   * Carrega estatísticas
-   */
-  const loadStats = useCallback(async () => {
-    try {
-      const response = await expenseApi.getStats();
-      
-      if (response.status === 'success' && response.data) {
-        // Se response.data for um objeto paginado, extrair o array
-        const items = Array.isArray(response.data) 
-          ? response.data 
-          : response.data.items || [];
-        setExpenses(items);
-        
-        // Atualizar informações de paginação
-        if (response.data && !Array.isArray(response.data)) {
-          setTotalItems(response.data.total || items.length);
-          setTotalPages(response.data.totalPages || Math.ceil((response.data.total || items.length) / pageSize));
-          setCurrentPage(response.data.page || 1);
-        }
-      }
-    } catch (err) {
-      console.error('Erro ao carregar estatísticas:', err);
-    }
-  }, []);
+  const pageSize = params.limit || DEFAULT_PAGE_SIZE;
+  const currentPage = list.data?.page ?? params.page ?? 1;
+  const totalPages = list.data?.totalPages ?? 1;
+  const totalItems = list.data?.total ?? 0;
+  const loading = list.isLoading || mutating;
 
   /**
    * Cria uma nova despesa
    */
   const createExpense = useCallback(async (data: CreateExpenseData): Promise<Expense | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await expenseApi.create(data);
       
       if (response.status === 'success' && response.data) {
-        setExpenses(prev => [response.data!, ...prev]);
-
         // Registrar atividade
         activityLogger.logFinancialTransaction(
           'expense',
@@ -152,8 +126,8 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
 
         toast.success('Despesa criada com sucesso');
 
-        // Recarregar estatísticas
-        loadStats();
+        // A nova despesa entra no cache e as listagens abertas são recarregadas
+        await commitEntity(queryClient, 'expenses', response.data, { created: true });
 
         return response.data;
       } else {
@@ -166,29 +140,24 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
       toast.error('Erro ao criar despesa');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   /**
    * Atualiza uma despesa
    */
   const updateExpense = useCallback(async (id: string, data: UpdateExpenseData): Promise<Expense | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await expenseApi.update(id, data);
       
       if (response.status === 'success' && response.data) {
-        setExpenses(prev => prev.map(expense => 
-          expense.id === id ? response.data! : expense
-        ));
+        commitEntity(queryClient, 'expenses', response.data);
         toast.success('Despesa atualizada com sucesso');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao atualizar despesa');
@@ -200,29 +169,24 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
       toast.error('Erro ao atualizar despesa');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   /**
    * Marca uma despesa como paga
    */
   const markExpenseAsPaid = useCallback(async (id: string, paidValue?: number, paidDate?: string): Promise<Expense | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await expenseApi.markAsPaid(id, paidValue, paidDate);
       
       if (response.status === 'success' && response.data) {
-        setExpenses(prev => prev.map(expense => 
-          expense.id === id ? response.data! : expense
-        ));
+        commitEntity(queryClient, 'expenses', response.data);
         toast.success('Despesa marcada como paga');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao marcar despesa como paga');
@@ -234,27 +198,25 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
       toast.error('Erro ao marcar despesa como paga');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   /**
    * Remove uma despesa
    */
   const deleteExpense = useCallback(async (id: string): Promise<boolean> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await expenseApi.remove(id);
       
       if (response.status === 'success') {
-        setExpenses(prev => prev.filter(expense => expense.id !== id));
+        removeEntity(queryClient, 'expenses', id);
+        invalidateEntities(queryClient, 'expenses');
         toast.success('Despesa removida com sucesso');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return true;
       } else {
         throw new Error(response.message || 'Erro ao remover despesa');
@@ -266,27 +228,28 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
       toast.error('Erro ao remover despesa');
       return false;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   /**
    * Busca uma despesa por ID
    */
   const getExpenseById = useCallback(async (id: string): Promise<Expense | null> => {
     try {
-      const response = await expenseApi.getById(id);
-      
-      if (response.status === 'success' && response.data) {
-        return response.data;
-      } else {
+      return await fetchEntity(queryClient, 'expenses', id, async () => {
+        const response = await expenseApi.getById(id);
+
+        if (response.status === 'success' && response.data) {
+          return response.data;
+        }
         throw new Error(response.message || 'Erro ao buscar despesa');
-      }
+      });
     } catch (err) {
       console.error('Erro ao buscar despesa:', err);
       return null;
     }
-  }, []);
+  }, [queryClient]);
 
   /**
    * Busca despesas por status
@@ -328,11 +291,9 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
    * Recarrega os dados
    */
   const refresh = useCallback(async (filters?: ExpenseFilters) => {
-    await Promise.all([
-      loadExpenses(filters),
-      loadStats()
-    ]);
-  }, [loadExpenses, loadStats]);
+    if (filters) setQuery(prev => ({ ...prev, ...filters }));
+    await refreshEntities(queryClient, 'expenses');
+  }, [queryClient]);
 
   /**
    * Busca despesas por ordem de compra
@@ -352,54 +313,19 @@ export const useExpensesApi = (initialFilters: ExpenseFilters = {}) => {
     }
   }, []);
 
-  // Carregamento inicial com timeout de segurança
-  useEffect(() => {
-    let timeoutId: NodeJS.Timeout;
-    
-    const loadData = async () => {
-      try {
-        await Promise.all([
-          loadExpenses({ page: 1, limit: 50 }),
-          loadStats()
-        ]);
-      } catch (error) {
-        console.error('Erro no carregamento inicial de despesas:', error);
-        // Garantir que loading seja finalizado mesmo em caso de erro
-        setLoading(false);
-      }
-    };
-
-    // Timeout de segurança: se após 30 segundos ainda estiver carregando, finalizar
-    timeoutId = setTimeout(() => {
-      if (loading) {
-        console.warn('⚠️ Timeout no carregamento de despesas - finalizando loading');
-        setLoading(false);
-      }
-    }, 30000);
-
-    loadData();
-
-    return () => {
-      clearTimeout(timeoutId);
-    };
-  }, []); // Executar apenas na montagem
-
   // Funções de paginação
   const changePage = useCallback((page: number) => {
-    setCurrentPage(page);
-    loadExpenses({ page, limit: pageSize });
-  }, [loadExpenses, pageSize]);
+    setQuery(prev => ({ ...prev, page }));
+  }, []);
 
   const changePageSize = useCallback((size: number) => {
-    setPageSize(size);
-    setCurrentPage(1);
-    loadExpenses({ page: 1, limit: size });
-  }, [loadExpenses]);
+    setQuery(prev => ({ ...prev, page: 1, limit: size }));
+  }, []);
 
   return {
     expenses,
     loading,
-    error,
+    error: error || (list.error instanceof Error ? list.error.message : null),
     stats,
     createExpense,
     updateExpense,
@@ -64,6 +64,9 @@ export interface InterventionHistoryFilters {
   startDate?: Date | string;
   endDate?: Date | string;
   type?: 'health' | 'mortality' | 'movement' | 'weight';
+  // Paginação por cursor (`pagination.nextCursor` da resposta); sem cursor nem limit, todas as páginas são carregadas
+  cursor?: string;
+  limit?: number;
 }
 
 export function useInterventionsApi() {
@@ -229,6 +232,7 @@ export function useInterventionsApi() {
       if (filters.cattlePurchaseId) params.append('cattlePurchaseId', filters.cattlePurchaseId);
       if (filters.penId) params.append('penId', filters.penId);
       if (filters.type) params.append('type', filters.type);
+      if (filters.limit) params.append('limit', String(filters.limit));
       
       if (filters.startDate) {
         const startDate = filters.startDate instanceof Date 
@@ -243,29 +247,42 @@ export function useInterventionsApi() {
           : filters.endDate;
         params.append('endDate', endDate);
       }
-      
-      const queryString = params.toString();
-      const url = `/interventions/history${queryString ? `?${queryString}` : ''}`;
-      const response = await apiClient.get(url);
-      
-      // Aceitar múltiplas estruturas de resposta
-      if (response?.data?.data) {
-        return response.data.data; // Retornar apenas o array de intervenções
-      }
-      
-      // Fallback para estruturas diferentes
-      if (Array.isArray(response?.data)) {
-        return response.data;
-      }
-      
-      // Aceitar array direto
-      if (Array.isArray(response)) {
-        return response;
+
+      const fetchPage = async (cursor?: string) => {
+        const pageParams = new URLSearchParams(params);
+        if (cursor) pageParams.set('cursor', cursor);
+        const queryString = pageParams.toString();
+        const response: any = await apiClient.get(`/interventions/history${queryString ? `?${queryString}` : ''}`);
+
+        // Aceitar múltiplas estruturas de resposta
+        const items = Array.isArray(response?.data?.data)
+          ? response.data.data
+          : Array.isArray(response?.data)
+            ? response.data
+            : Array.isArray(response) ? response : null;
+
+        if (!items) {
+          console.warn('⚠️ Resposta inesperada ao buscar histórico de intervenções:', response);
+        }
+
+        return { items: items || [], nextCursor: (response?.pagination?.nextCursor as string | null) ?? null };
+      };
+
+      // Com cursor ou limite explícitos, devolve só a página pedida
+      if (filters.cursor || filters.limit) {
+        return (await fetchPage(filters.cursor)).items;
       }
-      
-      // Se não houver dados, retornar array vazio ao invés de lançar erro
-      console.warn('⚠️ Resposta inesperada ao buscar histórico de intervenções:', response);
-      return [];
+
+      // Sem paginação explícita, segue o cursor até o fim para manter o histórico completo
+      const history: any[] = [];
+      let cursor: string | undefined;
+      do {
+        const page = await fetchPage(cursor);
+        history.push(...page.items);
+        cursor = page.nextCursor || undefined;
+      } while (cursor);
+
+      return history;
     } catch (err: any) {
       console.error('❌ [useInterventionsApi] Erro ao buscar histórico de intervenções:', err);
       const errorMessage = err.response?.data?.message || err.message || 'Erro ao buscar histórico';
@@ -278,13 +295,17 @@ export function useInterventionsApi() {
   }, []);
 
   // Buscar estatísticas de intervenções
-  const getInterventionStatistics = useCallback(async (cycleId?: string) => {
+  // Período do ciclo opcional (compras pela data de compra, demais registros pela data do evento)
+  const getInterventionStatistics = useCallback(async (period?: { startDate?: string; endDate?: string }) => {
     try {
       setLoading(true);
       setError(null);
       
-      const params = cycleId ? `?cycleId=${cycleId}` : '';
-      const response = await apiClient.get(`/interventions/statistics${params}`);
+      const params = new URLSearchParams();
+      if (period?.startDate) params.append('startDate', period.startDate);
+      if (period?.endDate) params.append('endDate', period.endDate);
+      const query = params.toString();
+      const response = await apiClient.get(`/interventions/statistics${query ? `?${query}` : ''}`);
       
       // Aceitar resposta direta ou resposta com data
       if (response?.data) {
@@ -1,86 +1,119 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { partnerApi, Partner, CreatePartnerData, UpdatePartnerData, PartnerFilters, PartnerStats } from '@/services/api/partnerApi';
-import { toast } from 'sonner';
 import { showErrorNotification, showSuccessNotification } from '@/utils/errorHandler';
 import { activityLogger } from '@/services/activityLogger';
+import {
+  commitEntity,
+  entityKeys,
+  ensureEntityList,
+  FetchedPage,
+  fetchEntity,
+  invalidateEntities,
+  refreshEntities,
+  removeEntity,
+  useEntityList,
+  useEntityStats,
+} from '@/hooks/queries/entityCache';
+
+const DEFAULT_PAGE_SIZE = 50;
+
+/**
+ * Busca uma página de parceiros (compartilhada entre todas as instâncias do hook)
+ */
+const fetchPartnersPage = async (filters: PartnerFilters): Promise<FetchedPage<Partner>> => {
+  try {
+    const response = await partnerApi.getAll(filters);
+
+    if (response.status === 'success' && response.data) {
+      // Se response.data for um objeto paginado, extrair o array
+      if (Array.isArray(response.data)) {
+        return { items: response.data };
+      }
+      const data = response.data as any;
+      const items: Partner[] = data.items || [];
+      return {
+        items,
+        total: data.total || items.length,
+        page: data.page || 1,
+        totalPages: data.totalPages || Math.ceil((data.total || items.length) / (filters.limit || DEFAULT_PAGE_SIZE)),
+      };
+    }
+    throw new Error(response.message || 'Erro ao carregar parceiros');
+  } catch (err) {
+    console.error('Erro ao carregar parceiros:', err);
+    showErrorNotification(err, 'Erro ao carregar parceiros');
+    throw err;
+  }
+};
+
+const fetchPartnerStats = async (): Promise<PartnerStats | null> => {
+  try {
+    const response = await partnerApi.getStats();
+    return response.status === 'success' && response.data ? response.data : null;
+  } catch (err) {
+    console.error('Erro ao carregar estatísticas:', err);
+    return null;
+  }
+};
 
 /**
  * Hook para gerenciar Partners via API Backend
  * Substitui o hook direto do Supabase por integração via API
  */
 export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
-  const [partners, setPartners] = useState<Partner[]>([]);
-  const [loading, setLoading] = useState(true);
+  const queryClient = useQueryClient();
+  const [mutating, setMutating] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [stats, setStats] = useState<PartnerStats | null>(null);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [totalItems, setTotalItems] = useState(0);
-  const [pageSize, setPageSize] = useState(50);
+
+  // `initialFilters` costuma ser um objeto literal novo a cada render
+  const initialFiltersKey = JSON.stringify(initialFilters);
+  const baseFilters = useMemo<PartnerFilters>(() => JSON.parse(initialFiltersKey), [initialFiltersKey]);
+  const [query, setQuery] = useState<PartnerFilters>({ page: 1, limit: DEFAULT_PAGE_SIZE });
+  const params = useMemo(() => ({ ...baseFilters, ...query }), [baseFilters, query]);
+
+  const { list, items: partners } = useEntityList('partners', params, fetchPartnersPage);
+  const stats = useEntityStats('partners', fetchPartnerStats);
+
+  const pageSize = params.limit || DEFAULT_PAGE_SIZE;
+  const currentPage = list.data?.page ?? params.page ?? 1;
+  const totalPages = list.data?.totalPages ?? 1;
+  const totalItems = list.data?.total ?? 0;
+  const loading = list.isLoading || mutating;
 
   /**
-   * Carrega os parceiros
+   * Carrega os parceiros (reaproveita a listagem em cache se ainda estiver fresca)
    */
   const loadPartners = useCallback(async (filters: PartnerFilters = {}) => {
+    const next = {
+      ...query,
+      ...filters,
+      page: filters.page || query.page,
+      limit: filters.limit || query.limit
+    };
+    setQuery(prev => JSON.stringify(prev) === JSON.stringify(next) ? prev : next);
+
     try {
-      setLoading(true);
       setError(null);
-
-      const response = await partnerApi.getAll({ 
-        ...initialFilters, 
-        ...filters,
-        page: filters.page || currentPage,
-        limit: filters.limit || pageSize 
-      });
-      
-      if (response.status === 'success' && response.data) {
-        // Se response.data for um objeto paginado, extrair o array
-        const items = Array.isArray(response.data) 
-          ? response.data 
-          : response.data.items || [];
-        setPartners(items);
-        
-        // Atualizar informações de paginação
-        if (response.data && !Array.isArray(response.data)) {
-          setTotalItems(response.data.total || items.length);
-          setTotalPages(response.data.totalPages || Math.ceil((response.data.total || items.length) / pageSize));
-          setCurrentPage(response.data.page || 1);
-        }
-      } else {
-        throw new Error(response.message || 'Erro ao carregar parceiros');
-      }
+      await ensureEntityList(queryClient, 'partners', { ...baseFilters, ...next }, fetchPartnersPage);
     } catch (err) {
-      const errorMessage = err instanceof Error ? err.message : 'Erro desconhecido';
-      setError(errorMessage);
-      console.error('Erro ao carregar parceiros:', err);
-      showErrorNotification(err, 'Erro ao carregar parceiros');
-    } finally {
-      setLoading(false);
+      setError(err instanceof Error ? err.message : 'Erro desconhecido');
     }
-  }, [initialFilters]);
+  }, [queryClient, baseFilters, query]);
 
   /**
    * Carrega estatísticas
    */
   const loadStats = useCallback(async () => {
-    try {
-      const response = await partnerApi.getStats();
-      
-      if (response.status === 'success' && response.data) {
-        // Stats não deve sobrescrever os partners, apenas atualizar as estatísticas
-        // Não chamar setPartners aqui pois isso apaga a lista de parceiros
-      }
-    } catch (err) {
-      console.error('Erro ao carregar estatísticas:', err);
-    }
-  }, []);
+    await queryClient.invalidateQueries({ queryKey: entityKeys.stats('partners') });
+  }, [queryClient]);
 
   /**
    * Cria um novo parceiro
    */
   const createPartner = useCallback(async (data: CreatePartnerData): Promise<Partner | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await partnerApi.create(data);
@@ -103,9 +136,8 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
 
         showSuccessNotification('Parceiro criado com sucesso');
 
-        // Recarregar a lista completa para garantir sincronização
-        await loadPartners();
-        await loadStats();
+        // O novo parceiro entra no cache e as listagens abertas são recarregadas
+        await commitEntity(queryClient, 'partners', response.data, { created: true });
         
         return response.data;
       } else {
@@ -120,16 +152,16 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
       showErrorNotification(err, 'Erro ao criar parceiro');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPartners, loadStats]);
+  }, [queryClient]);
 
   /**
    * Atualiza um parceiro
    */
   const updatePartner = useCallback(async (id: string, data: UpdatePartnerData): Promise<Partner | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await partnerApi.update(id, data);
@@ -148,9 +180,8 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
 
         showSuccessNotification('Parceiro atualizado com sucesso');
 
-        // Recarregar a lista completa para garantir sincronização
-        await loadPartners();
-        await loadStats();
+        // Atualiza a entidade em todas as listagens sem buscá-las de novo
+        await commitEntity(queryClient, 'partners', response.data);
         
         return response.data;
       } else {
@@ -163,29 +194,24 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
       showErrorNotification(err, 'Erro ao atualizar parceiro');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPartners, loadStats]);
+  }, [queryClient, partners]);
 
   /**
    * Ativa/desativa um parceiro
    */
   const togglePartnerStatus = useCallback(async (id: string, isActive: boolean): Promise<Partner | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await partnerApi.toggleStatus(id, isActive);
       
       if (response.status === 'success' && response.data) {
-        setPartners(prev => prev.map(partner => 
-          partner.id === id ? response.data! : partner
-        ));
+        commitEntity(queryClient, 'partners', response.data);
         showSuccessNotification(`Parceiro ${isActive ? 'ativado' : 'desativado'} com sucesso`);
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao alterar status do parceiro');
@@ -197,23 +223,23 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
       showErrorNotification(err, 'Erro ao alterar status');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPartners, loadStats]);
+  }, [queryClient]);
 
   /**
    * Remove um parceiro
    */
   const deletePartner = useCallback(async (id: string): Promise<boolean> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await partnerApi.remove(id);
       
       if (response.status === 'success') {
         const deletedPartner = partners.find(p => p.id === id);
-        setPartners(prev => prev.filter(partner => partner.id !== id));
+        removeEntity(queryClient, 'partners', id);
 
         // Registrar atividade
         if (deletedPartner) {
@@ -226,9 +252,9 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
         }
 
         showSuccessNotification('Parceiro removido com sucesso');
-        
-        // Recarregar estatísticas
-        loadStats();
+
+        // Estatísticas e demais páginas ficam desatualizadas
+        invalidateEntities(queryClient, 'partners');
         
         return true;
       } else {
@@ -241,27 +267,28 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
       showErrorNotification(err, 'Erro ao remover parceiro');
       return false;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPartners, loadStats]);
+  }, [queryClient, partners]);
 
   /**
-   * Busca um parceiro por ID
+   * Busca um parceiro por ID (usa o cache normalizado quando disponível)
    */
   const getPartnerById = useCallback(async (id: string): Promise<Partner | null> => {
     try {
-      const response = await partnerApi.getById(id);
-      
-      if (response.status === 'success' && response.data) {
-        return response.data;
-      } else {
+      return await fetchEntity(queryClient, 'partners', id, async () => {
+        const response = await partnerApi.getById(id);
+
+        if (response.status === 'success' && response.data) {
+          return response.data;
+        }
         throw new Error(response.message || 'Erro ao buscar parceiro');
-      }
+      });
     } catch (err) {
       console.error('Erro ao buscar parceiro:', err);
       return null;
     }
-  }, []);
+  }, [queryClient]);
 
   /**
    * Busca parceiros por tipo
@@ -320,67 +347,21 @@ export const usePartnersApi = (initialFilters: PartnerFilters = {}) => {
   /**
    * Recarrega os dados
    */
-  const refresh = useCallback(() => {
-    loadPartners();
-    loadStats();
-  }, [loadPartners, loadStats]);
-
-  // Carregamento inicial
-  useEffect(() => {
-    
-    const loadInitialData = async () => {
-      try {
-        setLoading(true);
-        
-        // Carregar partners e stats em paralelo
-        const [partnersResponse, statsResponse] = await Promise.all([
-          partnerApi.getAll({ ...initialFilters, page: 1, limit: pageSize }),
-          partnerApi.getStats()
-        ]);
-        
-        if (partnersResponse.status === 'success' && partnersResponse.data) {
-          const items = Array.isArray(partnersResponse.data) 
-            ? partnersResponse.data 
-            : partnersResponse.data.items || [];
-          setPartners(items);
-          
-          // Atualizar informações de paginação no carregamento inicial
-          if (!Array.isArray(partnersResponse.data)) {
-            setTotalItems(partnersResponse.data.total || items.length);
-            setTotalPages(partnersResponse.data.totalPages || Math.ceil((partnersResponse.data.total || items.length) / pageSize));
-          }
-        }
-        
-        if (statsResponse.status === 'success' && statsResponse.data) {
-          setStats(statsResponse.data);
-        }
-      } catch (err) {
-        console.error('[usePartnersApi] Erro no carregamento inicial:', err);
-        setError(err instanceof Error ? err.message : 'Erro desconhecido');
-      } finally {
-        setLoading(false);
-      }
-    };
-    
-    loadInitialData();
-  }, []); // Executar apenas na montagem
+  const refresh = useCallback(() => refreshEntities(queryClient, 'partners'), [queryClient]);
 
-  // Fun\u00e7\u00f5es de pagina\u00e7\u00e3o
+  // Funções de paginação
   const changePage = useCallback((page: number) => {
-    setCurrentPage(page);
-    loadPartners({ page, limit: pageSize });
-  }, [loadPartners, pageSize]);
+    setQuery(prev => ({ ...prev, page }));
+  }, []);
 
   const changePageSize = useCallback((size: number) => {
-    setPageSize(size);
-    setCurrentPage(1);
-    loadPartners({ page: 1, limit: size });
-  }, [loadPartners]);
+    setQuery(prev => ({ ...prev, page: 1, limit: size }));
+  }, []);
 
   return {
     partners,
     loading,
-    error,
+    error: error || (list.error instanceof Error ? list.error.message : null),
     stats,
     loadPartners,
     loadStats,
@@ -1,73 +1,101 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { payerAccountApi, PayerAccount, CreatePayerAccountData, UpdatePayerAccountData, PayerAccountFilters, PayerAccountStats } from '@/services/api/payerAccountApi';
-import { toast } from 'sonner';
 import { showErrorNotification, showSuccessNotification } from '@/utils/errorHandler';
 import { activityLogger } from '@/services/activityLogger';
+import {
+  commitEntity,
+  ensureEntityList,
+  entityKeys,
+  FetchedPage,
+  fetchEntity,
+  invalidateEntities,
+  refreshEntities,
+  removeEntity,
+  useEntityList,
+  useEntityStats,
+} from '@/hooks/queries/entityCache';
+
+/**
+ * Busca as contas pagadoras (compartilhada entre todas as instâncias do hook)
+ */
+export const fetchPayerAccountsPage = async (filters: PayerAccountFilters): Promise<FetchedPage<PayerAccount>> => {
+  try {
+    const response = await payerAccountApi.getAll(filters);
+
+    if (response.status === 'success' && response.data) {
+      // Se response.data for um objeto paginado, extrair o array
+      if (Array.isArray(response.data)) {
+        return { items: response.data };
+      }
+      const data = response.data as any;
+      return { items: data.items || [], total: data.total, page: data.page, totalPages: data.totalPages };
+    }
+    throw new Error(response.message || 'Erro ao carregar contas pagadoras');
+  } catch (err) {
+    console.error('Erro ao carregar contas pagadoras:', err);
+    showErrorNotification(err, 'Erro ao carregar contas pagadoras');
+    throw err;
+  }
+};
+
+const fetchPayerAccountStats = async (): Promise<PayerAccountStats | null> => {
+  try {
+    const response = await payerAccountApi.getStats();
+    return response.status === 'success' && response.data ? response.data : null;
+  } catch (err) {
+    console.error('Erro ao carregar estatísticas:', err);
+    return null;
+  }
+};
 
 /**
  * Hook para gerenciar PayerAccounts via API Backend
  * Substitui o hook direto do Supabase por integração via API
  */
 export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) => {
-  const [payerAccounts, setPayerAccounts] = useState<PayerAccount[]>([]);
-  const [loading, setLoading] = useState(true);
+  const queryClient = useQueryClient();
+  const [mutating, setMutating] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [stats, setStats] = useState<PayerAccountStats | null>(null);
+
+  // `initialFilters` costuma ser um objeto literal novo a cada render
+  const initialFiltersKey = JSON.stringify(initialFilters);
+  const baseFilters = useMemo<PayerAccountFilters>(() => JSON.parse(initialFiltersKey), [initialFiltersKey]);
+  const [query, setQuery] = useState<PayerAccountFilters>({});
+  const params = useMemo(() => ({ ...baseFilters, ...query }), [baseFilters, query]);
+
+  const { list, items: payerAccounts } = useEntityList('payer-accounts', params, fetchPayerAccountsPage);
+  const stats = useEntityStats('payer-accounts', fetchPayerAccountStats);
+  const loading = list.isLoading || mutating;
 
   /**
-   * Carrega as contas pagadoras
+   * Carrega as contas pagadoras (reaproveita a listagem em cache se ainda estiver fresca)
    */
   const loadPayerAccounts = useCallback(async (filters: PayerAccountFilters = {}) => {
+    const next = { ...query, ...filters };
+    setQuery(prev => JSON.stringify(prev) === JSON.stringify(next) ? prev : next);
+
     try {
-      setLoading(true);
       setError(null);
-
-      const response = await payerAccountApi.getAll({ ...initialFilters, ...filters });
-      
-      if (response.status === 'success' && response.data) {
-        // Se response.data for um objeto paginado, extrair o array
-        const items = Array.isArray(response.data) 
-          ? response.data 
-          : response.data.items || [];
-        setPayerAccounts(items);
-      } else {
-        throw new Error(response.message || 'Erro ao carregar contas pagadoras');
-      }
+      await ensureEntityList(queryClient, 'payer-accounts', { ...baseFilters, ...next }, fetchPayerAccountsPage);
     } catch (err) {
-      const errorMessage = err instanceof Error ? err.message : 'Erro desconhecido';
-      setError(errorMessage);
-      console.error('Erro ao carregar contas pagadoras:', err);
-      showErrorNotification(err, 'Erro ao carregar contas pagadoras');
-    } finally {
-      setLoading(false);
+      setError(err instanceof Error ? err.message : 'Erro desconhecido');
     }
-  }, [initialFilters]);
+  }, [queryClient, baseFilters, query]);
 
   /**
    * Carrega estatísticas
    */
   const loadStats = useCallback(async () => {
-    try {
-      const response = await payerAccountApi.getStats();
-      
-      if (response.status === 'success' && response.data) {
-        // Se response.data for um objeto paginado, extrair o array
-        const items = Array.isArray(response.data) 
-          ? response.data 
-          : response.data.items || [];
-        setPayerAccounts(items);
-      }
-    } catch (err) {
-      console.error('Erro ao carregar estatísticas:', err);
-    }
-  }, []);
+    await queryClient.invalidateQueries({ queryKey: entityKeys.stats('payer-accounts') });
+  }, [queryClient]);
 
   /**
    * Cria uma nova conta pagadora
    */
   const createPayerAccount = useCallback(async (data: CreatePayerAccountData): Promise<PayerAccount | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await payerAccountApi.create(data);
@@ -89,9 +117,8 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
 
         showSuccessNotification('Conta pagadora criada com sucesso');
 
-        // Recarregar a lista completa para garantir sincronização
-        await loadPayerAccounts();
-        await loadStats();
+        // A nova conta entra no cache e as listagens abertas são recarregadas
+        await commitEntity(queryClient, 'payer-accounts', response.data, { created: true });
         
         return response.data;
       } else {
@@ -104,16 +131,16 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
       showErrorNotification(err, 'Erro ao criar conta pagadora');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPayerAccounts, loadStats]);
+  }, [queryClient]);
 
   /**
    * Atualiza uma conta pagadora
    */
   const updatePayerAccount = useCallback(async (id: string, data: UpdatePayerAccountData): Promise<PayerAccount | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await payerAccountApi.update(id, data);
@@ -132,9 +159,8 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
 
         showSuccessNotification('Conta pagadora atualizada com sucesso');
 
-        // Recarregar a lista completa para garantir sincronização
-        await loadPayerAccounts();
-        await loadStats();
+        // Atualiza a conta em todas as listagens sem buscá-las de novo
+        await commitEntity(queryClient, 'payer-accounts', response.data);
         
         return response.data;
       } else {
@@ -147,29 +173,24 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
       showErrorNotification(err, 'Erro ao atualizar conta pagadora');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPayerAccounts, loadStats]);
+  }, [queryClient, payerAccounts]);
 
   /**
    * Atualiza o saldo de uma conta
    */
   const updateAccountBalance = useCallback(async (id: string, balance: number, operation: 'ADD' | 'SUBTRACT' | 'SET'): Promise<PayerAccount | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await payerAccountApi.updateBalance(id, balance, operation);
       
       if (response.status === 'success' && response.data) {
-        setPayerAccounts(prev => prev.map(account => 
-          account.id === id ? response.data! : account
-        ));
+        commitEntity(queryClient, 'payer-accounts', response.data);
         showSuccessNotification('Saldo atualizado com sucesso');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao atualizar saldo');
@@ -181,29 +202,24 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
       showErrorNotification(err, 'Erro ao atualizar saldo');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPayerAccounts, loadStats]);
+  }, [queryClient]);
 
   /**
    * Ativa/desativa uma conta
    */
   const toggleAccountStatus = useCallback(async (id: string, isActive: boolean): Promise<PayerAccount | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await payerAccountApi.toggleStatus(id, isActive);
       
       if (response.status === 'success' && response.data) {
-        setPayerAccounts(prev => prev.map(account => 
-          account.id === id ? response.data! : account
-        ));
+        commitEntity(queryClient, 'payer-accounts', response.data);
         showSuccessNotification(`Conta ${isActive ? 'ativada' : 'desativada'} com sucesso`);
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao alterar status da conta');
@@ -215,23 +231,23 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
       showErrorNotification(err, 'Erro ao alterar status');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPayerAccounts, loadStats]);
+  }, [queryClient]);
 
   /**
    * Remove uma conta pagadora
    */
   const deletePayerAccount = useCallback(async (id: string): Promise<boolean> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await payerAccountApi.remove(id);
       
       if (response.status === 'success') {
         const deletedAccount = payerAccounts.find(a => a.id === id);
-        setPayerAccounts(prev => prev.filter(account => account.id !== id));
+        removeEntity(queryClient, 'payer-accounts', id);
 
         // Registrar atividade
         if (deletedAccount) {
@@ -244,9 +260,9 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
         }
 
         showSuccessNotification('Conta pagadora removida com sucesso');
-        
-        // Recarregar estatísticas
-        loadStats();
+
+        // Estatísticas e demais listagens ficam desatualizadas
+        invalidateEntities(queryClient, 'payer-accounts');
         
         return true;
       } else {
@@ -259,27 +275,28 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
       showErrorNotification(err, 'Erro ao remover conta pagadora');
       return false;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadPayerAccounts, loadStats]);
+  }, [queryClient, payerAccounts]);
 
   /**
-   * Busca uma conta pagadora por ID
+   * Busca uma conta pagadora por ID (usa o cache normalizado quando disponível)
    */
   const getPayerAccountById = useCallback(async (id: string): Promise<PayerAccount | null> => {
     try {
-      const response = await payerAccountApi.getById(id);
-      
-      if (response.status === 'success' && response.data) {
-        return response.data;
-      } else {
+      return await fetchEntity(queryClient, 'payer-accounts', id, async () => {
+        const response = await payerAccountApi.getById(id);
+
+        if (response.status === 'success' && response.data) {
+          return response.data;
+        }
         throw new Error(response.message || 'Erro ao buscar conta pagadora');
-      }
+      });
     } catch (err) {
       console.error('Erro ao buscar conta pagadora:', err);
       return null;
     }
-  }, []);
+  }, [queryClient]);
 
   /**
    * Busca contas por status
@@ -338,53 +355,17 @@ export const usePayerAccountsApi = (initialFilters: PayerAccountFilters = {}) =>
   /**
    * Recarrega os dados
    */
-  const refresh = useCallback(() => {
-    loadPayerAccounts();
-    loadStats();
-  }, [loadPayerAccounts, loadStats]);
-
-  // Carregamento inicial
-  useEffect(() => {
-    
-    const loadInitialData = async () => {
-      try {
-        setLoading(true);
-        
-        // Carregar payer accounts e stats em paralelo
-        const [accountsResponse, statsResponse] = await Promise.all([
-          payerAccountApi.getAll(initialFilters),
-          payerAccountApi.getStats()
-        ]);
-        
-        if (accountsResponse.status === 'success' && accountsResponse.data) {
-          const items = Array.isArray(accountsResponse.data) 
-            ? accountsResponse.data 
-            : accountsResponse.data.items || [];
-          setPayerAccounts(items);
-        }
-        
-        if (statsResponse.status === 'success' && statsResponse.data) {
-          setStats(statsResponse.data);
-        }
-      } catch (err) {
-        console.error('[usePayerAccountsApi] Erro no carregamento inicial:', err);
-        setError(err instanceof Error ? err.message : 'Erro desconhecido');
-      } finally {
-        setLoading(false);
-      }
-    };
-    
-    loadInitialData();
-  }, []); // Executar apenas na montagem
+  const refresh = useCallback(() => refreshEntities(queryClient, 'payer-accounts'), [queryClient]);
 
   return {
     accounts: payerAccounts, // Alias para compatibilidade
     payerAccounts,
     loading,
-    error,
+    error: error || (list.error instanceof Error ? list.error.message : null),
     stats,
     loadAccounts: loadPayerAccounts,
     loadPayerAccounts,
+    fetchPayerAccounts: loadPayerAccounts, // Alias usado por InterventionsManagement
     loadStats,
     createPayerAccount,
     updatePayerAccount,
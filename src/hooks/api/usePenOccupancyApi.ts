@@ -1,5 +1,6 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { penApi } from '@/services/api/penApi';
+import { socketService } from '@/services/socket';
 import { toast } from 'sonner';
 
 interface PenOccupancy {
@@ -13,9 +14,47 @@ interface PenOccupancy {
   activeLots: number;
 }
 
+interface PenOccupancyDelta {
+  type: 'pen_delta';
+  version: number;
+  changes: any[];
+  removed: string[];
+}
+
+/**
+ * Converte um curral da API (ou de um delta do WebSocket) para o formato de ocupação
+ */
+const toPenOccupancy = (pen: any): PenOccupancy => {
+  const occupancyRate = pen.percentageOccupied || (
+    pen.capacity > 0 
+      ? ((pen.currentOccupancy || 0) / pen.capacity) * 100 
+      : 0
+  );
+
+  let status: PenOccupancy['status'] = 'available';
+  if (pen.status === 'MAINTENANCE' || pen.status === 'QUARANTINE') {
+    status = 'maintenance';
+  } else if (pen.status === 'OCCUPIED' && occupancyRate >= 95) {
+    status = 'full';
+  } else if (pen.status === 'OCCUPIED' && occupancyRate > 0) {
+    status = 'partial';
+  }
+
+  return {
+    penId: pen.penId || pen.id,
+    penNumber: pen.penNumber,
+    capacity: pen.capacity,
+    currentOccupancy: pen.currentOccupancy || 0,
+    occupancyRate,
+    status,
+    lastUpdated: new Date(),
+    activeLots: pen.activeLots || Math.ceil((pen.currentOccupancy || 0) > 0 ? 1 : 0)
+  };
+};
+
 /**
  * Hook para gerenciar ocupação de currais via API Backend
- * Substitui o hook useRealtimePenOccupancy que usava dados mockados
+ * Carrega a ocupação uma vez e aplica as variações publicadas pelo servidor via WebSocket
  */
 export const usePenOccupancyApi = () => {
   const [occupancyData, setOccupancyData] = useState<PenOccupancy[]>([]);
@@ -41,33 +80,7 @@ export const usePenOccupancyApi = () => {
           : response.data.items || [];
 
         // Mapear para formato de ocupação
-        const occupancy: PenOccupancy[] = occupancyInfo.map(pen => {
-          const occupancyRate = pen.percentageOccupied || (
-            pen.capacity > 0 
-              ? ((pen.currentOccupancy || 0) / pen.capacity) * 100 
-              : 0
-          );
-
-          let status: PenOccupancy['status'] = 'available';
-          if (pen.status === 'MAINTENANCE' || pen.status === 'QUARANTINE') {
-            status = 'maintenance';
-          } else if (pen.status === 'OCCUPIED' && occupancyRate >= 95) {
-            status = 'full';
-          } else if (pen.status === 'OCCUPIED' && occupancyRate > 0) {
-            status = 'partial';
-          }
-
-          return {
-            penId: pen.penId || pen.id,
-            penNumber: pen.penNumber,
-            capacity: pen.capacity,
-            currentOccupancy: pen.currentOccupancy || 0,
-            occupancyRate,
-            status,
-            lastUpdated: new Date(),
-            activeLots: pen.activeLots || Math.ceil((pen.currentOccupancy || 0) > 0 ? 1 : 0)
-          };
-        });
+        const occupancy: PenOccupancy[] = occupancyInfo.map(toPenOccupancy);
 
         setOccupancyData(occupancy);
         setIsConnected(true);
@@ -131,19 +144,59 @@ export const usePenOccupancyApi = () => {
     }
   }, [loadOccupancyData]);
 
-  // Carrega dados iniciais
+  /**
+   * Aplica uma variação de ocupação publicada pelo servidor
+   */
+  const lastVersionRef = useRef<number | null>(null);
+
+  const applyDelta = useCallback((delta: PenOccupancyDelta) => {
+    if (delta?.type !== 'pen_delta') return;
+
+    // Versão fora de sequência: alguma variação foi perdida, recarrega tudo
+    const lastVersion = lastVersionRef.current;
+    lastVersionRef.current = delta.version;
+    if (lastVersion !== null && delta.version !== lastVersion + 1) {
+      loadOccupancyData();
+      return;
+    }
+
+    setOccupancyData(prev => {
+      const removed = new Set(delta.removed || []);
+      const byPen = new Map(
+        prev.filter(p => !removed.has(p.penId)).map(p => [p.penId, p])
+      );
+
+      (delta.changes || []).forEach(change => {
+        const pen = toPenOccupancy(change);
+        byPen.set(pen.penId, pen);
+      });
+
+      return Array.from(byPen.values());
+    });
+  }, [loadOccupancyData]);
+
+  // Carrega dados iniciais e passa a receber as variações em tempo real
   useEffect(() => {
     loadOccupancyData();
 
-    // Atualização periódica a cada 30 segundos
-    const interval = setInterval(() => {
-      if (!loading) {
-        loadOccupancyData();
-      }
-    }, 30000);
+    const token = localStorage.getItem('authToken');
+    if (token && !socketService.isConnected()) {
+      socketService.connect(token);
+    }
 
-    return () => clearInterval(interval);
-  }, [loadOccupancyData]);
+    socketService.subscribePenOccupancy(applyDelta);
+
+    // Variações publicadas enquanto desconectado são perdidas
+    const offReconnect = socketService.onReconnect(() => {
+      lastVersionRef.current = null;
+      loadOccupancyData();
+    });
+
+    return () => {
+      socketService.unsubscribePenOccupancy(applyDelta);
+      offReconnect();
+    };
+  }, [loadOccupancyData, applyDelta]);
 
   return {
     occupancyData,
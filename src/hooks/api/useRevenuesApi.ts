@@ -1,131 +1,116 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { revenueApi, Revenue, CreateRevenueData, UpdateRevenueData, RevenueFilters, RevenueStats } from '@/services/api/revenueApi';
 import { toast } from 'sonner';
 import { activityLogger } from '@/services/activityLogger';
+import {
+  commitEntity,
+  FetchedPage,
+  fetchEntity,
+  invalidateEntities,
+  refreshEntities,
+  removeEntity,
+  useEntityList,
+  useEntityStats,
+} from '@/hooks/queries/entityCache';
+
+const DEFAULT_PAGE_SIZE = 50;
+const EMPTY_PAGE: FetchedPage<Revenue> = { items: [], total: 0, page: 1, totalPages: 1 };
+
+/**
+ * Busca uma página de receitas (compartilhada entre todas as instâncias do hook)
+ */
+const fetchRevenuesPage = async (filters: RevenueFilters): Promise<FetchedPage<Revenue>> => {
+  try {
+    const response: any = await revenueApi.getAll(filters);
+
+    // Erro de autenticação ou sem resposta: lista vazia, sem notificar
+    if (!response || (response.status === 'error' && response.message === 'Usuário não autenticado')) {
+      return EMPTY_PAGE;
+    }
+
+    // Verificar primeiro se a resposta tem items (formato da nossa API)
+    if (response.items !== undefined) {
+      return {
+        items: response.items || [],
+        total: response.results || response.total || 0,
+        page: response.page || 1,
+        totalPages: response.totalPages || 1,
+      };
+    }
+
+    if (response.status === 'success') {
+      if (!response.data) return EMPTY_PAGE;
+      // Se response.data for um objeto paginado, extrair o array
+      if (Array.isArray(response.data)) return { items: response.data };
+      const items: Revenue[] = response.data.items || [];
+      return {
+        items,
+        total: response.data.total || items.length,
+        page: response.data.page || 1,
+        totalPages: response.data.totalPages || Math.ceil((response.data.total || items.length) / (filters.limit || DEFAULT_PAGE_SIZE)),
+      };
+    }
+
+    // Só lançar erro se realmente for um erro, não uma mensagem informativa
+    if (response.message && !response.message.includes('Nenhuma') && !response.message.includes('encontrad')) {
+      throw new Error(response.message || 'Erro ao carregar receitas');
+    }
+    return EMPTY_PAGE;
+  } catch (err: any) {
+    // Não mostrar erro se for problema de autenticação
+    if (err?.message?.includes('autenticado')) return EMPTY_PAGE;
+    console.error('Erro ao carregar receitas:', err);
+    toast.error('Erro ao carregar receitas');
+    throw err;
+  }
+};
+
+const fetchRevenueStats = async (): Promise<RevenueStats | null> => {
+  try {
+    const response = await revenueApi.getStats();
+    return response.status === 'success' && response.data ? response.data : null;
+  } catch (err) {
+    console.error('Erro ao carregar estatísticas:', err);
+    return null;
+  }
+};
 
 /**
  * Hook para gerenciar Revenues via API Backend
  * Substitui o hook direto do Supabase por integração via API
  */
 export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
-  const [revenues, setRevenues] = useState<Revenue[]>([]);
-  const [loading, setLoading] = useState(true);
+  const queryClient = useQueryClient();
+  const [mutating, setMutating] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [stats, setStats] = useState<RevenueStats | null>(null);
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [totalItems, setTotalItems] = useState(0);
-  const [pageSize, setPageSize] = useState(50);
-
-  /**
-   * Carrega as receitas
-   */
-  const loadRevenues = useCallback(async (filters: RevenueFilters = {}) => {
-    try {
-      setLoading(true);
-      setError(null);
 
-      const response = await revenueApi.getAll({
-        ...initialFilters,
-        ...filters,
-        page: filters.page || currentPage,
-        limit: filters.limit || pageSize
-      });
+  // `initialFilters` costuma ser um objeto literal novo a cada render
+  const initialFiltersKey = JSON.stringify(initialFilters);
+  const baseFilters = useMemo<RevenueFilters>(() => JSON.parse(initialFiltersKey), [initialFiltersKey]);
+  const [query, setQuery] = useState<RevenueFilters>({ page: 1, limit: DEFAULT_PAGE_SIZE });
+  const params = useMemo(() => ({ ...baseFilters, ...query }), [baseFilters, query]);
 
-      // Verificar se a resposta é de erro de autenticação
-      if (response && response.status === 'error' && response.message === 'Usuário não autenticado') {
-        // Não mostrar erro, apenas definir lista vazia
-        setRevenues([]);
-        setTotalItems(0);
-        setTotalPages(1);
-        setCurrentPage(1);
-        return;
-      }
+  const { list, items: revenues } = useEntityList('revenues', params, fetchRevenuesPage);
+  const stats = useEntityStats('revenues', fetchRevenueStats);
 
-      // Verificar primeiro se a resposta tem items (formato da nossa API)
-      if (response && response.items !== undefined) {
-        setRevenues(response.items || []);
-        setTotalItems(response.results || response.total || 0);
-        setTotalPages(response.totalPages || 1);
-        setCurrentPage(response.page || 1);
-      } else if (response && response.status === 'success') {
-        // Se temos uma resposta de sucesso, processar os dados
-        if (response.data) {
-          // Se response.data for um objeto paginado, extrair o array
-          const items = Array.isArray(response.data)
-            ? response.data
-            : response.data.items || [];
-          setRevenues(items);
-
-          // Atualizar informações de paginação
-          if (response.data && !Array.isArray(response.data)) {
-            setTotalItems(response.data.total || items.length);
-            setTotalPages(response.data.totalPages || Math.ceil((response.data.total || items.length) / pageSize));
-            setCurrentPage(response.data.page || 1);
-          }
-        } else {
-          // Nenhum dado, mas ainda é sucesso (lista vazia)
-          setRevenues([]);
-          setTotalItems(0);
-          setTotalPages(1);
-          setCurrentPage(1);
-        }
-      } else if (!response) {
-        // Sem resposta (provavelmente não autenticado)
-        setRevenues([]);
-      } else {
-        // Só lançar erro se realmente for um erro, não uma mensagem informativa
-        if (response.message && !response.message.includes('Nenhuma') && !response.message.includes('encontrad')) {
-          throw new Error(response.message || 'Erro ao carregar receitas');
-        }
-        // Se for uma mensagem informativa ou resposta vazia, apenas definir lista vazia
-        setRevenues([]);
-        setTotalItems(0);
-        setTotalPages(1);
-        setCurrentPage(1);
-      }
-    } catch (err) {
-      // Não mostrar erro se for problema de autenticação
-      if (!err.message?.includes('autenticado')) {
-        const errorMessage = err instanceof Error ? err.message : 'Erro desconhecido';
-        setError(errorMessage);
-        console.error('Erro ao carregar receitas:', err);
-        toast.error('Erro ao carregar receitas');
-      }
-      setRevenues([]);
-    } finally {
-      setLoading(false);
-    }
-  }, [initialFilters]);
-
-  /**
-   * Carrega estatísticas
-   */
-  const loadStats = useCallback(async () => {
-    try {
-      const response = await revenueApi.getStats();
-      
-      if (response.status === 'success' && response.data) {
-        setStats(response.data);
-      }
-    } catch (err) {
-      console.error('Erro ao carregar estatísticas:', err);
-    }
-  }, []);
+  const pageSize = params.limit || DEFAULT_PAGE_SIZE;
+  const currentPage = list.data?.page ?? params.page ?? 1;
+  const totalPages = list.data?.totalPages ?? 1;
+  const totalItems = list.data?.total ?? 0;
+  const loading = list.isLoading || mutating;
 
   /**
    * Cria uma nova receita
    */
   const createRevenue = useCallback(async (data: CreateRevenueData): Promise<Revenue | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await revenueApi.create(data);
       
       if (response.status === 'success' && response.data) {
-        setRevenues(prev => [response.data!, ...prev]);
-
         // Registrar atividade
         activityLogger.logFinancialTransaction(
           'revenue',
@@ -140,9 +125,9 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
         );
 
         toast.success('Receita criada com sucesso');
-        
-        // Recarregar estatísticas
-        loadStats();
+
+        // A nova receita entra no cache e as listagens abertas são recarregadas
+        await commitEntity(queryClient, 'revenues', response.data, { created: true });
         
         return response.data;
       } else {
@@ -155,25 +140,23 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
       toast.error('Erro ao criar receita');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   /**
    * Atualiza uma receita
    */
   const updateRevenue = useCallback(async (id: string, data: UpdateRevenueData): Promise<Revenue | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await revenueApi.update(id, data);
       
       if (response.status === 'success' && response.data) {
         const oldRevenue = revenues.find(r => r.id === id);
-        setRevenues(prev => prev.map(revenue =>
-          revenue.id === id ? response.data! : revenue
-        ));
+        commitEntity(queryClient, 'revenues', response.data);
 
         // Registrar atividade
         activityLogger.logUpdate(
@@ -186,9 +169,6 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
 
         toast.success('Receita atualizada com sucesso');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao atualizar receita');
@@ -200,24 +180,22 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
       toast.error('Erro ao atualizar receita');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient, revenues]);
 
   /**
    * Marca uma receita como recebida
    */
   const markRevenueAsReceived = useCallback(async (id: string, receivedValue?: number, receivedDate?: string): Promise<Revenue | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await revenueApi.markAsReceived(id, receivedValue, receivedDate);
       
       if (response.status === 'success' && response.data) {
-        setRevenues(prev => prev.map(revenue =>
-          revenue.id === id ? response.data! : revenue
-        ));
+        commitEntity(queryClient, 'revenues', response.data);
 
         // Registrar atividade
         activityLogger.logStatusChange(
@@ -230,9 +208,6 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
 
         toast.success('Receita marcada como recebida');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return response.data;
       } else {
         throw new Error(response.message || 'Erro ao marcar receita como recebida');
@@ -244,23 +219,24 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
       toast.error('Erro ao marcar receita como recebida');
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   /**
    * Remove uma receita
    */
   const deleteRevenue = useCallback(async (id: string): Promise<boolean> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
 
       const response = await revenueApi.remove(id);
       
       if (response.status === 'success') {
         const deletedRevenue = revenues.find(r => r.id === id);
-        setRevenues(prev => prev.filter(revenue => revenue.id !== id));
+        removeEntity(queryClient, 'revenues', id);
+        invalidateEntities(queryClient, 'revenues');
 
         // Registrar atividade
         if (deletedRevenue) {
@@ -274,9 +250,6 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
 
         toast.success('Receita removida com sucesso');
         
-        // Recarregar estatísticas
-        loadStats();
-        
         return true;
       } else {
         throw new Error(response.message || 'Erro ao remover receita');
@@ -288,27 +261,28 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
       toast.error('Erro ao remover receita');
       return false;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient, revenues]);
 
   /**
    * Busca uma receita por ID
    */
   const getRevenueById = useCallback(async (id: string): Promise<Revenue | null> => {
     try {
-      const response = await revenueApi.getById(id);
-      
-      if (response.status === 'success' && response.data) {
-        return response.data;
-      } else {
+      return await fetchEntity(queryClient, 'revenues', id, async () => {
+        const response = await revenueApi.getById(id);
+
+        if (response.status === 'success' && response.data) {
+          return response.data;
+        }
         throw new Error(response.message || 'Erro ao buscar receita');
-      }
+      });
     } catch (err) {
       console.error('Erro ao buscar receita:', err);
       return null;
     }
-  }, []);
+  }, [queryClient]);
 
   /**
    * Busca receitas por status
@@ -350,11 +324,9 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
    * Recarrega os dados
    */
   const refresh = useCallback(async (filters?: RevenueFilters) => {
-    await Promise.all([
-      loadRevenues(filters),
-      loadStats()
-    ]);
-  }, [loadRevenues, loadStats]);
+    if (filters) setQuery(prev => ({ ...prev, ...filters }));
+    await refreshEntities(queryClient, 'revenues');
+  }, [queryClient]);
 
   /**
    * Busca receitas por registro de venda
@@ -374,54 +346,19 @@ export const useRevenuesApi = (initialFilters: RevenueFilters = {}) => {
     }
   }, []);
 
-  // Carregamento inicial com timeout de segurança
-  useEffect(() => {
-    let timeoutId: NodeJS.Timeout;
-    
-    const loadData = async () => {
-      try {
-        await Promise.all([
-          loadRevenues({ page: 1, limit: 50 }),
-          loadStats()
-        ]);
-      } catch (error) {
-        console.error('Erro no carregamento inicial de receitas:', error);
-        // Garantir que loading seja finalizado mesmo em caso de erro
-        setLoading(false);
-      }
-    };
-
-    // Timeout de segurança: se após 30 segundos ainda estiver carregando, finalizar
-    timeoutId = setTimeout(() => {
-      if (loading) {
-        console.warn('⚠️ Timeout no carregamento de receitas - finalizando loading');
-        setLoading(false);
-      }
-    }, 30000);
-
-    loadData();
-
-    return () => {
-      clearTimeout(timeoutId);
-    };
-  }, []); // Executar apenas na montagem
-
   // Funções de paginação
   const changePage = useCallback((page: number) => {
-    setCurrentPage(page);
-    loadRevenues({ page, limit: pageSize });
-  }, [loadRevenues, pageSize]);
+    setQuery(prev => ({ ...prev, page }));
+  }, []);
 
   const changePageSize = useCallback((size: number) => {
-    setPageSize(size);
-    setCurrentPage(1);
-    loadRevenues({ page: 1, limit: size });
-  }, [loadRevenues]);
+    setQuery(prev => ({ ...prev, page: 1, limit: size }));
+  }, []);
 
   return {
     revenues,
     loading,
-    error,
+    error: error || (list.error instanceof Error ? list.error.message : null),
     stats,
     createRevenue,
     updateRevenue,
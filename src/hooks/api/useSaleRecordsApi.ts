@@ -1,79 +1,91 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { saleRecordsApi, SaleRecord, CreateSaleRecordData, UpdateSaleRecordData, SaleRecordFilters, SaleRecordStats } from '@/services/api/saleRecordsApi';
 import { toast } from 'sonner';
 import { activityLogger } from '@/services/activityLogger';
+import {
+  commitEntity,
+  ensureEntityList,
+  FetchedPage,
+  fetchEntity,
+  invalidateEntities,
+  refreshEntities,
+  removeEntity,
+  useEntityList,
+  useEntityStats,
+} from '@/hooks/queries/entityCache';
+
+// Buscar registros de venda (compartilhado entre todas as instâncias do hook)
+const fetchSaleRecordsPage = async (filters: SaleRecordFilters): Promise<FetchedPage<SaleRecord>> => {
+  try {
+    const data = await saleRecordsApi.findAll(filters);
+
+    // Garantir que sempre temos um array
+    return { items: Array.isArray(data) ? data : [] };
+  } catch (err: any) {
+    // Não mostrar erro se for problema de autenticação
+    if (err.message?.includes('autenticado')) {
+      return { items: [] };
+    }
+    console.error('❌ Erro ao carregar registros de venda:', err);
+    toast.error(err.response?.data?.message || err.message || 'Erro ao carregar registros de venda');
+    throw err;
+  }
+};
+
+const fetchSaleRecordStats = async (): Promise<SaleRecordStats | null> => {
+  try {
+    return await saleRecordsApi.getStats();
+  } catch (err: any) {
+    console.error('❌ Erro ao carregar estatísticas de registros de venda:', err);
+    return null;
+  }
+};
 
 export const useSaleRecordsApi = () => {
-  const [saleRecords, setSaleRecords] = useState<SaleRecord[]>([]);
-  const [loading, setLoading] = useState(false);
+  const queryClient = useQueryClient();
+  const [filters, setFilters] = useState<SaleRecordFilters>({});
+  const [mutating, setMutating] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [stats, setStats] = useState<SaleRecordStats | null>(null);
 
-  // Carregar registros de venda
-  const loadSaleRecords = useCallback(async (filters?: SaleRecordFilters) => {
-    try {
-      setLoading(true);
-      setError(null);
+  const { list, items: saleRecords } = useEntityList('sale-records', filters, fetchSaleRecordsPage);
+  const stats = useEntityStats('sale-records', fetchSaleRecordStats);
+  const loading = list.isLoading || mutating;
 
-      const data = await saleRecordsApi.findAll(filters);
-
-      // Garantir que sempre temos um array
-      const salesArray = Array.isArray(data) ? data : [];
-      setSaleRecords(salesArray);
-    } catch (err: any) {
-      // Não mostrar erro se for problema de autenticação
-      if (!err.message?.includes('autenticado')) {
-        console.error('❌ Erro ao carregar registros de venda:', err);
-        const errorMessage = err.response?.data?.message || err.message || 'Erro ao carregar registros de venda';
-        setError(errorMessage);
-        toast.error(errorMessage);
-      }
-      setSaleRecords([]); // Garantir array vazio em caso de erro
-    } finally {
-      setLoading(false);
-    }
-  }, []);
+  // Carregar registros de venda (reaproveita a listagem em cache se ainda estiver fresca)
+  const loadSaleRecords = useCallback(async (nextFilters: SaleRecordFilters = {}) => {
+    setFilters(prev => JSON.stringify(prev) === JSON.stringify(nextFilters) ? prev : nextFilters);
 
-  // Carregar estatísticas
-  const loadStats = useCallback(async () => {
     try {
-      const statsData = await saleRecordsApi.getStats();
-      setStats(statsData);
+      setError(null);
+      await ensureEntityList(queryClient, 'sale-records', nextFilters, fetchSaleRecordsPage);
     } catch (err: any) {
-      console.error('❌ Erro ao carregar estatísticas de registros de venda:', err);
+      setError(err.response?.data?.message || err.message || 'Erro ao carregar registros de venda');
     }
-  }, []);
+  }, [queryClient]);
 
-  // Buscar registro de venda por ID
+  // Buscar registro de venda por ID (usa o cache normalizado quando disponível)
   const getSaleRecordById = useCallback(async (id: string): Promise<SaleRecord | null> => {
     try {
-      setLoading(true);
       setError(null);
-      
-      const record = await saleRecordsApi.findById(id);
-      
-      return record;
+
+      return await fetchEntity(queryClient, 'sale-records', id, () => saleRecordsApi.findById(id));
     } catch (err: any) {
       console.error('❌ Erro ao buscar registro de venda:', err);
       const errorMessage = err.response?.data?.message || err.message || 'Erro ao buscar registro de venda';
       setError(errorMessage);
       toast.error(errorMessage);
       return null;
-    } finally {
-      setLoading(false);
     }
-  }, []);
+  }, [queryClient]);
 
   // Criar novo registro de venda
   const createSaleRecord = useCallback(async (recordData: CreateSaleRecordData): Promise<SaleRecord | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
-      
+
       const newRecord = await saleRecordsApi.create(recordData);
-      
-      // Atualizar lista local
-      setSaleRecords(prev => [newRecord, ...prev]);
 
       // Registrar atividade
       activityLogger.logCreate(
@@ -87,8 +99,8 @@ export const useSaleRecordsApi = () => {
         }
       );
 
-      // Atualizar estatísticas
-      await loadStats();
+      // O novo registro entra no cache; listagens e estatísticas são recarregadas
+      await commitEntity(queryClient, 'sale-records', newRecord, { created: true });
 
       toast.success('Registro de venda criado com sucesso!');
       return newRecord;
@@ -99,24 +111,19 @@ export const useSaleRecordsApi = () => {
       toast.error(errorMessage);
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient]);
 
   // Atualizar registro de venda
   const updateSaleRecord = useCallback(async (id: string, updates: UpdateSaleRecordData): Promise<SaleRecord | null> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
-      
+
       const oldRecord = saleRecords.find(r => r.id === id);
       const updatedRecord = await saleRecordsApi.update(id, updates);
 
-      // Atualizar lista local
-      setSaleRecords(prev => prev.map(record =>
-        record.id === id ? updatedRecord : record
-      ));
-
       // Registrar atividade
       activityLogger.logUpdate(
         'sale',
@@ -126,8 +133,8 @@ export const useSaleRecordsApi = () => {
         updatedRecord
       );
 
-      // Atualizar estatísticas
-      await loadStats();
+      // Atualiza o registro em todas as listagens sem buscá-las de novo
+      await commitEntity(queryClient, 'sale-records', updatedRecord);
 
       toast.success('Registro de venda atualizado com sucesso!');
       return updatedRecord;
@@ -138,21 +145,21 @@ export const useSaleRecordsApi = () => {
       toast.error(errorMessage);
       return null;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient, saleRecords]);
 
   // Excluir registro de venda
   const deleteSaleRecord = useCallback(async (id: string): Promise<boolean> => {
     try {
-      setLoading(true);
+      setMutating(true);
       setError(null);
-      
+
       const deletedRecord = saleRecords.find(r => r.id === id);
       await saleRecordsApi.delete(id);
 
-      // Remover da lista local
-      setSaleRecords(prev => prev.filter(record => record.id !== id));
+      // Remover de todas as listagens em cache
+      removeEntity(queryClient, 'sale-records', id);
 
       // Registrar atividade
       if (deletedRecord) {
@@ -165,7 +172,7 @@ export const useSaleRecordsApi = () => {
       }
 
       // Atualizar estatísticas
-      await loadStats();
+      await invalidateEntities(queryClient, 'sale-records');
 
       toast.success('Registro de venda excluído com sucesso!');
       return true;
@@ -176,30 +183,23 @@ export const useSaleRecordsApi = () => {
       toast.error(errorMessage);
       return false;
     } finally {
-      setLoading(false);
+      setMutating(false);
     }
-  }, [loadStats]);
+  }, [queryClient, saleRecords]);
 
   // Refresh (recarregar dados)
-  const refresh = useCallback(async (filters?: SaleRecordFilters) => {
-    await Promise.all([
-      loadSaleRecords(filters),
-      loadStats()
-    ]);
-  }, [loadSaleRecords, loadStats]);
-
-  // Carregar dados iniciais
-  useEffect(() => {
-    refresh();
-  }, [refresh]);
+  const refresh = useCallback(async (nextFilters?: SaleRecordFilters) => {
+    if (nextFilters) setFilters(nextFilters);
+    await refreshEntities(queryClient, 'sale-records');
+  }, [queryClient]);
 
   return {
     // Estado
     saleRecords,
     loading,
-    error,
+    error: error || (list.error instanceof Error ? list.error.message : null),
     stats,
-    
+
     // Funções
     getSaleRecordById,
     createSaleRecord,
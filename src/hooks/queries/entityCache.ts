@@ -0,0 +1,281 @@
+import { useMemo } from 'react';
+import {
+  keepPreviousData,
+  QueryClient,
+  replaceEqualDeep,
+  useQuery,
+  useQueryClient,
+} from '@tanstack/react-query';
+
+export type EntityType = 'partners' | 'payer-accounts' | 'expenses' | 'revenues' | 'sale-records';
+
+interface Identifiable {
+  id: string;
+}
+
+export type EntityMap<T> = Record<string, T>;
+
+// Página de uma listagem: só os IDs, as entidades ficam no mapa normalizado
+export interface EntityPage {
+  ids: string[];
+  total: number;
+  page: number;
+  totalPages: number;
+}
+
+// Resultado bruto de uma listagem, antes da normalização
+export interface FetchedPage<T> {
+  items: T[];
+  total?: number;
+  page?: number;
+  totalPages?: number;
+}
+
+export const ENTITY_STORE_KEY = ['entities'] as const;
+
+// Listagens são revalidadas em segundo plano após 1 minuto
+export const LIST_STALE_TIME = 1000 * 60;
+const DETAIL_STALE_TIME = 1000 * 60;
+
+// Query Keys
+export const entityKeys = {
+  all: (type: EntityType) => [type] as const,
+  lists: (type: EntityType) => [type, 'list'] as const,
+  list: (type: EntityType, params: object) => [type, 'list', params] as const,
+  details: (type: EntityType) => [type, 'detail'] as const,
+  detail: (type: EntityType, id: string) => [type, 'detail', id] as const,
+  stats: (type: EntityType) => [type, 'stats'] as const,
+  entities: (type: EntityType) => [...ENTITY_STORE_KEY, type] as const,
+};
+
+// Entidades afetadas por mutações de outra: despesas e receitas movimentam o saldo das contas
+const RELATED_ENTITIES: Partial<Record<EntityType, EntityType[]>> = {
+  expenses: ['payer-accounts'],
+  revenues: ['payer-accounts'],
+};
+
+/**
+ * Mescla entidades no mapa normalizado do tipo.
+ *
+ * Entidades sem alteração mantêm a mesma referência (`replaceEqualDeep`), então linhas
+ * memoizadas não re-renderizam quando uma listagem é recarregada com os mesmos dados.
+ */
+export function upsertEntities<T extends Identifiable>(queryClient: QueryClient, type: EntityType, items: T[]) {
+  queryClient.setQueryData<EntityMap<T>>(entityKeys.entities(type), (current) => {
+    const base = current || {};
+    let next = base;
+
+    for (const item of items) {
+      if (!item?.id) continue;
+      const previous = base[item.id];
+      const merged = replaceEqualDeep(previous, previous ? { ...previous, ...item } : item);
+      if (merged === previous) continue;
+      if (next === base) next = { ...base };
+      next[item.id] = merged;
+    }
+
+    // Retornar undefined mantém o cache intacto e não notifica os observadores
+    return next === base && current ? undefined : next;
+  });
+}
+
+/**
+ * Remove uma entidade do mapa, das páginas já carregadas e do cache de detalhe
+ */
+export function removeEntity(queryClient: QueryClient, type: EntityType, id: string) {
+  queryClient.setQueryData<EntityMap<unknown>>(entityKeys.entities(type), (current) => {
+    if (!current || !(id in current)) return undefined;
+    const { [id]: _removed, ...rest } = current;
+    return rest;
+  });
+
+  queryClient.setQueriesData<EntityPage>({ queryKey: entityKeys.lists(type) }, (page) =>
+    page && page.ids.includes(id)
+      ? { ...page, ids: page.ids.filter(itemId => itemId !== id), total: Math.max(0, page.total - 1) }
+      : page
+  );
+
+  queryClient.removeQueries({ queryKey: entityKeys.detail(type, id) });
+}
+
+/**
+ * Invalida o que depende das entidades do tipo após uma mutação.
+ *
+ * Listagens ativas só são recarregadas quando `refetchLists` é verdadeiro (ex.: criação,
+ * quando o novo registro precisa entrar na página); nos demais casos ficam marcadas como
+ * desatualizadas e são revalidadas na próxima montagem.
+ */
+export function invalidateEntities(
+  queryClient: QueryClient,
+  type: EntityType,
+  { refetchLists = false }: { refetchLists?: boolean } = {}
+) {
+  return Promise.all([
+    queryClient.invalidateQueries({
+      queryKey: entityKeys.lists(type),
+      refetchType: refetchLists ? 'active' : 'none',
+    }),
+    queryClient.invalidateQueries({ queryKey: entityKeys.stats(type) }),
+    ...(RELATED_ENTITIES[type] || []).map(related =>
+      queryClient.invalidateQueries({ queryKey: entityKeys.all(related) })
+    ),
+  ]);
+}
+
+/**
+ * Grava no cache a entidade devolvida por uma mutação e invalida as consultas dependentes
+ */
+export function commitEntity<T extends Identifiable>(
+  queryClient: QueryClient,
+  type: EntityType,
+  item: T,
+  { created = false }: { created?: boolean } = {}
+) {
+  upsertEntities(queryClient, type, [item]);
+  queryClient.setQueryData(entityKeys.detail(type, item.id), item);
+  return invalidateEntities(queryClient, type, { refetchLists: created });
+}
+
+/**
+ * Normaliza uma página recém-buscada: entidades vão para o mapa, a página guarda os IDs
+ */
+export async function fetchEntityPage<T extends Identifiable>(
+  queryClient: QueryClient,
+  type: EntityType,
+  fetchPage: () => Promise<FetchedPage<T>>
+): Promise<EntityPage> {
+  const { items, total, page, totalPages } = await fetchPage();
+  upsertEntities(queryClient, type, items);
+
+  return {
+    ids: items.map(item => item.id),
+    total: total ?? items.length,
+    page: page ?? 1,
+    totalPages: totalPages ?? 1,
+  };
+}
+
+/**
+ * Busca uma entidade por ID.
+ *
+ * Se ela já está no mapa (carregada por qualquer listagem) é devolvida na hora e o
+ * detalhe é revalidado em segundo plano; chamadas simultâneas compartilham a mesma requisição.
+ */
+export async function fetchEntity<T extends Identifiable>(
+  queryClient: QueryClient,
+  type: EntityType,
+  id: string,
+  fetchOne: () => Promise<T | null>
+): Promise<T | null> {
+  const options = {
+    queryKey: entityKeys.detail(type, id),
+    queryFn: async () => {
+      const item = await fetchOne();
+      if (item) upsertEntities(queryClient, type, [item]);
+      return item;
+    },
+    staleTime: DETAIL_STALE_TIME,
+  };
+
+  const cached = queryClient.getQueryData<EntityMap<T>>(entityKeys.entities(type))?.[id];
+  if (cached) {
+    void queryClient.prefetchQuery(options);
+    return cached;
+  }
+
+  return queryClient.fetchQuery(options);
+}
+
+/**
+ * Mapa normalizado (id -> entidade) de um tipo. É alimentado apenas por
+ * `upsertEntities`/`removeEntity`, nunca por requisição própria.
+ */
+export function useEntityMap<T>(type: EntityType): EntityMap<T> {
+  const { data } = useQuery<EntityMap<T>>({
+    queryKey: entityKeys.entities(type),
+    queryFn: () => ({}),
+    initialData: {},
+    enabled: false,
+  });
+
+  return data;
+}
+
+/**
+ * Garante a página de uma listagem no cache: reaproveita a que ainda está fresca ou a
+ * requisição já em andamento com os mesmos parâmetros.
+ */
+export function ensureEntityList<T extends Identifiable, P extends object>(
+  queryClient: QueryClient,
+  type: EntityType,
+  params: P,
+  fetchPage: (params: P) => Promise<FetchedPage<T>>
+): Promise<EntityPage> {
+  return queryClient.fetchQuery({
+    queryKey: entityKeys.list(type, params),
+    queryFn: () => fetchEntityPage(queryClient, type, () => fetchPage(params)),
+    staleTime: LIST_STALE_TIME,
+    retry: false,
+  });
+}
+
+/**
+ * Recarrega listagens e estatísticas ativas do tipo (as inativas ficam desatualizadas)
+ */
+export function refreshEntities(queryClient: QueryClient, type: EntityType) {
+  return Promise.all([
+    queryClient.invalidateQueries({ queryKey: entityKeys.lists(type) }),
+    queryClient.invalidateQueries({ queryKey: entityKeys.stats(type) }),
+  ]);
+}
+
+/**
+ * Listagem paginada sobre o cache normalizado.
+ *
+ * Componentes que pedem os mesmos parâmetros compartilham a mesma query (uma requisição
+ * só, mesmo montando ao mesmo tempo); os itens são lidos do mapa, então uma entidade
+ * atualizada por mutação ou detalhe aparece em todas as listagens sem novo fetch.
+ */
+export function useEntityList<T extends Identifiable, P extends object>(
+  type: EntityType,
+  params: P,
+  fetchPage: (params: P) => Promise<FetchedPage<T>>,
+  options: { enabled?: boolean } = {}
+) {
+  const queryClient = useQueryClient();
+
+  const list = useQuery({
+    queryKey: entityKeys.list(type, params),
+    queryFn: () => fetchEntityPage(queryClient, type, () => fetchPage(params)),
+    enabled: options.enabled ?? true,
+    // Mantém a página anterior na tela enquanto a próxima chega
+    placeholderData: keepPreviousData,
+    staleTime: LIST_STALE_TIME,
+    // O ApiClient já repete requisições que falham
+    retry: false,
+  });
+
+  const entities = useEntityMap<T>(type);
+  const ids = list.data?.ids;
+
+  const items = useMemo(
+    () => (ids || []).map(id => entities[id]).filter((item): item is T => Boolean(item)),
+    [ids, entities]
+  );
+
+  return { list, items };
+}
+
+/**
+ * Estatísticas do tipo, compartilhadas entre as instâncias do hook e invalidadas a cada mutação
+ */
+export function useEntityStats<S>(type: EntityType, fetchStats: () => Promise<S | null>) {
+  const { data } = useQuery({
+    queryKey: entityKeys.stats(type),
+    queryFn: fetchStats,
+    staleTime: LIST_STALE_TIME,
+    retry: false,
+  });
+
+  return data ?? null;
+}
@@ -0,0 +1,39 @@
+import { keepPreviousData, useQuery } from '@tanstack/react-query';
+import api from '@/lib/api';
+import { CashFlow } from '@/services/api/cashFlow';
+
+export interface CashFlowListQuery {
+  search?: string;
+  sortBy?: string;
+  sortOrder?: 'asc' | 'desc';
+  type?: 'INCOME' | 'EXPENSE';
+}
+
+// Query Keys
+export const CASH_FLOW_QUERY_KEYS = {
+  all: ['cash-flows'] as const,
+  lists: () => [...CASH_FLOW_QUERY_KEYS.all, 'list'] as const,
+  list: (query: CashFlowListQuery) => [...CASH_FLOW_QUERY_KEYS.lists(), query] as const,
+};
+
+// Hook para listar movimentações com busca e ordenação feitas no servidor
+export const useCashFlowList = (query: CashFlowListQuery, options: { enabled?: boolean } = {}) => {
+  return useQuery({
+    queryKey: CASH_FLOW_QUERY_KEYS.list(query),
+    queryFn: async () => {
+      const response = await api.get('/cash-flows', {
+        params: {
+          search: query.search || undefined,
+          sortBy: query.sortBy,
+          sortOrder: query.sortOrder,
+          type: query.type,
+        },
+      });
+      return Array.isArray(response.data) ? (response.data as CashFlow[]) : [];
+    },
+    enabled: options.enabled ?? true,
+    // Mantém a lista anterior na tela enquanto a nova ordenação chega
+    placeholderData: keepPreviousData,
+    staleTime: 1000 * 60, // 1 minuto
+  });
+};
@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useMemo } from 'react';
 import cashFlowService, {
   CashFlow,
   CashFlowSummary,
@@ -8,6 +8,8 @@ import cashFlowService, {
 import categoryAPI from '@/services/api/categoryApi';
 import calendarEventService from '@/services/api/calendarEvent';
 import api from '@/lib/api';
+import { useEntityList } from '@/hooks/queries/entityCache';
+import { fetchPayerAccountsPage } from '@/hooks/api/usePayerAccountsApi';
 
 import { useSafeToast } from '@/hooks/useSafeToast';
 export const useCashFlow = () => {
@@ -15,7 +17,6 @@ export const useCashFlow = () => {
   const [cashFlows, setCashFlows] = useState<CashFlow[]>([]);
   const [summary, setSummary] = useState<CashFlowSummary | null>(null);
   const [categories, setCategories] = useState<FinancialCategory[]>([]);
-  const [accounts, setAccounts] = useState<FinancialAccount[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   // Buscar dados do Cash Flow
@@ -101,27 +102,17 @@ export const useCashFlow = () => {
     }
   }, []); // toast não deve ser dependência
 
-  // Buscar contas
-  const fetchAccounts = useCallback(async () => {
-    try {
-      const response = await api.get('/payer-accounts');
-      
-      if (response.data.data?.items) {
-        const formattedAccounts = response.data.data.items.map((acc: any) => ({
-          id: acc.id,
-          accountName: acc.accountName,
-          accountType: acc.accountType,
-          bankName: acc.bankName,
-          balance: acc.balance || 0,
-          initialBalance: acc.initialBalance || 0,
-          isActive: acc.isActive
-        }));
-        setAccounts(formattedAccounts);
-      }
-    } catch (error: any) {
-      console.error('❌ Erro ao buscar contas:', error);
-    }
-  }, []);
+  // Contas vêm da mesma listagem em cache usada por usePayerAccountsApi (uma requisição só)
+  const { items: payerAccounts } = useEntityList('payer-accounts', {}, fetchPayerAccountsPage);
+  const accounts = useMemo<FinancialAccount[]>(() => payerAccounts.map((acc: any) => ({
+    id: acc.id,
+    accountName: acc.accountName,
+    accountType: acc.accountType,
+    bankName: acc.bankName,
+    balance: acc.balance || 0,
+    initialBalance: acc.initialBalance || 0,
+    isActive: acc.isActive
+  })), [payerAccounts]);
 
   // Criar movimentação
   const createCashFlow = useCallback(async (data: any) => {
@@ -266,8 +257,7 @@ export const useCashFlow = () => {
   useEffect(() => {
     fetchCashFlows();
     fetchCategories();
-    fetchAccounts();
-  }, [fetchCashFlows, fetchCategories, fetchAccounts]);
+  }, [fetchCashFlows, fetchCategories]);
 
   // Atualizar resumo quando cashFlows mudarem
   useEffect(() => {
@@ -1,6 +1,8 @@
 import { useCallback } from 'react';
-import jsPDF from 'jspdf';
-import html2canvas from 'html2canvas';
+
+// jsPDF e html2canvas só são baixados quando um PDF é gerado, fora do chunk das páginas
+const loadJsPDF = () => import('jspdf').then(module => module.default);
+const loadHtml2Canvas = () => import('html2canvas').then(module => module.default);
 
 interface PDFOptions {
   filename?: string;
@@ -29,6 +31,7 @@ export const usePDFGenerator = () => {
       }
 
       // Configurar opções do canvas
+      const html2canvas = await loadHtml2Canvas();
       const canvas = await html2canvas(element, {
         scale: quality,
         useCORS: true,
@@ -41,6 +44,7 @@ export const usePDFGenerator = () => {
 
       // Configurar dimensões do PDF
       const imgData = canvas.toDataURL('image/png');
+      const jsPDF = await loadJsPDF();
       const pdf = new jsPDF(orientation, 'mm', format);
       
       const pdfWidth = pdf.internal.pageSize.getWidth();
@@ -88,6 +92,7 @@ export const usePDFGenerator = () => {
     } = options;
 
     try {
+      const jsPDF = await loadJsPDF();
       const pdf = new jsPDF(orientation, 'mm', format);
       const pageWidth = pdf.internal.pageSize.getWidth();
       const pageHeight = pdf.internal.pageSize.getHeight();
@@ -161,6 +166,7 @@ export const usePDFGenerator = () => {
     } = options;
 
     try {
+      const jsPDF = await loadJsPDF();
       const pdf = new jsPDF(orientation, 'mm', format);
       const pageWidth = pdf.internal.pageSize.getWidth();
       const pageHeight = pdf.internal.pageSize.getHeight();
@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react';
 import { useAppStore } from '../stores/useAppStore';
+import { useShallow } from 'zustand/react/shallow';
 import { apiService } from '../services/api';
 
 interface SyncState {
@@ -15,10 +16,9 @@ export function useRealDataSync() {
     lastSync: null
   });
 
-  const store = useAppStore();
-  const { 
-    cycles, 
-    cattlePurchases, 
+  const {
+    cycles,
+    cattlePurchases,
     partners,
     expenses,
     revenues,
@@ -33,7 +33,24 @@ export function useRealDataSync() {
     setPenRegistrations,
     setHealthRecords,
     setWeightReadings
-  } = store;
+  } = useAppStore(useShallow(state => ({
+    cycles: state.cycles,
+    cattlePurchases: state.cattlePurchases,
+    partners: state.partners,
+    expenses: state.expenses,
+    revenues: state.revenues,
+    penRegistrations: state.penRegistrations,
+    healthRecords: state.healthRecords,
+    currentWeightReadings: state.currentWeightReadings,
+    setCycles: state.setCycles,
+    setCattlePurchases: state.setCattlePurchases,
+    setPartners: state.setPartners,
+    setExpenses: state.setExpenses,
+    setRevenues: state.setRevenues,
+    setPenRegistrations: state.setPenRegistrations,
+    setHealthRecords: state.setHealthRecords,
+    setWeightReadings: state.setWeightReadings
+  })));
 
   const syncWithBackend = async () => {
     try {
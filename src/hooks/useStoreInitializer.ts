@@ -4,35 +4,32 @@
  */
 
 import { useEffect } from 'react';
-import { useAppStore } from '@/stores/useAppStore';
+import { loadStoreSlice, useAppStore } from '@/stores/useAppStore';
+import { getPageSlices } from '@/pages/registry';
+import { cancelIdleCallback, idleCallback } from '@/utils/performance';
 
-export const useStoreInitializer = () => {
+export const useStoreInitializer = (currentPage?: string) => {
   const initializeStore = useAppStore(state => state.initializeStore);
 
   useEffect(() => {
-    // Inicializar o store após múltiplos ticks para garantir segurança
-    const timer1 = setTimeout(() => {
-      const timer2 = setTimeout(() => {
-        const timer3 = setTimeout(() => {
-          try {
-            initializeStore();
-          } catch (error) {
-            console.error('Error initializing store:', error);
-            // Tentar novamente em caso de erro
-            setTimeout(() => {
-              try {
-                initializeStore();
-              } catch (retryError) {
-                console.error('Retry error initializing store:', retryError);
-              }
-            }, 100);
-          }
-        }, 10);
-        return () => clearTimeout(timer3);
-      }, 10);
-      return () => clearTimeout(timer2);
-    }, 10);
+    // Adia para depois da primeira pintura
+    const handle = idleCallback(() => {
+      try {
+        initializeStore();
+      } catch (error) {
+        console.error('Error initializing store:', error);
+      }
+    }, { timeout: 2000 });
 
-    return () => clearTimeout(timer1);
+    return () => cancelIdleCallback(handle as number);
   }, [initializeStore]);
+
+  useEffect(() => {
+    const slices = currentPage ? getPageSlices(currentPage) : [];
+    if (slices.length === 0) return;
+
+    Promise.all(slices.map(loadStoreSlice)).catch(error => {
+      console.error('Erro ao carregar dados da página:', error);
+    });
+  }, [currentPage]);
 };
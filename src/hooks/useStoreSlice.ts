@@ -0,0 +1,29 @@
+/**
+ * Hook para carregar domínios do store sob demanda
+ */
+
+import { useEffect, useState } from 'react';
+import { isStoreSliceLoaded, LazySliceName, loadStoreSlice } from '@/stores/useAppStore';
+
+export const useStoreSlice = (...slices: LazySliceName[]) => {
+  const key = slices.join(',');
+  const [ready, setReady] = useState(() => slices.every(isStoreSliceLoaded));
+
+  useEffect(() => {
+    let active = true;
+    setReady(slices.every(isStoreSliceLoaded));
+
+    Promise.all(slices.map(loadStoreSlice))
+      .then(() => {
+        if (active) setReady(true);
+      })
+      .catch(error => console.error('Erro ao carregar dados do store:', error));
+
+    return () => {
+      active = false;
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [key]);
+
+  return ready;
+};
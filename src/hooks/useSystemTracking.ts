@@ -4,8 +4,6 @@ import { trackSystemChange } from '../utils/systemUpdates';
 
 // Hook para rastrear ações importantes do sistema
 export const useSystemTracking = () => {
-  const store = useAppStore();
-  
   useEffect(() => {
     // Rastrear mudanças importantes
     const unsubscribe = useAppStore.subscribe(
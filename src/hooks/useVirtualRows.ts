@@ -0,0 +1,76 @@
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import { calculateVisibleItems } from '@/utils/performance';
+
+interface VirtualRowsOptions {
+  // Altura fixa (px) de cada linha da tabela
+  rowHeight: number;
+  // Linhas extras renderizadas acima e abaixo da janela visível
+  overscan?: number;
+  // Altura usada antes da primeira medição do container
+  initialHeight?: number;
+  // Quando muda (ex.: nova ordenação ou busca), a rolagem volta ao topo
+  resetKey?: unknown;
+}
+
+/**
+ * Janela de linhas visíveis para tabelas longas.
+ *
+ * Só as linhas dentro da área rolável (mais o `overscan`) vão para o DOM; o espaço das
+ * demais é ocupado por duas linhas espaçadoras (`paddingTop`/`paddingBottom`), então a
+ * barra de rolagem continua proporcional à lista inteira.
+ */
+export function useVirtualRows<T>(items: T[], {
+  rowHeight,
+  overscan = 8,
+  initialHeight = 600,
+  resetKey,
+}: VirtualRowsOptions) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const frameRef = useRef<number | null>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [containerHeight, setContainerHeight] = useState(initialHeight);
+
+  // Atualiza no máximo uma vez por frame
+  const onScroll = useCallback(() => {
+    if (frameRef.current !== null) return;
+    frameRef.current = requestAnimationFrame(() => {
+      frameRef.current = null;
+      setScrollTop(containerRef.current?.scrollTop || 0);
+    });
+  }, []);
+
+  useEffect(() => {
+    const container = containerRef.current;
+    if (!container || typeof ResizeObserver === 'undefined') return;
+
+    const observer = new ResizeObserver(([entry]) => {
+      setContainerHeight(entry.contentRect.height || initialHeight);
+    });
+    observer.observe(container);
+
+    return () => observer.disconnect();
+  }, [initialHeight]);
+
+  useEffect(() => () => {
+    if (frameRef.current !== null) cancelAnimationFrame(frameRef.current);
+  }, []);
+
+  useEffect(() => {
+    if (containerRef.current) containerRef.current.scrollTop = 0;
+    setScrollTop(0);
+  }, [resetKey]);
+
+  const { visibleItems, startIndex, totalHeight, offsetY } = useMemo(
+    () => calculateVisibleItems(items, scrollTop, containerHeight, rowHeight, overscan),
+    [items, scrollTop, containerHeight, rowHeight, overscan]
+  );
+
+  return {
+    containerRef,
+    onScroll,
+    visibleItems,
+    startIndex,
+    paddingTop: offsetY,
+    paddingBottom: Math.max(0, totalHeight - offsetY - visibleItems.length * rowHeight),
+  };
+}
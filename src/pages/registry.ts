@@ -0,0 +1,62 @@
+/**
+ * Páginas da aplicação, cada uma em seu próprio chunk
+ *
+ * O menu lateral chama `prefetchPage` ao passar o mouse (ou focar) em um item, então o
+ * chunk da página e os domínios do store que ela usa já estão baixados no clique.
+ */
+
+import { lazyWithPrefetch } from '@/utils/performance';
+import { LazySliceName, loadStoreSlice } from '@/stores/useAppStore';
+
+export const ShadcnDashboard = lazyWithPrefetch(() => import('@/components/Dashboard/ShadcnDashboard'));
+export const CompleteLots = lazyWithPrefetch(() => import('@/components/Lots/CompleteLots'));
+export const CompleteRegistrations = lazyWithPrefetch(() => import('@/components/Registrations/CompleteRegistrations'));
+export const CashFlowDashboard = lazyWithPrefetch(() => import('@/components/CashFlow/CashFlowDashboard'));
+export const IntegratedDashboard = lazyWithPrefetch(() => import('@/components/FinancialAnalysis/IntegratedDashboard'));
+export const SalesManagement = lazyWithPrefetch(() => import('@/components/Sales/SalesManagement'));
+export const PurchaseManagement = lazyWithPrefetch(() => import('@/components/Purchases/SimplifiedPurchaseManagement'));
+export const CompleteCalendar = lazyWithPrefetch(() => import('@/components/Calendar/CompleteCalendar'));
+export const Settings = lazyWithPrefetch(() => import('@/components/System/GeneralSettings'));
+export const CategoryManagement = lazyWithPrefetch(() => import('@/components/Categories/CategoryManagement'));
+export const Reports = lazyWithPrefetch(() => import('@/pages/Reports'));
+export const FinancialSettings = lazyWithPrefetch(() => import('@/pages/FinancialSettings'));
+export const InterventionsManagement = lazyWithPrefetch(() => import('@/components/Interventions/InterventionsManagement'));
+
+interface PageDefinition {
+  component: { prefetch: () => Promise<unknown> };
+  // Domínios do store carregados sob demanda que a página usa
+  slices?: LazySliceName[];
+}
+
+const PAGES: Record<string, PageDefinition> = {
+  dashboard: { component: ShadcnDashboard },
+  lots: { component: CompleteLots, slices: ['nonCash'] },
+  'integrated-analysis': { component: IntegratedDashboard, slices: ['cashFlow', 'dre', 'indirectCosts'] },
+  financial: { component: CashFlowDashboard, slices: ['cashFlow'] },
+  sales: { component: SalesManagement },
+  purchases: { component: PurchaseManagement },
+  calendar: { component: CompleteCalendar },
+  reports: { component: Reports, slices: ['dre', 'indirectCosts'] },
+  registrations: { component: CompleteRegistrations },
+  settings: { component: Settings },
+  categories: { component: CategoryManagement },
+  'financial-settings': { component: FinancialSettings },
+  interventions: { component: InterventionsManagement },
+};
+
+export const getPageSlices = (page: string): LazySliceName[] => PAGES[page]?.slices || [];
+
+/**
+ * Baixa antecipadamente o chunk da página e os domínios do store que ela usa
+ */
+export function prefetchPage(page: string) {
+  const definition = PAGES[page];
+  if (!definition) return;
+
+  definition.component.prefetch().catch((error) => {
+    console.warn(`Falha ao pré-carregar a página ${page}:`, error);
+  });
+  definition.slices?.forEach((slice) => {
+    loadStoreSlice(slice).catch(() => undefined);
+  });
+}
@@ -1,6 +1,7 @@
 import React from 'react';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import { ReactQueryDevtools } from '@tanstack/react-query-devtools';
+import { ENTITY_STORE_KEY } from '@/hooks/queries/entityCache';
 
 // Configuração do Query Client
 const queryClient = new QueryClient({
@@ -39,6 +40,13 @@ const queryClient = new QueryClient({
   },
 });
 
+// O mapa normalizado de entidades só muda por escrita direta e não pode ser coletado
+// enquanto alguma listagem em cache ainda aponta para os IDs dele
+queryClient.setQueryDefaults(ENTITY_STORE_KEY, {
+  staleTime: Infinity,
+  gcTime: Infinity,
+});
+
 interface QueryProviderProps {
   children: React.ReactNode;
 }
@@ -4,15 +4,7 @@ import { openDB, DBSchema, IDBPDatabase } from 'idb';
 interface OfflineDB extends DBSchema {
   pendingOperations: {
     key: string;
-    value: {
-      id: string;
-      type: 'create' | 'update' | 'delete';
-      entity: string;
-      data: any;
-      timestamp: Date;
-      synced: boolean;
-      attempts: number;
-    };
+    value: PendingOperation;
   };
   cachedData: {
     key: string;
@@ -25,6 +17,111 @@ interface OfflineDB extends DBSchema {
   };
 }
 
+type OperationType = 'create' | 'update' | 'delete';
+
+interface PendingOperation {
+  id: string;
+  type: OperationType;
+  entity: string;
+  data: any;
+  // Versão do registro conhecida quando a edição foi feita offline
+  lastUpdatedAt?: string;
+  timestamp: Date;
+  synced: boolean;
+  attempts: number;
+}
+
+interface SyncOperation {
+  clientId: string;
+  type: OperationType;
+  entity: string;
+  id?: string;
+  data: any;
+  lastUpdatedAt?: string;
+}
+
+interface SyncResult {
+  clientId: string;
+  status: 'applied' | 'conflict' | 'failed' | 'skipped';
+  entityId?: string;
+  serverUpdatedAt?: string | null;
+  serverData?: any;
+  error?: string;
+}
+
+// Operações coalescidas: cada envio leva as operações originais que representa
+interface CoalescedOperation {
+  operation: SyncOperation;
+  sources: PendingOperation[];
+}
+
+const SYNC_CHUNK_SIZE = 50;
+const MAX_ATTEMPTS = 5;
+const TEMP_ID_PREFIX = 'temp_';
+
+const recordKey = (operation: PendingOperation) => `${operation.entity}:${operation.data?.id ?? operation.id}`;
+
+const isTempId = (id?: string) => !!id && id.startsWith(TEMP_ID_PREFIX);
+
+/**
+ * Reduz a fila a no máximo uma operação por registro, preservando a ordem:
+ * create + update vira um create com os dados mesclados, create + delete se anula,
+ * updates consecutivos são mesclados (mantendo a versão mais antiga conhecida) e
+ * update + delete vira delete.
+ */
+export function coalesceOperations(pending: PendingOperation[]): CoalescedOperation[] {
+  const byRecord = new Map<string, CoalescedOperation>();
+  const order: string[] = [];
+
+  const sorted = [...pending].sort((a, b) => new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime());
+
+  for (const source of sorted) {
+    const key = recordKey(source);
+    const { id: recordId, ...data } = source.data || {};
+    const existing = byRecord.get(key);
+
+    if (!existing) {
+      byRecord.set(key, {
+        operation: {
+          clientId: source.id,
+          type: source.type,
+          entity: source.entity,
+          id: source.type === 'create' ? undefined : recordId,
+          data: source.type === 'delete' ? {} : data,
+          lastUpdatedAt: source.lastUpdatedAt
+        },
+        sources: [source]
+      });
+      order.push(key);
+      continue;
+    }
+
+    existing.sources.push(source);
+    const current = existing.operation;
+
+    if (source.type === 'delete') {
+      if (current.type === 'create') {
+        // Criado e excluído offline: nada a enviar
+        current.type = 'delete';
+        current.data = null;
+      } else {
+        current.type = 'delete';
+        current.data = {};
+      }
+    } else if (source.type === 'update' && current.type !== 'delete') {
+      current.data = { ...current.data, ...data };
+      current.lastUpdatedAt = current.lastUpdatedAt || source.lastUpdatedAt;
+    } else if (source.type === 'create' && current.type === 'delete' && current.data === null) {
+      // Recriado após criar e excluir
+      existing.operation = { ...current, type: 'create', data, clientId: source.id };
+    }
+  }
+
+  return order
+    .map(key => byRecord.get(key)!)
+    .filter(entry => entry.operation.data !== null);
+}
+
 class OfflineService {
   private db: IDBPDatabase<OfflineDB> | null = null;
   private isOnline: boolean = navigator.onLine;
@@ -83,14 +180,15 @@ class OfflineService {
   /**
    * Adicionar operação à fila offline
    */
-  async queueOperation(type: 'create' | 'update' | 'delete', entity: string, data: any) {
+  async queueOperation(type: OperationType, entity: string, data: any, lastUpdatedAt?: string) {
     if (!this.db) return;
 
-    const operation = {
+    const operation: PendingOperation = {
       id: `${Date.now()}_${Math.random()}`,
       type,
       entity,
       data,
+      lastUpdatedAt: lastUpdatedAt ?? data?.updatedAt,
       timestamp: new Date(),
       synced: false,
       attempts: 0
@@ -144,7 +242,8 @@ class OfflineService {
   }
 
   /**
-   * Sincronizar operações pendentes
+   * Sincronizar operações pendentes: a fila é coalescida por registro e enviada
+   * em blocos para o endpoint de aplicação em lote
    */
   async syncOperations() {
     if (!this.db || !this.isOnline || this.syncInProgress) return;
@@ -156,37 +255,99 @@ class OfflineService {
       const operations = await this.db.getAll('pendingOperations');
       const pending = operations.filter(op => !op.synced);
 
+      if (pending.length === 0) {
+        return;
+      }
+
+      // Operações que se anularam (create + delete) não precisam ir ao servidor
+      const merged = coalesceOperations(pending);
+      const sent = new Set(merged.flatMap(entry => entry.sources.map(source => source.id)));
       for (const operation of pending) {
-        try {
-          // Enviar operação para o servidor
-          const success = await this.sendOperationToServer(operation);
-
-          if (success) {
-            // Marcar como sincronizado
-            operation.synced = true;
-            await this.db.put('pendingOperations', operation);
+        if (!sent.has(operation.id)) {
+          await this.markSynced(operation);
+        }
+      }
+
+      const coalesced: CoalescedOperation[] = [];
+      for (const entry of merged) {
+        if (entry.operation.type !== 'create' && !entry.operation.id) {
+          // Sem o ID do registro o servidor rejeitaria o bloco inteiro
+          console.error('Operation without record id discarded:', entry.operation);
+          for (const source of entry.sources) {
+            await this.db.delete('pendingOperations', source.id);
+          }
+          continue;
+        }
+        coalesced.push(entry);
+      }
+
+      // IDs temporários criados offline -> IDs reais, para os blocos seguintes desta execução;
+      // a fila persistida é reescrita a cada ID resolvido, valendo também para as próximas
+      const idMap = new Map<string, string>();
+      let conflicts = 0;
+      let failures = 0;
+
+      for (let i = 0; i < coalesced.length; i += SYNC_CHUNK_SIZE) {
+        const chunk = coalesced.slice(i, i + SYNC_CHUNK_SIZE);
+        const results = await this.sendOperationsToServer(
+          chunk.map(entry => this.resolveTempIds(entry.operation, idMap))
+        );
+
+        // Falha de rede/autenticação: mantém a fila e tenta no próximo ciclo
+        if (!results) {
+          throw new Error('Falha ao enviar operações para o servidor');
+        }
+
+        const byClientId = new Map(results.map(result => [result.clientId, result]));
+
+        for (const entry of chunk) {
+          const result = byClientId.get(entry.operation.clientId);
+          const tempId = entry.sources[0].data?.id;
+
+          if (result?.status === 'applied') {
+            for (const source of entry.sources) {
+              await this.markSynced(source);
+            }
+            if (entry.operation.type === 'create' && isTempId(tempId) && result.entityId) {
+              idMap.set(tempId, result.entityId);
+              await this.rewriteTempId(tempId, result.entityId, pending);
+            }
+          } else if (result?.status === 'conflict') {
+            // O servidor prevalece: descarta a alteração local e avisa a UI
+            conflicts++;
+            window.dispatchEvent(new CustomEvent('offline-conflict', {
+              detail: {
+                entity: entry.operation.entity,
+                id: entry.operation.id,
+                localData: entry.operation.data,
+                serverData: result.serverData,
+                serverUpdatedAt: result.serverUpdatedAt
+              }
+            }));
+            for (const source of entry.sources) {
+              await this.db.delete('pendingOperations', source.id);
+            }
           } else {
-            // Incrementar tentativas
-            operation.attempts++;
-
-            if (operation.attempts > 5) {
-              // Após 5 tentativas, mover para fila de erros
-              console.error('Operation failed after 5 attempts:', operation);
-              await this.db.delete('pendingOperations', operation.id);
-            } else {
-              await this.db.put('pendingOperations', operation);
+            failures++;
+            for (const source of entry.sources) {
+              await this.registerFailure(source, result?.error);
             }
           }
-        } catch (error) {
-          console.error('Sync error for operation:', operation, error);
         }
       }
 
       // Limpar operações sincronizadas antigas
       await this.cleanupSyncedOperations();
+      localStorage.setItem('lastSyncTime', new Date().toISOString());
 
       console.log('✅ Sync completed');
-      this.notifyUser('Sincronização concluída', 'success');
+      if (conflicts > 0) {
+        this.notifyUser(`${conflicts} alteração(ões) offline descartada(s) por conflito`, 'warning');
+      } else if (failures > 0) {
+        this.notifyUser(`${failures} operação(ões) não sincronizada(s)`, 'warning');
+      } else {
+        this.notifyUser('Sincronização concluída', 'success');
+      }
     } catch (error) {
       console.error('Sync failed:', error);
       this.notifyUser('Erro na sincronização', 'error');
@@ -196,51 +357,102 @@ class OfflineService {
   }
 
   /**
-   * Enviar operação para o servidor
+   * Substitui IDs temporários já criados no servidor (no ID do registro e nas referências)
    */
-  private async sendOperationToServer(operation: any): Promise<boolean> {
-    const token = localStorage.getItem('token');
-    if (!token) return false;
-
-    const endpoints: Record<string, Record<string, string>> = {
-      'cattle-purchases': {
-        create: '/api/v1/cattle-purchases',
-        update: `/api/v1/cattle-purchases/${operation.data.id}`,
-        delete: `/api/v1/cattle-purchases/${operation.data.id}`
-      },
-      'sales': {
-        create: '/api/v1/sale-records',
-        update: `/api/v1/sale-records/${operation.data.id}`,
-        delete: `/api/v1/sale-records/${operation.data.id}`
-      }
-      // Adicionar outros endpoints conforme necessário
-    };
+  private resolveTempIds(operation: SyncOperation, idMap: Map<string, string>): SyncOperation {
+    if (idMap.size === 0) return operation;
 
-    const endpoint = endpoints[operation.entity]?.[operation.type];
-    if (!endpoint) return false;
+    const data = Object.fromEntries(
+      Object.entries(operation.data || {}).map(([key, value]) => [
+        key,
+        typeof value === 'string' && idMap.has(value) ? idMap.get(value) : value
+      ])
+    );
 
-    const methods: Record<string, string> = {
-      create: 'POST',
-      update: 'PUT',
-      delete: 'DELETE'
+    return {
+      ...operation,
+      id: operation.id && idMap.has(operation.id) ? idMap.get(operation.id) : operation.id,
+      data
     };
+  }
+
+  /**
+   * Troca um ID temporário pelo ID real nas operações ainda na fila (no ID do registro e
+   * nas referências), para que não sejam reenviadas com o ID temporário se esta execução
+   * falhar. As operações já carregadas são alteradas no próprio objeto, que é o regravado
+   * ao registrar falhas.
+   */
+  private async rewriteTempId(tempId: string, entityId: string, loaded: PendingOperation[]) {
+    if (!this.db) return;
+
+    const loadedById = new Map(loaded.map(operation => [operation.id, operation]));
+    const stored = await this.db.getAll('pendingOperations');
+
+    for (const candidate of stored) {
+      const operation = loadedById.get(candidate.id) ?? candidate;
+      if (operation.synced || !operation.data) continue;
+
+      let changed = false;
+      for (const [key, value] of Object.entries(operation.data)) {
+        if (value === tempId) {
+          operation.data[key] = entityId;
+          changed = true;
+        }
+      }
+
+      if (changed) {
+        await this.db.put('pendingOperations', operation);
+      }
+    }
+  }
+
+  private async markSynced(operation: PendingOperation) {
+    if (!this.db) return;
+    operation.synced = true;
+    await this.db.put('pendingOperations', operation);
+  }
+
+  private async registerFailure(operation: PendingOperation, error?: string) {
+    if (!this.db) return;
+
+    operation.attempts++;
+
+    if (operation.attempts > MAX_ATTEMPTS) {
+      // Após 5 tentativas, descartar a operação
+      console.error(`Operation failed after ${MAX_ATTEMPTS} attempts:`, operation, error);
+      await this.db.delete('pendingOperations', operation.id);
+    } else {
+      await this.db.put('pendingOperations', operation);
+    }
+  }
+
+  /**
+   * Enviar um bloco de operações para o servidor
+   */
+  private async sendOperationsToServer(operations: SyncOperation[]): Promise<SyncResult[] | null> {
+    const token = localStorage.getItem('authToken') || localStorage.getItem('token');
+    if (!token) return null;
 
     try {
       const apiUrl = import.meta.env.VITE_API_URL || '/api/v1';
-      const baseUrl = apiUrl.replace('/api/v1', '');
-      const response = await fetch(`${baseUrl}${endpoint}`, {
-        method: methods[operation.type],
+      const response = await fetch(`${apiUrl}/sync/operations`, {
+        method: 'POST',
         headers: {
           'Authorization': `Bearer ${token}`,
           'Content-Type': 'application/json'
         },
-        body: operation.type !== 'delete' ? JSON.stringify(operation.data) : undefined
+        body: JSON.stringify({ operations })
       });
 
-      return response.ok;
+      if (!response.ok) {
+        return null;
+      }
+
+      const payload = await response.json();
+      return payload.data?.results || [];
     } catch (error) {
-      console.error('Failed to send operation to server:', error);
-      return false;
+      console.error('Failed to send operations to server:', error);
+      return null;
     }
   }
 
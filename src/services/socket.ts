@@ -3,9 +3,10 @@ import { io, Socket } from 'socket.io-client';
 class SocketService {
   private socket: Socket | null = null;
   private connected = false;
+  private penOccupancySubscribed = false;
 
   connect(token: string) {
-    if (this.connected) return;
+    if (this.connected || this.socket) return;
 
     // Sempre usar WebSocket do Cloudflare Pages (ambiente online)
     const getWebSocketUrl = (): string => {
@@ -29,6 +30,10 @@ class SocketService {
 
     this.socket.on('connect', () => {
       this.connected = true;
+      // Salas são perdidas ao reconectar
+      if (this.penOccupancySubscribed) {
+        this.socket?.emit('subscribe:pen-occupancy');
+      }
     });
 
     this.socket.on('disconnect', () => {
@@ -45,6 +50,7 @@ class SocketService {
       this.socket.disconnect();
       this.socket = null;
       this.connected = false;
+      this.penOccupancySubscribed = false;
     }
   }
 
@@ -52,15 +58,36 @@ class SocketService {
   subscribePenOccupancy(callback: (data: any) => void) {
     if (!this.socket) return;
     
+    this.penOccupancySubscribed = true;
     this.socket.emit('subscribe:pen-occupancy');
     this.socket.on('pen-occupancy:update', callback);
   }
 
-  unsubscribePenOccupancy() {
+  unsubscribePenOccupancy(callback?: (data: any) => void) {
     if (!this.socket) return;
     
-    this.socket.emit('unsubscribe:pen-occupancy');
-    this.socket.off('pen-occupancy:update');
+    // Sem callback (chamada antiga), remove todos os ouvintes da ocupação
+    if (callback) {
+      this.socket.off('pen-occupancy:update', callback);
+    } else {
+      this.socket.off('pen-occupancy:update');
+    }
+
+    // Só sai da sala quando não houver mais ninguém ouvindo
+    if (this.socket.listeners('pen-occupancy:update').length === 0) {
+      this.penOccupancySubscribed = false;
+      this.socket.emit('unsubscribe:pen-occupancy');
+    }
+  }
+
+  // Reconexão (ex.: recarregar dados perdidos enquanto desconectado)
+  onReconnect(callback: () => void) {
+    if (!this.socket) return () => {};
+
+    this.socket.io.on('reconnect', callback);
+    return () => {
+      this.socket?.io.off('reconnect', callback);
+    };
   }
 
   // Atualizações de Lotes
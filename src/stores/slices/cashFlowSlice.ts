@@ -0,0 +1,217 @@
+import { v4 as uuidv4 } from 'uuid';
+import {
+  FinancialAccount, CashFlowEntry, CashFlowProjection, WorkingCapital, FinancialContribution
+} from '../../types';
+import { StoreSlice } from './types';
+
+/**
+ * DRC: fluxo de caixa, contribuições, projeções e capital de giro
+ * Carregado sob demanda por `loadStoreSlice`; o estado inicial fica em `lazySliceState`.
+ */
+export const createCashFlowSlice: StoreSlice = (set, get) => ({
+  // 🆕 AÇÕES DO DRC
+  // Ações - DRC/Fluxo de Caixa
+  addCashFlowEntry: (entry) => set((state) => {
+    const newEntry: CashFlowEntry = {
+      ...entry,
+      id: uuidv4(),
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    // Se for uma entrada realizada, criar/atualizar conta financeira correspondente
+    if (entry.status === 'realizado' && entry.actualAmount) {
+      const financialAccount: FinancialAccount = {
+        id: uuidv4(),
+        type: ['aporte', 'receita', 'financiamento'].includes(entry.type) ? 'receivable' : 'payable',
+        description: entry.description,
+        amount: entry.actualAmount,
+        dueDate: entry.date,
+        status: 'paid',
+        paymentDate: entry.date,
+        relatedEntityType: 'other_costs',
+        relatedEntityId: newEntry.id,
+        createdAt: new Date()
+      };
+      
+      return {
+        cashFlowEntries: [...state.cashFlowEntries, newEntry],
+        financialAccounts: [...state.financialAccounts, financialAccount]
+      };
+    }
+    
+    return {
+      cashFlowEntries: [...state.cashFlowEntries, newEntry]
+    };
+  }),
+  
+  updateCashFlowEntry: (id, data) => set((state) => ({
+    cashFlowEntries: state.cashFlowEntries.map(entry => 
+      entry.id === id 
+        ? { ...entry, ...data, updatedAt: new Date() }
+        : entry
+    )
+  })),
+  
+  deleteCashFlowEntry: (id) => set((state) => ({
+    cashFlowEntries: state.cashFlowEntries.filter(entry => entry.id !== id)
+  })),
+  
+  // Ações - Contribuições Financeiras
+  addFinancialContribution: (contribution) => set((state) => {
+    const newContribution: FinancialContribution = {
+      ...contribution,
+      id: uuidv4(),
+      status: contribution.status || 'projetado',
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    // Criar entrada no fluxo de caixa
+    const cashFlowEntry: CashFlowEntry = {
+      id: uuidv4(),
+      date: contribution.date,
+      type: 'aporte',
+      category: 'Contribuição',
+      subcategory: contribution.type,
+      description: `${contribution.contributorName} - ${contribution.type}`,
+      plannedAmount: contribution.amount,
+      actualAmount: contribution.status === 'realizado' ? contribution.amount : undefined,
+      status: contribution.status === 'realizado' ? 'realizado' : 'projetado',
+      relatedEntityType: 'loan',
+      relatedEntityId: newContribution.id,
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    return {
+      financialContributions: [...state.financialContributions, newContribution],
+      cashFlowEntries: [...state.cashFlowEntries, cashFlowEntry]
+    };
+  }),
+  
+  updateFinancialContribution: (id, data) => set((state) => ({
+    financialContributions: state.financialContributions.map(contribution => 
+      contribution.id === id 
+        ? { ...contribution, ...data, updatedAt: new Date() }
+        : contribution
+    )
+  })),
+  
+  confirmFinancialContribution: (id) => set((state) => {
+    const contribution = state.financialContributions.find(c => c.id === id);
+    if (!contribution) return state;
+    
+    // Atualizar status da contribuição
+    const updatedContributions = state.financialContributions.map(c => 
+      c.id === id ? { ...c, status: 'confirmado' as const } : c
+    );
+    
+    // Atualizar entrada do fluxo de caixa para realizado
+    const updatedCashFlow = state.cashFlowEntries.map(entry => 
+      entry.relatedEntityId === id && entry.relatedEntityType === 'loan'
+        ? { ...entry, status: 'realizado' as const, actualAmount: entry.plannedAmount }
+        : entry
+    );
+    
+    return {
+      financialContributions: updatedContributions,
+      cashFlowEntries: updatedCashFlow
+    };
+  }),
+  
+  // Ações - Análises e Projeções
+  generateCashFlowProjection: (horizonDays) => set((state) => {
+    // Calcular projeção baseada nos dados atuais
+    const projection: CashFlowProjection = {
+      id: uuidv4(),
+      projectionDate: new Date(),
+      horizonDays,
+      scenarios: [
+        {
+          name: 'pessimista',
+          assumptions: {
+            salesGrowth: -10,
+            costIncrease: 15,
+            paymentDelay: 15,
+            defaultRate: 5
+          },
+          projectedBalance: 0, // Calcular baseado nos dados
+          minimumBalance: 0,
+          capitalNeed: 0
+        },
+        {
+          name: 'realista',
+          assumptions: {
+            salesGrowth: 5,
+            costIncrease: 5,
+            paymentDelay: 5,
+            defaultRate: 2
+          },
+          projectedBalance: 0,
+          minimumBalance: 0,
+          capitalNeed: 0
+        },
+        {
+          name: 'otimista',
+          assumptions: {
+            salesGrowth: 20,
+            costIncrease: 0,
+            paymentDelay: 0,
+            defaultRate: 0
+          },
+          projectedBalance: 0,
+          minimumBalance: 0,
+          capitalNeed: 0
+        }
+      ],
+      createdAt: new Date()
+    };
+    
+    return {
+      cashFlowProjections: [...state.cashFlowProjections, projection]
+    };
+  }),
+  
+  calculateWorkingCapital: () => set((state) => {
+    // Calcular capital de giro atual
+    const cashAndEquivalents = state.bankStatements.reduce((sum, s) => 
+      s.type === 'credit' ? sum + s.amount : sum - s.amount, 0
+    );
+    
+    const accountsReceivable = state.financialAccounts
+      .filter(a => a.type === 'receivable' && a.status === 'pending')
+      .reduce((sum, a) => sum + a.amount, 0);
+    
+    const accountsPayable = state.financialAccounts
+      .filter(a => a.type === 'payable' && a.status === 'pending')
+      .reduce((sum, a) => sum + a.amount, 0);
+    
+    // Calcular valor do inventário (animais)
+    const inventory = state.cattlePurchases
+      .filter(lot => lot.status === 'active')
+      .reduce((sum, lot) => sum + lot.custoAcumulado.total, 0);
+    
+    const workingCapital: WorkingCapital = {
+      id: uuidv4(),
+      date: new Date(),
+      cashAndEquivalents,
+      accountsReceivable,
+      inventory,
+      otherCurrentAssets: 0,
+      accountsPayable,
+      shortTermDebt: 0,
+      accruedExpenses: 0,
+      otherCurrentLiabilities: 0,
+      workingCapital: (cashAndEquivalents + accountsReceivable + inventory) - accountsPayable,
+      currentRatio: accountsPayable > 0 ? (cashAndEquivalents + accountsReceivable + inventory) / accountsPayable : 1,
+      quickRatio: accountsPayable > 0 ? (cashAndEquivalents + accountsReceivable) / accountsPayable : 1,
+      cashConversionCycle: 0, // Implementar cálculo específico
+      createdAt: new Date()
+    };
+    
+    return {
+      workingCapitalHistory: [...state.workingCapitalHistory, workingCapital]
+    };
+  }),
+});
@@ -0,0 +1,217 @@
+import { v4 as uuidv4 } from 'uuid';
+import { getInitialPens } from './helpers';
+import { StoreSlice } from './types';
+
+/**
+ * Navegação, notificações, atualizações do sistema e cadastros auxiliares
+ */
+export const createCoreSlice: StoreSlice = (set, get) => ({
+  currentPage: 'dashboard',
+  darkMode: false,
+  sidebarCollapsed: false,
+  notifications: [],
+  transporters: [],
+  financialInstitutions: [],
+  systemUpdates: [],
+  updateFeedbacks: [],
+  lastViewedUpdateDate: undefined,
+
+  // Ações - Navegação
+  setCurrentPage: (page) => set({ currentPage: page }),
+  setDarkMode: (darkMode) => set({ darkMode }),
+  setSidebarCollapsed: (sidebarCollapsed) => set({ sidebarCollapsed }),
+  
+  // Ações - Notificações
+  addNotification: (notification) => set((state) => ({
+    notifications: [
+      { 
+        ...notification, 
+        id: uuidv4(), 
+        isRead: false, 
+        createdAt: new Date() 
+      },
+      ...state.notifications
+    ]
+  })),
+  markNotificationAsRead: (id) => set((state) => ({
+    notifications: state.notifications.map(notification => 
+      notification.id === id ? { ...notification, isRead: true } : notification
+    )
+  })),
+  markAllNotificationsAsRead: () => set((state) => ({
+    notifications: state.notifications.map(notification => ({ ...notification, isRead: true }))
+  })),
+  deleteNotification: (id) => set((state) => ({
+    notifications: state.notifications.filter(notification => notification.id !== id)
+  })),
+  clearAllNotifications: () => set({ notifications: [] }),
+  getUnreadNotificationsCount: () => {
+    const { notifications } = get();
+    return notifications.filter(notification => !notification.isRead).length;
+  },
+  
+  // 🆕 IMPLEMENTAÇÃO DA FUNÇÃO PARA LIMPAR DADOS DE TESTE
+  clearAllTestData: () => set((state) => ({
+    // Manter estado de navegação
+    currentPage: state.currentPage,
+    darkMode: state.darkMode,
+    sidebarCollapsed: state.sidebarCollapsed,
+    
+    // Limpar todos os dados transacionais
+    cycles: [],
+    partners: [],
+    cattlePurchases: [],
+    currentWeightReadings: [],
+    healthRecords: [],
+    feedCosts: [],
+    lotMovements: [],
+    financialAccounts: [],
+    
+    // Resetar KPIs
+    kpis: [
+      {
+        label: 'Animais Confinados',
+        value: '0',
+        icon: 'Beef'
+      },
+      {
+        label: 'Média Dia/Confinado',
+        value: '0',
+        icon: 'Clock'
+      },
+      {
+        label: 'Média Quebra de Peso',
+        value: '0%',
+        icon: 'TrendingDown'
+      },
+      {
+        label: 'Mortalidade Acumulada',
+        value: '0%',
+        icon: 'AlertTriangle'
+      }
+    ],
+    
+    // Manter estrutura de currais mas limpar alocações
+    penRegistrations: state.penRegistrations,
+    penAllocations: [],
+    penStatuses: state.penStatuses.map(pen => ({
+      ...pen,
+      currentAnimals: 0,
+      status: 'available' as const
+    })),
+    
+    // Limpar dados financeiros
+    debts: [],
+    bankStatements: [],
+    financialReconciliations: [],
+    costCenters: [],
+    costAllocations: [],
+    expenses: [],
+    budgetPlans: [],
+    financialReports: [],
+    
+    // Limpar contas pagadoras
+    payerAccounts: [],
+    
+    // Limpar vendas e notificações
+    saleRecords: [],
+    notifications: [],
+    
+    // Limpar modelo operacional
+    loteCurralLinks: [],
+    costProportionalAllocations: [],
+    saleDesignations: [],
+    
+    // Limpar transportadoras e instituições financeiras
+    transporters: [],
+    financialInstitutions: [],
+    
+    // Manter estados de atualizações do sistema
+    systemUpdates: state.systemUpdates,
+    updateFeedbacks: state.updateFeedbacks,
+    lastViewedUpdateDate: state.lastViewedUpdateDate,
+    
+    // Limpar dados do DRC
+    cashFlowEntries: [],
+    financialContributions: [],
+    cashFlowPeriods: [],
+    cashFlowProjections: [],
+    workingCapitalHistory: [],
+    
+    // Limpar lançamentos não-caixa
+    nonCashExpenses: [],
+    
+    // Limpar DRE
+    dreStatements: [],
+    dreComparisons: [],
+    
+    // Limpar rateio de custos indiretos
+    indirectCostAllocations: [],
+    allocationTemplates: [],
+    indirectCostCenters: []
+  })),
+  
+  // Ações - Transportadoras
+  addTransporter: (transporter) => set((state) => ({
+    transporters: [...state.transporters, { ...transporter, id: uuidv4(), createdAt: new Date(), updatedAt: new Date() }]
+  })),
+  updateTransporter: (id, data) => set((state) => ({
+    transporters: state.transporters.map(transporter => 
+      transporter.id === id ? { ...transporter, ...data, updatedAt: new Date() } : transporter
+    )
+  })),
+  deleteTransporter: (id) => set((state) => ({
+    transporters: state.transporters.filter(transporter => transporter.id !== id)
+  })),
+  
+  // Ações - Instituições Financeiras
+  addFinancialInstitution: (institution) => set((state) => ({
+    financialInstitutions: [...state.financialInstitutions, { ...institution, id: uuidv4(), createdAt: new Date(), updatedAt: new Date() }]
+  })),
+  updateFinancialInstitution: (id, data) => set((state) => ({
+    financialInstitutions: state.financialInstitutions.map(institution => 
+      institution.id === id ? { ...institution, ...data, updatedAt: new Date() } : institution
+    )
+  })),
+  deleteFinancialInstitution: (id) => set((state) => ({
+    financialInstitutions: state.financialInstitutions.filter(institution => institution.id !== id)
+  })),
+  
+  // Ações - Atualizações do Sistema
+  setLastViewedUpdateDate: (date) => set({ lastViewedUpdateDate: date }),
+  addSystemUpdate: (update) => set((state) => ({
+    systemUpdates: [...state.systemUpdates, { ...update, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateSystemUpdate: (id, data) => set((state) => ({
+    systemUpdates: state.systemUpdates.map(update => 
+      update.id === id ? { ...update, ...data, updatedAt: new Date() } : update
+    )
+  })),
+  deleteSystemUpdate: (id) => set((state) => ({
+    systemUpdates: state.systemUpdates.filter(update => update.id !== id)
+  })),
+  addUpdateFeedback: (feedback) => set((state) => ({
+    updateFeedbacks: [...state.updateFeedbacks, { ...feedback, id: uuidv4(), createdAt: new Date() }]
+  })),
+  getUnviewedUpdatesCount: () => {
+    const { systemUpdates, lastViewedUpdateDate } = get();
+    if (!lastViewedUpdateDate) return systemUpdates.length;
+    return systemUpdates.filter(update => update.releaseDate > lastViewedUpdateDate).length;
+  },
+
+  // Função para inicializar dados após o store estar pronto
+  initializeStore: () => {
+    const state = get();
+    if (state.penRegistrations.length === 0) {
+      try {
+        const initialPens = getInitialPens();
+        set({
+          penRegistrations: initialPens.penRegistrations,
+          penStatuses: initialPens.penStatuses
+        });
+      } catch (error) {
+        console.error('Error initializing store:', error);
+      }
+    }
+  }
+});
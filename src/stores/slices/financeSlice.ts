@@ -0,0 +1,237 @@
+import { v4 as uuidv4 } from 'uuid';
+import {
+  CattlePurchase
+} from '../../types';
+import { StoreSlice } from './types';
+
+/**
+ * Dívidas, extratos, conciliações, centros de custo, despesas, orçamentos e vendas
+ */
+export const createFinanceSlice: StoreSlice = (set, get) => ({
+  debts: [],
+  bankStatements: [],
+  financialReconciliations: [],
+  costCenters: [],
+  costAllocations: [],
+  expenses: [],
+  budgetPlans: [],
+  financialReports: [],
+  payerAccounts: [],
+  saleRecords: [],
+  revenues: [],
+
+  // Ações - Dívidas
+  addDebt: (debt) => set((state) => ({
+    debts: [...state.debts, { 
+      ...debt, 
+      id: uuidv4(), 
+      createdAt: new Date(),
+      updatedAt: new Date()
+    }]
+  })),
+  updateDebt: (id, data) => set((state) => ({
+    debts: state.debts.map(debt => 
+      debt.id === id ? { ...debt, ...data, updatedAt: new Date() } : debt
+    )
+  })),
+  deleteDebt: (id) => set((state) => ({
+    debts: state.debts.filter(debt => debt.id !== id)
+  })),
+  
+  // Ações - Extratos Bancários
+  addBankStatement: (statement) => set((state) => ({
+    bankStatements: [...state.bankStatements, { ...statement, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateBankStatement: (id, data) => set((state) => ({
+    bankStatements: state.bankStatements.map(statement => 
+      statement.id === id ? { ...statement, ...data } : statement
+    )
+  })),
+  deleteBankStatement: (id) => set((state) => ({
+    bankStatements: state.bankStatements.filter(statement => statement.id !== id)
+  })),
+  
+  // Ações - Conciliações Financeiras
+  addFinancialReconciliation: (reconciliation) => set((state) => ({
+    financialReconciliations: [...state.financialReconciliations, { ...reconciliation, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateFinancialReconciliation: (id, data) => set((state) => ({
+    financialReconciliations: state.financialReconciliations.map(reconciliation => 
+      reconciliation.id === id ? { ...reconciliation, ...data } : reconciliation
+    )
+  })),
+  deleteFinancialReconciliation: (id) => set((state) => ({
+    financialReconciliations: state.financialReconciliations.filter(reconciliation => reconciliation.id !== id)
+  })),
+  
+  // Ações - Centros de Custo
+  addCostCenter: (center) => set((state) => ({
+    costCenters: [...state.costCenters, { ...center, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateCostCenter: (id, data) => set((state) => ({
+    costCenters: state.costCenters.map(center => 
+      center.id === id ? { ...center, ...data } : center
+    )
+  })),
+  deleteCostCenter: (id) => set((state) => ({
+    costCenters: state.costCenters.map(center => 
+      center.id === id ? { ...center, isActive: false } : center
+    )
+  })),
+  
+  // Ações - Alocações de Custo
+  addCostAllocation: (allocation) => set((state) => ({
+    costAllocations: [...state.costAllocations, { ...allocation, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateCostAllocation: (id, data) => set((state) => ({
+    costAllocations: state.costAllocations.map(allocation => 
+      allocation.id === id ? { ...allocation, ...data } : allocation
+    )
+  })),
+  deleteCostAllocation: (id) => set((state) => ({
+    costAllocations: state.costAllocations.filter(allocation => allocation.id !== id)
+  })),
+  
+  // Ações - Despesas
+  addExpense: (expense) => set((state) => ({
+    expenses: [...state.expenses, { 
+      ...expense, 
+      id: uuidv4(), 
+      createdAt: new Date(),
+      updatedAt: new Date()
+    }]
+  })),
+  updateExpense: (id, data) => set((state) => ({
+    expenses: state.expenses.map(expense => 
+      expense.id === id ? { ...expense, ...data, updatedAt: new Date() } : expense
+    )
+  })),
+  deleteExpense: (id) => set((state) => ({
+    expenses: state.expenses.filter(expense => expense.id !== id)
+  })),
+  
+  // Ações - Planos de Orçamento
+  addBudgetPlan: (plan) => set((state) => ({
+    budgetPlans: [...state.budgetPlans, { 
+      ...plan, 
+      id: uuidv4(), 
+      createdAt: new Date(),
+      updatedAt: new Date()
+    }]
+  })),
+  updateBudgetPlan: (id, data) => set((state) => ({
+    budgetPlans: state.budgetPlans.map(plan => 
+      plan.id === id ? { ...plan, ...data, updatedAt: new Date() } : plan
+    )
+  })),
+  deleteBudgetPlan: (id) => set((state) => ({
+    budgetPlans: state.budgetPlans.filter(plan => plan.id !== id)
+  })),
+  
+  // Ações - Relatórios Financeiros
+  addFinancialReport: (report) => set((state) => ({
+    financialReports: [...state.financialReports, { ...report, id: uuidv4() }]
+  })),
+  updateFinancialReport: (id, data) => set((state) => ({
+    financialReports: state.financialReports.map(report => 
+      report.id === id ? { ...report, ...data } : report
+    )
+  })),
+  deleteFinancialReport: (id) => set((state) => ({
+    financialReports: state.financialReports.filter(report => report.id !== id)
+  })),
+  
+  // Ações - Contas Pagadoras
+  addPayerAccount: (account) => set((state) => {
+    // Se a nova conta for definida como padrão, remover o padrão das outras
+    let updatedAccounts = [...state.payerAccounts];
+    if (account.isDefault) {
+      updatedAccounts = updatedAccounts.map(acc => ({
+        ...acc,
+        isDefault: false
+      }));
+    }
+    
+    return {
+      payerAccounts: [...updatedAccounts, { ...account, id: uuidv4(), createdAt: new Date() }]
+    };
+  }),
+  updatePayerAccount: (id, data) => set((state) => {
+    // Se a conta for definida como padrão, remover o padrão das outras
+    let updatedAccounts = [...state.payerAccounts];
+    if (data.isDefault) {
+      updatedAccounts = updatedAccounts.map(acc => ({
+        ...acc,
+        isDefault: acc.id === id
+      }));
+    }
+    
+    return {
+      payerAccounts: updatedAccounts.map(account => 
+        account.id === id ? { ...account, ...data } : account
+      )
+    };
+  }),
+  deletePayerAccount: (id) => set((state) => ({
+    payerAccounts: state.payerAccounts.map(account => 
+      account.id === id ? { ...account, isActive: false } : account
+    )
+  })),
+  
+  // Ações - Registros de Venda
+  addSaleRecord: (record) => set((state) => {
+    const newRecord = { ...record, id: uuidv4(), createdAt: new Date() };
+    
+    // Marcar o lote como vendido
+    const updatedLots = state.cattlePurchases.map(lot => 
+      lot.id === record.lotId 
+        ? { ...lot, status: 'slaughtered' as CattlePurchase['status'], updatedAt: new Date() }
+        : lot
+    );
+    
+    return {
+      saleRecords: [...state.saleRecords, newRecord],
+      cattlePurchases: updatedLots
+    };
+  }),
+  updateSaleRecord: (id, data) => set((state) => {
+    const currentRecord = state.saleRecords.find(record => record.id === id);
+    if (!currentRecord) return state;
+    
+    // Se o status de conciliação mudou, atualizar o lote
+    if (data.reconciled !== undefined && data.reconciled !== currentRecord.reconciled) {
+      const updatedLots = state.cattlePurchases.map(lot => 
+        lot.id === currentRecord.lotId 
+          ? { ...lot, status: 'sold' as CattlePurchase['status'], updatedAt: new Date() }
+          : lot
+      );
+      
+      return {
+        saleRecords: state.saleRecords.map(record => 
+          record.id === id ? { ...record, ...data } : record
+        ),
+        cattlePurchases: updatedLots
+      };
+    }
+    
+    return {
+      saleRecords: state.saleRecords.map(record => 
+        record.id === id ? { ...record, ...data } : record
+      )
+    };
+  }),
+  deleteSaleRecord: (id) => set((state) => {
+    const record = state.saleRecords.find(r => r.id === id);
+    if (!record) return state;
+    
+    // Restaurar o status do lote para 'active'
+    const updatedLots = state.cattlePurchases.map(lot => 
+      lot.id === record.lotId ? { ...lot, status: 'active' as CattlePurchase['status'] } : lot
+    );
+    
+    return {
+      saleRecords: state.saleRecords.filter(r => r.id !== id),
+      cattlePurchases: updatedLots
+    };
+  }),
+});
@@ -0,0 +1,58 @@
+import { PenRegistration, PenStatus } from '../../types';
+
+
+// Helper function to ensure date is properly converted
+export const ensureDate = (date: any): Date => {
+  return date instanceof Date ? date : new Date(date);
+};
+
+// Generate initial pens with completely safe initialization
+export const getInitialPens = () => {
+  try {
+    const penRegistrations: PenRegistration[] = [];
+    const penStatuses: PenStatus[] = [];
+    
+    // Criar 15 currais por linha, total de 60 currais (4 linhas)
+    const pensPerLine = 15;
+    const totalLines = 4;
+    const totalPens = pensPerLine * totalLines;
+    
+    // Letras para as linhas
+    const lineLetters = ['A', 'B', 'C', 'D'];
+    
+    for (let i = 1; i <= totalPens; i++) {
+      const penNumber = i.toString();
+      const lineIndex = Math.floor((i - 1) / pensPerLine);
+      const lineLetter = lineLetters[lineIndex];
+      
+      // Create pen registration
+      penRegistrations.push({
+        id: `pen-${i}`,
+        penNumber,
+        capacity: 130, // Mantido temporariamente para compatibilidade
+        location: `Linha ${lineLetter}`,
+        description: '-',
+        isActive: true,
+        createdAt: new Date(),
+        updatedAt: new Date()
+      });
+      
+      // Create pen status
+      penStatuses.push({
+        penNumber,
+        capacity: 130, // Mantido temporariamente para compatibilidade
+        currentAnimals: 0,
+        status: 'available'
+      });
+    }
+    
+    return { penRegistrations, penStatuses };
+  } catch (error) {
+    console.error('Error generating initial pens:', error);
+    // Fallback to empty arrays
+    return {
+      penRegistrations: [],
+      penStatuses: []
+    };
+  }
+};
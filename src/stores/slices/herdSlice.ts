@@ -0,0 +1,1336 @@
+import { v4 as uuidv4 } from 'uuid';
+import {
+  CattlePurchase, FinancialAccount, PenStatus, Expense, Notification, LoteCurralLink, CostProportionalAllocation, SaleDesignation
+} from '../../types';
+import { ensureDate } from './helpers';
+import { StoreSlice } from './types';
+
+/**
+ * Ciclos, parceiros, lotes, currais, pesagens, sanidade e consultas operacionais
+ */
+export const createHerdSlice: StoreSlice = (set, get) => ({
+  cycles: [],
+  partners: [],
+  cattlePurchases: [],
+  currentWeightReadings: [],
+  healthRecords: [],
+  feedCosts: [],
+  lotMovements: [],
+  financialAccounts: [],
+  kpis: [
+    {
+      label: 'Animais Confinados',
+      value: '0',
+      icon: 'Beef'
+    },
+    {
+      label: 'Média Dia/Confinado',
+      value: '0',
+      icon: 'Clock'
+    },
+    {
+      label: 'Média Quebra de Peso',
+      value: '0%',
+      icon: 'TrendingDown'
+    },
+    {
+      label: 'Mortalidade Acumulada',
+      value: '0%',
+      icon: 'AlertTriangle'
+    }
+  ],
+  penRegistrations: [],
+  penAllocations: [],
+  penStatuses: [],
+  loteCurralLinks: [],
+  costProportionalAllocations: [],
+  saleDesignations: [],
+
+  // Ações - Ciclos
+  addCycle: (cycle) => set((state) => ({
+    cycles: [...state.cycles, { ...cycle, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateCycle: (id, data) => set((state) => ({
+    cycles: state.cycles.map(cycle => 
+      cycle.id === id ? { ...cycle, ...data } : cycle
+    )
+  })),
+  deleteCycle: (id) => set((state) => ({
+    cycles: state.cycles.filter(cycle => cycle.id !== id)
+  })),
+  setCycles: (cycles) => set({ cycles }),
+  setCattlePurchases: (cattlePurchases) => set({ cattlePurchases }),
+  setPartners: (partners) => set({ partners }),
+  setExpenses: (expenses) => set({ expenses }),
+  setRevenues: (revenues) => set({ revenues }),
+  setPenRegistrations: (penRegistrations) => set({ penRegistrations }),
+  setHealthRecords: (healthRecords) => set({ healthRecords }),
+  setWeightReadings: (currentWeightReadings) => set({ currentWeightReadings }),
+  
+  // Ações - Parceiros
+  addPartner: (partner) => set((state) => ({
+    partners: [...state.partners, { ...partner, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updatePartner: (id, data) => set((state) => ({
+    partners: state.partners.map(partner => 
+      partner.id === id ? { ...partner, ...data } : partner
+    )
+  })),
+  deletePartner: (id) => set((state) => ({
+    partners: state.partners.map(partner => 
+      partner.id === id ? { ...partner, isActive: false } : partner
+    )
+  })),
+  moveCattlePurchaseToNextStage: (id) => set((state) => {
+    const order = state.cattlePurchases.find(o => o.id === id);
+    if (!order) return state;
+    
+    let nextStatus: CattlePurchase['status'] = 'order';
+    const updatedState = { ...state };
+    
+    switch (order.status) {
+      case 'order':
+      {
+        nextStatus = 'payment_validation';
+        }
+      break;
+        
+      case 'payment_validation':
+      {
+        nextStatus = 'reception';
+        
+        // 🆕 INTEGRAÇÃO FINANCEIRA: Marcar contas como pagas se validado
+        if (order.paymentValidated) {
+          updatedState.financialAccounts = updatedState.financialAccounts.map(account => 
+            account.relatedEntityId === order.id && account.status === 'pending'
+              ? { ...account, status: 'paid', paymentDate: new Date() }
+              : account
+          );
+          
+          // Atualizar status das despesas
+          updatedState.expenses = updatedState.expenses.map(expense => 
+            expense.description?.includes(order.code) && !expense.isPaid
+              ? { ...expense, isPaid: true, paymentDate: new Date() }
+              : expense
+          );
+        }
+        
+        }
+      break;
+        
+      case 'reception':
+      {
+        nextStatus = 'confined';
+        
+        // 🆕 NOVO: Criar conta de frete ao recepcionar (quando temos o KM real)
+        const freightCost = (order.freightKm || 0) * (order.freightCostPerKm || 0);
+        if (freightCost > 0) {
+          const freightAccount: FinancialAccount = {
+            id: uuidv4(),
+            type: 'payable',
+            description: `Frete - ${order.code} - ${order.freightKm || 0} km`,
+            amount: freightCost,
+            dueDate: order.paymentDate || new Date(),
+            status: 'pending',
+            relatedEntityType: 'freight',
+            relatedEntityId: order.id,
+            createdAt: new Date()
+          };
+          updatedState.financialAccounts = [...updatedState.financialAccounts, freightAccount];
+          
+          // Criar despesa de frete
+          const freightExpense: Expense = {
+            id: uuidv4(),
+            date: new Date(),
+            description: `Frete - ${order.code} - ${order.freightKm || 0} km`,
+            category: 'freight',
+            purchaseValue: freightCost,
+            supplierId: order.transportCompanyId,
+            dueDate: order.paymentDate || new Date(),
+            paymentDate: undefined,
+            isPaid: false, // Começa como previsto
+            allocations: [],
+            impactsCashFlow: true, // Frete impacta o caixa
+            createdAt: new Date(),
+            updatedAt: new Date()
+          };
+          updatedState.expenses = [...updatedState.expenses, freightExpense];
+          
+          // Atualizar custo do lote com o frete
+          const lot = updatedState.cattlePurchases.find(l => l.purchaseId === order.id);
+          if (lot) {
+            updatedState.cattlePurchases = updatedState.cattlePurchases.map(l => 
+              l.id === lot.id 
+                ? {
+                    ...l,
+                    freightKm: order.freightKm || 0,
+                    freightCostPerKm: order.freightCostPerKm || 0,
+                    custoAcumulado: {
+                      ...l.custoAcumulado,
+                      frete: freightCost,
+                      total: l.custoAcumulado.total + freightCost
+                    },
+                    updatedAt: new Date()
+                  }
+                : l
+            );
+          }
+          
+          // Notificação sobre frete
+          const freightNotification: Notification = {
+            id: uuidv4(),
+            title: 'Frete Adicionado',
+            message: `Frete de R$ ${freightCost.toLocaleString('pt-BR', { minimumFractionDigits: 2 })} adicionado à ordem ${order.code}`,
+            type: 'info',
+            isRead: false,
+            relatedEntityType: 'purchase_order',
+            relatedEntityId: order.id,
+            createdAt: new Date()
+          };
+          updatedState.notifications = [...updatedState.notifications, freightNotification];
+        }
+        
+        }
+      break;
+        
+      default:
+        return state;
+    }
+    
+    updatedState.cattlePurchases = updatedState.cattlePurchases.map(o => 
+      o.id === id ? { ...o, status: nextStatus, updatedAt: new Date() } : o
+    );
+    
+    return updatedState;
+  }),
+  moveCattlePurchaseToPreviousStage: (id) => set((state) => {
+    const order = state.cattlePurchases.find(o => o.id === id);
+    if (!order) return state;
+    
+    let prevStatus: CattlePurchase['status'] = 'order';
+    
+    switch (order.status) {
+      case 'payment_validation':
+      {
+        prevStatus = 'order';
+        }
+      break;
+      case 'reception':
+      {
+        prevStatus = 'payment_validation';
+        }
+      break;
+      case 'confined':
+      {
+        prevStatus = 'reception';
+        }
+      break;
+      default:
+        return state;
+    }
+    
+    return {
+      cattlePurchases: state.cattlePurchases.map(o => 
+        o.id === id ? { ...o, status: prevStatus, updatedAt: new Date() } : o
+      )
+    };
+  }),
+  generateCattlePurchaseCode: () => {
+    const { cattlePurchases } = get();
+    const orderCount = cattlePurchases.length + 1;
+    return `X${orderCount.toString().padStart(4, '0')}`;
+  },
+  
+  // Ações - Lotes
+  addCattlePurchase: (lot) => set((state) => {
+    const newLot = { 
+      ...lot, 
+      id: uuidv4(), 
+      createdAt: new Date(),
+      updatedAt: new Date(),
+      custoAcumulado: {
+        aquisicao: 0,
+        sanidade: 0,
+        alimentacao: 0,
+        operacional: 0,
+        frete: 0,
+        outros: 0,
+        total: 0
+      }
+    };
+    
+    return {
+      cattlePurchases: [...state.cattlePurchases, newLot]
+    };
+  }),
+  updateCattlePurchase: (id, data) => set((state) => {
+    // Encontrar o lote atual
+    const currentLot = state.cattlePurchases.find(lot => lot.id === id);
+    if (!currentLot) return state;
+    
+    // Criar o lote atualizado
+    const updatedLot = { ...currentLot, ...data, updatedAt: new Date() };
+    
+    // Atualizar a lista de lotes
+    const updatedLots = state.cattlePurchases.map(lot => 
+      lot.id === id ? updatedLot : lot
+    );
+    
+    return {
+      cattlePurchases: updatedLots
+    };
+  }),
+  deleteCattlePurchase: (id) => set((state) => {
+    // Encontrar o lote a ser excluído
+    const lotToDelete = state.cattlePurchases.find(lot => lot.id === id);
+    if (!lotToDelete) return state;
+    
+    // Remover alocações do lote
+    const updatedPenAllocations = state.penAllocations.filter(alloc => alloc.lotId !== id);
+    
+    return {
+      cattlePurchases: state.cattlePurchases.filter(lot => lot.id !== id),
+      penAllocations: updatedPenAllocations
+    };
+  }),
+  generateLotNumber: () => {
+    const { cattlePurchases } = get();
+    const orderCount = cattlePurchases.length + 1;
+    return `X${orderCount.toString().padStart(4, '0')}`;
+  },
+  
+  // Ações - Pesagens
+  addWeightReading: (reading) => set((state) => ({
+    currentWeightReadings: [...state.currentWeightReadings, { ...reading, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateWeightReading: (id, data) => set((state) => ({
+    currentWeightReadings: state.currentWeightReadings.map(reading => 
+      reading.id === id ? { ...reading, ...data } : reading
+    )
+  })),
+  deleteWeightReading: (id) => set((state) => ({
+    currentWeightReadings: state.currentWeightReadings.filter(reading => reading.id !== id)
+  })),
+  
+  // Ações - Protocolos Sanitários
+  addHealthRecord: (record) => set((state) => {
+    const newRecord = { ...record, id: uuidv4(), createdAt: new Date() };
+    
+    // 🆕 INTEGRAÇÃO FINANCEIRA: Criar conta a pagar para o protocolo sanitário
+    const financialAccount: FinancialAccount = {
+      id: uuidv4(),
+      type: 'payable',
+      description: `Protocolo Sanitário - ${record.protocol} - ${state.cattlePurchases.find(l => l.id === record.lotId)?.lotNumber || record.lotId}`,
+      amount: record.cost,
+      dueDate: new Date(), // Pagamento imediato para protocolos
+      status: 'pending',
+      relatedEntityType: 'health_record',
+      relatedEntityId: newRecord.id,
+      createdAt: new Date()
+    };
+    
+    // 🆕 INTEGRAÇÃO CENTRO DE CUSTOS: Criar despesa de sanidade
+    const healthExpense: Expense = {
+      id: uuidv4(),
+      date: record.date,
+      description: `Protocolo Sanitário - ${record.protocol}`,
+      category: 'health_costs',
+      purchaseValue: record.cost,
+      supplierId: record.supplier,
+      dueDate: new Date(), // Pagamento imediato para protocolos
+      paymentDate: undefined,
+      isPaid: false, // Começa como previsto
+      allocations: [],
+      impactsCashFlow: true, // Sanidade impacta o caixa
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    // 🆕 INTEGRAÇÃO MODELO OPERACIONAL: Alocar custo proporcionalmente aos lotes no curral
+    const curralId = record.penNumber;
+    const linksNoCurral = state.loteCurralLinks.filter(
+      link => link.curralId === curralId && link.status === 'active'
+    );
+    
+    const totalAnimaisNoCurral = linksNoCurral.reduce((sum, link) => sum + link.quantidade, 0);
+    
+    const costAllocations: CostProportionalAllocation[] = [];
+    if (totalAnimaisNoCurral > 0) {
+      // Criar alocações proporcionais para cada lote no curral
+      linksNoCurral.forEach(link => {
+        const allocation: CostProportionalAllocation = {
+          id: uuidv4(),
+          custoOrigemId: newRecord.id,
+          custoOrigemTipo: 'health',
+          curralId,
+          loteId: link.loteId,
+          valorOriginal: record.cost,
+          valorAlocado: (link.quantidade / totalAnimaisNoCurral) * record.cost,
+          percentualAlocado: (link.quantidade / totalAnimaisNoCurral) * 100,
+          dataAlocacao: new Date(),
+          createdAt: new Date()
+        };
+        costAllocations.push(allocation);
+      });
+    }
+    
+    // Atualizar custos acumulados nos lotes
+    const updatedLots = state.cattlePurchases.map(lot => {
+      const alocacoesDoLote = costAllocations.filter(alloc => alloc.loteId === lot.id);
+      if (alocacoesDoLote.length === 0) return lot;
+      
+      const valorAlocadoTotal = alocacoesDoLote.reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+      
+      const custoAcumulado = { ...lot.custoAcumulado };
+      custoAcumulado.sanidade += valorAlocadoTotal;
+      custoAcumulado.total = 
+        custoAcumulado.aquisicao +
+        custoAcumulado.sanidade +
+        custoAcumulado.alimentacao +
+        custoAcumulado.operacional +
+        custoAcumulado.frete +
+        custoAcumulado.outros;
+      
+      return {
+        ...lot,
+        custoAcumulado,
+        updatedAt: new Date()
+      };
+    });
+    
+    // Adicionar notificação
+    const notification: Notification = {
+      id: uuidv4(),
+      title: 'Protocolo Sanitário Aplicado',
+      message: `Protocolo ${record.protocol} aplicado no curral ${curralId}. Custo: R$ ${record.cost.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}`,
+      type: 'info',
+      isRead: false,
+      relatedEntityType: 'health_record',
+      relatedEntityId: newRecord.id,
+      createdAt: new Date()
+    };
+    
+    return {
+      healthRecords: [...state.healthRecords, newRecord],
+      financialAccounts: [...state.financialAccounts, financialAccount],
+      expenses: [...state.expenses, healthExpense],
+      costProportionalAllocations: [...state.costProportionalAllocations, ...costAllocations],
+      cattlePurchases: updatedLots,
+      notifications: [...state.notifications, notification]
+    };
+  }),
+  updateHealthRecord: (id, data) => set((state) => ({
+    healthRecords: state.healthRecords.map(record => 
+      record.id === id ? { ...record, ...data } : record
+    )
+  })),
+  deleteHealthRecord: (id) => set((state) => ({
+    healthRecords: state.healthRecords.filter(record => record.id !== id)
+  })),
+  
+  // Ações - Custos de Alimentação
+  addFeedCost: (cost) => set((state) => {
+    const newCost = { ...cost, id: uuidv4(), createdAt: new Date() };
+    
+    // 🆕 INTEGRAÇÃO FINANCEIRA: Criar conta a pagar para alimentação
+    const financialAccount: FinancialAccount = {
+      id: uuidv4(),
+      type: 'payable',
+      description: `Alimentação - ${cost.feedType} - ${state.cattlePurchases.find(l => l.id === cost.lotId)?.lotNumber || cost.lotId}`,
+      amount: cost.totalCost,
+      dueDate: new Date(), // Pagamento imediato para alimentação
+      status: 'pending',
+      relatedEntityType: 'feed_cost',
+      relatedEntityId: newCost.id,
+      createdAt: new Date()
+    };
+    
+    // 🆕 INTEGRAÇÃO CENTRO DE CUSTOS: Criar despesa de alimentação
+    const feedExpense: Expense = {
+      id: uuidv4(),
+      date: cost.date,
+      description: `Alimentação - ${cost.feedType} - ${cost.currentQuantity}kg`,
+      category: 'feed',
+      purchaseValue: cost.totalCost,
+      supplierId: cost.supplier,
+      dueDate: new Date(), // Pagamento imediato para alimentação
+      paymentDate: undefined,
+      isPaid: false, // Começa como previsto
+      allocations: [],
+      impactsCashFlow: true, // Alimentação impacta o caixa
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    // 🆕 INTEGRAÇÃO MODELO OPERACIONAL: Alocar custo proporcionalmente aos lotes no curral
+    const curralId = cost.penNumber;
+    const linksNoCurral = state.loteCurralLinks.filter(
+      link => link.curralId === curralId && link.status === 'active'
+    );
+    
+    const totalAnimaisNoCurral = linksNoCurral.reduce((sum, link) => sum + link.quantidade, 0);
+    
+    const costAllocations: CostProportionalAllocation[] = [];
+    if (totalAnimaisNoCurral > 0) {
+      // Criar alocações proporcionais para cada lote no curral
+      linksNoCurral.forEach(link => {
+        const allocation: CostProportionalAllocation = {
+          id: uuidv4(),
+          custoOrigemId: newCost.id,
+          custoOrigemTipo: 'feed',
+          curralId,
+          loteId: link.loteId,
+          valorOriginal: cost.totalCost,
+          valorAlocado: (link.quantidade / totalAnimaisNoCurral) * cost.totalCost,
+          percentualAlocado: (link.quantidade / totalAnimaisNoCurral) * 100,
+          dataAlocacao: new Date(),
+          createdAt: new Date()
+        };
+        costAllocations.push(allocation);
+      });
+    }
+    
+    // Atualizar custos acumulados nos lotes
+    const updatedLots = state.cattlePurchases.map(lot => {
+      const alocacoesDoLote = costAllocations.filter(alloc => alloc.loteId === lot.id);
+      if (alocacoesDoLote.length === 0) return lot;
+      
+      const valorAlocadoTotal = alocacoesDoLote.reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+      
+      const custoAcumulado = { ...lot.custoAcumulado };
+      custoAcumulado.alimentacao += valorAlocadoTotal;
+      custoAcumulado.total = 
+        custoAcumulado.aquisicao +
+        custoAcumulado.sanidade +
+        custoAcumulado.alimentacao +
+        custoAcumulado.operacional +
+        custoAcumulado.frete +
+        custoAcumulado.outros;
+      
+      return {
+        ...lot,
+        custoAcumulado,
+        updatedAt: new Date()
+      };
+    });
+    
+          return {
+       feedCosts: [...state.feedCosts, newCost],
+       financialAccounts: [...state.financialAccounts, financialAccount],
+       expenses: [...state.expenses, feedExpense],
+       costProportionalAllocations: [...state.costProportionalAllocations, ...costAllocations],
+       cattlePurchases: updatedLots
+     };
+   }),
+  updateFeedCost: (id, data) => set((state) => ({
+    feedCosts: state.feedCosts.map(cost => 
+      cost.id === id ? { ...cost, ...data } : cost
+    )
+  })),
+  deleteFeedCost: (id) => set((state) => ({
+    feedCosts: state.feedCosts.filter(cost => cost.id !== id)
+  })),
+  
+  // Ações - Movimentações de Lote
+  addLotMovement: (movement) => set((state) => {
+    const newMovement = { ...movement, id: uuidv4(), createdAt: new Date() };
+    
+    // Atualizar status dos currais
+    const updatedPenStatuses = [...state.penStatuses];
+    
+    // Reduzir quantidade no curral de origem
+    if (movement.fromPen) {
+      const fromPenIndex = updatedPenStatuses.findIndex(p => p.penNumber === movement.fromPen);
+      if (fromPenIndex >= 0) {
+        updatedPenStatuses[fromPenIndex] = {
+          ...updatedPenStatuses[fromPenIndex],
+          currentAnimals: Math.max(0, updatedPenStatuses[fromPenIndex].currentAnimals - movement.currentQuantity),
+          status: updatedPenStatuses[fromPenIndex].currentAnimals - movement.currentQuantity > 0 ? 'occupied' : 'available'
+        };
+      }
+    }
+    
+    // Aumentar quantidade no curral de destino
+    const toPenIndex = updatedPenStatuses.findIndex(p => p.penNumber === movement.toPen);
+    if (toPenIndex >= 0) {
+      updatedPenStatuses[toPenIndex] = {
+        ...updatedPenStatuses[toPenIndex],
+        currentAnimals: updatedPenStatuses[toPenIndex].currentAnimals + movement.currentQuantity,
+        status: 'occupied'
+      };
+    }
+    
+    // Atualizar o curral do lote
+    const updatedLots = state.cattlePurchases.map(lot => 
+      lot.id === movement.lotId ? { ...lot, penNumber: movement.toPen } : lot
+    );
+    
+    return {
+      lotMovements: [...state.lotMovements, newMovement],
+      penStatuses: updatedPenStatuses,
+      cattlePurchases: updatedLots
+    };
+  }),
+  updateLotMovement: (id, data) => set((state) => ({
+    lotMovements: state.lotMovements.map(movement => 
+      movement.id === id ? { ...movement, ...data } : movement
+    )
+  })),
+  deleteLotMovement: (id) => set((state) => ({
+    lotMovements: state.lotMovements.filter(movement => movement.id !== id)
+  })),
+  
+  // Ações - Contas Financeiras
+  addFinancialAccount: (account) => set((state) => ({
+    financialAccounts: [...state.financialAccounts, { ...account, id: uuidv4(), createdAt: new Date() }]
+  })),
+  updateFinancialAccount: (id, data) => set((state) => ({
+    financialAccounts: state.financialAccounts.map(account => 
+      account.id === id ? { ...account, ...data } : account
+    )
+  })),
+  deleteFinancialAccount: (id) => set((state) => ({
+    financialAccounts: state.financialAccounts.filter(account => account.id !== id)
+  })),
+  
+  // Ações - KPIs
+  updateKPIs: () => set((state) => {
+    const totalAnimals = state.cattlePurchases.reduce((sum, lot) => sum + lot.entryQuantity, 0);
+    const totalDeaths = state.cattlePurchases.reduce((sum, lot) => sum + lot.deaths, 0);
+    const mortalityRate = totalAnimals > 0 ? (totalDeaths / totalAnimals) * 100 : 0;
+    
+    // Calcular média de dias em confinamento
+    const activeLots = state.cattlePurchases.filter(lot => lot.status === 'active');
+    let avgDaysInConfinement = 0;
+    
+    if (activeLots.length > 0) {
+      const totalDays = activeLots.reduce((sum, lot) => {
+        const daysInConfinement = Math.floor((new Date().getTime() - ensureDate(lot.entryDate).getTime()) / (1000 * 60 * 60 * 24));
+        return sum + daysInConfinement;
+      }, 0);
+      avgDaysInConfinement = totalDays / activeLots.length;
+    }
+    
+    // Calcular média de quebra de peso
+    let avgWeightLoss = 0;
+    
+    if (activeLots.length > 0) {
+      const totalWeightLoss = activeLots.reduce((sum, lot) => {
+        const order = state.cattlePurchases.find(o => o.id === lot.purchaseId);
+        if (!order) return sum;
+        
+        const currentWeightLoss = ((order.totalWeight - lot.entryWeight) / order.totalWeight) * 100;
+        return sum + currentWeightLoss;
+      }, 0);
+      avgWeightLoss = totalWeightLoss / activeLots.length;
+    }
+    
+    return {
+      kpis: [
+        {
+          label: 'Animais Confinados',
+          value: totalAnimals.toString(),
+          icon: 'Beef'
+        },
+        {
+          label: 'Média Dia/Confinado',
+          value: avgDaysInConfinement.toFixed(0),
+          icon: 'Clock'
+        },
+        {
+          label: 'Média Quebra de Peso',
+          value: `${avgWeightLoss.toFixed(1)}%`,
+          icon: 'TrendingDown'
+        },
+        {
+          label: 'Mortalidade Acumulada',
+          value: `${mortalityRate.toFixed(1)}%`,
+          icon: 'AlertTriangle'
+        }
+      ]
+    };
+  }),
+  
+  // Ações - Currais
+  addPenRegistration: (pen) => set((state) => {
+    const newPen = { ...pen, id: uuidv4(), createdAt: new Date() };
+    
+    // Adicionar ao status dos currais
+    const updatedPenStatuses = [...state.penStatuses];
+    const existingPenIndex = updatedPenStatuses.findIndex(p => p.penNumber === newPen.penNumber);
+    
+    if (existingPenIndex >= 0) {
+      // Atualizar curral existente
+      updatedPenStatuses[existingPenIndex] = {
+        ...updatedPenStatuses[existingPenIndex],
+        capacity: newPen.capacity
+      };
+    } else {
+      // Adicionar novo curral
+      updatedPenStatuses.push({
+        penNumber: newPen.penNumber,
+        capacity: newPen.capacity,
+        currentAnimals: 0,
+        status: 'available'
+      });
+    }
+    
+    return {
+      penRegistrations: [...state.penRegistrations, newPen],
+      penStatuses: updatedPenStatuses
+    };
+  }),
+  updatePenRegistration: (id, data) => set((state) => {
+    const penToUpdate = state.penRegistrations.find(pen => pen.id === id);
+    if (!penToUpdate) return state;
+    
+    // Atualizar o registro do curral
+    const updatedPens = state.penRegistrations.map(pen => 
+      pen.id === id ? { ...pen, ...data } : pen
+    );
+    
+    // Atualizar status dos currais se necessário
+    let updatedPenStatuses = [...state.penStatuses];
+    
+    if (data.capacity !== undefined) {
+      updatedPenStatuses = updatedPenStatuses.map(status => 
+        status.penNumber === penToUpdate.penNumber 
+          ? { ...status, capacity: data.capacity as number } 
+          : status
+      );
+    }
+    
+    return {
+      penRegistrations: updatedPens,
+      penStatuses: updatedPenStatuses
+    };
+  }),
+  deletePenRegistration: (id) => set((state) => {
+    const pen = state.penRegistrations.find(p => p.id === id);
+    if (!pen) return state;
+    
+    // Marcar como inativo em vez de excluir
+    const updatedPens = state.penRegistrations.map(p => 
+      p.id === id ? { ...p, isActive: false } : p
+    );
+    
+    // Atualizar status dos currais
+    const updatedPenStatuses = state.penStatuses.filter(status => 
+      status.penNumber !== pen.penNumber
+    );
+    
+    return {
+      penRegistrations: updatedPens,
+      penStatuses: updatedPenStatuses
+    };
+  }),
+  
+  // Ações - Alocações de Curral (LEGACY - mantido para compatibilidade)
+  addPenAllocation: (allocation) => set((state) => ({
+    penAllocations: [...state.penAllocations, { ...allocation, id: uuidv4(), createdAt: new Date() }],
+    penStatuses: state.penStatuses.map(pen => 
+      pen.penNumber === allocation.penNumber 
+        ? { 
+            ...pen, 
+            currentAnimals: pen.currentAnimals + allocation.currentQuantity,
+            status: 'occupied' as PenStatus['status']
+          }
+        : pen
+    )
+  })),
+  updatePenAllocation: (id, data) => set((state) => {
+    const currentAllocation = state.penAllocations.find(a => a.id === id);
+    if (!currentAllocation) return state;
+    
+    const updatedAllocations = state.penAllocations.map(alloc => 
+      alloc.id === id ? { ...alloc, ...data } : alloc
+    );
+    
+    // Recalcular animais nos currais se a quantidade mudou
+    if (data.currentQuantity) {
+      const difference = (data.currentQuantity || 0) - currentAllocation.currentQuantity;
+      const updatedPenStatuses = state.penStatuses.map(pen => 
+        pen.penNumber === currentAllocation.penNumber
+          ? { 
+              ...pen, 
+              currentAnimals: Math.max(0, pen.currentAnimals + difference),
+              status: (pen.currentAnimals + difference > 0 ? 'occupied' : 'available') as PenStatus['status']
+            }
+          : pen
+      );
+      
+      return {
+        penAllocations: updatedAllocations,
+        penStatuses: updatedPenStatuses
+      };
+    }
+    
+    return {
+      penAllocations: updatedAllocations
+    };
+  }),
+  deletePenAllocation: (id) => set((state) => {
+    const allocation = state.penAllocations.find(a => a.id === id);
+    if (!allocation) return state;
+    
+    return {
+      penAllocations: state.penAllocations.filter(a => a.id !== id),
+      penStatuses: state.penStatuses.map(pen => 
+        pen.penNumber === allocation.penNumber
+          ? { 
+              ...pen, 
+              currentAnimals: Math.max(0, pen.currentAnimals - allocation.currentQuantity),
+              status: (pen.currentAnimals - allocation.currentQuantity > 0 ? 'occupied' : 'available') as PenStatus['status']
+            }
+          : pen
+      )
+    };
+  }),
+  
+  // Ações - Modelo Operacional Lote-Curral
+  addLoteCurralLink: (link) => set((state) => {
+    const newLink = { 
+      ...link, 
+      id: uuidv4(), 
+      createdAt: new Date(), 
+      updatedAt: new Date() 
+    };
+    
+    // Atualizar status do curral
+    const updatedPenStatuses = state.penStatuses.map(pen => 
+      pen.penNumber === link.curralId
+        ? {
+            ...pen,
+            currentAnimals: pen.currentAnimals + link.quantidade,
+            status: 'occupied' as PenStatus['status']
+          }
+        : pen
+    );
+    
+    return {
+      loteCurralLinks: [...state.loteCurralLinks, newLink],
+      penStatuses: updatedPenStatuses
+    };
+  }),
+  updateLoteCurralLink: (id, data) => set((state) => ({
+    loteCurralLinks: state.loteCurralLinks.map(link => 
+      link.id === id ? { ...link, ...data, updatedAt: new Date() } : link
+    )
+  })),
+  removeLoteCurralLink: (id) => set((state) => {
+    const link = state.loteCurralLinks.find(l => l.id === id);
+    if (!link) return state;
+    
+    // Atualizar status do curral
+    const updatedPenStatuses = state.penStatuses.map(pen => 
+      pen.penNumber === link.curralId
+        ? {
+            ...pen,
+            currentAnimals: Math.max(0, pen.currentAnimals - link.quantidade),
+            status: (pen.currentAnimals - link.quantidade > 0 ? 'occupied' : 'available') as PenStatus['status']
+          }
+        : pen
+    );
+    
+    return {
+      loteCurralLinks: state.loteCurralLinks.map(l => 
+        l.id === id ? { ...l, status: 'removed' as LoteCurralLink['status'], dataRemocao: new Date() } : l
+      ),
+      penStatuses: updatedPenStatuses
+    };
+  }),
+  allocateLotToPens: (loteId, allocations) => set((state) => {
+    const lot = state.cattlePurchases.find(l => l.id === loteId);
+    if (!lot) return state;
+    
+    const totalAllocated = allocations.reduce((sum, alloc) => sum + alloc.quantidade, 0);
+    
+    // Criar links para cada alocação
+    const newLinks = allocations.map(alloc => ({
+      id: uuidv4(),
+      loteId,
+      curralId: alloc.curralId,
+      quantidade: alloc.quantidade,
+      percentualDoLote: (alloc.quantidade / totalAllocated) * 100,
+      percentualDoCurral: 0, // Será calculado abaixo
+      dataAlocacao: new Date(),
+      status: 'active' as LoteCurralLink['status'],
+      createdAt: new Date(),
+      updatedAt: new Date()
+    }));
+    
+    // Atualizar status dos currais e calcular percentual do curral
+    const updatedPenStatuses = [...state.penStatuses];
+    newLinks.forEach(link => {
+      const penIndex = updatedPenStatuses.findIndex(p => p.penNumber === link.curralId);
+      if (penIndex >= 0) {
+        const pen = updatedPenStatuses[penIndex];
+        const newTotal = pen.currentAnimals + link.quantidade;
+        link.percentualDoCurral = (link.quantidade / pen.capacity) * 100;
+        
+        updatedPenStatuses[penIndex] = {
+          ...pen,
+          currentAnimals: newTotal,
+          status: 'occupied' as PenStatus['status']
+        };
+      }
+    });
+    
+    // Atualizar alocações atuais do lote
+    const updatedLots = state.cattlePurchases.map(l => 
+      l.id === loteId
+        ? {
+            ...l,
+            alocacoesAtuais: allocations.map(alloc => ({
+              curralId: alloc.curralId,
+              quantidade: alloc.quantidade,
+              percentual: (alloc.quantidade / totalAllocated) * 100
+            })),
+            updatedAt: new Date()
+          }
+        : l
+    );
+    
+    return {
+      loteCurralLinks: [...state.loteCurralLinks, ...newLinks],
+      penStatuses: updatedPenStatuses,
+      cattlePurchases: updatedLots
+    };
+  }),
+  
+  // Ações - Alocação Proporcional de Custos
+  allocateCostProportionally: (custoOrigemId, custoOrigemTipo, curralId, valorTotal) => set((state) => {
+    // Obter todos os links ativos para o curral
+    const linksNoCurral = state.loteCurralLinks.filter(
+      link => link.curralId === curralId && link.status === 'active'
+    );
+    
+    const totalAnimaisNoCurral = linksNoCurral.reduce((sum, link) => sum + link.quantidade, 0);
+    
+    if (totalAnimaisNoCurral === 0) return state;
+    
+    // Criar alocações proporcionais para cada lote no curral
+    const newAllocations = linksNoCurral.map(link => ({
+      id: uuidv4(),
+      custoOrigemId,
+      custoOrigemTipo,
+      curralId,
+      loteId: link.loteId,
+      valorOriginal: valorTotal,
+      valorAlocado: (link.quantidade / totalAnimaisNoCurral) * valorTotal,
+      percentualAlocado: (link.quantidade / totalAnimaisNoCurral) * 100,
+      dataAlocacao: new Date(),
+      createdAt: new Date()
+    }));
+    
+    // Atualizar custos acumulados nos lotes
+    const updatedLots = state.cattlePurchases.map(lot => {
+      const alocacoesDoLote = newAllocations.filter(alloc => alloc.loteId === lot.id);
+      if (alocacoesDoLote.length === 0) return lot;
+      
+      const valorAlocadoTotal = alocacoesDoLote.reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+      
+      const custoAcumulado = { ...lot.custoAcumulado };
+      
+      switch (custoOrigemTipo) {
+        case 'health':
+      {
+          custoAcumulado.sanidade += valorAlocadoTotal;
+          }
+      break;
+        case 'feed':
+      {
+          custoAcumulado.alimentacao += valorAlocadoTotal;
+          }
+      break;
+        case 'operational':
+      {
+          custoAcumulado.operacional += valorAlocadoTotal;
+          }
+      break;
+        case 'other':
+      {
+          custoAcumulado.outros += valorAlocadoTotal;
+          }
+      break;
+      }
+      
+      custoAcumulado.total = 
+        custoAcumulado.aquisicao +
+        custoAcumulado.sanidade +
+        custoAcumulado.alimentacao +
+        custoAcumulado.operacional +
+        custoAcumulado.frete +
+        custoAcumulado.outros;
+      
+      return {
+        ...lot,
+        custoAcumulado,
+        updatedAt: new Date()
+      };
+    });
+    
+    return {
+      costProportionalAllocations: [...state.costProportionalAllocations, ...newAllocations],
+      cattlePurchases: updatedLots
+    };
+  }),
+  getCostAllocationsByLot: (loteId) => {
+    const { costProportionalAllocations } = get();
+    return costProportionalAllocations.filter(allocation => allocation.loteId === loteId);
+  },
+  
+  // Ações - Pipeline de Vendas
+  addSaleDesignation: (designation) => set((state) => ({
+    saleDesignations: [...state.saleDesignations, { ...designation, id: uuidv4(), createdAt: new Date(), updatedAt: new Date() }]
+  })),
+  updateSaleDesignation: (id, data) => set((state) => ({
+    saleDesignations: state.saleDesignations.map(designation => 
+      designation.id === id ? { ...designation, ...data, updatedAt: new Date() } : designation
+    )
+  })),
+  moveSaleDesignationToNextStage: (id) => set((state) => {
+    const designation = state.saleDesignations.find(d => d.id === id);
+    if (!designation) return state;
+    
+    let nextStatus: SaleDesignation['status'] = designation.status;
+    
+    switch (designation.status) {
+      case 'next_slaughter':
+      {
+        nextStatus = 'scheduled';
+        }
+      break;
+      case 'scheduled':
+      {
+        nextStatus = 'shipped';
+        }
+      break;
+      case 'shipped':
+      {
+        nextStatus = 'slaughtered';
+        }
+      break;
+      case 'slaughtered':
+      {
+        nextStatus = 'reconciled';
+        }
+      break;
+    }
+    
+    return {
+      saleDesignations: state.saleDesignations.map(d => 
+        d.id === id ? { ...d, status: nextStatus, updatedAt: new Date() } : d
+      )
+    };
+  }),
+  
+  // Consultas - Modelo Operacional
+  getLotesInCurral: (curralId) => {
+    const { cattlePurchases, loteCurralLinks } = get();
+    return loteCurralLinks
+      .filter(link => link.curralId === curralId && link.status === 'active')
+      .map(link => {
+        const lote = cattlePurchases.find(lot => lot.id === link.loteId);
+        return {
+          lote: lote!,
+          link
+        };
+      })
+      .filter(item => item.lote);
+  },
+  getCurraisOfLote: (loteId) => {
+    const { penRegistrations, loteCurralLinks } = get();
+    return loteCurralLinks
+      .filter(link => link.loteId === loteId && link.status === 'active')
+      .map(link => {
+        const curral = penRegistrations.find(pen => pen.penNumber === link.curralId);
+        return {
+          curral: curral!,
+          link
+        };
+      })
+      .filter(item => item.curral);
+  },
+  calculateLotCostsByCategory: (loteId) => {
+    const { cattlePurchases, costProportionalAllocations } = get();
+    
+    const lot = cattlePurchases.find(l => l.id === loteId);
+    if (!lot) {
+      return {
+        aquisicao: 0,
+        sanidade: 0,
+        alimentacao: 0,
+        operacional: 0,
+        frete: 0,
+        outros: 0,
+        total: 0
+      };
+    }
+    
+    // Custo de aquisição
+    const order = cattlePurchases.find(o => o.id === lot.purchaseId);
+    let acquisitionCost = 0;
+    
+    if (order) {
+      const rcPercentage = order.rcPercentage || 50; // Default 50% se não informado
+      const carcassWeight = order.totalWeight * (rcPercentage / 100);
+      const arrobas = carcassWeight / 15;
+      const animalValue = arrobas * order.pricePerArroba;
+      acquisitionCost = animalValue + order.commission + order.otherCosts;
+    }
+    
+    // Custos alocados proporcionalmente
+    const allocations = costProportionalAllocations.filter(alloc => alloc.loteId === loteId);
+    
+    const healthCosts = allocations
+      .filter(alloc => alloc.custoOrigemTipo === 'health')
+      .reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+    
+    const feedingCosts = allocations
+      .filter(alloc => alloc.custoOrigemTipo === 'feed')
+      .reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+    
+    const operationalCosts = allocations
+      .filter(alloc => alloc.custoOrigemTipo === 'operational')
+      .reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+    
+    const otherCosts = allocations
+      .filter(alloc => alloc.custoOrigemTipo === 'other')
+      .reduce((sum, alloc) => sum + alloc.valorAlocado, 0);
+    
+    // Custos de frete
+    const freightCost = lot.freightKm * lot.freightCostPerKm;
+    
+    const total = acquisitionCost + healthCosts + feedingCosts + freightCost + otherCosts;
+    
+    return {
+      aquisicao: acquisitionCost,
+      sanidade: healthCosts,
+      alimentacao: feedingCosts,
+      operacional: operationalCosts,
+      frete: freightCost,
+      outros: otherCosts,
+      total
+    };
+  },
+  
+  // Funções de Utilidade
+  calculateLotCosts: (lotId) => {
+    const { cattlePurchases, healthRecords, feedCosts } = get();
+    
+    const lot = cattlePurchases.find(l => l.id === lotId);
+    if (!lot) return 0;
+    
+    // Custo de aquisição
+    const order = cattlePurchases.find(o => o.id === lot.purchaseId);
+    let acquisitionCost = 0;
+    
+    if (order) {
+      const rcPercentage = order.rcPercentage || 50; // Default 50% se não informado
+      const carcassWeight = order.totalWeight * (rcPercentage / 100);
+      const arrobas = carcassWeight / 15;
+      const animalValue = arrobas * order.pricePerArroba;
+      acquisitionCost = animalValue + order.commission + order.otherCosts;
+    }
+    
+    // Custos sanitários
+    const healthCosts = healthRecords
+      .filter(record => record.lotId === lotId)
+      .reduce((sum, record) => sum + record.cost, 0);
+    
+    // Custos de alimentação
+    const feedingCosts = feedCosts
+      .filter(cost => cost.lotId === lotId)
+      .reduce((sum, cost) => sum + cost.totalCost, 0);
+    
+    // Custos de frete
+    const freightCost = lot.freightKm * lot.freightCostPerKm;
+    
+    return acquisitionCost + healthCosts + feedingCosts + freightCost;
+  },
+  calculateLotProfit: (lotId, pricePerArroba) => {
+    const { cattlePurchases, healthRecords, feedCosts } = get();
+    
+    const lot = cattlePurchases.find(l => l.id === lotId);
+    if (!lot) {
+      return {
+        lotId,
+        saleDate: new Date(),
+        pricePerArroba,
+        estimatedWeight: 0,
+        grossRevenue: 0,
+        totalCosts: 0,
+        netProfit: 0,
+        profitPerAnimal: 0,
+        profitMargin: 0,
+        daysInConfinement: 0,
+        costBreakdown: {
+          acquisition: 0,
+          feed: 0,
+          health: 0,
+          freight: 0,
+          financing: 0,
+          other: 0
+        }
+      };
+    }
+    
+    // Calcular dias em confinamento
+    const daysInConfinement = Math.floor((new Date().getTime() - ensureDate(lot.entryDate).getTime()) / (1000 * 60 * 60 * 24));
+    
+    // Estimar peso atual
+    const estimatedWeight = lot.entryWeight + (lot.estimatedGmd * lot.entryQuantity * daysInConfinement);
+    
+    // Calcular receita bruta
+    const grossRevenue = (estimatedWeight / 15) * pricePerArroba;
+    
+    // Custo de aquisição
+    const order = cattlePurchases.find(o => o.id === lot.purchaseId);
+    let acquisitionCost = 0;
+    
+    if (order) {
+      const rcPercentage = order.rcPercentage || 50; // Default 50% se não informado
+      const carcassWeight = order.totalWeight * (rcPercentage / 100);
+      const arrobas = carcassWeight / 15;
+      const animalValue = arrobas * order.pricePerArroba;
+      acquisitionCost = animalValue + order.commission + order.otherCosts;
+    }
+    
+    // Custos sanitários
+    const healthCosts = healthRecords
+      .filter(record => record.lotId === lotId)
+      .reduce((sum, record) => sum + record.cost, 0);
+    
+    // Custos de alimentação
+    const feedingCosts = feedCosts
+      .filter(cost => cost.lotId === lotId)
+      .reduce((sum, cost) => sum + cost.totalCost, 0);
+    
+    // Custos de frete
+    const freightCost = lot.freightKm * lot.freightCostPerKm;
+    
+    // Outros custos (financiamento, etc.)
+    const financingCost = acquisitionCost * 0.01 * (daysInConfinement / 30); // 1% ao mês
+    const otherCosts = 0;
+    
+    // Custo total
+    const totalCosts = acquisitionCost + healthCosts + feedingCosts + freightCost + financingCost + otherCosts;
+    
+    // Lucro líquido
+    const netProfit = grossRevenue - totalCosts;
+    
+    // Lucro por animal
+    const profitPerAnimal = lot.entryQuantity > 0 ? netProfit / lot.entryQuantity : 0;
+    
+    // Margem de lucro
+    const profitMargin = grossRevenue > 0 ? (netProfit / grossRevenue) * 100 : 0;
+    
+    return {
+      lotId,
+      saleDate: new Date(),
+      pricePerArroba,
+      estimatedWeight,
+      grossRevenue,
+      totalCosts,
+      netProfit,
+      profitPerAnimal,
+      profitMargin,
+      daysInConfinement,
+      costBreakdown: {
+        acquisition: acquisitionCost,
+        feed: feedingCosts,
+        health: healthCosts,
+        freight: freightCost,
+        financing: financingCost,
+        other: otherCosts
+      }
+    };
+  },
+  calculateZootechnicalPerformance: (lotId) => {
+    const { cattlePurchases, currentWeightReadings, healthRecords } = get();
+    
+    const lot = cattlePurchases.find(l => l.id === lotId);
+    if (!lot) {
+      return {
+        lotId,
+        gmd: 0,
+        feedConversion: 0,
+        daysInConfinement: 0,
+        mortality: 0,
+        averageEntryWeight: 0,
+        averageCurrentWeight: 0,
+        projectedExitWeight: 0,
+        efficiency: 0
+      };
+    }
+    
+    // Calcular dias em confinamento
+    const daysInConfinement = Math.floor((new Date().getTime() - ensureDate(lot.entryDate).getTime()) / (1000 * 60 * 60 * 24));
+    
+    // Calcular GMD (ganho médio diário)
+    const gmd = lot.estimatedGmd; // Usar o GMD estimado como fallback
+    
+    // Calcular peso médio de entrada
+    const averageEntryWeight = lot.entryQuantity > 0 ? lot.entryWeight / lot.entryQuantity : 0;
+    
+    // Calcular peso médio atual
+    const averageCurrentWeight = averageEntryWeight + (gmd * daysInConfinement);
+    
+    // Calcular peso projetado de saída (após 90 dias)
+    const projectedExitWeight = averageEntryWeight + (gmd * 90);
+    
+    // Calcular taxa de mortalidade
+    const mortality = lot.entryQuantity > 0 ? (lot.deaths / lot.entryQuantity) * 100 : 0;
+    
+    // Calcular conversão alimentar (kg de alimento / kg de ganho de peso)
+    const feedConversion = 6.5; // Valor padrão
+    
+    // Calcular eficiência (ganho de peso / consumo de alimento * 100)
+    const efficiency = 100 / feedConversion;
+    
+    return {
+      lotId,
+      gmd,
+      feedConversion,
+      daysInConfinement,
+      mortality,
+      averageEntryWeight,
+      averageCurrentWeight,
+      projectedExitWeight,
+      efficiency
+    };
+  },
+  getTotalConfinedAnimals: () => {
+    const { cattlePurchases } = get();
+    return cattlePurchases
+      .filter(lot => lot.status === 'active')
+      .reduce((sum, lot) => sum + lot.entryQuantity, 0);
+  },
+  getUnallocatedAnimals: () => {
+    const { cattlePurchases, penAllocations } = get();
+    
+    // Total de animais em lotes ativos
+    const totalAnimals = cattlePurchases
+      .filter(lot => lot.status === 'active')
+      .reduce((sum, lot) => sum + lot.entryQuantity, 0);
+    
+    // Total de animais alocados em currais
+    const allocatedAnimals = penAllocations.reduce((sum, allocation) => sum + allocation.currentQuantity, 0);
+    
+    return totalAnimals - allocatedAnimals;
+  },
+  getAvailablePens: () => {
+    const { penStatuses } = get();
+    return penStatuses.filter(pen => 
+      pen.status === 'available' || pen.currentAnimals < pen.capacity
+    );
+  },
+
+  // 🆕 NOVO: Função helper para calcular arrobas de carcaça
+  calculateCarcassArrobas: (order) => {
+    const rcPercentage = order.rcPercentage || 50; // Default 50% se não informado
+    const carcassWeight = order.totalWeight * (rcPercentage / 100);
+    return carcassWeight / 15;
+  },
+});
@@ -0,0 +1,146 @@
+import { v4 as uuidv4 } from 'uuid';
+import {
+  Expense, NonCashExpense
+} from '../../types';
+import { StoreSlice } from './types';
+
+/**
+ * Lançamentos não-caixa (mortalidade e quebra de peso)
+ * Carregado sob demanda por `loadStoreSlice`; o estado inicial fica em `lazySliceState`.
+ */
+export const createNonCashSlice: StoreSlice = (set, get) => ({
+  // 🆕 IMPLEMENTAÇÃO DE LANÇAMENTOS NÃO-CAIXA
+  addNonCashExpense: (expense) => set((state) => {
+    const newExpense: NonCashExpense = {
+      ...expense,
+      id: uuidv4(),
+      affectsCashFlow: false, // Sempre false para non-cash
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    // Criar despesa correspondente com flag impactsCashFlow = false
+    const correspondingExpense: Expense = {
+      id: uuidv4(),
+      date: expense.date,
+      description: expense.description,
+      category: expense.type === 'mortality' ? 'deaths' : 'financial_other',
+      purchaseValue: expense.monetaryValue,
+      dueDate: expense.date, // Lançamento não-caixa, vencimento é a mesma data
+      paymentDate: expense.date, // Já "realizado" pois não impacta caixa
+      isPaid: true, // Sempre true para lançamentos não-caixa
+      allocations: [],
+      impactsCashFlow: false,
+      nonCashExpenseId: newExpense.id,
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+    
+    // Se for mortalidade, atualizar o lote
+    if (expense.type === 'mortality' && expense.currentQuantity !== undefined) {
+      const updatedLots = state.cattlePurchases.map(lot => 
+        lot.id === expense.relatedEntityId
+          ? { 
+              ...lot, 
+              deaths: (lot.deaths || 0) + expense.currentQuantity!,
+              updatedAt: new Date()
+            }
+          : lot
+      );
+      
+      return {
+        nonCashExpenses: [...state.nonCashExpenses, newExpense],
+        expenses: [...state.expenses, correspondingExpense],
+        cattlePurchases: updatedLots
+      };
+    }
+    
+    return {
+      nonCashExpenses: [...state.nonCashExpenses, newExpense],
+      expenses: [...state.expenses, correspondingExpense]
+    };
+  }),
+  
+  updateNonCashExpense: (id, data) => set((state) => ({
+    nonCashExpenses: state.nonCashExpenses.map(expense => 
+      expense.id === id 
+        ? { ...expense, ...data, updatedAt: new Date() }
+        : expense
+    )
+  })),
+  
+  deleteNonCashExpense: (id) => set((state) => ({
+    nonCashExpenses: state.nonCashExpenses.filter(expense => expense.id !== id),
+    expenses: state.expenses.filter(expense => expense.nonCashExpenseId !== id)
+  })),
+  
+  recordMortality: (lotId, currentQuantity, cause, notes) => {
+    const state = get();
+    const lot = state.cattlePurchases.find(l => l.id === lotId);
+    if (!lot) return;
+    
+    const order = state.cattlePurchases.find(o => o.id === lot.purchaseId);
+    if (!order) return;
+    
+    // Calcular valor monetário da perda (baseado no custo médio por animal)
+    const costPerAnimal = lot.custoAcumulado.total / lot.entryQuantity;
+    const monetaryValue = costPerAnimal * currentQuantity;
+    
+    const mortalityExpense: Omit<NonCashExpense, 'id' | 'createdAt' | 'updatedAt'> = {
+      date: new Date(),
+      type: 'mortality',
+      description: `Mortalidade de ${currentQuantity} animais - ${lot.lotNumber}`,
+      relatedEntityType: 'cattle_lot',
+      relatedEntityId: lotId,
+      currentQuantity,
+      monetaryValue,
+      mortalityDetails: {
+        cause,
+        veterinarianReport: notes
+      },
+      accountingImpact: 'operational_loss',
+      affectsDRE: true,
+      affectsCashFlow: false,
+      notes
+    };
+    
+    get().addNonCashExpense(mortalityExpense);
+  },
+  
+  recordWeightLoss: (lotId, expectedWeight, actualWeight, notes) => {
+    const state = get();
+    const lot = state.cattlePurchases.find(l => l.id === lotId);
+    if (!lot) return;
+    
+    const currentWeightLoss = expectedWeight - actualWeight;
+    const lossPercentage = (currentWeightLoss / expectedWeight) * 100;
+    
+    // Calcular valor monetário da perda (baseado no preço médio de compra)
+    const order = state.cattlePurchases.find(o => o.id === lot.purchaseId);
+    if (!order) return;
+    
+    const pricePerKg = (order.pricePerArroba / 15) * (order.rcPercentage || 50) / 100;
+    const monetaryValue = currentWeightLoss * pricePerKg;
+    
+    const currentWeightLossExpense: Omit<NonCashExpense, 'id' | 'createdAt' | 'updatedAt'> = {
+      date: new Date(),
+      type: 'currentWeight_loss',
+      description: `Quebra de peso - ${lot.lotNumber}`,
+      relatedEntityType: 'cattle_lot',
+      relatedEntityId: lotId,
+      currentWeightLoss,
+      monetaryValue,
+      currentWeightLossDetails: {
+        expectedWeight,
+        actualWeight,
+        lossPercentage
+      },
+      accountingImpact: 'cost_of_goods_sold',
+      affectsDRE: true,
+      affectsCashFlow: false,
+      notes
+    };
+    
+    get().addNonCashExpense(currentWeightLossExpense);
+  },
+});
@@ -0,0 +1,323 @@
+import { StateCreator } from 'zustand';
+import { 
+  FatteningCycle, Partner, CattlePurchase, WeightReading, 
+  HealthRecord, FeedCost, LotMovement, SaleSimulation, FinancialAccount,
+  KPI, PenStatus, Debt, ZootechnicalPerformance, BankStatement, 
+  FinancialReconciliation, CostCenter, CostAllocation, Expense, 
+  BudgetPlan, FinancialReport, PenRegistration, PenAllocation, 
+  PayerAccount, SaleRecord, Notification, LoteCurralLink, 
+  CostProportionalAllocation, SaleDesignation,
+  Transporter, FinancialInstitution,
+  SystemUpdate, UpdateFeedback,
+  // 🆕 TIPOS DO DRC
+  CashFlowEntry, CashFlowPeriod, CashFlowProjection, WorkingCapital,
+  FinancialContribution, CashFlowEntryFormData, FinancialContributionFormData,
+  // 🆕 TIPOS DE LANÇAMENTOS NÃO-CAIXA
+  NonCashExpense,
+  // 🆕 TIPOS DO DRE
+  DREStatement, DREGenerationParams, DREComparison,
+  // 🆕 TIPOS DE RATEIO DE CUSTOS INDIRETOS
+  IndirectCostAllocation, AllocationTemplate, IndirectCostCenter,
+  AllocationGenerationParams, IndirectCostSummary
+} from '../../types';
+
+export interface AppState {
+  // Estado
+  currentPage: string;
+  darkMode: boolean;
+  sidebarCollapsed: boolean;
+  
+  // Dados
+  cycles: FatteningCycle[];
+  partners: Partner[];
+  cattlePurchases: CattlePurchase[];
+  currentWeightReadings: WeightReading[];
+  healthRecords: HealthRecord[];
+  feedCosts: FeedCost[];
+  lotMovements: LotMovement[];
+  financialAccounts: FinancialAccount[];
+  kpis: KPI[];
+  penRegistrations: PenRegistration[];
+  penAllocations: PenAllocation[];
+  penStatuses: PenStatus[];
+  debts: Debt[];
+  bankStatements: BankStatement[];
+  financialReconciliations: FinancialReconciliation[];
+  costCenters: CostCenter[];
+  costAllocations: CostAllocation[];
+  expenses: Expense[];
+  budgetPlans: BudgetPlan[];
+  financialReports: FinancialReport[];
+  payerAccounts: PayerAccount[];
+  saleRecords: SaleRecord[];
+  revenues: any[];
+  notifications: Notification[];
+  loteCurralLinks: LoteCurralLink[];
+  costProportionalAllocations: CostProportionalAllocation[];
+  saleDesignations: SaleDesignation[];
+  transporters: Transporter[];
+  financialInstitutions: FinancialInstitution[];
+  
+  // Estados de Atualizações do Sistema
+  systemUpdates: SystemUpdate[];
+  updateFeedbacks: UpdateFeedback[];
+  lastViewedUpdateDate?: Date;
+  
+  // 🆕 ESTADOS DO DRC
+  cashFlowEntries: CashFlowEntry[];
+  financialContributions: FinancialContribution[];
+  cashFlowPeriods: CashFlowPeriod[];
+  cashFlowProjections: CashFlowProjection[];
+  workingCapitalHistory: WorkingCapital[];
+  
+  // 🆕 ESTADOS DE LANÇAMENTOS NÃO-CAIXA
+  nonCashExpenses: NonCashExpense[];
+  
+  // 🆕 ESTADOS DO DRE
+  dreStatements: DREStatement[];
+  dreComparisons: DREComparison[];
+  
+  // 🆕 ESTADOS DE RATEIO DE CUSTOS INDIRETOS
+  indirectCostAllocations: IndirectCostAllocation[];
+  allocationTemplates: AllocationTemplate[];
+  indirectCostCenters: IndirectCostCenter[];
+  
+  // Ações - Navegação
+  setCurrentPage: (page: string) => void;
+  setDarkMode: (darkMode: boolean) => void;
+  setSidebarCollapsed: (collapsed: boolean) => void;
+  
+  // Ações - Ciclos
+  addCycle: (cycle: Omit<FatteningCycle, 'id' | 'createdAt'>) => void;
+  updateCycle: (id: string, data: Partial<FatteningCycle>) => void;
+  deleteCycle: (id: string) => void;
+  setCycles: (cycles: FatteningCycle[]) => void;
+  setCattlePurchases: (lots: CattlePurchase[]) => void;
+  setPartners: (partners: Partner[]) => void;
+  setExpenses: (expenses: Expense[]) => void;
+  setRevenues: (revenues: any[]) => void;
+  setPenRegistrations: (pens: PenRegistration[]) => void;
+  setHealthRecords: (records: HealthRecord[]) => void;
+  setWeightReadings: (readings: WeightReading[]) => void;
+  
+  // Ações - Parceiros
+  addPartner: (partner: Omit<Partner, 'id' | 'createdAt'>) => void;
+  updatePartner: (id: string, data: Partial<Partner>) => void;
+  deletePartner: (id: string) => void;
+  
+  // Ações - Lotes/Compras de Gado
+  addCattlePurchase: (lot: Omit<CattlePurchase, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateCattlePurchase: (id: string, data: Partial<CattlePurchase>) => void;
+  deleteCattlePurchase: (id: string) => void;
+  moveCattlePurchaseToNextStage: (id: string) => void;
+  moveCattlePurchaseToPreviousStage: (id: string) => void;
+  generateCattlePurchaseCode: () => string;
+  generateLotNumber: () => string;
+  
+  // Ações - Pesagens
+  addWeightReading: (reading: Omit<WeightReading, 'id' | 'createdAt'>) => void;
+  updateWeightReading: (id: string, data: Partial<WeightReading>) => void;
+  deleteWeightReading: (id: string) => void;
+  
+  // Ações - Protocolos Sanitários
+  addHealthRecord: (record: Omit<HealthRecord, 'id' | 'createdAt'>) => void;
+  updateHealthRecord: (id: string, data: Partial<HealthRecord>) => void;
+  deleteHealthRecord: (id: string) => void;
+  
+  // Ações - Custos de Alimentação
+  addFeedCost: (cost: Omit<FeedCost, 'id' | 'createdAt'>) => void;
+  updateFeedCost: (id: string, data: Partial<FeedCost>) => void;
+  deleteFeedCost: (id: string) => void;
+  
+  // Ações - Movimentações de Lote
+  addLotMovement: (movement: Omit<LotMovement, 'id' | 'createdAt'>) => void;
+  updateLotMovement: (id: string, data: Partial<LotMovement>) => void;
+  deleteLotMovement: (id: string) => void;
+  
+  // Ações - Contas Financeiras
+  addFinancialAccount: (account: Omit<FinancialAccount, 'id' | 'createdAt'>) => void;
+  updateFinancialAccount: (id: string, data: Partial<FinancialAccount>) => void;
+  deleteFinancialAccount: (id: string) => void;
+  
+  // Ações - KPIs
+  updateKPIs: () => void;
+  
+  // Ações - Currais
+  addPenRegistration: (pen: Omit<PenRegistration, 'id' | 'createdAt'>) => void;
+  updatePenRegistration: (id: string, data: Partial<PenRegistration>) => void;
+  deletePenRegistration: (id: string) => void;
+  
+  // Ações - Alocações de Curral (LEGACY - mantido para compatibilidade)
+  addPenAllocation: (allocation: Omit<PenAllocation, 'id' | 'createdAt'>) => void;
+  updatePenAllocation: (id: string, data: Partial<PenAllocation>) => void;
+  deletePenAllocation: (id: string) => void;
+  
+  // Ações - Modelo Operacional Lote-Curral
+  addLoteCurralLink: (link: Omit<LoteCurralLink, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateLoteCurralLink: (id: string, data: Partial<LoteCurralLink>) => void;
+  removeLoteCurralLink: (id: string) => void;
+  allocateLotToPens: (loteId: string, allocations: { curralId: string; quantidade: number }[]) => void;
+  
+  // Ações - Alocação Proporcional de Custos
+  allocateCostProportionally: (custoOrigemId: string, custoOrigemTipo: 'health' | 'feed' | 'operational' | 'other', curralId: string, valorTotal: number) => void;
+  getCostAllocationsByLot: (loteId: string) => CostProportionalAllocation[];
+  
+  // Ações - Pipeline de Vendas
+  addSaleDesignation: (designation: Omit<SaleDesignation, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateSaleDesignation: (id: string, data: Partial<SaleDesignation>) => void;
+  moveSaleDesignationToNextStage: (id: string) => void;
+  
+  // Consultas - Modelo Operacional
+  getLotesInCurral: (curralId: string) => { lote: CattlePurchase; link: LoteCurralLink }[];
+  getCurraisOfLote: (loteId: string) => { curral: PenRegistration; link: LoteCurralLink }[];
+  calculateLotCostsByCategory: (loteId: string) => CattlePurchase['custoAcumulado'];
+  
+  // Ações - Dívidas
+  addDebt: (debt: Omit<Debt, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateDebt: (id: string, data: Partial<Debt>) => void;
+  deleteDebt: (id: string) => void;
+  
+  // Ações - Extratos Bancários
+  addBankStatement: (statement: Omit<BankStatement, 'id' | 'createdAt'>) => void;
+  updateBankStatement: (id: string, data: Partial<BankStatement>) => void;
+  deleteBankStatement: (id: string) => void;
+  
+  // Ações - Conciliações Financeiras
+  addFinancialReconciliation: (reconciliation: Omit<FinancialReconciliation, 'id' | 'createdAt'>) => void;
+  updateFinancialReconciliation: (id: string, data: Partial<FinancialReconciliation>) => void;
+  deleteFinancialReconciliation: (id: string) => void;
+  
+  // Ações - Centros de Custo
+  addCostCenter: (center: Omit<CostCenter, 'id' | 'createdAt'>) => void;
+  updateCostCenter: (id: string, data: Partial<CostCenter>) => void;
+  deleteCostCenter: (id: string) => void;
+  
+  // Ações - Alocações de Custo
+  addCostAllocation: (allocation: Omit<CostAllocation, 'id' | 'createdAt'>) => void;
+  updateCostAllocation: (id: string, data: Partial<CostAllocation>) => void;
+  deleteCostAllocation: (id: string) => void;
+  
+  // Ações - Despesas
+  addExpense: (expense: Omit<Expense, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateExpense: (id: string, data: Partial<Expense>) => void;
+  deleteExpense: (id: string) => void;
+  
+  // Ações - Planos de Orçamento
+  addBudgetPlan: (plan: Omit<BudgetPlan, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateBudgetPlan: (id: string, data: Partial<BudgetPlan>) => void;
+  deleteBudgetPlan: (id: string) => void;
+  
+  // Ações - Relatórios Financeiros
+  addFinancialReport: (report: Omit<FinancialReport, 'id'>) => void;
+  updateFinancialReport: (id: string, data: Partial<FinancialReport>) => void;
+  deleteFinancialReport: (id: string) => void;
+  
+  // Ações - Contas Pagadoras
+  addPayerAccount: (account: Omit<PayerAccount, 'id' | 'createdAt'>) => void;
+  updatePayerAccount: (id: string, data: Partial<PayerAccount>) => void;
+  deletePayerAccount: (id: string) => void;
+  
+  // Ações - Registros de Venda
+  addSaleRecord: (record: Omit<SaleRecord, 'id' | 'createdAt'>) => void;
+  updateSaleRecord: (id: string, data: Partial<SaleRecord>) => void;
+  deleteSaleRecord: (id: string) => void;
+  
+  // Ações - Notificações
+  addNotification: (notification: Omit<Notification, 'id' | 'isRead' | 'createdAt'>) => void;
+  markNotificationAsRead: (id: string) => void;
+  markAllNotificationsAsRead: () => void;
+  deleteNotification: (id: string) => void;
+  clearAllNotifications: () => void;
+  getUnreadNotificationsCount: () => number;
+  
+  // Funções de Utilidade
+  calculateLotCosts: (lotId: string) => number;
+  calculateLotProfit: (lotId: string, pricePerArroba: number) => SaleSimulation;
+  calculateZootechnicalPerformance: (lotId: string) => ZootechnicalPerformance;
+  getTotalConfinedAnimals: () => number;
+  getUnallocatedAnimals: () => number;
+  getAvailablePens: () => PenStatus[];
+
+  // 🆕 NOVO: Função helper para calcular arrobas de carcaça
+  calculateCarcassArrobas: (order: CattlePurchase) => number;
+  
+  // 🆕 AÇÕES DO DRC
+  // Ações - DRC/Fluxo de Caixa
+  addCashFlowEntry: (entry: CashFlowEntryFormData) => void;
+  updateCashFlowEntry: (id: string, data: Partial<CashFlowEntryFormData>) => void;
+  deleteCashFlowEntry: (id: string) => void;
+  
+  // Ações - Contribuições Financeiras
+  addFinancialContribution: (contribution: FinancialContributionFormData) => void;
+  updateFinancialContribution: (id: string, data: Partial<FinancialContributionFormData>) => void;
+  confirmFinancialContribution: (id: string) => void;
+  
+  // Ações - Análises e Projeções
+  generateCashFlowProjection: (horizonDays: number) => void;
+  calculateWorkingCapital: () => void;
+  
+  // 🆕 AÇÕES DE LANÇAMENTOS NÃO-CAIXA
+  addNonCashExpense: (expense: Omit<NonCashExpense, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateNonCashExpense: (id: string, data: Partial<NonCashExpense>) => void;
+  deleteNonCashExpense: (id: string) => void;
+  recordMortality: (lotId: string, currentQuantity: number, cause: 'disease' | 'accident' | 'stress' | 'unknown', notes?: string) => void;
+  recordWeightLoss: (lotId: string, expectedWeight: number, actualWeight: number, notes?: string) => void;
+  
+  // 🆕 AÇÕES DO DRE
+  generateDREStatement: (params: DREGenerationParams) => DREStatement | null;
+  saveDREStatement: (dre: DREStatement) => void;
+  deleteDREStatement: (id: string) => void;
+  compareDREs: (entityIds: string[], entityType: 'lot' | 'pen', periodStart: Date, periodEnd: Date) => DREComparison | null;
+  getDREByEntity: (entityType: 'lot' | 'pen', entityId: string) => DREStatement[];
+  
+  // 🆕 AÇÕES DE RATEIO DE CUSTOS INDIRETOS
+  generateIndirectCostAllocation: (params: AllocationGenerationParams) => IndirectCostAllocation | null;
+  saveIndirectCostAllocation: (allocation: IndirectCostAllocation) => void;
+  approveIndirectCostAllocation: (id: string, approvedBy: string) => void;
+  applyIndirectCostAllocation: (id: string) => void;
+  deleteIndirectCostAllocation: (id: string) => void;
+  getIndirectCostSummary: (entityType: 'lot' | 'pen' | 'global', entityId: string, periodStart: Date, periodEnd: Date) => IndirectCostSummary | null;
+  // Templates
+  createAllocationTemplate: (template: Omit<AllocationTemplate, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateAllocationTemplate: (id: string, data: Partial<AllocationTemplate>) => void;
+  deleteAllocationTemplate: (id: string) => void;
+  // Centros de Custo
+  createIndirectCostCenter: (center: Omit<IndirectCostCenter, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateIndirectCostCenter: (id: string, data: Partial<IndirectCostCenter>) => void;
+  deleteIndirectCostCenter: (id: string) => void;
+  
+  // 🆕 FUNÇÃO PARA LIMPAR DADOS DE TESTE
+  clearAllTestData: () => void;
+  
+  // Ações - Transportadoras
+  addTransporter: (transporter: Omit<Transporter, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateTransporter: (id: string, data: Partial<Transporter>) => void;
+  deleteTransporter: (id: string) => void;
+  
+  // Ações - Instituições Financeiras
+  addFinancialInstitution: (institution: Omit<FinancialInstitution, 'id' | 'createdAt' | 'updatedAt'>) => void;
+  updateFinancialInstitution: (id: string, data: Partial<FinancialInstitution>) => void;
+  deleteFinancialInstitution: (id: string) => void;
+  
+  // Estados de Atualizações do Sistema
+  
+  // Ações - Atualizações do Sistema
+  setLastViewedUpdateDate: (date: Date) => void;
+  addSystemUpdate: (update: Omit<SystemUpdate, 'id' | 'createdAt'>) => void;
+  updateSystemUpdate: (id: string, data: Partial<SystemUpdate>) => void;
+  deleteSystemUpdate: (id: string) => void;
+  addUpdateFeedback: (feedback: Omit<UpdateFeedback, 'id' | 'createdAt'>) => void;
+  getUnviewedUpdatesCount: () => number;
+
+  // Inicialização dos dados locais
+  initializeStore: () => void;
+}
+
+/**
+ * Cada domínio do store é um slice que recebe o `set`/`get` do store completo,
+ * então ações de um slice podem ler e chamar as de outro.
+ */
+export type StoreSlice = StateCreator<AppState, [], [], Partial<AppState>>;
+
+// Domínios carregados sob demanda (chunks separados)
+export type LazySliceName = 'cashFlow' | 'nonCash' | 'dre' | 'indirectCosts';
@@ -1,19 +1,27 @@
 import React, { ReactElement } from 'react';
 import { render, RenderOptions } from '@testing-library/react';
 import { BrowserRouter } from 'react-router-dom';
+import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import { SupabaseProvider } from '@/providers/SupabaseProvider';
 import { NotificationProvider } from '@/components/Notifications/ModernNotificationSystem';
 
 // Componente wrapper para testes
 const AllTheProviders = ({ children }: { children: React.ReactNode }) => {
+  // Cache novo por teste, sem retry, para um teste não enxergar dados de outro
+  const [queryClient] = React.useState(() => new QueryClient({
+    defaultOptions: { queries: { retry: false } },
+  }));
+
   return (
-    <BrowserRouter>
-      <SupabaseProvider>
-        <NotificationProvider>
-          {children}
-        </NotificationProvider>
-      </SupabaseProvider>
-    </BrowserRouter>
+    <QueryClientProvider client={queryClient}>
+      <BrowserRouter>
+        <SupabaseProvider>
+          <NotificationProvider>
+            {children}
+          </NotificationProvider>
+        </SupabaseProvider>
+      </BrowserRouter>
+    </QueryClientProvider>
   );
 };
 
@@ -2,6 +2,8 @@
  * Utilitários de performance e otimização
  */
 
+import { ComponentType, lazy } from 'react';
+
 /**
  * Debounce - Adia a execução até parar de chamar por X ms
  * Útil para: Campos de busca, validações, auto-save
@@ -99,6 +101,29 @@ export const lazyLoadComponent = (
   });
 };
 
+/**
+ * Lazy com prefetch - React.lazy cujo chunk pode ser baixado antes da renderização
+ * Útil para: Páginas (prefetch ao passar o mouse ou focar o item do menu)
+ */
+export function lazyWithPrefetch<T extends ComponentType<any>>(
+  factory: () => Promise<{ default: T }>
+) {
+  let pending: Promise<{ default: T }> | null = null;
+
+  const load = () => {
+    if (!pending) {
+      pending = factory().catch((error) => {
+        // Permite nova tentativa se o download falhar
+        pending = null;
+        throw error;
+      });
+    }
+    return pending;
+  };
+
+  return Object.assign(lazy(load), { prefetch: load });
+}
+
 /**
  * Batch Updates - Agrupa múltiplas atualizações
  */
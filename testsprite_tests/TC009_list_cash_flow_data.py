@@ -1,7 +1,11 @@
+import time
+
 import requests
 
 BASE_URL = "http://localhost:3001"
 TIMEOUT = 30
+# Resumo de todo o histórico (milhares de lançamentos) deve vir das rollups mensais
+SUMMARY_MAX_SECONDS = 1.0
 
 def test_list_cash_flow_data():
     url = f"{BASE_URL}/api/v1/cash-flows"
@@ -37,4 +41,40 @@ def test_list_cash_flow_data():
         f"{data['balance']} vs calculated {calculated_balance}"
     )
 
-test_list_cash_flow_data()
\ No newline at end of file
+def test_cash_flow_summary_large_range_timing():
+    url = f"{BASE_URL}/api/v1/cash-flows/summary"
+    headers = {
+        "Accept": "application/json"
+    }
+    # Período longo: todos os meses fechados entram pelas rollups, só o mês aberto é somado ao vivo
+    params = {"startDate": "2000-01-01T00:00:00.000Z", "endDate": time.strftime("%Y-%m-%dT23:59:59.999Z", time.gmtime())}
+
+    # A primeira leitura materializa os meses que ainda não têm rollup
+    try:
+        requests.get(url, headers=headers, params=params, timeout=TIMEOUT).raise_for_status()
+    except requests.RequestException as e:
+        assert False, f"Request to cash flow summary failed: {e}"
+
+    started = time.perf_counter()
+    try:
+        response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        assert False, f"Request to cash flow summary failed: {e}"
+    elapsed = time.perf_counter() - started
+
+    data = response.json()
+    for key in ["totalIncome", "totalExpense", "pendingIncome", "pendingExpense", "paidIncome", "paidExpense", "balance"]:
+        assert isinstance(data.get(key), (int, float)), f"Summary field {key} should be numeric"
+    assert abs(data["balance"] - (data["paidIncome"] - data["paidExpense"])) < 0.01, (
+        "Summary balance should be paidIncome - paidExpense"
+    )
+    assert isinstance(data.get("rolledUpMonths"), int), "rolledUpMonths should be an integer"
+
+    assert elapsed < SUMMARY_MAX_SECONDS, (
+        f"Cash flow summary over the full history took {elapsed:.3f}s "
+        f"(limit {SUMMARY_MAX_SECONDS}s, {data['rolledUpMonths']} months from rollups)"
+    )
+
+test_list_cash_flow_data()
+test_cash_flow_summary_large_range_timing()
\ No newline at end of file
@@ -5,8 +5,20 @@ TIMEOUT = 30
 
 def test_get_dashboard_statistics():
     url = f"{BASE_URL}/api/v1/stats"
+
+    # Stats carry financial figures, so the endpoint requires authentication
+    anonymous = requests.get(url, headers={"Accept": "application/json"}, timeout=TIMEOUT)
+    assert anonymous.status_code == 401, f"Unauthenticated stats request should be rejected, got {anonymous.status_code}"
+
+    login = requests.post(
+        f"{BASE_URL}/api/v1/auth/login",
+        json={"email": "carlosedufaraujo@outlook.com", "password": "368308450Ce*"},
+        timeout=TIMEOUT,
+    )
+    assert login.status_code == 200, f"Login failed with status {login.status_code}"
     headers = {
-        "Accept": "application/json"
+        "Accept": "application/json",
+        "Authorization": f"Bearer {login.json()['token']}",
     }
     try:
         response = requests.get(url, headers=headers, timeout=TIMEOUT)
@@ -68,4 +80,28 @@ def test_get_dashboard_statistics():
         assert key in performance_index, f"Missing key in performanceIndex: {key}"
         assert isinstance(performance_index[key], (int, float)), f"performanceIndex.{key} should be numeric"
 
+    cache_control = response.headers.get("Cache-Control", "")
+    assert "private" in cache_control and "no-store" in cache_control, \
+        f"Stats must not be stored by shared caches, got Cache-Control: {cache_control}"
+
+    # Stats must be served from the pre-computed dashboard snapshot
+    source = response.headers.get("X-Dashboard-Snapshot")
+    assert source in ("snapshot", "stale", "refreshed"), f"Unexpected X-Dashboard-Snapshot header: {source}"
+    snapshot = data.get("snapshot")
+    assert isinstance(snapshot, dict), "snapshot metadata should be an object"
+    assert isinstance(snapshot.get("version"), int), "snapshot.version should be an integer"
+    assert isinstance(snapshot.get("computedAt"), str), "snapshot.computedAt should be a string"
+    assert snapshot.get("source") == source, "snapshot.source should match X-Dashboard-Snapshot header"
+
+    # A second read must not recompute the snapshot
+    try:
+        second = requests.get(url, headers=headers, timeout=TIMEOUT)
+        second.raise_for_status()
+    except requests.RequestException as e:
+        assert False, f"Second request to {url} failed: {e}"
+    second_source = second.headers.get("X-Dashboard-Snapshot")
+    assert second_source in ("snapshot", "stale"), f"Second read should hit the snapshot, got {second_source}"
+    second_snapshot = second.json()["snapshot"]
+    assert second_snapshot["version"] >= snapshot["version"], "snapshot.version should never go backwards"
+
 test_get_dashboard_statistics()
\ No newline at end of file
@@ -1,7 +1,19 @@
 import asyncio
+import json
+import os
 from playwright import async_api
 from playwright.async_api import expect
 
+# Relatório gerado por `npm run bundle:budget` (scripts/check-bundle-budget.cjs)
+BUNDLE_REPORT = os.path.join(os.path.dirname(__file__), 'tmp', 'bundle_report.json')
+
+
+def load_bundle_report():
+    if not os.path.exists(BUNDLE_REPORT):
+        return None
+    with open(BUNDLE_REPORT, encoding='utf-8') as report_file:
+        return json.load(report_file)
+
 async def run_test():
     pw = None
     browser = None
@@ -88,6 +100,19 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
 
+        # -> Measure navigation timing and check the bundle budget report alongside it
+        load_ms = await page.evaluate(
+            "() => { const [nav] = performance.getEntriesByType('navigation'); return nav ? nav.domContentLoadedEventEnd : null; }"
+        )
+        bundle_report = load_bundle_report()
+        if bundle_report:
+            initial_js = bundle_report['initialJs']
+            print(f"DOMContentLoaded: {load_ms} ms | JS inicial: {initial_js['gzipKb']} / {initial_js['limitKb']} KB gzip")
+            over_budget = [chunk['file'] for chunk in bundle_report['chunks'] if not chunk['withinBudget']]
+            assert bundle_report['withinBudget'], f"Bundle over budget: initial {initial_js['gzipKb']} KB, chunks {over_budget}"
+        else:
+            print(f"DOMContentLoaded: {load_ms} ms | bundle report not found (run npm run build && npm run bundle:budget)")
+
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from playwright import async_api
+
+# Benchmark de rolagem da tabela de despesas do Centro Financeiro com 20k linhas.
+# A listagem de /cash-flows é respondida com dados sintéticos para que o volume não
+# dependa do banco; login e demais chamadas vão para o backend real.
+
+BASE_URL = os.environ.get('BENCH_BASE_URL', 'http://localhost:5173')
+EMAIL = os.environ.get('BENCH_EMAIL', 'carlosedufaraujo@outlook.com')
+PASSWORD = os.environ.get('BENCH_PASSWORD', '')
+
+ROW_COUNT = int(os.environ.get('BENCH_ROWS', '20000'))
+SCROLL_DURATION_MS = 4000
+MIN_FPS = float(os.environ.get('BENCH_MIN_FPS', '30'))
+MAX_DOM_ROWS = 200
+MAX_HEAP_GROWTH_MB = 150
+
+REPORT = os.path.join(os.path.dirname(__file__), 'tmp', 'scroll_benchmark.json')
+
+# Rola o container até o fim em SCROLL_DURATION_MS e mede o intervalo entre frames
+SCROLL_SCRIPT = """
+async ({ selector, durationMs }) => {
+  const container = document.querySelector(selector);
+  if (!container) return null;
+
+  const distance = container.scrollHeight - container.clientHeight;
+  const frames = [];
+  const start = performance.now();
+  let last = start;
+
+  await new Promise((resolve) => {
+    const step = (now) => {
+      frames.push(now - last);
+      last = now;
+      const progress = Math.min(1, (now - start) / durationMs);
+      container.scrollTop = distance * progress;
+      if (progress < 1) requestAnimationFrame(step);
+      else resolve();
+    };
+    requestAnimationFrame(step);
+  });
+
+  const elapsed = performance.now() - start;
+  const sorted = frames.slice(1).sort((a, b) => a - b);
+  return {
+    frames: frames.length,
+    fps: frames.length / (elapsed / 1000),
+    p95FrameMs: sorted[Math.floor(sorted.length * 0.95)] || 0,
+    maxFrameMs: sorted[sorted.length - 1] || 0,
+    longFrames: sorted.filter((ms) => ms > 50).length,
+    domRows: container.querySelectorAll('tbody tr').length,
+  };
+}
+"""
+
+HEAP_SCRIPT = "() => (performance.memory ? performance.memory.usedJSHeapSize : null)"
+
+
+def build_expense_rows(count):
+    rng = random.Random(42)
+    start = datetime(2019, 1, 1)
+    rows = []
+    for index in range(count):
+        due = start + timedelta(days=index * 2190 // count)
+        rows.append({
+            'id': f'bench-{index}',
+            'type': 'EXPENSE',
+            'categoryId': f'cat-{index % 12}',
+            'accountId': 'bench-account',
+            'description': f'Despesa {index} - Ração lote {index % 300}',
+            'amount': round(rng.uniform(50, 25000), 2),
+            'date': due.isoformat(),
+            'dueDate': due.isoformat(),
+            'status': 'PAID' if index % 3 else 'PENDING',
+            'supplier': f'Fornecedor {index % 80}',
+            'account': {'accountName': 'Conta Benchmark', 'bankName': 'Banco'},
+        })
+    return rows
+
+
+async def run_test():
+    pw = None
+    browser = None
+    context = None
+
+    try:
+        payload = json.dumps(build_expense_rows(ROW_COUNT))
+
+        pw = await async_api.async_playwright().start()
+        browser = await pw.chromium.launch(
+            headless=True,
+            args=[
+                "--window-size=1280,720",
+                "--disable-dev-shm-usage",
+                "--enable-precise-memory-info",   # performance.memory com valores reais
+            ],
+        )
+        context = await browser.new_context(viewport={'width': 1280, 'height': 720})
+        context.set_default_timeout(15000)
+        page = await context.new_page()
+
+        async def serve_cash_flows(route):
+            request = route.request
+            if request.method == 'GET' and urlparse(request.url).path.endswith('/cash-flows'):
+                await route.fulfill(status=200, content_type='application/json', body=payload)
+            else:
+                await route.continue_()
+
+        await page.route('**/cash-flows**', serve_cash_flows)
+
+        # -> Login
+        await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=15000)
+        await page.locator('input[type="email"]').first.fill(EMAIL)
+        await page.locator('input[type="password"]').first.fill(PASSWORD)
+        await page.locator('form button[type="submit"], form button').first.click()
+        await page.wait_for_selector('[aria-label="Navegar para Centro Financeiro"]', timeout=20000)
+
+        heap_before = await page.evaluate(HEAP_SCRIPT)
+
+        # -> Centro Financeiro, aba Despesas
+        await page.click('[aria-label="Navegar para Centro Financeiro"]')
+        await page.get_by_role('tab', name='Despesas').click()
+        selector = '[data-testid="cash-flow-table-expense"]'
+        await page.wait_for_selector(f'{selector} tbody tr', timeout=30000)
+        await page.wait_for_timeout(1000)
+
+        heap_loaded = await page.evaluate(HEAP_SCRIPT)
+        result = await page.evaluate(SCROLL_SCRIPT, {'selector': selector, 'durationMs': SCROLL_DURATION_MS})
+        assert result, 'Expense table scroll container not found'
+        heap_after = await page.evaluate(HEAP_SCRIPT)
+
+        heap_growth_mb = None
+        if heap_before is not None and heap_after is not None:
+            heap_growth_mb = round((heap_after - heap_before) / (1024 * 1024), 1)
+
+        report = {
+            'rows': ROW_COUNT,
+            **{key: round(value, 1) if isinstance(value, float) else value for key, value in result.items()},
+            'heapBeforeMb': heap_before and round(heap_before / (1024 * 1024), 1),
+            'heapLoadedMb': heap_loaded and round(heap_loaded / (1024 * 1024), 1),
+            'heapAfterMb': heap_after and round(heap_after / (1024 * 1024), 1),
+            'heapGrowthMb': heap_growth_mb,
+        }
+        os.makedirs(os.path.dirname(REPORT), exist_ok=True)
+        with open(REPORT, 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, indent=2)
+
+        print(
+            f"{ROW_COUNT} linhas | {report['fps']} fps | p95 {report['p95FrameMs']} ms | "
+            f"linhas no DOM: {report['domRows']} | heap +{heap_growth_mb} MB"
+        )
+
+        # --> Assertions
+        assert result['domRows'] <= MAX_DOM_ROWS, \
+            f"Table is not virtualized: {result['domRows']} rows in the DOM for {ROW_COUNT} records"
+        assert result['fps'] >= MIN_FPS, \
+            f"Scroll too slow: {result['fps']:.1f} fps (minimum {MIN_FPS})"
+        if heap_growth_mb is not None:
+            assert heap_growth_mb <= MAX_HEAP_GROWTH_MB, \
+                f"Heap grew {heap_growth_mb} MB while loading and scrolling {ROW_COUNT} rows"
+
+    finally:
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+asyncio.run(run_test())
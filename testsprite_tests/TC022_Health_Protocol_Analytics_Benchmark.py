@@ -0,0 +1,122 @@
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+# Benchmark do analítico de protocolos sanitários: compara programas de vacinação por
+# temporada, curral e mês sobre os fatos pré-calculados (health_protocol_facts).
+# Mede a reconstrução completa dos fatos e a latência das consultas de recorte.
+
+API_URL = os.environ.get('BENCH_API_URL', 'http://localhost:3001/api/v1')
+EMAIL = os.environ.get('BENCH_EMAIL', 'carlosedufaraujo@outlook.com')
+PASSWORD = os.environ.get('BENCH_PASSWORD', '')
+TIMEOUT = 60
+
+ITERATIONS = int(os.environ.get('BENCH_ITERATIONS', '20'))
+MAX_SLICE_P95_MS = float(os.environ.get('BENCH_MAX_SLICE_P95_MS', '300'))
+MAX_FULL_REFRESH_MS = float(os.environ.get('BENCH_MAX_FULL_REFRESH_MS', '30000'))
+SEASONS = 4  # Temporadas de 6 meses para trás
+
+REPORT = os.path.join(os.path.dirname(__file__), 'tmp', 'health_protocol_benchmark.json')
+
+ANALYTICS_URL = f"{API_URL}/integrated-interventions/health-protocol/analytics"
+
+
+def login():
+    response = requests.post(
+        f"{API_URL}/auth/login",
+        json={'email': EMAIL, 'password': PASSWORD},
+        timeout=TIMEOUT,
+    )
+    response.raise_for_status()
+    body = response.json()
+    token = body.get('token') or (body.get('data') or {}).get('token')
+    assert token, 'Login did not return a token'
+    return {'Authorization': f"Bearer {token}", 'Accept': 'application/json'}
+
+
+def timed_get(headers, params):
+    started = time.perf_counter()
+    response = requests.get(ANALYTICS_URL, headers=headers, params=params, timeout=TIMEOUT)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    assert response.status_code == 200, f"Analytics request failed ({response.status_code}): {response.text[:200]}"
+    return elapsed_ms, response.json()['data']
+
+
+def season_ranges():
+    now = datetime.now(timezone.utc)
+    for index in range(SEASONS):
+        end = now - timedelta(days=182 * index)
+        start = end - timedelta(days=182)
+        yield start.isoformat(), end.isoformat()
+
+
+def test_health_protocol_analytics_benchmark():
+    headers = login()
+
+    started = time.perf_counter()
+    refresh = requests.post(f"{ANALYTICS_URL}/refresh", headers=headers, params={'full': 'true'}, timeout=TIMEOUT * 5)
+    full_refresh_ms = (time.perf_counter() - started) * 1000
+    assert refresh.status_code == 200, f"Full refresh failed ({refresh.status_code}): {refresh.text[:200]}"
+    refresh_result = refresh.json()['data']
+    assert refresh_result['mode'] == 'full', f"Expected a full refresh, got {refresh_result['mode']}"
+
+    # Sem alterações desde a reconstrução, o refresh incremental não reprocessa nada além da margem.
+    # Sem nenhum fato gravado não há marca d'água, e o segundo refresh volta a ser completo.
+    incremental = requests.post(f"{ANALYTICS_URL}/refresh", headers=headers, timeout=TIMEOUT)
+    assert incremental.status_code == 200, f"Incremental refresh failed ({incremental.status_code})"
+    expected_mode = 'incremental' if refresh_result['facts'] > 0 else 'full'
+    assert incremental.json()['data']['mode'] == expected_mode, \
+        f"Second refresh should be {expected_mode}, got {incremental.json()['data']['mode']}"
+
+    # Recortes: programas por temporada, um programa por curral e por mês, e o top programa por lote
+    _, protocols = timed_get(headers, {'groupBy': 'protocol'})
+    slices = []
+    for start, end in season_ranges():
+        slices.append({'groupBy': 'protocol', 'startDate': start, 'endDate': end})
+        slices.append({'groupBy': 'pen', 'startDate': start, 'endDate': end})
+    for protocol in protocols[:3]:
+        slices.append({'groupBy': 'month', 'productName': protocol['label']})
+        slices.append({'groupBy': 'lot', 'productName': protocol['label']})
+
+    samples = []
+    for _ in range(ITERATIONS):
+        for params in slices:
+            elapsed_ms, rows = timed_get(headers, params)
+            samples.append(elapsed_ms)
+            for row in rows:
+                assert row['treatedHead'] >= 0 and row['deathsAfter'] >= 0, f"Invalid counts in {row}"
+                assert 0 <= row['mortalityRate'] <= 100, f"Mortality rate out of range in {row}"
+
+    samples.sort()
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'facts': refresh_result['facts'],
+        'fullRefreshMs': round(full_refresh_ms, 1),
+        'serverRefreshMs': refresh_result['durationMs'],
+        'protocols': len(protocols),
+        'slices': len(slices),
+        'requests': len(samples),
+        'p50Ms': round(statistics.median(samples), 1),
+        'p95Ms': round(samples[max(0, int(len(samples) * 0.95) - 1)], 1),
+        'maxMs': round(samples[-1], 1),
+    }
+    os.makedirs(os.path.dirname(REPORT), exist_ok=True)
+    with open(REPORT, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file, indent=2)
+
+    print(
+        f"{report['facts']} fatos | reconstrução {report['fullRefreshMs']} ms | "
+        f"{report['requests']} consultas: p50 {report['p50Ms']} ms, p95 {report['p95Ms']} ms"
+    )
+
+    # --> Assertions
+    assert full_refresh_ms <= MAX_FULL_REFRESH_MS, \
+        f"Full refresh too slow: {full_refresh_ms:.0f} ms (limit {MAX_FULL_REFRESH_MS} ms)"
+    assert report['p95Ms'] <= MAX_SLICE_P95_MS, \
+        f"Protocol slices too slow: p95 {report['p95Ms']} ms (limit {MAX_SLICE_P95_MS} ms)"
+
+test_health_protocol_analytics_benchmark()
@@ -74,7 +74,10 @@ export default defineConfig({
             'axios',
             'date-fns',
             'zod'
-          ]
+          ],
+          // Bibliotecas pesadas usadas só por algumas páginas ficam em chunks próprios
+          'vendor-charts': ['recharts'],
+          'vendor-pdf': ['jspdf', 'html2canvas']
         }
       }
     }